@@ -1,136 +1,339 @@
 __version__ = "1.5.1"
 
+from typing import TYPE_CHECKING
+
 from bigtree._globals import Globals
-from bigtree.binarytree.binarytree import BinaryTree
-from bigtree.binarytree.construct import list_to_binarytree
-from bigtree.dag.construct import dataframe_to_dag, dict_to_dag, list_to_dag
-from bigtree.dag.dag import DAG
-from bigtree.dag.export import dag_to_dataframe, dag_to_dict, dag_to_dot, dag_to_list
-from bigtree.dag.parsing import get_path_dag
-from bigtree.node.basenode import BaseNode
-from bigtree.node.binarynode import BinaryNode
-from bigtree.node.dagnode import DAGNode
-from bigtree.node.node import Node
-from bigtree.tree.construct import (
-    add_dataframe_to_tree_by_name,
-    add_dataframe_to_tree_by_path,
-    add_dict_to_tree_by_name,
-    add_dict_to_tree_by_path,
-    add_path_to_tree,
-    add_polars_to_tree_by_name,
-    add_polars_to_tree_by_path,
-    dataframe_to_tree,
-    dataframe_to_tree_by_relation,
-    dict_to_tree,
-    list_to_tree,
-    list_to_tree_by_relation,
-    nested_dict_key_to_tree,
-    nested_dict_to_tree,
-    newick_to_tree,
-    polars_to_tree,
-    polars_to_tree_by_relation,
-    render_tree,
-    rich_to_tree,
-    str_to_tree,
-)
-from bigtree.tree.export import (
-    hprint_tree,
-    hyield_tree,
-    iprint_tree,
-    print_tree,
-    tree_to_dataframe,
-    tree_to_dict,
-    tree_to_dot,
-    tree_to_html,
-    tree_to_mermaid,
-    tree_to_nested_dict,
-    tree_to_nested_dict_key,
-    tree_to_newick,
-    tree_to_pillow,
-    tree_to_pillow_graph,
-    tree_to_polars,
-    tree_to_vis,
-    vprint_tree,
-    vyield_tree,
-    yield_tree,
-)
-from bigtree.tree.helper import (
-    clone_tree,
-    get_subtree,
-    get_tree_diff,
-    get_tree_diff_dataframe,
-    prune_tree,
-)
-from bigtree.tree.modify import (
-    copy_and_replace_nodes_from_tree_to_tree,
-    copy_nodes,
-    copy_nodes_from_tree_to_tree,
-    copy_or_shift_logic,
-    merge_trees,
-    replace_logic,
-    shift_and_replace_nodes,
-    shift_nodes,
-)
-from bigtree.tree.parsing import get_common_ancestors, get_path
-from bigtree.tree.query import query_tree
-from bigtree.tree.search import (
-    find,
-    find_attr,
-    find_attrs,
-    find_child,
-    find_child_by_name,
-    find_children,
-    find_full_path,
-    find_name,
-    find_names,
-    find_path,
-    find_paths,
-    find_relative_path,
-    find_relative_paths,
-    findall,
-)
-from bigtree.tree.tree import Tree
-from bigtree.utils.constants import (
-    ANSIBorderStyle,
-    ANSIHPrintStyle,
-    ANSIPrintStyle,
-    ANSIVPrintStyle,
-    ASCIIBorderStyle,
-    ASCIIHPrintStyle,
-    ASCIIPrintStyle,
-    ASCIIVPrintStyle,
-    BaseHPrintStyle,
-    BasePrintStyle,
-    BaseVPrintStyle,
-    BorderStyle,
-    ConstBoldBorderStyle,
-    ConstBoldHPrintStyle,
-    ConstBoldPrintStyle,
-    ConstBoldVPrintStyle,
-    ConstBorderStyle,
-    ConstHPrintStyle,
-    ConstPrintStyle,
-    ConstVPrintStyle,
-    DoubleBorderStyle,
-    DoubleHPrintStyle,
-    DoublePrintStyle,
-    DoubleVPrintStyle,
-    RoundedBorderStyle,
-    RoundedHPrintStyle,
-    RoundedPrintStyle,
-    RoundedVPrintStyle,
-)
-from bigtree.utils.groot import speak_like_groot, whoami
-from bigtree.utils.iterators import (
-    dag_iterator,
-    inorder_iter,
-    levelorder_iter,
-    levelordergroup_iter,
-    postorder_iter,
-    preorder_iter,
-    zigzag_iter,
-    zigzaggroup_iter,
-)
-from bigtree.utils.plot import plot_tree, reingold_tilford
-from bigtree.workflows.app_calendar import Calendar
-from bigtree.workflows.app_todo import AppToDo
+from bigtree._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from bigtree.binarytree.binarytree import BinaryTree
+    from bigtree.binarytree.construct import list_to_binarytree
+    from bigtree.dag.construct import dataframe_to_dag, dict_to_dag, list_to_dag
+    from bigtree.dag.dag import DAG
+    from bigtree.dag.export import (
+        dag_to_dataframe,
+        dag_to_dict,
+        dag_to_dot,
+        dag_to_dot_file,
+        dag_to_list,
+    )
+    from bigtree.dag.parsing import get_path_dag
+    from bigtree.node.basenode import BaseNode
+    from bigtree.node.binarynode import BinaryNode
+    from bigtree.node.dagnode import DAGNode
+    from bigtree.node.mappednode import MappedNode
+    from bigtree.node.node import Node
+    from bigtree.node.viewnode import ViewNode
+    from bigtree.tree.construct import (
+        add_dataframe_to_tree_by_name,
+        add_dataframe_to_tree_by_path,
+        add_dict_to_tree_by_name,
+        add_dict_to_tree_by_path,
+        add_path_to_tree,
+        add_polars_to_tree_by_name,
+        add_polars_to_tree_by_path,
+        bytes_to_tree,
+        csv_to_tree,
+        dataframe_to_tree,
+        dataframe_to_tree_by_relation,
+        dict_to_tree,
+        iter_to_tree,
+        jsonl_to_tree,
+        list_to_tree,
+        list_to_tree_by_relation,
+        load_tree,
+        mmap_tree,
+        nested_dict_key_to_tree,
+        nested_dict_to_tree,
+        newick_to_tree,
+        polars_to_tree,
+        polars_to_tree_by_relation,
+        render_tree,
+        rich_to_tree,
+        str_to_tree,
+    )
+    from bigtree.tree.export import (
+        hprint_tree,
+        hyield_tree,
+        iprint_tree,
+        print_tree,
+        save_tree,
+        tree_to_bytes,
+        tree_to_csv,
+        tree_to_dataframe,
+        tree_to_dict,
+        tree_to_dot,
+        tree_to_dot_file,
+        tree_to_html,
+        tree_to_jsonl,
+        tree_to_mermaid,
+        tree_to_mermaid_file,
+        tree_to_nested_dict,
+        tree_to_nested_dict_key,
+        tree_to_nested_json,
+        tree_to_newick,
+        tree_to_newick_file,
+        tree_to_parquet,
+        tree_to_pillow,
+        tree_to_pillow_graph,
+        tree_to_pillow_graph_tiles,
+        tree_to_pillow_tiles,
+        tree_to_polars,
+        tree_to_vis,
+        tree_to_vis_json,
+        vprint_tree,
+        vyield_tree,
+        yield_tree,
+    )
+    from bigtree.tree.helper import (
+        apply_patch,
+        clone_tree,
+        diff_to_patch,
+        get_leaf_distance_matrix,
+        get_subtree,
+        get_subtree_hashes,
+        get_subtree_view,
+        get_tree_diff,
+        get_tree_diff_by_hash,
+        get_tree_diff_dataframe,
+        prune_tree,
+    )
+    from bigtree.tree.modify import (
+        copy_and_replace_nodes_from_tree_to_tree,
+        copy_nodes,
+        copy_nodes_from_tree_to_tree,
+        copy_or_shift_logic,
+        merge_trees,
+        replace_logic,
+        shift_and_replace_nodes,
+        shift_nodes,
+    )
+    from bigtree.tree.parsing import get_common_ancestors, get_path
+    from bigtree.tree.query import query_tree
+    from bigtree.tree.search import (
+        find,
+        find_attr,
+        find_attrs,
+        find_child,
+        find_child_by_name,
+        find_children,
+        find_full_path,
+        find_name,
+        find_names,
+        find_path,
+        find_paths,
+        find_relative_path,
+        find_relative_paths,
+        findall,
+    )
+    from bigtree.tree.store import TreeStore
+    from bigtree.tree.tree import Tree
+    from bigtree.utils.constants import (
+        ANSIBorderStyle,
+        ANSIHPrintStyle,
+        ANSIPrintStyle,
+        ANSIVPrintStyle,
+        ASCIIBorderStyle,
+        ASCIIHPrintStyle,
+        ASCIIPrintStyle,
+        ASCIIVPrintStyle,
+        BaseHPrintStyle,
+        BasePrintStyle,
+        BaseVPrintStyle,
+        BorderStyle,
+        ConstBoldBorderStyle,
+        ConstBoldHPrintStyle,
+        ConstBoldPrintStyle,
+        ConstBoldVPrintStyle,
+        ConstBorderStyle,
+        ConstHPrintStyle,
+        ConstPrintStyle,
+        ConstVPrintStyle,
+        DoubleBorderStyle,
+        DoubleHPrintStyle,
+        DoublePrintStyle,
+        DoubleVPrintStyle,
+        RoundedBorderStyle,
+        RoundedHPrintStyle,
+        RoundedPrintStyle,
+        RoundedVPrintStyle,
+    )
+    from bigtree.utils.groot import speak_like_groot, whoami
+    from bigtree.utils.iterators import (
+        dag_iterator,
+        inorder_iter,
+        levelorder_iter,
+        levelordergroup_iter,
+        postorder_iter,
+        preorder_iter,
+        zigzag_iter,
+        zigzaggroup_iter,
+    )
+    from bigtree.utils.plot import plot_tree, reingold_tilford
+    from bigtree.workflows.app_calendar import Calendar
+    from bigtree.workflows.app_todo import AppToDo
+
+# Exports are imported from their module on first access, such that importing bigtree does not import all modules and
+# their optional dependencies
+_LAZY_EXPORTS = {
+    "BinaryTree": "bigtree.binarytree.binarytree",
+    "list_to_binarytree": "bigtree.binarytree.construct",
+    "dataframe_to_dag": "bigtree.dag.construct",
+    "dict_to_dag": "bigtree.dag.construct",
+    "list_to_dag": "bigtree.dag.construct",
+    "DAG": "bigtree.dag.dag",
+    "dag_to_dataframe": "bigtree.dag.export",
+    "dag_to_dict": "bigtree.dag.export",
+    "dag_to_dot": "bigtree.dag.export",
+    "dag_to_dot_file": "bigtree.dag.export",
+    "dag_to_list": "bigtree.dag.export",
+    "get_path_dag": "bigtree.dag.parsing",
+    "BaseNode": "bigtree.node.basenode",
+    "BinaryNode": "bigtree.node.binarynode",
+    "DAGNode": "bigtree.node.dagnode",
+    "MappedNode": "bigtree.node.mappednode",
+    "Node": "bigtree.node.node",
+    "ViewNode": "bigtree.node.viewnode",
+    "add_dataframe_to_tree_by_name": "bigtree.tree.construct",
+    "add_dataframe_to_tree_by_path": "bigtree.tree.construct",
+    "add_dict_to_tree_by_name": "bigtree.tree.construct",
+    "add_dict_to_tree_by_path": "bigtree.tree.construct",
+    "add_path_to_tree": "bigtree.tree.construct",
+    "add_polars_to_tree_by_name": "bigtree.tree.construct",
+    "add_polars_to_tree_by_path": "bigtree.tree.construct",
+    "bytes_to_tree": "bigtree.tree.construct",
+    "csv_to_tree": "bigtree.tree.construct",
+    "dataframe_to_tree": "bigtree.tree.construct",
+    "dataframe_to_tree_by_relation": "bigtree.tree.construct",
+    "dict_to_tree": "bigtree.tree.construct",
+    "iter_to_tree": "bigtree.tree.construct",
+    "jsonl_to_tree": "bigtree.tree.construct",
+    "list_to_tree": "bigtree.tree.construct",
+    "list_to_tree_by_relation": "bigtree.tree.construct",
+    "load_tree": "bigtree.tree.construct",
+    "mmap_tree": "bigtree.tree.construct",
+    "nested_dict_key_to_tree": "bigtree.tree.construct",
+    "nested_dict_to_tree": "bigtree.tree.construct",
+    "newick_to_tree": "bigtree.tree.construct",
+    "polars_to_tree": "bigtree.tree.construct",
+    "polars_to_tree_by_relation": "bigtree.tree.construct",
+    "render_tree": "bigtree.tree.construct",
+    "rich_to_tree": "bigtree.tree.construct",
+    "str_to_tree": "bigtree.tree.construct",
+    "hprint_tree": "bigtree.tree.export",
+    "hyield_tree": "bigtree.tree.export",
+    "iprint_tree": "bigtree.tree.export",
+    "print_tree": "bigtree.tree.export",
+    "save_tree": "bigtree.tree.export",
+    "tree_to_bytes": "bigtree.tree.export",
+    "tree_to_dataframe": "bigtree.tree.export",
+    "tree_to_dict": "bigtree.tree.export",
+    "tree_to_dot": "bigtree.tree.export",
+    "tree_to_dot_file": "bigtree.tree.export",
+    "tree_to_html": "bigtree.tree.export",
+    "tree_to_mermaid": "bigtree.tree.export",
+    "tree_to_mermaid_file": "bigtree.tree.export",
+    "tree_to_nested_dict": "bigtree.tree.export",
+    "tree_to_nested_dict_key": "bigtree.tree.export",
+    "tree_to_nested_json": "bigtree.tree.export",
+    "tree_to_newick": "bigtree.tree.export",
+    "tree_to_newick_file": "bigtree.tree.export",
+    "tree_to_pillow": "bigtree.tree.export",
+    "tree_to_pillow_graph": "bigtree.tree.export",
+    "tree_to_pillow_graph_tiles": "bigtree.tree.export",
+    "tree_to_pillow_tiles": "bigtree.tree.export",
+    "tree_to_polars": "bigtree.tree.export",
+    "tree_to_parquet": "bigtree.tree.export",
+    "tree_to_csv": "bigtree.tree.export",
+    "tree_to_jsonl": "bigtree.tree.export",
+    "tree_to_vis": "bigtree.tree.export",
+    "tree_to_vis_json": "bigtree.tree.export",
+    "vprint_tree": "bigtree.tree.export",
+    "vyield_tree": "bigtree.tree.export",
+    "yield_tree": "bigtree.tree.export",
+    "apply_patch": "bigtree.tree.helper",
+    "clone_tree": "bigtree.tree.helper",
+    "diff_to_patch": "bigtree.tree.helper",
+    "get_leaf_distance_matrix": "bigtree.tree.helper",
+    "get_subtree": "bigtree.tree.helper",
+    "get_subtree_hashes": "bigtree.tree.helper",
+    "get_subtree_view": "bigtree.tree.helper",
+    "get_tree_diff": "bigtree.tree.helper",
+    "get_tree_diff_by_hash": "bigtree.tree.helper",
+    "get_tree_diff_dataframe": "bigtree.tree.helper",
+    "prune_tree": "bigtree.tree.helper",
+    "copy_and_replace_nodes_from_tree_to_tree": "bigtree.tree.modify",
+    "copy_nodes": "bigtree.tree.modify",
+    "copy_nodes_from_tree_to_tree": "bigtree.tree.modify",
+    "copy_or_shift_logic": "bigtree.tree.modify",
+    "merge_trees": "bigtree.tree.modify",
+    "replace_logic": "bigtree.tree.modify",
+    "shift_and_replace_nodes": "bigtree.tree.modify",
+    "shift_nodes": "bigtree.tree.modify",
+    "get_common_ancestors": "bigtree.tree.parsing",
+    "get_path": "bigtree.tree.parsing",
+    "query_tree": "bigtree.tree.query",
+    "find": "bigtree.tree.search",
+    "find_attr": "bigtree.tree.search",
+    "find_attrs": "bigtree.tree.search",
+    "find_child": "bigtree.tree.search",
+    "find_child_by_name": "bigtree.tree.search",
+    "find_children": "bigtree.tree.search",
+    "find_full_path": "bigtree.tree.search",
+    "find_name": "bigtree.tree.search",
+    "find_names": "bigtree.tree.search",
+    "find_path": "bigtree.tree.search",
+    "find_paths": "bigtree.tree.search",
+    "find_relative_path": "bigtree.tree.search",
+    "find_relative_paths": "bigtree.tree.search",
+    "findall": "bigtree.tree.search",
+    "TreeStore": "bigtree.tree.store",
+    "Tree": "bigtree.tree.tree",
+    "ANSIBorderStyle": "bigtree.utils.constants",
+    "ANSIHPrintStyle": "bigtree.utils.constants",
+    "ANSIPrintStyle": "bigtree.utils.constants",
+    "ANSIVPrintStyle": "bigtree.utils.constants",
+    "ASCIIBorderStyle": "bigtree.utils.constants",
+    "ASCIIHPrintStyle": "bigtree.utils.constants",
+    "ASCIIPrintStyle": "bigtree.utils.constants",
+    "ASCIIVPrintStyle": "bigtree.utils.constants",
+    "BaseHPrintStyle": "bigtree.utils.constants",
+    "BasePrintStyle": "bigtree.utils.constants",
+    "BaseVPrintStyle": "bigtree.utils.constants",
+    "BorderStyle": "bigtree.utils.constants",
+    "ConstBoldBorderStyle": "bigtree.utils.constants",
+    "ConstBoldHPrintStyle": "bigtree.utils.constants",
+    "ConstBoldPrintStyle": "bigtree.utils.constants",
+    "ConstBoldVPrintStyle": "bigtree.utils.constants",
+    "ConstBorderStyle": "bigtree.utils.constants",
+    "ConstHPrintStyle": "bigtree.utils.constants",
+    "ConstPrintStyle": "bigtree.utils.constants",
+    "ConstVPrintStyle": "bigtree.utils.constants",
+    "DoubleBorderStyle": "bigtree.utils.constants",
+    "DoubleHPrintStyle": "bigtree.utils.constants",
+    "DoublePrintStyle": "bigtree.utils.constants",
+    "DoubleVPrintStyle": "bigtree.utils.constants",
+    "RoundedBorderStyle": "bigtree.utils.constants",
+    "RoundedHPrintStyle": "bigtree.utils.constants",
+    "RoundedPrintStyle": "bigtree.utils.constants",
+    "RoundedVPrintStyle": "bigtree.utils.constants",
+    "speak_like_groot": "bigtree.utils.groot",
+    "whoami": "bigtree.utils.groot",
+    "dag_iterator": "bigtree.utils.iterators",
+    "inorder_iter": "bigtree.utils.iterators",
+    "levelorder_iter": "bigtree.utils.iterators",
+    "levelordergroup_iter": "bigtree.utils.iterators",
+    "postorder_iter": "bigtree.utils.iterators",
+    "preorder_iter": "bigtree.utils.iterators",
+    "zigzag_iter": "bigtree.utils.iterators",
+    "zigzaggroup_iter": "bigtree.utils.iterators",
+    "plot_tree": "bigtree.utils.plot",
+    "reingold_tilford": "bigtree.utils.plot",
+    "Calendar": "bigtree.workflows.app_calendar",
+    "AppToDo": "bigtree.workflows.app_todo",
+}
+
+__all__ = ["Globals", *_LAZY_EXPORTS]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
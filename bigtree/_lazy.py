@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_exports(
+    module_name: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Get module-level `__getattr__` and `__dir__` functions that import exports of module from their own module on
+    first access, such that importing the module does not import all its exports and their optional dependencies.
+
+    Args:
+        module_name: name of module with exports
+        exports: name of export and name of module to import export from
+
+    Returns:
+        Module-level `__getattr__` and `__dir__` functions
+    """
+    module_globals = sys.modules[module_name].__dict__
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        if name in exports:
+            value = getattr(importlib.import_module(exports[name]), name)
+            module_globals[name] = value
+            return value
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted({*module_globals, *exports})
+
+    return __getattr__, __dir__
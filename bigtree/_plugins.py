@@ -1,3 +1,57 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+
+class PluginMeta(type):
+    """Metaclass for classes with plugins, where plugins are registered on first access of the class instead of when
+    it is defined, so that modules of plugins and their optional dependencies are only imported when they are used.
+
+    Plugins are registered when an attribute that is not defined is accessed from the class, when the class is
+    instantiated, or when its attributes are listed. Plugins of parent classes are registered before plugins of the
+    class.
+    """
+
+    def __init__(cls, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        cls._pending_plugins: list[Callable[[], None]] = []
+
+    def register_plugins_lazily(cls, register_func: Callable[[], None]) -> None:
+        """Register plugins with `register_func` on first access of the class.
+
+        Args:
+            register_func: function that registers plugins
+        """
+        cls._pending_plugins.append(register_func)
+
+    def _register_pending_plugins(cls) -> bool:
+        """Register pending plugins of class and its parent classes.
+
+        Returns:
+            Indicator if any plugins are registered
+        """
+        registered = False
+        for _cls in reversed(cls.__mro__):
+            pending_plugins = _cls.__dict__.get("_pending_plugins")
+            while pending_plugins:
+                pending_plugins.pop(0)()
+                registered = True
+        return registered
+
+    def __getattr__(cls, name: str) -> Any:
+        if not name.startswith("__") and cls._register_pending_plugins():
+            return getattr(cls, name)
+        raise AttributeError(f"type object {cls.__name__!r} has no attribute {name!r}")
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        cls._register_pending_plugins()
+        return super().__call__(*args, **kwargs)
+
+    def __dir__(cls) -> list[str]:
+        cls._register_pending_plugins()
+        return list(super().__dir__())
+
+
 def register_binarytree_plugins() -> None:
     """Register plugin for BinaryTree"""
     from bigtree.binarytree import construct
@@ -50,6 +104,7 @@ def register_dag_plugins() -> None:
             "to_dict": export.dag_to_dict,
             "to_list": export.dag_to_list,
             "to_dot": export.dag_to_dot,
+            "to_dot_file": export.dag_to_dot_file,
             # Iterator methods
             "iterate": iterators.dag_iterator,
         },
@@ -84,6 +139,9 @@ def register_tree_plugins() -> None:
             "from_str": construct.str_to_tree,
             "from_newick": construct.newick_to_tree,
             "from_rich": construct.rich_to_tree,
+            "from_bytes": construct.bytes_to_tree,
+            "load": construct.load_tree,
+            "mmap": construct.mmap_tree,
         },
         method="class",
     )
@@ -107,16 +165,28 @@ def register_tree_plugins() -> None:
             "vyield": export.vyield_tree,
             "to_dataframe": export.tree_to_dataframe,
             "to_polars": export.tree_to_polars,
+            "to_parquet": export.tree_to_parquet,
+            "to_csv": export.tree_to_csv,
+            "to_jsonl": export.tree_to_jsonl,
             "to_dict": export.tree_to_dict,
             "to_nested_dict": export.tree_to_nested_dict,
             "to_nested_dict_key": export.tree_to_nested_dict_key,
+            "to_nested_json": export.tree_to_nested_json,
             "to_html": export.tree_to_html,
             "to_newick": export.tree_to_newick,
+            "to_newick_file": export.tree_to_newick_file,
             "to_dot": export.tree_to_dot,
+            "to_dot_file": export.tree_to_dot_file,
             "to_pillow_graph": export.tree_to_pillow_graph,
+            "to_pillow_graph_tiles": export.tree_to_pillow_graph_tiles,
             "to_pillow": export.tree_to_pillow,
+            "to_pillow_tiles": export.tree_to_pillow_tiles,
             "to_mermaid": export.tree_to_mermaid,
+            "to_mermaid_file": export.tree_to_mermaid_file,
             "to_vis": export.tree_to_vis,
+            "to_vis_json": export.tree_to_vis_json,
+            "to_bytes": export.tree_to_bytes,
+            "save": export.save_tree,
             # Iterator methods
             "preorder_iter": iterators.preorder_iter,
             "postorder_iter": iterators.postorder_iter,
@@ -145,6 +215,9 @@ def register_tree_plugins() -> None:
             "find_children": search.find_children,
             "find_child": search.find_child,
             "find_child_by_name": search.find_child_by_name,
+            # Helper methods
+            "apply_patch": helper.apply_patch,
+            "leaf_distance_matrix": helper.get_leaf_distance_matrix,
         },
         method="default",
     )
@@ -153,6 +226,7 @@ def register_tree_plugins() -> None:
             # Helper methods
             "clone": helper.clone_tree,
             "subtree": helper.get_subtree,
+            "subtree_view": helper.get_subtree_view,
             "prune": helper.prune_tree,
         },
         method="helper",
@@ -162,6 +236,8 @@ def register_tree_plugins() -> None:
             # Helper methods
             "diff_dataframe": helper.get_tree_diff_dataframe,
             "diff": helper.get_tree_diff,
+            "diff_by_hash": helper.get_tree_diff_by_hash,
+            "diff_to_patch": helper.diff_to_patch,
         },
         method="diff",
     )
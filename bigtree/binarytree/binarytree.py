@@ -23,4 +23,4 @@ class BinaryTree(Tree):
         super().__init__(root)
 
 
-register_binarytree_plugins()
+BinaryTree.register_plugins_lazily(register_binarytree_plugins)
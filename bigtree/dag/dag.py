@@ -4,11 +4,11 @@ import copy
 import functools
 from typing import Any, Callable, Literal, TypeVar
 
-from bigtree._plugins import register_dag_plugins
+from bigtree._plugins import PluginMeta, register_dag_plugins
 from bigtree.node import dagnode
 
 
-class DAG:
+class DAG(metaclass=PluginMeta):
     """
     DAG wraps around DAGNode class to provide a quick, intuitive, Pythonic API for
 
@@ -121,4 +121,4 @@ class DAG:
 
 T = TypeVar("T", bound=DAG)
 
-register_dag_plugins()
+DAG.register_plugins_lazily(register_dag_plugins)
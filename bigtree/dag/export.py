@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Mapping, TypeVar
+import os
+from typing import IO, Any, Mapping, TypeVar
 
 from bigtree.node import dagnode
 from bigtree.utils import assertions, common, exceptions, iterators
+from bigtree.utils.dot import DotWriter
 
 try:
     import pandas as pd
@@ -19,7 +21,13 @@ except ImportError:  # pragma: no cover
 
     pydot = MagicMock()
 
-__all__ = ["dag_to_list", "dag_to_dict", "dag_to_dataframe", "dag_to_dot"]
+__all__ = [
+    "dag_to_list",
+    "dag_to_dict",
+    "dag_to_dataframe",
+    "dag_to_dot",
+    "dag_to_dot_file",
+]
 
 
 T = TypeVar("T", bound=dagnode.DAGNode)
@@ -262,3 +270,98 @@ def dag_to_dot(
             _graph.add_edge(edge)
 
     return _graph
+
+
+def dag_to_dot_file(
+    dag: T | list[T],
+    file: str | os.PathLike[str] | IO[str],
+    rankdir: str = "TB",
+    bg_colour: str | None = None,
+    node_colour: str | None = None,
+    node_shape: str | None = None,
+    edge_colour: str | None = None,
+    node_attr: str | None = None,
+    edge_attr: str | None = None,
+) -> None:
+    """Export DAG or list of DAGs to dot file, writing DOT statements to file as the DAG is traversed without creating
+    pydot objects, hence pydot is not required. Note that node names must be unique.
+
+    Each node is written once, followed by the edges to its children, refer to ``dag_to_dot`` for the customisations.
+    Dot file can be rendered to image with Graphviz, or loaded with ``pydot.graph_from_dot_file``.
+
+    Examples:
+        >>> import io
+        >>> from bigtree import DAGNode, dag_to_dot_file
+        >>> a = DAGNode("a", step=1)
+        >>> b = DAGNode("b", step=1)
+        >>> c = DAGNode("c", step=2, parents=[a, b])
+        >>> d = DAGNode("d", step=2, parents=[a, c])
+        >>> e = DAGNode("e", step=3, parents=[d])
+        >>> dot_file = io.StringIO()
+        >>> dag_to_dot_file(a, dot_file)
+        >>> print(dot_file.getvalue())
+        strict digraph G {
+        rankdir=TB;
+        a [label=a];
+        a -> c;
+        a -> d;
+        c [label=c];
+        c -> d;
+        b [label=b];
+        b -> c;
+        d [label=d];
+        d -> e;
+        e [label=e];
+        }
+        <BLANKLINE>
+
+    Args:
+        dag: DAG(s) to be exported
+        file: path of file, or file object opened in text mode
+        rankdir: set direction of graph layout, accepts 'TB', 'BT, 'LR', or 'RL'
+        bg_colour: background color of image
+        node_colour: fill colour of nodes
+        node_shape: shape of nodes. Possible node_shape include "circle", "square", "diamond", "triangle"
+        edge_colour: colour of edges
+        node_attr: node attribute for style, overrides node_colour. Possible node attributes include {"style": "filled",
+            "fillcolor": "gold"}
+        edge_attr: edge attribute for style, overrides edge_colour. Possible edge attributes include {"style": "bold",
+            "label": "edge label", "color": "black"}
+    """
+    # Get style
+    graph_style = dict(rankdir=rankdir)
+    graph_style.update(dict(bgcolor=bg_colour) if bg_colour else {})
+    node_style = dict(style="filled", fillcolor=node_colour) if node_colour else {}
+    node_style.update({"shape": node_shape} if node_shape else {})
+    edge_style = dict(color=edge_colour) if edge_colour else {}
+
+    if not isinstance(dag, list):
+        dag = [dag]
+    for _dag in dag:
+        assertions.assert_tree_type(_dag, dagnode.DAGNode, "DAGNode")
+
+    with common.open_file(file, "w") as fp:
+        writer = DotWriter(fp, graph_attr=graph_style)
+        for _dag in dag:
+            # Traverse connected nodes, upwards and downwards, without recursion
+            visited_nodes = {_dag.node_name}
+            stack = [_dag]
+            while stack:
+                _node = stack.pop()
+                node_name = _node.node_name
+                _node_style = {"label": node_name, **node_style}
+                if node_attr and _node.get_attr(node_attr):
+                    _node_style.update(_node.get_attr(node_attr))
+                writer.add_node(node_name, _node_style)
+
+                for child in _node.children:
+                    _edge_style = edge_style.copy()
+                    if edge_attr and child.get_attr(edge_attr):
+                        _edge_style.update(child.get_attr(edge_attr))
+                    writer.add_edge(node_name, child.node_name, _edge_style)
+
+                for next_node in reversed([*_node.parents, *_node.children]):
+                    if next_node.node_name not in visited_nodes:
+                        visited_nodes.add(next_node.node_name)
+                        stack.append(next_node)
+        writer.close()
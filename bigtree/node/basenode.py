@@ -2,15 +2,13 @@ from __future__ import annotations
 
 import copy
 import heapq
-from typing import Any, Generator, Iterable, Mapping, TypeVar
+from typing import TYPE_CHECKING, Any, Generator, Iterable, Mapping, TypeVar
 
 from bigtree._globals import Globals
 from bigtree.utils import exceptions, iterators
 
-try:
+if TYPE_CHECKING:
     import matplotlib.pyplot as plt
-except ImportError:  # pragma: no cover
-    plt = None
 
 
 class BaseNode:
@@ -200,6 +198,9 @@ class BaseNode:
         current_parent = self.parent
         current_child_idx = None
 
+        # Get children of new parent before modifying tree, read-only nodes raise error here
+        new_parent_children = new_parent.__children if new_parent is not None else []
+
         # Assign new parent - rollback if error
         self.__pre_assign_parent(new_parent)
         try:
@@ -217,14 +218,14 @@ class BaseNode:
             # Assign self to new parent
             self.__parent = new_parent
             if new_parent is not None:
-                new_parent.__children.append(self)
+                new_parent_children.append(self)
 
             self.__post_assign_parent(new_parent)
 
         except Exception as exc_info:
             # Remove self from new parent
             if new_parent is not None:
-                new_parent.__children.remove(self)
+                new_parent_children.remove(self)
 
             # Reassign self to old parent
             self.__parent = current_parent
@@ -786,6 +787,58 @@ class BaseNode:
         obj.__dict__.update(self.__dict__)
         return obj
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Get state of self without parent and children, which are pickled once for the whole tree.
+
+        Returns:
+            State of node
+        """
+        state = self.__dict__.copy()
+        state["_BaseNode__parent"] = None
+        state["_BaseNode__children"] = []
+        return state
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle whole tree as flat preorder list of node states, from whichever node is pickled. Root is pickled with
+        the tree, and other nodes are pickled as position of node from root, such that nodes of the same tree are
+        unpickled into the same tree. Pickling and unpickling do not recurse, hence deep trees can be pickled.
+
+        Examples:
+            >>> import pickle
+            >>> from bigtree import Node
+            >>> root = Node("a", age=90)
+            >>> b = Node("b", age=65, parent=root)
+            >>> b_copy = pickle.loads(pickle.dumps(b))
+            >>> b_copy
+            Node(/a/b, age=65)
+            >>> b_copy.root.children
+            (Node(/a/b, age=65),)
+
+        Returns:
+            Callable and arguments to unpickle node
+        """
+        if self.parent is not None:
+            return _unpickle_child, _get_root_and_positions(self)
+        _, nodes_state = _get_nodes_state(self)
+        return _reduce_tree(nodes_state)
+
+    def __deepcopy__(self: T, memo: dict[int, Any]) -> T:
+        """Deep copy whole tree of self, return copy of self. Nodes are copied without recursion, hence deep trees can
+        be copied.
+
+        Args:
+            memo: dictionary of objects already copied
+
+        Returns:
+            Deep copy of node
+        """
+        if self.parent is not None:
+            root, child_positions = _get_root_and_positions(self)
+            return _unpickle_child(copy.deepcopy(root, memo), child_positions)
+
+        nodes, nodes_state = _get_nodes_state(self)
+        return _copy_nodes(nodes, nodes_state, memo)
+
     def __repr__(self) -> str:
         """Print format of BaseNode.
 
@@ -834,3 +887,209 @@ class BaseNode:
 
 
 T = TypeVar("T", bound=BaseNode)
+
+
+def _get_root_and_positions(tree: T) -> tuple[T, list[int]]:
+    """Get root of tree, and position of node among children of its ancestors, from root.
+
+    Args:
+        tree: node of tree
+
+    Returns:
+        Root of tree, and position of node from root
+    """
+    child_positions = []
+    _node = tree
+    while _node.parent is not None:
+        parent = _node.parent
+        child_positions.append(
+            next(idx for idx, child in enumerate(parent.children) if child is _node)
+        )
+        _node = parent
+    return _node, child_positions[::-1]
+
+
+def _get_nodes_state(
+    tree: T,
+) -> tuple[list[T], list[tuple[type[T], dict[str, Any], list[int | None]]]]:
+    """Get nodes of tree in preorder and their state, with position of children of each node in preorder, or None for
+    empty child of BinaryNode.
+
+    Args:
+        tree: root of tree
+
+    Returns:
+        Nodes in preorder, and node type, node state, and position of children of each node
+    """
+    nodes: list[T] = []
+    nodes_state: list[tuple[type[T], dict[str, Any], list[int | None]]] = []
+    stack: list[tuple[T, int, int]] = [(tree, -1, -1)]
+    while stack:
+        _node, parent_idx, child_idx = stack.pop()
+        node_idx = len(nodes)
+        if parent_idx >= 0:
+            nodes_state[parent_idx][2][child_idx] = node_idx
+        children = _node.children
+        nodes.append(_node)
+        nodes_state.append((type(_node), _node.__getstate__(), [None] * len(children)))
+        stack.extend(
+            (child, node_idx, child_idx)
+            for child_idx, child in reversed(list(enumerate(children)))
+            if child is not None
+        )
+    return nodes, nodes_state
+
+
+def _assign_children(
+    nodes: list[T], nodes_state: list[tuple[type[T], dict[str, Any], list[int | None]]]
+) -> None:
+    """Assign children of nodes from position of children of each node.
+
+    Args:
+        nodes: nodes in preorder
+        nodes_state: node type, node state, and position of children of each node
+    """
+    # Nodes are from a valid tree, hence skip checks while assigning children
+    assertions_ = Globals.ASSERTIONS
+    Globals.ASSERTIONS = False
+    try:
+        for _node, (_, _, children_idx) in zip(nodes, nodes_state):
+            if any(child_idx is not None for child_idx in children_idx):
+                _node.children = [
+                    None if child_idx is None else nodes[child_idx]
+                    for child_idx in children_idx
+                ]
+    finally:
+        Globals.ASSERTIONS = assertions_
+
+
+def _copy_nodes(
+    nodes: list[T],
+    nodes_state: list[tuple[type[T], dict[str, Any], list[int | None]]],
+    memo: dict[int, Any],
+) -> T:
+    """Deep copy nodes from their node states, return copy of root of tree.
+
+    Args:
+        nodes: nodes in preorder
+        nodes_state: node type, node state, and position of children of each node
+        memo: dictionary of objects already copied
+
+    Returns:
+        Copy of root of tree
+    """
+    # Register new nodes before copying states, such that attributes referring to nodes refer to new nodes
+    new_nodes: list[T] = []
+    for _node, (node_type, _, _) in zip(nodes, nodes_state):
+        new_node = node_type.__new__(node_type)
+        memo[id(_node)] = new_node
+        new_nodes.append(new_node)
+    for new_node, (_, state, _) in zip(new_nodes, nodes_state):
+        new_node.__dict__.update(copy.deepcopy(state, memo))
+    _assign_children(new_nodes, nodes_state)
+    return new_nodes[0]
+
+
+def _split_state(state: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Split node state into attributes that cannot refer to nodes, such as parent and children that are reset in node
+    state, and other attributes that may refer to nodes.
+
+    Args:
+        state: node state
+
+    Returns:
+        Attributes that cannot refer to nodes, and other attributes
+    """
+    structure_state: dict[str, Any] = {}
+    attrs_state: dict[str, Any] = {}
+    for key, value in state.items():
+        if (
+            value is None
+            or isinstance(value, (str, int, float))
+            or (isinstance(value, list) and all(item is None for item in value))
+        ):
+            structure_state[key] = value
+        else:
+            attrs_state[key] = value
+    return structure_state, attrs_state
+
+
+def _reduce_tree(
+    nodes_state: list[tuple[type[T], dict[str, Any], list[int | None]]],
+) -> tuple[Any, ...]:
+    """Get callable, arguments, and state to unpickle tree from node states in preorder. Tree structure is pickled
+    before attributes that may refer to nodes, such that root is already pickled and nodes referred to are pickled as
+    position of node from root.
+
+    Args:
+        nodes_state: node type, node state, and position of children of each node
+
+    Returns:
+        Callable, arguments, and state to unpickle tree
+    """
+    structure_nodes_state: list[tuple[type[T], dict[str, Any], list[int | None]]] = []
+    attrs_states: list[dict[str, Any]] = []
+    for node_type, state, children_idx in nodes_state:
+        structure_state, attrs_state = _split_state(state)
+        structure_nodes_state.append((node_type, structure_state, children_idx))
+        attrs_states.append(attrs_state)
+    if not any(attrs_states):
+        return _unpickle_tree, (structure_nodes_state,)
+    return (
+        _unpickle_tree,
+        (structure_nodes_state,),
+        attrs_states,
+        None,
+        None,
+        _set_tree_attrs,
+    )
+
+
+def _set_tree_attrs(tree: T, attrs_states: list[dict[str, Any]]) -> None:
+    """Set attributes of nodes of unpickled tree in preorder.
+
+    Args:
+        tree: root of tree
+        attrs_states: attributes of each node in preorder
+    """
+    stack = [tree]
+    for attrs_state in attrs_states:
+        _node = stack.pop()
+        _node.__dict__.update(attrs_state)
+        stack.extend(child for child in reversed(_node.children) if child is not None)
+
+
+def _unpickle_tree(
+    nodes_state: list[tuple[type[T], dict[str, Any], list[int | None]]],
+) -> T:
+    """Unpickle tree from node states in preorder, return root of tree.
+
+    Args:
+        nodes_state: node type, node state, and position of children of each node
+
+    Returns:
+        Root of tree
+    """
+    nodes: list[T] = []
+    for node_type, state, _ in nodes_state:
+        _node = node_type.__new__(node_type)
+        _node.__dict__.update(state)
+        nodes.append(_node)
+    _assign_children(nodes, nodes_state)
+    return nodes[0]
+
+
+def _unpickle_child(root: T, child_positions: list[int]) -> T:
+    """Unpickle node from root of its unpickled tree and position of node from root.
+
+    Args:
+        root: root of tree
+        child_positions: position of node among children of its ancestors, from root
+
+    Returns:
+        Node
+    """
+    _node = root
+    for child_position in child_positions:
+        _node = _node.children[child_position]
+    return _node
@@ -401,6 +401,17 @@ class BinaryNode(node.Node):
             children.sort(**kwargs)
             self.__children = children  # type: ignore
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Get state of self without parent and children, which are pickled once for the whole tree.
+
+        Returns:
+            State of node
+        """
+        state = self.__dict__.copy()
+        state["_BinaryNode__parent"] = None
+        state["_BinaryNode__children"] = [None, None]
+        return state
+
     def __repr__(self) -> str:
         """Print format of BinaryNode.
 
@@ -4,6 +4,7 @@ import copy
 from typing import Any, Generator, Iterable, Mapping, TypeVar
 
 from bigtree._globals import Globals
+from bigtree.node import basenode
 from bigtree.utils import exceptions
 
 
@@ -580,6 +581,67 @@ class DAGNode:
         obj.__dict__.update(self.__dict__)
         return obj
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Get state of self without parents and children, which are pickled once for the whole DAG.
+
+        Returns:
+            State of node
+        """
+        state = self.__dict__.copy()
+        state["_DAGNode__parents"] = []
+        state["_DAGNode__children"] = []
+        return state
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle whole DAG, all nodes connected to self, as flat list of node states, from whichever node is pickled.
+        One node of the DAG is pickled with the DAG, and other nodes are pickled as position of node from that node,
+        such that nodes of the same DAG are unpickled into the same DAG. Pickling and unpickling do not recurse, hence
+        deep DAGs can be pickled.
+
+        Examples:
+            >>> import pickle
+            >>> from bigtree import DAGNode
+            >>> a = DAGNode("a")
+            >>> b = DAGNode("b", parents=[a])
+            >>> c = DAGNode("c", parents=[a, b])
+            >>> c_copy = pickle.loads(pickle.dumps(c))
+            >>> c_copy.parents
+            (DAGNode(a, ), DAGNode(b, ))
+            >>> c_copy.parents[0].children
+            (DAGNode(b, ), DAGNode(c, ))
+
+        Returns:
+            Callable and arguments to unpickle node
+        """
+        nodes = _get_connected_nodes(self)
+        anchor = min(nodes, key=id)
+        if anchor is not self:
+            return _unpickle_connected_node, (anchor, _get_node_idx(anchor, self))
+        return _reduce_dag(_get_nodes_state(nodes))
+
+    def __deepcopy__(self: T, memo: dict[int, Any]) -> T:
+        """Deep copy whole DAG of self, return copy of self. Nodes are copied without recursion, hence deep DAGs can be
+        copied.
+
+        Args:
+            memo: dictionary of objects already copied
+
+        Returns:
+            Deep copy of node
+        """
+        # Register new nodes before copying states, such that attributes referring to nodes refer to new nodes
+        nodes = _get_connected_nodes(self)
+        nodes_state = _get_nodes_state(nodes)
+        new_nodes: list[T] = []
+        for _node, (node_type, _, _, _) in zip(nodes, nodes_state):
+            new_node = node_type.__new__(node_type)
+            memo[id(_node)] = new_node
+            new_nodes.append(new_node)
+        for new_node, (_, state, _, _) in zip(new_nodes, nodes_state):
+            new_node.__dict__.update(copy.deepcopy(state, memo))
+        _assign_parents_children(new_nodes, nodes_state)
+        return new_nodes[0]
+
     def __getitem__(self, child_name: str) -> "DAGNode":
         """Get child by name identifier.
 
@@ -656,3 +718,161 @@ class DAGNode:
 
 
 T = TypeVar("T", bound=DAGNode)
+
+
+def _get_connected_nodes(dag: T) -> list[T]:
+    """Get all nodes connected to node through parents and children, in a deterministic order starting from node.
+
+    Args:
+        dag: node of DAG
+
+    Returns:
+        Connected nodes
+    """
+    nodes: list[T] = []
+    visited: set[int] = set()
+    stack = [dag]
+    while stack:
+        _node = stack.pop()
+        if id(_node) in visited:
+            continue
+        visited.add(id(_node))
+        nodes.append(_node)
+        stack.extend(reversed(list(_node.parents)))
+        stack.extend(reversed(list(_node.children)))
+    return nodes
+
+
+def _get_node_idx(dag: T, _node: T) -> int:
+    """Get position of node among connected nodes of `dag`.
+
+    Args:
+        dag: node of DAG
+        _node: node connected to `dag`
+
+    Returns:
+        Position of node
+    """
+    return next(
+        idx
+        for idx, connected_node in enumerate(_get_connected_nodes(dag))
+        if connected_node is _node
+    )
+
+
+def _get_nodes_state(
+    nodes: list[T],
+) -> list[tuple[type[T], dict[str, Any], list[int], list[int]]]:
+    """Get state of connected nodes, with position of parents and children of each node.
+
+    Args:
+        nodes: connected nodes
+
+    Returns:
+        Node type, node state, and position of parents and children of each node
+    """
+    nodes_idx = {id(_node): idx for idx, _node in enumerate(nodes)}
+    return [
+        (
+            type(_node),
+            _node.__getstate__(),
+            [nodes_idx[id(parent)] for parent in _node.parents],
+            [nodes_idx[id(child)] for child in _node.children],
+        )
+        for _node in nodes
+    ]
+
+
+def _assign_parents_children(
+    nodes: list[T],
+    nodes_state: list[tuple[type[T], dict[str, Any], list[int], list[int]]],
+) -> None:
+    """Assign parents and children of nodes from position of parents and children of each node. Order of parents and
+    children are restored as is, hence they are assigned directly instead of with setters.
+
+    Args:
+        nodes: connected nodes
+        nodes_state: node type, node state, and position of parents and children of each node
+    """
+    for _node, (_, _, parents_idx, children_idx) in zip(nodes, nodes_state):
+        _node.__dict__["_DAGNode__parents"] = [nodes[idx] for idx in parents_idx]
+        _node.__dict__["_DAGNode__children"] = [nodes[idx] for idx in children_idx]
+
+
+def _reduce_dag(
+    nodes_state: list[tuple[type[T], dict[str, Any], list[int], list[int]]],
+) -> tuple[Any, ...]:
+    """Get callable, arguments, and state to unpickle DAG from state of connected nodes. DAG structure is pickled before
+    attributes that may refer to nodes, such that first node is already pickled and nodes referred to are pickled as
+    position of node from first node.
+
+    Args:
+        nodes_state: node type, node state, and position of parents and children of each node
+
+    Returns:
+        Callable, arguments, and state to unpickle DAG
+    """
+    structure_nodes_state: list[
+        tuple[type[T], dict[str, Any], list[int], list[int]]
+    ] = []
+    attrs_states: list[dict[str, Any]] = []
+    for node_type, state, parents_idx, children_idx in nodes_state:
+        structure_state, attrs_state = basenode._split_state(state)
+        structure_nodes_state.append(
+            (node_type, structure_state, parents_idx, children_idx)
+        )
+        attrs_states.append(attrs_state)
+    if not any(attrs_states):
+        return _unpickle_dag, (structure_nodes_state,)
+    return (
+        _unpickle_dag,
+        (structure_nodes_state,),
+        attrs_states,
+        None,
+        None,
+        _set_dag_attrs,
+    )
+
+
+def _set_dag_attrs(dag: T, attrs_states: list[dict[str, Any]]) -> None:
+    """Set attributes of connected nodes of unpickled DAG.
+
+    Args:
+        dag: first node of DAG
+        attrs_states: attributes of each connected node
+    """
+    for _node, attrs_state in zip(_get_connected_nodes(dag), attrs_states):
+        _node.__dict__.update(attrs_state)
+
+
+def _unpickle_dag(
+    nodes_state: list[tuple[type[T], dict[str, Any], list[int], list[int]]],
+) -> T:
+    """Unpickle DAG from state of connected nodes, return first node.
+
+    Args:
+        nodes_state: node type, node state, and position of parents and children of each node
+
+    Returns:
+        First node of DAG
+    """
+    nodes: list[T] = []
+    for node_type, state, _, _ in nodes_state:
+        _node = node_type.__new__(node_type)
+        _node.__dict__.update(state)
+        nodes.append(_node)
+    _assign_parents_children(nodes, nodes_state)
+    return nodes[0]
+
+
+def _unpickle_connected_node(dag: T, node_idx: int) -> T:
+    """Unpickle node from unpickled node of its DAG and position of node among connected nodes.
+
+    Args:
+        dag: node of DAG
+        node_idx: position of node in connected nodes of `dag`
+
+    Returns:
+        Node
+    """
+    return _get_connected_nodes(dag)[node_idx]
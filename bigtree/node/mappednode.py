@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import copy
+from typing import Any, Iterable, TypeVar
+
+from bigtree.node import basenode, node
+from bigtree.utils import exceptions
+
+__all__ = ["MappedNode"]
+
+T = TypeVar("T", bound="MappedNode")
+
+
+class MappedNode(node.Node):
+    """
+    MappedNode is a read-only ``Node`` of a tree that is memory-mapped from a binary snapshot, created with
+    ``mmap_tree`` instead of being instantiated directly.
+
+    Nodes are materialized only when they are traversed, for example when accessing `parent` or `children` of a node,
+    searching for a path, or iterating the tree. Each node is materialized once and reused, so a tree of MappedNode can
+    be used with the search, query, iterator, and export methods of ``Node``.
+
+    The structure and attributes are read from the mapped buffers, hence processes that map the same file share the
+    operating system page cache instead of each holding a full tree.
+
+    Structure of tree is read-only, setting `parent`, `children`, or `sep`, adding nodes to the tree, and sorting
+    children will raise TreeError. Attributes of materialized nodes can be modified, but are not written back to the
+    file. Copying a node returns a copy of the whole tree as a tree of ``Node``, with the node copied.
+
+    Examples:
+        >>> import os, tempfile
+        >>> from bigtree import Node, find_full_path, mmap_tree, save_tree
+        >>> root = Node("a", age=90)
+        >>> b = Node("b", age=65, parent=root)
+        >>> c = Node("c", age=60, parent=root)
+        >>> d = Node("d", age=40, parent=b)
+        >>> with tempfile.TemporaryDirectory() as tmp_dir:
+        ...     path = os.path.join(tmp_dir, "tree.bin")
+        ...     save_tree(root, path)
+        ...     mapped_root = mmap_tree(path)
+        >>> mapped_root
+        MappedNode(/a, age=90)
+        >>> find_full_path(mapped_root, "a/b/d").get_attr("age")
+        40
+        >>> mapped_root.show(attr_list=["age"])
+        a [age=90]
+        ├── b [age=65]
+        │   └── d [age=40]
+        └── c [age=60]
+    """
+
+    def __init__(self, tree_bytes: Any, node_idx: int):
+        self._tree_bytes = tree_bytes
+        self._node_idx = node_idx
+        self._sep = tree_bytes.sep or "/"
+        self.__dict__.update(tree_bytes.get_attrs(node_idx))
+
+    @staticmethod
+    def __raise_read_only() -> None:
+        """Raise error when modifying structure of tree."""
+        raise exceptions.TreeError(
+            "MappedNode is read-only, structure of memory-mapped tree cannot be modified"
+        )
+
+    @property
+    def sep(self) -> str:
+        """Get separator, which is the same for all nodes in memory-mapped tree.
+
+        Returns:
+            Separator
+        """
+        return self._sep
+
+    @sep.setter
+    def sep(self, value: str) -> None:
+        """Separator of memory-mapped tree cannot be set.
+
+        Args:
+            value: separator to replace default separator
+        """
+        self.__raise_read_only()
+
+    @property
+    def _BaseNode__parent(self) -> MappedNode | None:
+        """Get parent node, used when a node is assigned as parent or child of the node.
+
+        Returns:
+            Parent node, none if the node is root
+        """
+        return self.parent
+
+    @_BaseNode__parent.setter
+    def _BaseNode__parent(self, new_parent: node.Node | None) -> None:
+        """Parent of memory-mapped tree cannot be set, setting the current parent when rolling back an assignment is
+        allowed.
+
+        Args:
+            new_parent: parent node
+        """
+        if new_parent is not self.parent:
+            self.__raise_read_only()
+
+    @property
+    def _BaseNode__children(self) -> list[node.Node]:
+        """Children of memory-mapped tree cannot be modified by assigning a node as parent of the node.
+
+        Returns:
+            Child node(s)
+        """
+        self.__raise_read_only()
+        return []
+
+    @property
+    def parent(self: T) -> T | None:
+        """Get parent node, materializing it if it is not materialized.
+
+        Returns:
+            Parent node, none if the node is root
+        """
+        parent_idx = self._tree_bytes.parents[self._node_idx]
+        if parent_idx < 0:
+            return None
+        _node: T = self._tree_bytes.get_node(parent_idx)
+        return _node
+
+    @parent.setter
+    def parent(self: T, new_parent: T) -> None:
+        """Parent of memory-mapped tree cannot be set.
+
+        Args:
+            new_parent: parent node
+        """
+        self.__raise_read_only()
+
+    @property
+    def children(self: T) -> tuple[T, ...]:
+        """Get child nodes, materializing those that are not materialized.
+
+        Returns:
+            Child node(s)
+        """
+        return tuple(
+            self._tree_bytes.get_node(child_idx)
+            for child_idx in self._tree_bytes.iter_children_idx(self._node_idx)
+        )
+
+    @children.setter
+    def children(self: T, new_children: Iterable[T]) -> None:
+        """Children of memory-mapped tree cannot be set.
+
+        Args:
+            new_children: child node(s)
+        """
+        self.__raise_read_only()
+
+    @children.deleter
+    def children(self) -> None:
+        """Children of memory-mapped tree cannot be deleted."""
+        self.__raise_read_only()
+
+    @property
+    def is_leaf(self) -> bool:
+        """Get indicator if self is leaf node, without materializing children.
+
+        Returns:
+            Indicator if node is leaf node
+        """
+        return bool(self._tree_bytes.sizes[self._node_idx] == 1)
+
+    @property
+    def root(self: T) -> T:
+        """Get root node of tree, without materializing ancestors.
+
+        Returns:
+            Root node
+        """
+        _node: T = self._tree_bytes.get_node(0)
+        return _node
+
+    @property
+    def depth(self) -> int:
+        """Get depth of self, indexing starts from 1, without materializing ancestors.
+
+        Returns:
+            Depth of node
+        """
+        parents = self._tree_bytes.parents
+        depth, node_idx = 1, self._node_idx
+        while parents[node_idx] >= 0:
+            depth += 1
+            node_idx = parents[node_idx]
+        return depth
+
+    def append(self: T, other: T) -> T:
+        """Nodes cannot be added to memory-mapped tree.
+
+        Args:
+            other: other node, child to be added
+        """
+        self.__raise_read_only()
+        return self
+
+    def extend(self: T, others: list[T]) -> T:
+        """Nodes cannot be added to memory-mapped tree.
+
+        Args:
+            others: other nodes, children to be added
+        """
+        self.__raise_read_only()
+        return self
+
+    def sort(self: T, **kwargs: Any) -> T:
+        """Children of memory-mapped tree cannot be sorted.
+
+        Args:
+            kwargs: keyword arguments to list.sort()
+        """
+        self.__raise_read_only()
+        return self
+
+    def __get_nodes_state(
+        self,
+    ) -> tuple[
+        list[node.Node], list[tuple[type[node.Node], dict[str, Any], list[int | None]]]
+    ]:
+        """Get nodes of tree in preorder and their state as ``Node``, with position of children of each node in
+        preorder.
+
+        Returns:
+            Nodes in preorder, and node type, node state, and position of children of each node
+        """
+        nodes: list[node.Node] = []
+        nodes_state: list[tuple[type[node.Node], dict[str, Any], list[int | None]]] = []
+        stack: list[tuple[MappedNode, int, int]] = [(self, -1, -1)]
+        while stack:
+            _node, parent_idx, child_idx = stack.pop()
+            node_idx = len(nodes)
+            if parent_idx >= 0:
+                nodes_state[parent_idx][2][child_idx] = node_idx
+            children = _node.children
+            state = {
+                k: v
+                for k, v in _node.__dict__.items()
+                if k not in ("_tree_bytes", "_node_idx")
+            }
+            state["_BaseNode__parent"] = None
+            state["_BaseNode__children"] = []
+            nodes.append(_node)
+            nodes_state.append((node.Node, state, [None] * len(children)))
+            stack.extend(
+                (child, node_idx, child_idx)
+                for child_idx, child in reversed(list(enumerate(children)))
+            )
+        return nodes, nodes_state
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle memory-mapped tree as tree of ``Node``, which is unpickled without the memory-mapped file.
+
+        Returns:
+            Callable and arguments to unpickle node
+        """
+        if self.parent is not None:
+            return basenode._unpickle_child, basenode._get_root_and_positions(self)
+        _, nodes_state = self.__get_nodes_state()
+        return basenode._reduce_tree(nodes_state)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> node.Node:  # type: ignore[override]
+        """Deep copy memory-mapped tree as tree of ``Node``, return copy of self.
+
+        Args:
+            memo: dictionary of objects already copied
+
+        Returns:
+            Deep copy of node
+        """
+        if self.parent is not None:
+            root, child_positions = basenode._get_root_and_positions(self)
+            return basenode._unpickle_child(copy.deepcopy(root, memo), child_positions)
+        nodes, nodes_state = self.__get_nodes_state()
+        return basenode._copy_nodes(nodes, nodes_state, memo)
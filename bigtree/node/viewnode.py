@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import copy
+from typing import Any, Callable, Iterable, TypeVar
+
+from bigtree.node import basenode, node
+from bigtree.utils import exceptions
+
+__all__ = ["ViewNode"]
+
+T = TypeVar("T", bound="ViewNode")
+
+
+class ViewNode(node.Node):
+    """
+    ViewNode is a read-only view of a ``Node`` and its descendants, up to a maximum depth and optionally filtered by a
+    condition, created with ``get_subtree_view`` instead of being instantiated directly.
+
+    Nodes are not copied. Each node of the view wraps a node of the viewed tree and is created only when it is
+    traversed, hence getting a view of the top levels of a large tree is proportional to the size of the view. The
+    view root becomes the root of the view with depth 1, and attributes are read from the viewed nodes, so a tree of
+    ViewNode can be printed and exported like a tree of ``Node``.
+
+    Nodes of the view are instances of a subclass of both ``ViewNode`` and the viewed node type, hence properties and
+    methods overridden by the viewed node type, such as `node_name`, are used by the view.
+
+    Structure of view is read-only, setting `parent`, `children`, or `sep`, adding nodes to the view, and sorting
+    children will raise TreeError.
+    Attributes set on nodes of the view are not written to the viewed nodes. Copying the view returns a copy of the
+    viewed nodes, as a tree of their node type.
+
+    Examples:
+        >>> from bigtree import Node, get_subtree_view
+        >>> root = Node("a", age=90)
+        >>> b = Node("b", age=65, parent=root)
+        >>> c = Node("c", age=60, parent=root)
+        >>> d = Node("d", age=40, parent=b)
+        >>> b_view = get_subtree_view(root, "b")
+        >>> b_view
+        ViewNode(/b, age=65)
+        >>> b_view.show(attr_list=["age"])
+        b [age=65]
+        └── d [age=40]
+        >>> b_view.children[0].viewed_node is d
+        True
+    """
+
+    def __new__(cls, _node: node.Node | None = None, *args: Any, **kwargs: Any) -> Any:
+        """Create node of view, as an instance of the view class of viewed node type.
+
+        Args:
+            _node: viewed node
+
+        Returns:
+            Node of view
+        """
+        if cls is ViewNode and _node is not None:
+            cls = _get_view_class(type(_node))
+        return super().__new__(cls)
+
+    def __init__(
+        self,
+        _node: node.Node,
+        max_depth: int = 0,
+        filter_condition: Callable[[node.Node], bool] | None = None,
+        sep: str | None = None,
+    ):
+        self._view_node = _node
+        self._view_max_depth = max_depth
+        self._view_filter_condition = filter_condition
+        self._view_sep = sep if sep is not None else _node.sep
+        self._view_parent: ViewNode | None = None
+        self._view_children: tuple[ViewNode | None, ...] | None = None
+        self._view_depth = 1
+
+    def __getattr__(self, name: str) -> Any:
+        """Get attribute of viewed node, if it is not set on the view.
+
+        Args:
+            name: attribute name
+
+        Returns:
+            Attribute value
+        """
+        # Private attributes of viewed node that store tree structure are not shared with the view
+        if name.startswith(("_view", "_BaseNode__")):
+            raise AttributeError(name)
+        return getattr(self._view_node, name)
+
+    @staticmethod
+    def __raise_read_only() -> None:
+        """Raise error when modifying structure of view."""
+        raise exceptions.TreeError(
+            "ViewNode is read-only, structure of view cannot be modified"
+        )
+
+    @property
+    def _BaseNode__parent(self) -> ViewNode | None:
+        """Get parent node in view, used when a node is assigned as parent or child of the view.
+
+        Returns:
+            Parent node, none if the node is view root
+        """
+        return self._view_parent
+
+    @_BaseNode__parent.setter
+    def _BaseNode__parent(self, new_parent: node.Node | None) -> None:
+        """Parent of view cannot be set, setting the current parent when rolling back an assignment is allowed.
+
+        Args:
+            new_parent: parent node
+        """
+        if new_parent is not self._view_parent:
+            self.__raise_read_only()
+
+    @property
+    def _BaseNode__children(self) -> list[node.Node]:
+        """Children of view cannot be modified by assigning a node as parent of the view.
+
+        Returns:
+            Child node(s)
+        """
+        self.__raise_read_only()
+        return []
+
+    @property
+    def viewed_node(self) -> node.Node:
+        """Get viewed node.
+
+        Returns:
+            Viewed node
+        """
+        return self._view_node
+
+    @property
+    def sep(self) -> str:
+        """Get separator, which is the separator of the viewed node at the view root.
+
+        Returns:
+            Separator
+        """
+        return self._view_sep
+
+    @sep.setter
+    def sep(self, value: str) -> None:
+        """Separator of view cannot be set.
+
+        Args:
+            value: separator to replace default separator
+        """
+        self.__raise_read_only()
+
+    @property
+    def parent(self: T) -> T | None:
+        """Get parent node in view, the view root has no parent.
+
+        Returns:
+            Parent node, none if the node is view root
+        """
+        return self._view_parent  # type: ignore[return-value]
+
+    @parent.setter
+    def parent(self: T, new_parent: T) -> None:
+        """Parent of view cannot be set.
+
+        Args:
+            new_parent: parent node
+        """
+        self.__raise_read_only()
+
+    @property
+    def children(self: T) -> tuple[T, ...]:
+        """Get child nodes in view, wrapping children of viewed node that are within maximum depth and fulfil filter
+        condition. Child nodes are wrapped once and reused.
+
+        Returns:
+            Child node(s)
+        """
+        if self._view_children is None:
+            view_children: list[ViewNode | None] = []
+            if not self._view_max_depth or self._view_depth < self._view_max_depth:
+                filter_condition = self._view_filter_condition
+                for child in self._view_node.children:
+                    if child is None:
+                        # For binary node
+                        view_children.append(None)
+                    elif filter_condition is None or filter_condition(child):
+                        view_child = ViewNode(
+                            child,
+                            self._view_max_depth,
+                            filter_condition,
+                            self._view_sep,
+                        )
+                        view_child._view_parent = self
+                        view_child._view_depth = self._view_depth + 1
+                        view_children.append(view_child)
+            self._view_children = tuple(view_children)
+        return self._view_children  # type: ignore[return-value]
+
+    @children.setter
+    def children(self: T, new_children: Iterable[T]) -> None:
+        """Children of view cannot be set.
+
+        Args:
+            new_children: child node(s)
+        """
+        self.__raise_read_only()
+
+    @children.deleter
+    def children(self) -> None:
+        """Children of view cannot be deleted."""
+        self.__raise_read_only()
+
+    @property
+    def root(self: T) -> T:
+        """Get view root, without recursion.
+
+        Returns:
+            Root node
+        """
+        _node = self
+        while _node._view_parent is not None:
+            _node = _node._view_parent  # type: ignore[assignment]
+        return _node
+
+    @property
+    def depth(self) -> int:
+        """Get depth of self in view, indexing starts from 1 at the view root.
+
+        Returns:
+            Depth of node
+        """
+        return self._view_depth
+
+    def rename(self, name: str) -> None:
+        """Nodes of view cannot be renamed.
+
+        Args:
+            name: new node name
+        """
+        self.__raise_read_only()
+
+    def append(self: T, other: T) -> T:
+        """Nodes cannot be added to view.
+
+        Args:
+            other: other node, child to be added
+        """
+        self.__raise_read_only()
+        return self
+
+    def extend(self: T, others: list[T]) -> T:
+        """Nodes cannot be added to view.
+
+        Args:
+            others: other nodes, children to be added
+        """
+        self.__raise_read_only()
+        return self
+
+    def sort(self: T, **kwargs: Any) -> T:
+        """Children of view cannot be sorted.
+
+        Args:
+            kwargs: keyword arguments to list.sort()
+        """
+        self.__raise_read_only()
+        return self
+
+    def describe(
+        self, exclude_attributes: Iterable[str] = (), exclude_prefix: str = ""
+    ) -> list[tuple[str, Any]]:
+        """Get information of viewed node sorted by attribute name, returns list of tuples. Attributes set on the view
+        take precedence over attributes of the viewed node.
+
+        Args:
+            exclude_attributes: attributes to exclude
+            exclude_prefix: prefix of attributes to exclude
+
+        Returns:
+            List of attribute name and attribute value pairs
+        """
+        attrs = {
+            **self._view_node.__dict__,
+            **{k: v for k, v in self.__dict__.items() if not k.startswith("_view")},
+        }
+        return [
+            item
+            for item in sorted(attrs.items(), key=lambda item: item[0])
+            if (item[0] not in exclude_attributes)
+            and (not len(exclude_prefix) or not item[0].startswith(exclude_prefix))
+        ]
+
+    def __get_nodes_state(
+        self,
+    ) -> tuple[
+        list[node.Node], list[tuple[type[node.Node], dict[str, Any], list[int | None]]]
+    ]:
+        """Get viewed nodes of view in preorder and their state, with position of children of each node in preorder.
+
+        Returns:
+            Viewed nodes in preorder, and node type, node state, and position of children of each node
+        """
+        nodes: list[node.Node] = []
+        nodes_state: list[tuple[type[node.Node], dict[str, Any], list[int | None]]] = []
+        stack: list[tuple[ViewNode, int, int]] = [(self, -1, -1)]
+        while stack:
+            _node, parent_idx, child_idx = stack.pop()
+            node_idx = len(nodes)
+            if parent_idx >= 0:
+                nodes_state[parent_idx][2][child_idx] = node_idx
+            children = _node.children
+            state = _node._view_node.__getstate__()
+            state.update(
+                (k, v) for k, v in _node.__dict__.items() if not k.startswith("_view")
+            )
+            state["_sep"] = self._view_sep
+            nodes.append(_node._view_node)
+            nodes_state.append((type(_node._view_node), state, [None] * len(children)))
+            stack.extend(
+                (child, node_idx, child_idx)
+                for child_idx, child in reversed(list(enumerate(children)))
+                if child is not None
+            )
+        return nodes, nodes_state
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle view as tree of viewed nodes, which is unpickled into a tree of the viewed node type.
+
+        Returns:
+            Callable and arguments to unpickle node
+        """
+        if self.parent is not None:
+            return basenode._unpickle_child, basenode._get_root_and_positions(self)
+        _, nodes_state = self.__get_nodes_state()
+        return basenode._reduce_tree(nodes_state)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> node.Node:  # type: ignore[override]
+        """Deep copy view as tree of viewed nodes, return copy of self as the viewed node type.
+
+        Args:
+            memo: dictionary of objects already copied
+
+        Returns:
+            Deep copy of node
+        """
+        if self.parent is not None:
+            root, child_positions = basenode._get_root_and_positions(self)
+            return basenode._unpickle_child(copy.deepcopy(root, memo), child_positions)
+        nodes, nodes_state = self.__get_nodes_state()
+        return basenode._copy_nodes(nodes, nodes_state, memo)
+
+
+_VIEW_CLASSES: dict[type[node.Node], type[ViewNode]] = {}
+
+
+def _get_view_class(node_type: type[node.Node]) -> type[ViewNode]:
+    """Get view class of node type, which is a subclass of both ``ViewNode`` and the node type. Properties and methods
+    of ``ViewNode`` take precedence, while other properties and methods overridden by the node type are kept. View
+    class is created once for each node type.
+
+    Args:
+        node_type: type of viewed node
+
+    Returns:
+        View class of node type
+    """
+    if node_type is node.Node or issubclass(node_type, ViewNode):
+        return ViewNode
+    if node_type not in _VIEW_CLASSES:
+        _VIEW_CLASSES[node_type] = type(
+            f"View{node_type.__name__}", (ViewNode, node_type), {}
+        )
+    return _VIEW_CLASSES[node_type]
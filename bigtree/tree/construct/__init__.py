@@ -1,25 +1,69 @@
-from .dataframes import (
-    add_dataframe_to_tree_by_name,
-    add_dataframe_to_tree_by_path,
-    add_polars_to_tree_by_name,
-    add_polars_to_tree_by_path,
-    dataframe_to_tree,
-    dataframe_to_tree_by_relation,
-    polars_to_tree,
-    polars_to_tree_by_relation,
-)
-from .dictionaries import (
-    add_dict_to_tree_by_name,
-    add_dict_to_tree_by_path,
-    dict_to_tree,
-    nested_dict_key_to_tree,
-    nested_dict_to_tree,
-)
-from .lists import list_to_tree, list_to_tree_by_relation
-from .render import render_tree
-from .strings import add_path_to_tree, newick_to_tree, rich_to_tree, str_to_tree
+from typing import TYPE_CHECKING
+
+from bigtree._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from bigtree.tree.construct.binary import bytes_to_tree, load_tree, mmap_tree
+    from bigtree.tree.construct.dataframes import (
+        add_dataframe_to_tree_by_name,
+        add_dataframe_to_tree_by_path,
+        add_polars_to_tree_by_name,
+        add_polars_to_tree_by_path,
+        dataframe_to_tree,
+        dataframe_to_tree_by_relation,
+        polars_to_tree,
+        polars_to_tree_by_relation,
+    )
+    from bigtree.tree.construct.dictionaries import (
+        add_dict_to_tree_by_name,
+        add_dict_to_tree_by_path,
+        dict_to_tree,
+        nested_dict_key_to_tree,
+        nested_dict_to_tree,
+    )
+    from bigtree.tree.construct.lists import list_to_tree, list_to_tree_by_relation
+    from bigtree.tree.construct.render import render_tree
+    from bigtree.tree.construct.streams import csv_to_tree, iter_to_tree, jsonl_to_tree
+    from bigtree.tree.construct.strings import (
+        add_path_to_tree,
+        newick_to_tree,
+        rich_to_tree,
+        str_to_tree,
+    )
+
+_LAZY_EXPORTS = {
+    "bytes_to_tree": "bigtree.tree.construct.binary",
+    "load_tree": "bigtree.tree.construct.binary",
+    "mmap_tree": "bigtree.tree.construct.binary",
+    "add_dataframe_to_tree_by_name": "bigtree.tree.construct.dataframes",
+    "add_dataframe_to_tree_by_path": "bigtree.tree.construct.dataframes",
+    "add_polars_to_tree_by_name": "bigtree.tree.construct.dataframes",
+    "add_polars_to_tree_by_path": "bigtree.tree.construct.dataframes",
+    "dataframe_to_tree": "bigtree.tree.construct.dataframes",
+    "dataframe_to_tree_by_relation": "bigtree.tree.construct.dataframes",
+    "polars_to_tree": "bigtree.tree.construct.dataframes",
+    "polars_to_tree_by_relation": "bigtree.tree.construct.dataframes",
+    "add_dict_to_tree_by_name": "bigtree.tree.construct.dictionaries",
+    "add_dict_to_tree_by_path": "bigtree.tree.construct.dictionaries",
+    "dict_to_tree": "bigtree.tree.construct.dictionaries",
+    "nested_dict_key_to_tree": "bigtree.tree.construct.dictionaries",
+    "nested_dict_to_tree": "bigtree.tree.construct.dictionaries",
+    "list_to_tree": "bigtree.tree.construct.lists",
+    "list_to_tree_by_relation": "bigtree.tree.construct.lists",
+    "render_tree": "bigtree.tree.construct.render",
+    "csv_to_tree": "bigtree.tree.construct.streams",
+    "iter_to_tree": "bigtree.tree.construct.streams",
+    "jsonl_to_tree": "bigtree.tree.construct.streams",
+    "add_path_to_tree": "bigtree.tree.construct.strings",
+    "newick_to_tree": "bigtree.tree.construct.strings",
+    "rich_to_tree": "bigtree.tree.construct.strings",
+    "str_to_tree": "bigtree.tree.construct.strings",
+}
 
 __all__ = [
+    "bytes_to_tree",
+    "load_tree",
+    "mmap_tree",
     "add_dataframe_to_tree_by_name",
     "add_dataframe_to_tree_by_path",
     "add_polars_to_tree_by_name",
@@ -36,8 +80,13 @@ __all__ = [
     "list_to_tree",
     "list_to_tree_by_relation",
     "render_tree",
+    "csv_to_tree",
+    "iter_to_tree",
+    "jsonl_to_tree",
     "add_path_to_tree",
     "newick_to_tree",
     "rich_to_tree",
     "str_to_tree",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
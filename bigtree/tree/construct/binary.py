@@ -0,0 +1,424 @@
+from __future__ import annotations
+
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+from typing import IO, Any, Iterator, TypeVar
+
+from bigtree._globals import Globals
+from bigtree.node import mappednode, node
+from bigtree.utils import common
+from bigtree.utils.constants import BinaryConstants
+
+__all__ = [
+    "bytes_to_tree",
+    "load_tree",
+    "mmap_tree",
+]
+
+T = TypeVar("T", bound=node.Node)
+
+
+class _TreeBytes:
+    """Sections of tree bytes, read as views of the underlying buffer without copying or decoding data. Refer to
+    ``BinaryConstants`` for the binary layout.
+
+    Args:
+        data: tree bytes, or any object supporting the buffer protocol such as memory-mapped file
+    """
+
+    def __init__(self, data: Any):
+        self.view = memoryview(data).cast("B")
+        self.offset = 0
+
+        header_size = struct.calcsize(BinaryConstants.HEADER_FORMAT)
+        (
+            magic,
+            version,
+            _,
+            n_columns,
+            sep_idx,
+            _,
+            self.n_nodes,
+            self.n_strings,
+        ) = struct.unpack(
+            BinaryConstants.HEADER_FORMAT, self._take(header_size, "header")
+        )
+        if magic != BinaryConstants.MAGIC:
+            raise ValueError(
+                "Invalid tree bytes, data does not start with header of tree bytes"
+            )
+        if version > BinaryConstants.VERSION:
+            raise ValueError(
+                f"Unsupported tree bytes version {version}, supported version is up to {BinaryConstants.VERSION}"
+            )
+
+        # String table
+        self.string_offsets = self._cast(
+            self._take(8 * (self.n_strings + 1), "string table"), "Q"
+        )
+        self.strings = self._take(self.string_offsets[-1], "string table")
+        self.decoded_strings: list[str] | None = None
+        self.sep = (
+            None if sep_idx == BinaryConstants.NO_INDEX else self.get_string(sep_idx)
+        )
+
+        # Structure
+        self.parents = self._cast(self._take(8 * self.n_nodes, "structure"), "q")
+        self.sizes = self._cast(self._take(8 * self.n_nodes, "structure"), "q")
+
+        # Columns
+        self.columns: list[tuple[str, bytes, memoryview, memoryview]] = []
+        column_header_size = struct.calcsize(BinaryConstants.COLUMN_FORMAT)
+        for _ in range(n_columns):
+            name_idx, type_code, data_length = struct.unpack(
+                BinaryConstants.COLUMN_FORMAT, self._take(column_header_size, "column")
+            )
+            mask = self._take(self.n_nodes, "column")
+            column_data = self._take(data_length, "column")
+            self.columns.append(
+                (self.get_string(name_idx), type_code, mask, column_data)
+            )
+
+    def _take(self, length: int, section: str) -> memoryview:
+        """Get view of the next `length` bytes, and skip the padding after it.
+
+        Args:
+            length: number of bytes
+            section: name of section, for error message
+
+        Returns:
+            View of bytes
+        """
+        start, self.offset = self.offset, self.offset + length
+        if self.offset > len(self.view):
+            raise ValueError(f"Invalid tree bytes, data is truncated at {section}")
+        self.offset += -length % 8
+        return self.view[start : start + length]
+
+    @staticmethod
+    def _cast(view: memoryview, type_code: str) -> Any:
+        """Cast view of little-endian bytes to sequence of values.
+
+        Args:
+            view: view of bytes
+            type_code: array type code of values
+
+        Returns:
+            Sequence of values, supporting indexing and ``tolist()``
+        """
+        if sys.byteorder != "little":  # pragma: no cover
+            values = array(type_code, view)
+            values.byteswap()
+            return values
+        return view.cast(type_code)  # type: ignore[call-overload]
+
+    def get_string(self, idx: int) -> str:
+        """Get string from string table.
+
+        Args:
+            idx: index of string
+
+        Returns:
+            String
+        """
+        return bytes(
+            self.strings[self.string_offsets[idx] : self.string_offsets[idx + 1]]
+        ).decode("utf-8", errors="surrogatepass")
+
+    def get_column_values(self, type_code: bytes, column_data: memoryview) -> list[Any]:
+        """Get values of column. Typed columns have one value for every node, object columns have one value for every
+        node with value.
+
+        Args:
+            type_code: type code of column
+            column_data: view of column data
+
+        Returns:
+            Values of column
+        """
+        if type_code == BinaryConstants.TYPE_OBJECT:
+            values: list[Any] = pickle.loads(column_data)
+            return values
+        if type_code == BinaryConstants.TYPE_BOOL:
+            return [bool(value) for value in column_data]
+        if type_code == BinaryConstants.TYPE_STR:
+            if self.decoded_strings is None:
+                self.decoded_strings = [
+                    self.get_string(idx) for idx in range(self.n_strings)
+                ]
+            strings = self.decoded_strings
+            return [strings[idx] for idx in self._cast(column_data, "I")]
+        if type_code in (BinaryConstants.TYPE_INT, BinaryConstants.TYPE_FLOAT):
+            values = self._cast(column_data, type_code.decode()).tolist()
+            return values
+        raise ValueError(f"Invalid tree bytes, unknown column type {type_code!r}")
+
+
+class _MappedTreeBytes(_TreeBytes):
+    """Tree bytes that materialize ``MappedNode`` on demand, reading structure and attributes of a single node from the
+    underlying buffer.
+
+    Args:
+        data: tree bytes, or any object supporting the buffer protocol such as memory-mapped file
+    """
+
+    def __init__(self, data: Any):
+        super().__init__(data)
+        self.nodes: dict[int, mappednode.MappedNode] = {}
+        self.column_values: list[Any] = []
+        for _, type_code, _, column_data in self.columns:
+            if type_code == BinaryConstants.TYPE_STR:
+                self.column_values.append(self._cast(column_data, "I"))
+            elif type_code in (BinaryConstants.TYPE_INT, BinaryConstants.TYPE_FLOAT):
+                self.column_values.append(self._cast(column_data, type_code.decode()))
+            else:
+                self.column_values.append(column_data)
+        self.object_columns: dict[int, tuple[list[Any], list[int]]] = {}
+
+    def get_node(self, node_idx: int) -> mappednode.MappedNode:
+        """Get node, materializing it if it is not materialized.
+
+        Args:
+            node_idx: index of node in preorder
+
+        Returns:
+            Node
+        """
+        _node = self.nodes.get(node_idx)
+        if _node is None:
+            _node = self.nodes[node_idx] = mappednode.MappedNode(self, node_idx)
+        return _node
+
+    def iter_children_idx(self, node_idx: int) -> Iterator[int]:
+        """Iterate index of children, by skipping the subtree of each child in preorder.
+
+        Args:
+            node_idx: index of node in preorder
+
+        Returns:
+            Index of child nodes
+        """
+        sizes = self.sizes
+        child_idx, end_idx = node_idx + 1, node_idx + sizes[node_idx]
+        while child_idx < end_idx:
+            yield child_idx
+            child_idx += sizes[child_idx]
+
+    def get_attrs(self, node_idx: int) -> dict[str, Any]:
+        """Get attributes of node.
+
+        Args:
+            node_idx: index of node in preorder
+
+        Returns:
+            Attribute name and attribute value of node
+        """
+        attrs: dict[str, Any] = {}
+        for column_idx, (attr_name, type_code, mask, _) in enumerate(self.columns):
+            flag = mask[node_idx]
+            if flag == BinaryConstants.MASK_ABSENT:
+                continue
+            if flag == BinaryConstants.MASK_NONE:
+                attrs[attr_name] = None
+                continue
+            values = self.column_values[column_idx]
+            if type_code == BinaryConstants.TYPE_BOOL:
+                attrs[attr_name] = bool(values[node_idx])
+            elif type_code == BinaryConstants.TYPE_STR:
+                attrs[attr_name] = self.get_string(values[node_idx])
+            elif type_code == BinaryConstants.TYPE_OBJECT:
+                attrs[attr_name] = self.get_object(column_idx, node_idx)
+            else:
+                attrs[attr_name] = values[node_idx]
+        return attrs
+
+    def get_object(self, column_idx: int, node_idx: int) -> Any:
+        """Get value of node in object column, object column is unpickled when it is first accessed.
+
+        Args:
+            column_idx: index of column
+            node_idx: index of node in preorder
+
+        Returns:
+            Attribute value of node
+        """
+        if column_idx not in self.object_columns:
+            _, type_code, mask, column_data = self.columns[column_idx]
+            positions, position = [], 0
+            for flag in mask:
+                positions.append(position)
+                position += flag == BinaryConstants.MASK_VALUE
+            self.object_columns[column_idx] = (
+                self.get_column_values(type_code, column_data),
+                positions,
+            )
+        values, positions = self.object_columns[column_idx]
+        return values[positions[node_idx]]
+
+
+def _iter_column(
+    tree_bytes: _TreeBytes, type_code: bytes, mask: memoryview, column_data: memoryview
+) -> Iterator[tuple[int, Any]]:
+    """Iterate index and value of nodes with the attribute in column.
+
+    Args:
+        tree_bytes: sections of tree bytes
+        type_code: type code of column
+        mask: view of mask of column
+        column_data: view of column data
+
+    Returns:
+        Index of node and attribute value
+    """
+    values = tree_bytes.get_column_values(type_code, column_data)
+    if type_code == BinaryConstants.TYPE_OBJECT:
+        iter_values = iter(values)
+        for node_idx, flag in enumerate(mask):
+            if flag == BinaryConstants.MASK_VALUE:
+                yield node_idx, next(iter_values)
+            elif flag == BinaryConstants.MASK_NONE:
+                yield node_idx, None
+    elif mask == b"\x01" * len(mask):
+        yield from enumerate(values)
+    else:
+        for node_idx, flag in enumerate(mask):
+            if flag == BinaryConstants.MASK_VALUE:
+                yield node_idx, values[node_idx]
+            elif flag == BinaryConstants.MASK_NONE:
+                yield node_idx, None
+
+
+def bytes_to_tree(
+    data: bytes,
+    node_type: type[T] = node.Node,  # type: ignore[assignment]
+) -> T:
+    """Construct tree from compact binary snapshot exported with ``tree_to_bytes``, return root of tree.
+
+    Nodes are constructed from the attribute columns, and attached to their parent in preorder without recursion.
+    Object columns are unpickled, hence only load bytes from trusted sources.
+
+    Examples:
+        >>> from bigtree import Node, bytes_to_tree, tree_to_bytes
+        >>> root = Node("a", age=90)
+        >>> b = Node("b", age=65, parent=root)
+        >>> c = Node("c", age=60, parent=root)
+        >>> d = Node("d", age=40, parent=b)
+        >>> root = bytes_to_tree(tree_to_bytes(root))
+        >>> root.show(attr_list=["age"])
+        a [age=90]
+        ├── b [age=65]
+        │   └── d [age=40]
+        └── c [age=60]
+
+    Args:
+        data: binary snapshot of tree, or any object supporting the buffer protocol
+        node_type: node type of tree to be created, defaults to ``Node``
+
+    Returns:
+        Node
+    """
+    tree_bytes = _TreeBytes(data)
+    n_nodes = tree_bytes.n_nodes
+    if not n_nodes:
+        raise ValueError("Invalid tree bytes, data does not contain any node")
+
+    node_attrs: list[dict[str, Any]] = [{} for _ in range(n_nodes)]
+    for attr_name, type_code, mask, column_data in tree_bytes.columns:
+        for node_idx, attr_value in _iter_column(
+            tree_bytes, type_code, mask, column_data
+        ):
+            node_attrs[node_idx][attr_name] = attr_value
+    # Snapshot is exported from a valid tree, hence skip checks while constructing and attaching nodes
+    parents = tree_bytes.parents
+    assertions_ = Globals.ASSERTIONS
+    Globals.ASSERTIONS = False
+    try:
+        nodes = [node_type(**attrs) for attrs in node_attrs]
+        for node_idx in range(1, n_nodes):
+            parent_idx = parents[node_idx]
+            if not 0 <= parent_idx < node_idx:
+                raise ValueError(
+                    f"Invalid tree bytes, parent of node {node_idx} is not before node in preorder"
+                )
+            nodes[node_idx].parent = nodes[parent_idx]
+    finally:
+        Globals.ASSERTIONS = assertions_
+
+    root_node = nodes[0]
+    if tree_bytes.sep is not None and isinstance(root_node, node.Node):
+        root_node.sep = tree_bytes.sep
+    return root_node
+
+
+def load_tree(
+    file: str | os.PathLike[str] | IO[bytes],
+    node_type: type[T] = node.Node,  # type: ignore[assignment]
+) -> T:
+    """Load tree from file saved with ``save_tree``, return root of tree.
+
+    Refer to ``bytes_to_tree`` for constructing tree from binary snapshot.
+
+    Examples:
+        >>> import io
+        >>> from bigtree import Node, load_tree, save_tree
+        >>> root = Node("a", age=90)
+        >>> b = Node("b", age=65, parent=root)
+        >>> tree_file = io.BytesIO()
+        >>> save_tree(root, tree_file)
+        >>> _ = tree_file.seek(0)
+        >>> load_tree(tree_file).show(attr_list=["age"])
+        a [age=90]
+        └── b [age=65]
+
+    Args:
+        file: path of file, or file object opened in binary mode
+        node_type: node type of tree to be created, defaults to ``Node``
+
+    Returns:
+        Node
+    """
+    with common.open_file(file, "rb") as fp:
+        data = fp.read()
+    return bytes_to_tree(data, node_type=node_type)
+
+
+def mmap_tree(file: str | os.PathLike[str] | IO[bytes]) -> mappednode.MappedNode:
+    """Open tree saved with ``save_tree`` as read-only memory-mapped tree, return root of tree.
+
+    Nodes are materialized as ``MappedNode`` only when they are traversed, reading their structure and attributes
+    directly from the memory-mapped file. Processes that map the same file share the operating system page cache, and
+    memory usage grows with the number of traversed nodes instead of the size of tree. Object columns are unpickled
+    when they are first accessed, hence only open files from trusted sources.
+
+    Examples:
+        >>> import os, tempfile
+        >>> from bigtree import Node, mmap_tree, save_tree
+        >>> root = Node("a", age=90)
+        >>> b = Node("b", age=65, parent=root)
+        >>> c = Node("c", age=60, parent=root)
+        >>> d = Node("d", age=40, parent=b)
+        >>> with tempfile.TemporaryDirectory() as tmp_dir:
+        ...     path = os.path.join(tmp_dir, "tree.bin")
+        ...     save_tree(root, path)
+        ...     mapped_root = mmap_tree(path)
+        >>> [_node.node_name for _node in mapped_root.children]
+        ['b', 'c']
+        >>> mapped_root["b"]["d"].path_name
+        '/a/b/d'
+
+    Args:
+        file: path of file, or file object opened in binary mode that supports ``fileno()``
+
+    Returns:
+        MappedNode
+    """
+    with common.open_file(file, "rb") as fp:
+        data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    tree_bytes = _MappedTreeBytes(data)
+    if not tree_bytes.n_nodes:
+        raise ValueError("Invalid tree bytes, data does not contain any node")
+    return tree_bytes.get_node(0)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any, Mapping, TypeVar
 
 from bigtree.node import node
-from bigtree.tree.construct.strings import add_path_to_tree
+from bigtree.tree.construct.strings import _assign_new_parent, add_path_to_tree
 from bigtree.utils import assertions, common
 
 __all__ = [
@@ -278,14 +278,17 @@ def nested_dict_to_tree(
     """
     assertions.assert_length_not_empty(node_attrs, "Dictionary", "node_attrs")
 
-    def _recursive_add_child(
-        child_dict: Mapping[str, Any], parent_node: T | None = None
+    def _add_child(
+        child_dict: Mapping[str, Any],
+        parent_node: T | None = None,
+        sibling_names: set[str] | None = None,
     ) -> T:
-        """Recursively add child to tree, given child attributes and parent node.
+        """Add child to tree, given child attributes and parent node. Children of child are added to stack.
 
         Args:
             child_dict: child to be added to tree, from dictionary
             parent_node: parent node to be assigned to child node
+            sibling_names: names of children of parent node added so far
 
         Returns:
             Node
@@ -297,12 +300,19 @@ def nested_dict_to_tree(
             raise TypeError(
                 f"child_key {child_key} should be List type, received {node_children}"
             )
-        root = node_type(node_name, parent=parent_node, **child_dict)
-        for _child in node_children:
-            _recursive_add_child(_child, parent_node=root)
-        return root
+        _node = node_type(node_name, **child_dict)
+        if parent_node is not None and sibling_names is not None:
+            _assign_new_parent(_node, parent_node, sibling_names)
+        children_names: set[str] = set()
+        stack.extend(
+            (_child, _node, children_names) for _child in reversed(node_children)
+        )
+        return _node
 
-    root_node = _recursive_add_child(node_attrs)
+    stack: list[tuple[Mapping[str, Any], T, set[str]]] = []
+    root_node = _add_child(node_attrs)
+    while stack:
+        _add_child(*stack.pop())
     return root_node
 
 
@@ -388,10 +398,10 @@ def nested_dict_key_to_tree(
     """
     assertions.assert_length(node_attrs, 1, "Dictionary", "node_attrs")
 
-    def _recursive_add_child(
+    def _add_child(
         child_name: str, child_dict: Mapping[str, Any], parent_node: T | None = None
     ) -> T:
-        """Recursively add child to tree, given child attributes and parent node.
+        """Add child to tree, given child attributes and parent node. Children of child are added to stack.
 
         Args:
             child_name: child name to be added to tree
@@ -411,13 +421,18 @@ def nested_dict_key_to_tree(
             raise TypeError(
                 f"child_key {child_key} should be Dict type, received {node_children}"
             )
-        root = node_type(child_name, parent=parent_node, **child_dict)
-        for _child_name in node_children:
-            _recursive_add_child(
-                _child_name, node_children[_child_name], parent_node=root
-            )
-        return root
+        _node = node_type(child_name, **child_dict)
+        if parent_node is not None:
+            _assign_new_parent(_node, parent_node)
+        stack.extend(
+            (_child_name, node_children[_child_name], _node)
+            for _child_name in reversed(list(node_children))
+        )
+        return _node
 
+    stack: list[tuple[str, Mapping[str, Any], T]] = []
     root_node_name = list(node_attrs.keys())[0]
-    root_node = _recursive_add_child(root_node_name, node_attrs[root_node_name])
+    root_node = _add_child(root_node_name, node_attrs[root_node_name])
+    while stack:
+        _add_child(*stack.pop())
     return root_node
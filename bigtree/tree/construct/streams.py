@@ -0,0 +1,535 @@
+from __future__ import annotations
+
+import csv
+import itertools
+import json
+import os
+from typing import IO, Any, Callable, Iterable, Iterator, Mapping, TypeVar
+
+from bigtree._globals import Globals
+from bigtree.node import node
+from bigtree.tree.construct.strings import _add_path_to_tree
+from bigtree.utils import assertions, common, exceptions
+
+__all__ = [
+    "csv_to_tree",
+    "jsonl_to_tree",
+    "iter_to_tree",
+]
+
+T = TypeVar("T", bound=node.Node)
+
+
+def csv_to_tree(
+    file: str | os.PathLike[str] | IO[str],
+    path_col: str | None = None,
+    child_col: str | None = None,
+    parent_col: str | None = None,
+    attribute_cols: list[str] | None = None,
+    sep: str = "/",
+    duplicate_name_allowed: bool = True,
+    delimiter: str = ",",
+    chunk_size: int = 10_000,
+    progress: Callable[[int], Any] | None = None,
+    node_type: type[T] = node.Node,  # type: ignore[assignment]
+) -> T:
+    """Construct tree from csv file, return root of tree. Rows are read from the file in chunks of `chunk_size` rows and
+    added to the tree incrementally, so the whole file is never held in memory.
+
+    Tree can be constructed using path or using adjacency list (parent and child names).
+
+    - If `child_col` and `parent_col` are not set, tree is constructed using path. `path_col` takes first column if not
+      set
+    - If either `child_col` or `parent_col` is set, tree is constructed using adjacency list. `child_col` takes first
+      column and `parent_col` takes second column if not set
+
+    `attribute_cols` specify columns for node attributes, if not set, it takes all other columns.
+
+    - Only attributes in `attribute_cols` with non-empty values will be added to the tree
+    - Attribute values are added as strings, as read from the csv file
+
+    Refer to `iter_to_tree` for the requirements on paths and parent-child names.
+
+    Examples:
+        >>> import io
+        >>> from bigtree import csv_to_tree
+        >>> csv_file = io.StringIO(
+        ...     "path,age\\n"
+        ...     "a,90\\n"
+        ...     "a/b,65\\n"
+        ...     "a/c,60\\n"
+        ...     "a/b/d,40\\n"
+        ...     "a/b/e,35\\n"
+        ... )
+        >>> root = csv_to_tree(csv_file, chunk_size=2, progress=print)
+        2
+        4
+        5
+        >>> root.show(attr_list=["age"])
+        a [age=90]
+        ├── b [age=65]
+        │   ├── d [age=40]
+        │   └── e [age=35]
+        └── c [age=60]
+
+    Args:
+        file: path of csv file, or file object opened in text mode
+        path_col: column containing path information, used if constructing tree using path
+        child_col: column containing child name information, used if constructing tree using adjacency list
+        parent_col: column containing parent name information, used if constructing tree using adjacency list
+        attribute_cols: columns containing node attribute information, if not set, it will take all other columns
+        sep: path separator for input path and created tree
+        duplicate_name_allowed: indicator if nodes with duplicate ``Node`` name is allowed, used if constructing tree
+            using path
+        delimiter: delimiter of csv file
+        chunk_size: number of rows to read and add to tree at a time
+        progress: callback that is called with the number of rows processed after each chunk
+        node_type: node type of tree to be created
+
+    Returns:
+        Node
+    """
+    with common.open_file(file, newline="") as fp:
+        reader = csv.DictReader(fp, delimiter=delimiter)
+        rows = ({k: None if v == "" else v for k, v in row.items()} for row in reader)
+        return _rows_to_tree(
+            rows,
+            path_col=path_col,
+            child_col=child_col,
+            parent_col=parent_col,
+            attribute_cols=attribute_cols,
+            sep=sep,
+            duplicate_name_allowed=duplicate_name_allowed,
+            chunk_size=chunk_size,
+            progress=progress,
+            node_type=node_type,
+        )
+
+
+def jsonl_to_tree(
+    file: str | os.PathLike[str] | IO[str],
+    path_col: str | None = None,
+    child_col: str | None = None,
+    parent_col: str | None = None,
+    attribute_cols: list[str] | None = None,
+    sep: str = "/",
+    duplicate_name_allowed: bool = True,
+    chunk_size: int = 10_000,
+    progress: Callable[[int], Any] | None = None,
+    node_type: type[T] = node.Node,  # type: ignore[assignment]
+) -> T:
+    """Construct tree from JSON Lines file, return root of tree. Each non-empty line of the file is a JSON object for
+    one node. Lines are read from the file in chunks of `chunk_size` lines and added to the tree incrementally, so the
+    whole file is never held in memory.
+
+    Tree can be constructed using path or using adjacency list (parent and child names).
+
+    - If `child_col` and `parent_col` are not set, tree is constructed using path. `path_col` takes first key if not
+      set
+    - If either `child_col` or `parent_col` is set, tree is constructed using adjacency list. `child_col` takes first
+      key and `parent_col` takes second key if not set
+
+    `attribute_cols` specify keys for node attributes, if not set, it takes all other keys.
+
+    - Only attributes in `attribute_cols` with non-null values will be added to the tree
+
+    Refer to `iter_to_tree` for the requirements on paths and parent-child names.
+
+    Examples:
+        >>> import io
+        >>> from bigtree import jsonl_to_tree
+        >>> jsonl_file = io.StringIO(
+        ...     '{"child": "a", "parent": null, "age": 90}\\n'
+        ...     '{"child": "b", "parent": "a", "age": 65}\\n'
+        ...     '{"child": "c", "parent": "a", "age": 60}\\n'
+        ...     '{"child": "d", "parent": "b", "age": 40}\\n'
+        ...     '{"child": "e", "parent": "b", "age": 35}\\n'
+        ... )
+        >>> root = jsonl_to_tree(jsonl_file, child_col="child", parent_col="parent")
+        >>> root.show(attr_list=["age"])
+        a [age=90]
+        ├── b [age=65]
+        │   ├── d [age=40]
+        │   └── e [age=35]
+        └── c [age=60]
+
+    Args:
+        file: path of JSON Lines file, or file object opened in text mode
+        path_col: key containing path information, used if constructing tree using path
+        child_col: key containing child name information, used if constructing tree using adjacency list
+        parent_col: key containing parent name information, used if constructing tree using adjacency list
+        attribute_cols: keys containing node attribute information, if not set, it will take all other keys
+        sep: path separator for input path and created tree
+        duplicate_name_allowed: indicator if nodes with duplicate ``Node`` name is allowed, used if constructing tree
+            using path
+        chunk_size: number of lines to read and add to tree at a time
+        progress: callback that is called with the number of lines processed after each chunk
+        node_type: node type of tree to be created
+
+    Returns:
+        Node
+    """
+    with common.open_file(file) as fp:
+        rows = (json.loads(line) for line in fp if line.strip())
+        return _rows_to_tree(
+            rows,
+            path_col=path_col,
+            child_col=child_col,
+            parent_col=parent_col,
+            attribute_cols=attribute_cols,
+            sep=sep,
+            duplicate_name_allowed=duplicate_name_allowed,
+            chunk_size=chunk_size,
+            progress=progress,
+            node_type=node_type,
+        )
+
+
+def iter_to_tree(
+    rows: Iterable[Mapping[str, Any] | str],
+    path_col: str | None = None,
+    child_col: str | None = None,
+    parent_col: str | None = None,
+    attribute_cols: list[str] | None = None,
+    sep: str = "/",
+    duplicate_name_allowed: bool = True,
+    chunk_size: int = 10_000,
+    progress: Callable[[int], Any] | None = None,
+    node_type: type[T] = node.Node,  # type: ignore[assignment]
+) -> T:
+    """Construct tree from iterable of rows, return root of tree. Rows can be path strings, or mappings of column name to
+    value. Rows are consumed in chunks of `chunk_size` rows and added to the tree incrementally, so `rows` can be a
+    generator that is too large to be held in memory.
+
+    Tree can be constructed using path or using adjacency list (parent and child names).
+
+    - If `child_col` and `parent_col` are not set, tree is constructed using path. `path_col` takes first key if not
+      set, and path string rows are used as path
+    - If either `child_col` or `parent_col` is set, tree is constructed using adjacency list. `child_col` takes first
+      key and `parent_col` takes second key if not set
+
+    `attribute_cols` specify keys for node attributes, if not set, it takes all other keys.
+
+    - Only attributes in `attribute_cols` with non-null values will be added to the tree
+
+    If constructing tree using path, path should contain ``Node`` name, separated by `sep`.
+
+    - For example: Path string "a/b" refers to Node("b") with parent Node("a")
+    - Path can start from root node `name`, or start with `sep`
+    - All paths should start from the same root node, and parent paths do not need to appear before child paths
+
+    If constructing tree using adjacency list, root node is inferred when parent name is empty, or when name appears as
+    parent but not as child. Parent rows do not need to appear before child rows.
+
+    - Since tree is created from parent-child names, only names of leaf nodes may be repeated. Error will be thrown if
+      names of intermediate nodes are repeated as there will be confusion
+    - Repeated rows of the same child and parent refer to the same node
+
+    Examples:
+        >>> from bigtree import iter_to_tree
+        >>> path_list = ["a/b", "a/c", "a/b/d", "a/b/e", "a/c/f", "a/b/e/g", "a/b/e/h"]
+        >>> root = iter_to_tree(iter(path_list), chunk_size=3, progress=print)
+        3
+        6
+        7
+        >>> root.show()
+        a
+        ├── b
+        │   ├── d
+        │   └── e
+        │       ├── g
+        │       └── h
+        └── c
+            └── f
+
+    Args:
+        rows: iterable of path strings or mappings containing path or parent-child name, and node attribute information
+        path_col: key containing path information, used if constructing tree using path
+        child_col: key containing child name information, used if constructing tree using adjacency list
+        parent_col: key containing parent name information, used if constructing tree using adjacency list
+        attribute_cols: keys containing node attribute information, if not set, it will take all other keys
+        sep: path separator for input path and created tree
+        duplicate_name_allowed: indicator if nodes with duplicate ``Node`` name is allowed, used if constructing tree
+            using path
+        chunk_size: number of rows to consume and add to tree at a time
+        progress: callback that is called with the number of rows processed after each chunk
+        node_type: node type of tree to be created
+
+    Returns:
+        Node
+    """
+    return _rows_to_tree(
+        iter(rows),
+        path_col=path_col,
+        child_col=child_col,
+        parent_col=parent_col,
+        attribute_cols=attribute_cols,
+        sep=sep,
+        duplicate_name_allowed=duplicate_name_allowed,
+        chunk_size=chunk_size,
+        progress=progress,
+        node_type=node_type,
+    )
+
+
+def _iter_chunks(
+    rows: Iterator[Any],
+    chunk_size: int,
+    progress: Callable[[int], Any] | None,
+) -> Iterator[list[Any]]:
+    """Consume iterator in chunks, and call progress callback after each chunk is processed.
+
+    Args:
+        rows: rows to consume
+        chunk_size: number of rows in each chunk
+        progress: callback that is called with the number of rows processed
+
+    Returns:
+        Chunk of rows
+    """
+    if chunk_size < 1:
+        raise ValueError(
+            f"Invalid chunk size {chunk_size}, check `chunk_size` to be a positive integer"
+        )
+    n_rows = 0
+    while True:
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            break
+        yield chunk
+        n_rows += len(chunk)
+        if progress:
+            progress(n_rows)
+    if not n_rows:
+        raise ValueError("Input does not contain any data, check input rows or file")
+
+
+def _rows_to_tree(
+    rows: Iterator[Mapping[str, Any] | str],
+    path_col: str | None,
+    child_col: str | None,
+    parent_col: str | None,
+    attribute_cols: list[str] | None,
+    sep: str,
+    duplicate_name_allowed: bool,
+    chunk_size: int,
+    progress: Callable[[int], Any] | None,
+    node_type: type[T],
+) -> T:
+    """Construct tree from iterator of rows, using path or using adjacency list.
+
+    Args:
+        rows: path strings or mappings containing path or parent-child name, and node attribute information
+        path_col: key containing path information
+        child_col: key containing child name information
+        parent_col: key containing parent name information
+        attribute_cols: keys containing node attribute information
+        sep: path separator for input path and created tree
+        duplicate_name_allowed: indicator if nodes with duplicate ``Node`` name is allowed
+        chunk_size: number of rows to consume at a time
+        progress: callback that is called with the number of rows processed after each chunk
+        node_type: node type of tree to be created
+
+    Returns:
+        Node
+    """
+    chunks = _iter_chunks(rows, chunk_size, progress)
+    if child_col or parent_col:
+        return _relation_chunks_to_tree(
+            chunks, child_col, parent_col, attribute_cols, node_type
+        )
+    return _path_chunks_to_tree(
+        chunks, path_col, attribute_cols, sep, duplicate_name_allowed, node_type
+    )
+
+
+def _get_attrs(
+    row: Mapping[str, Any], omit_keys: list[str], attribute_cols: list[str] | None
+) -> dict[str, Any]:
+    """Retrieve non-null node attributes from row.
+
+    Args:
+        row: row of data
+        omit_keys: keys that are not node attributes
+        attribute_cols: keys containing node attribute information, if not set, all keys not in `omit_keys` are used
+
+    Returns:
+        Attribute dictionary
+    """
+    if attribute_cols is not None:
+        row = {k: row.get(k) for k in attribute_cols}
+    return common.filter_attributes(row, omit_keys=omit_keys, omit_null_values=True)
+
+
+def _path_chunks_to_tree(
+    chunks: Iterator[list[Mapping[str, Any] | str]],
+    path_col: str | None,
+    attribute_cols: list[str] | None,
+    sep: str,
+    duplicate_name_allowed: bool,
+    node_type: type[T],
+) -> T:
+    """Construct tree from chunks of rows using path.
+
+    Args:
+        chunks: chunks of path strings or mappings containing path and node attribute information
+        path_col: key containing path information, if not set, it will take the first key
+        attribute_cols: keys containing node attribute information
+        sep: path separator for input path and created tree
+        duplicate_name_allowed: indicator if nodes with duplicate ``Node`` name is allowed
+        node_type: node type of tree to be created
+
+    Returns:
+        Node
+    """
+    root_node: T | None = None
+    path_cache: dict[str, T] = {}
+    name_cache: dict[str, str] = {}
+    for chunk in chunks:
+        for row in chunk:
+            if isinstance(row, str):
+                path, node_attrs = row, {}
+            else:
+                if not path_col:
+                    path_col = next(iter(row))
+                path = row.get(path_col)
+                node_attrs = _get_attrs(row, [path_col], attribute_cols)
+            if common.isnull(path):
+                path = ""
+            assertions.assert_length_not_empty(path, "Path", "path")
+
+            if root_node is None:
+                root_name = path.lstrip(sep).split(sep)[0]
+                root_node = node_type(root_name)
+                root_node.sep = sep
+                path_cache[root_name] = root_node
+                name_cache[root_name] = root_name
+            _add_path_to_tree(
+                root_node,
+                path,
+                sep,
+                duplicate_name_allowed,
+                node_attrs,
+                path_cache=path_cache,
+                name_cache=name_cache,
+            )
+    return root_node
+
+
+def _relation_chunks_to_tree(
+    chunks: Iterator[list[Mapping[str, Any] | str]],
+    child_col: str | None,
+    parent_col: str | None,
+    attribute_cols: list[str] | None,
+    node_type: type[T],
+) -> T:
+    """Construct tree from chunks of rows using adjacency list.
+
+    Nodes are looked up by name. Parent that has not appeared as child is created without attributes, and is attached
+    to its own parent when its row appears.
+
+    Args:
+        chunks: chunks of mappings containing parent-child name and node attribute information
+        child_col: key containing child name information, if not set, it will take the first key
+        parent_col: key containing parent name information, if not set, it will take the second key
+        attribute_cols: keys containing node attribute information
+        node_type: node type of tree to be created
+
+    Returns:
+        Node
+    """
+    name_nodes: dict[Any, T] = {}
+    parent_names: set[Any] = set()
+    duplicate_names: set[Any] = set()
+    duplicate_nodes: dict[tuple[Any, Any], T] = {}
+
+    def _raise_duplicate_error(_name: Any) -> None:
+        """Raise error for duplicated intermediate node name.
+
+        Args:
+            _name: duplicated node name
+        """
+        raise ValueError(
+            f"There exists duplicate child with different parent where the child is also a parent node.\n"
+            f"Duplicated node names should not happen, but can only exist in leaf nodes to avoid confusion.\n"
+            f"Check {_name}"
+        )
+
+    def _set_parent(_child: T, _parent: T, check_loop: bool) -> None:
+        """Assign parent to child without duplicate check, names are tracked in `name_nodes`.
+
+        Args:
+            _child: child node
+            _parent: parent node
+            check_loop: indicator whether to check for loop, only needed if child existed before
+        """
+        if check_loop and (
+            _parent is _child
+            or any(ancestor is _child for ancestor in _parent.ancestors)
+        ):
+            raise exceptions.LoopError(
+                "Error setting parent: Node cannot be ancestor of itself"
+            )
+        assertions_ = Globals.ASSERTIONS
+        Globals.ASSERTIONS = False
+        try:
+            _child.parent = _parent
+        finally:
+            Globals.ASSERTIONS = assertions_
+
+    for chunk in chunks:
+        for row in chunk:
+            if isinstance(row, str):
+                raise TypeError(
+                    f"Row {row} is not a mapping, rows should be mapping if constructing tree using adjacency list"
+                )
+            if not child_col or not parent_col:
+                keys = list(row)
+                child_col = child_col or keys[0]
+                parent_col = parent_col or keys[1]
+            child_name, parent_name = row.get(child_col), row.get(parent_col)
+            node_attrs = _get_attrs(row, [child_col, parent_col], attribute_cols)
+
+            if common.isnull(parent_name):
+                child_node = name_nodes.get(child_name)
+                if child_node is None:
+                    child_node = node_type(child_name)
+                    name_nodes[child_name] = child_node
+                child_node.set_attrs(node_attrs)
+                continue
+
+            if parent_name in duplicate_names:
+                _raise_duplicate_error(parent_name)
+            parent_node = name_nodes.get(parent_name)
+            if parent_node is None:
+                parent_node = node_type(parent_name)
+                name_nodes[parent_name] = parent_node
+            parent_names.add(parent_name)
+
+            existing_node = name_nodes.get(child_name)
+            if existing_node is None:
+                child_node = node_type(child_name)
+                name_nodes[child_name] = child_node
+            elif existing_node.parent is None:
+                child_node = existing_node
+            else:
+                if existing_node.parent is not parent_node:
+                    existing_node = duplicate_nodes.get((child_name, parent_name))
+                if existing_node is not None:
+                    existing_node.set_attrs(node_attrs)
+                    continue
+                if child_name in parent_names:
+                    _raise_duplicate_error(child_name)
+                duplicate_names.add(child_name)
+                child_node = node_type(child_name)
+                duplicate_nodes[(child_name, parent_name)] = child_node
+            child_node.set_attrs(node_attrs)
+            _set_parent(child_node, parent_node, check_loop=child_node is existing_node)
+
+    root_names = [name for name, _node in name_nodes.items() if _node.parent is None]
+    if len(root_names) != 1:
+        raise ValueError(
+            f"Unable to determine root node\n"
+            f"Possible root nodes: {sorted(root_names, key=lambda v: (isinstance(v, str), v))}"
+        )
+    return name_nodes[root_names[0]]
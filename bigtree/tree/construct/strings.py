@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
-from typing import Any, Iterable, Mapping, TypeVar
+from typing import IO, Any, Iterable, Iterator, Mapping, TypeVar
 
+from bigtree._globals import Globals
 from bigtree.node import node
 from bigtree.tree import search
 from bigtree.utils import assertions, constants, exceptions
@@ -25,6 +26,9 @@ __all__ = [
 
 T = TypeVar("T", bound=node.Node)
 
+_NON_ASCII_PATTERN = re.compile(r"[^\x00-\x7f]")
+_NEWICK_TOKEN_PATTERN = re.compile(r"'[^']*'|[()\[\]=:,']|[^()\[\]=:,']+")
+
 
 def add_path_to_tree(
     tree: T,
@@ -74,8 +78,36 @@ def add_path_to_tree(
     if not node_attrs:
         node_attrs = {}
     assertions.assert_length_not_empty(path, "Path", "path")
+    return _add_path_to_tree(tree.root, path, sep, duplicate_name_allowed, node_attrs)
+
+
+def _add_path_to_tree(
+    root_node: T,
+    path: str,
+    sep: str,
+    duplicate_name_allowed: bool,
+    node_attrs: Mapping[str, Any],
+    path_cache: dict[str, T] | None = None,
+    name_cache: dict[str, str] | None = None,
+) -> T:
+    """Add path to tree from its root node, return node of path added.
+
+    If `path_cache` and `name_cache` are provided, they must contain every node of the tree, keyed by the path (and
+    node name respectively) joined by the tree separator. Lookups will use the caches instead of searching the tree,
+    and the caches are updated with the nodes created.
 
-    root_node = tree.root
+    Args:
+        root_node: root node of existing tree
+        path: path to be added to tree
+        sep: path separator for input `path`
+        duplicate_name_allowed: indicator if nodes with duplicate ``Node`` name is allowed
+        node_attrs: attributes to add to node, key: attribute name, value: attribute value
+        path_cache: path of node, and the node
+        name_cache: name of node, and the path of node
+
+    Returns:
+        Node
+    """
     tree_sep = root_node.sep
     node_type = root_node.__class__
     branch = path.lstrip(sep).rstrip(sep).split(sep)
@@ -91,7 +123,18 @@ def add_path_to_tree(
     for idx in range(1, len(branch)):
         node_name = branch[idx]
         node_path = tree_sep.join(branch[: idx + 1])
-        if not duplicate_name_allowed:
+        if path_cache is not None and name_cache is not None:
+            _node = path_cache.get(node_path)
+            if (
+                not _node
+                and not duplicate_name_allowed
+                and name_cache.get(node_name, node_path) != node_path
+            ):
+                raise exceptions.DuplicatedNodeError(
+                    f"Node {node_name} already exists, try setting `duplicate_name_allowed` to True "
+                    f"to allow `Node` with same node name"
+                )
+        elif not duplicate_name_allowed:
             _node = search.find_name(root_node, node_name)
             if _node and not _node.path_name.endswith(node_path):
                 raise exceptions.DuplicatedNodeError(
@@ -105,18 +148,30 @@ def add_path_to_tree(
                 _node = node_type(node_name, **node_attrs)
             else:
                 _node = node_type(node_name)
-            _node.parent = parent_node
+            if path_cache is not None and name_cache is not None:
+                # Caches ensure that parent does not have child with the same name
+                assertions_ = Globals.ASSERTIONS
+                Globals.ASSERTIONS = False
+                try:
+                    _node.parent = parent_node
+                finally:
+                    Globals.ASSERTIONS = assertions_
+                path_cache[node_path] = _node
+                name_cache.setdefault(node_name, node_path)
+            else:
+                _node.parent = parent_node
         parent_node = _node
     _node.set_attrs(node_attrs)
     return _node
 
 
 def str_to_tree(
-    tree_string: str,
+    tree_string: str | IO[str],
     tree_prefix_list: Iterable[str] = (),
     node_type: type[T] = node.Node,  # type: ignore[assignment]
 ) -> T:
-    r"""Construct tree from tree string.
+    r"""Construct tree from tree string, or from file object containing tree string. Lines of file object are read
+    lazily, so tree can be constructed from large files without loading the whole file.
 
     Examples:
         >>> from bigtree import Tree
@@ -142,7 +197,7 @@ def str_to_tree(
             └── f
 
     Args:
-        tree_string: string to construct tree
+        tree_string: string, or file object opened in text mode, to construct tree
         tree_prefix_list: prefixes to mark the end of tree branch/stem and start of node name, optional. If not
             specified, it will infer unicode characters and whitespace as prefix
         node_type: node type of tree to be created
@@ -150,51 +205,113 @@ def str_to_tree(
     Returns:
         Node
     """
-    tree_string = tree_string.strip("\n")
-    assertions.assert_length_not_empty(tree_string, "Tree string", "tree_string")
-    tree_list = tree_string.split("\n")
-    root_node = node_type(tree_list[0])
+    tree_lines = _iter_tree_lines(tree_string)
+    root_name = next(tree_lines, "")
+    assertions.assert_length_not_empty(root_name, "Tree string", "tree_string")
+    root_node = node_type(root_name)
+
+    if tree_prefix_list:
+        prefix_pattern = re.compile("|".join(tree_prefix_list))
 
     # Infer prefix length
     prefix_length = None
-    cur_parent = root_node
-    for node_str in tree_list[1:]:
+    # Stack of nodes in current branch, index by depth - 1, and names of their children
+    stack: list[tuple[T, set[str]]] = [(root_node, set())]
+    for node_str in tree_lines:
         if tree_prefix_list:
-            node_name = re.split("|".join(tree_prefix_list), node_str)[-1].lstrip()
+            node_name = prefix_pattern.split(node_str)[-1].lstrip()
         else:
-            node_name = node_str.encode("ascii", "ignore").decode("ascii").lstrip()
+            node_name = _NON_ASCII_PATTERN.sub("", node_str).lstrip()
 
         # Find node parent
+        node_prefix_length = node_str.index(node_name)
         if not prefix_length:
-            prefix_length = node_str.index(node_name)
+            prefix_length = node_prefix_length
             if not prefix_length:
                 raise ValueError(
                     f"Invalid prefix, prefix should be unicode character or whitespace, "
                     f"otherwise specify one or more prefixes in `tree_prefix_list`, check: {node_str}"
                 )
-        node_prefix_length = node_str.index(node_name)
         if node_prefix_length % prefix_length:
             raise ValueError(
                 f"Tree string have different prefix length, check branch: {node_str}"
             )
-        while cur_parent.depth > node_prefix_length / prefix_length:
-            cur_parent = cur_parent.parent
+        del stack[max(node_prefix_length // prefix_length, 1) :]
+        parent_node, sibling_names = stack[-1]
 
         # Link node
         child_node = node_type(node_name)
-        child_node.parent = cur_parent
-        cur_parent = child_node
+        _assign_new_parent(child_node, parent_node, sibling_names)
+        stack.append((child_node, set()))
 
     return root_node
 
 
+def _iter_tree_lines(tree_string: str | IO[str]) -> Iterator[str]:
+    """Iterate lines of tree string or file object, excluding empty lines at the start and end.
+
+    Lines of file object are read lazily, empty lines are held back until a non-empty line is read.
+
+    Args:
+        tree_string: string or file object to construct tree
+
+    Returns:
+        Line of tree string without newline character
+    """
+    if isinstance(tree_string, str):
+        tree_string = tree_string.strip("\n")
+        if tree_string:
+            yield from tree_string.split("\n")
+        return
+
+    n_empty_lines = 0
+    started = False
+    for line in tree_string:
+        line = line.rstrip("\r\n")
+        if not line:
+            n_empty_lines += started
+            continue
+        yield from [""] * n_empty_lines
+        n_empty_lines = 0
+        started = True
+        yield line
+
+
+def _assign_new_parent(
+    _node: T, parent_node: T, sibling_names: set[str] | None = None
+) -> None:
+    """Assign parent to newly created node without node-level assertions, which take time proportional to the depth
+    of parent. A new node cannot be an ancestor of its parent, and duplicate names are checked against
+    `sibling_names` if provided.
+
+    Args:
+        _node: newly created node
+        parent_node: parent node to be assigned to node
+        sibling_names: names of children of parent node added so far
+    """
+    if sibling_names is not None and Globals.ASSERTIONS:
+        if _node.node_name in sibling_names:
+            raise exceptions.TreeError(
+                f"Duplicate node with same path\n"
+                f"There exist a node with same path {parent_node.path_name}{parent_node.sep}{_node.node_name}"
+            )
+        sibling_names.add(_node.node_name)
+    assertions_ = Globals.ASSERTIONS
+    Globals.ASSERTIONS = False
+    try:
+        _node.parent = parent_node
+    finally:
+        Globals.ASSERTIONS = assertions_
+
+
 def newick_to_tree(
-    tree_string: str,
+    tree_string: str | IO[str],
     length_attr: str = "length",
     attr_prefix: str = "&&NHX:",
     node_type: type[T] = node.Node,  # type: ignore[assignment]
 ) -> T:
-    """Construct tree from Newick notation, return root of tree.
+    """Construct tree from Newick notation, return root of tree. Newick notation can be read from file object in chunks,
+    so tree can be constructed from large files without loading the whole file.
 
     In the Newick Notation (or New Hampshire Notation)
 
@@ -239,7 +356,7 @@ def newick_to_tree(
         └── c [age=60, species=human]
 
     Args:
-        tree_string: Newick notation to construct tree
+        tree_string: Newick notation, or file object opened in text mode, to construct tree
         length_attr: attribute name to store node length, optional
         attr_prefix: prefix before all attributes, within square bracket, used to detect attributes
         node_type: node type of tree to be created
@@ -247,13 +364,13 @@ def newick_to_tree(
     Returns:
         Node
     """
-    assertions.assert_length_not_empty(tree_string, "Tree string", "tree_string")
+    if isinstance(tree_string, str):
+        assertions.assert_length_not_empty(tree_string, "Tree string", "tree_string")
 
     # Store results (for tracking)
     depth_nodes: dict[int, list[T]] = defaultdict(list)
     unlabelled_node_counter: int = 0
     current_depth: int = 1
-    tree_string_idx: int = 0
 
     # Store states (for assertions and checks)
     current_state: constants.NewickState = constants.NewickState.PARSE_STRING
@@ -312,12 +429,24 @@ def newick_to_tree(
             f"String not properly closed, check `tree_string` at index {tree_idx}"
         )
 
-    while tree_string_idx < len(tree_string):
-        character = tree_string[tree_string_idx]
-        if character == constants.NewickCharacter.OPEN_BRACKET:
+    open_bracket = constants.NewickCharacter.OPEN_BRACKET.value
+    close_bracket = constants.NewickCharacter.CLOSE_BRACKET.value
+    attr_start = constants.NewickCharacter.ATTR_START.value
+    attr_end = constants.NewickCharacter.ATTR_END.value
+    attr_key_value = constants.NewickCharacter.ATTR_KEY_VALUE.value
+    attr_quote = constants.NewickCharacter.ATTR_QUOTE.value
+    sep = constants.NewickCharacter.SEP.value
+    node_sep = constants.NewickCharacter.NODE_SEP.value
+
+    tree_string_idx = 0
+    for token, tree_string_idx in _iter_newick_tokens(tree_string, attr_prefix):
+        if not token:
+            break
+
+        if token == open_bracket:
             # Check and/or change state
             state_title = "Node creation start"
-            if current_state not in [constants.NewickState.PARSE_STRING]:
+            if current_state != constants.NewickState.PARSE_STRING:
                 _raise_value_error(tree_string_idx)
             # Logic
             current_depth += 1
@@ -328,14 +457,8 @@ def newick_to_tree(
             assert (
                 not cumulative_string_value
             ), f"{state_title}, should not have cumulative_string_value"
-            tree_string_idx += 1
-            continue
 
-        if character in [
-            constants.NewickCharacter.CLOSE_BRACKET,
-            constants.NewickCharacter.ATTR_START,
-            constants.NewickCharacter.NODE_SEP,
-        ]:
+        elif token == close_bracket or token == attr_start or token == node_sep:
             # Check and/or change state
             state_title = "Node creation end / Node attribute start"
             if current_state not in [
@@ -344,12 +467,8 @@ def newick_to_tree(
             ]:
                 _raise_value_error(tree_string_idx)
             # Logic
-            if character == constants.NewickCharacter.ATTR_START:
+            if token == attr_start:
                 current_state = constants.NewickState.PARSE_ATTRIBUTE_NAME
-                if tree_string[tree_string_idx + 1 :].startswith(  # noqa: E203
-                    attr_prefix
-                ):
-                    tree_string_idx += len(attr_prefix)
             current_node, unlabelled_node_counter = _create_node(
                 current_node,
                 cumulative_string,
@@ -357,22 +476,20 @@ def newick_to_tree(
                 depth_nodes,
                 current_depth,
             )
-            if character == constants.NewickCharacter.CLOSE_BRACKET:
+            if token == close_bracket:
                 current_depth -= 1
                 current_node = None
-            if character == constants.NewickCharacter.NODE_SEP:
+            if token == node_sep:
                 current_node = None
             cumulative_string = ""
             assert (
                 not cumulative_string_value
             ), f"{state_title}, should not have cumulative_string_value"
-            tree_string_idx += 1
-            continue
 
-        if character == constants.NewickCharacter.ATTR_END:
+        elif token == attr_end:
             # Check and/or change state
             state_title = "Node attribute end"
-            if current_state not in [constants.NewickState.PARSE_ATTRIBUTE_VALUE]:
+            if current_state != constants.NewickState.PARSE_ATTRIBUTE_VALUE:
                 _raise_value_error(tree_string_idx)
             current_state = constants.NewickState.PARSE_STRING
             # Logic
@@ -380,13 +497,11 @@ def newick_to_tree(
             current_node.set_attrs({cumulative_string: cumulative_string_value})
             cumulative_string = ""
             cumulative_string_value = ""
-            tree_string_idx += 1
-            continue
 
-        if character == constants.NewickCharacter.ATTR_KEY_VALUE:
+        elif token == attr_key_value:
             # Check and/or change state
             state_title = "Node attribute creation"
-            if current_state not in [constants.NewickState.PARSE_ATTRIBUTE_NAME]:
+            if current_state != constants.NewickState.PARSE_ATTRIBUTE_NAME:
                 _raise_value_error(tree_string_idx)
             current_state = constants.NewickState.PARSE_ATTRIBUTE_VALUE
             # Logic
@@ -396,15 +511,10 @@ def newick_to_tree(
             assert (
                 not cumulative_string_value
             ), f"{state_title}, should not have cumulative_string_value"
-            tree_string_idx += 1
-            continue
 
-        if character == constants.NewickCharacter.ATTR_QUOTE:
+        elif token[0] == attr_quote:
             # Logic
-            quote_end_idx = tree_string.find(
-                constants.NewickCharacter.ATTR_QUOTE, tree_string_idx + 1
-            )
-            if quote_end_idx == -1:
+            if len(token) == 1:
                 _raise_value_error(tree_string_idx)
             if current_state in [
                 constants.NewickState.PARSE_STRING,
@@ -412,19 +522,13 @@ def newick_to_tree(
             ]:
                 if cumulative_string:
                     _raise_value_error(tree_string_idx)
-                cumulative_string = tree_string[
-                    tree_string_idx + 1 : quote_end_idx  # noqa: E203
-                ]
+                cumulative_string = token[1:-1]
             else:
                 if cumulative_string_value:
                     _raise_value_error(tree_string_idx)
-                cumulative_string_value = tree_string[
-                    tree_string_idx + 1 : quote_end_idx  # noqa: E203
-                ]
-            tree_string_idx = quote_end_idx + 1
-            continue
+                cumulative_string_value = token[1:-1]
 
-        if character == constants.NewickCharacter.SEP:
+        elif token == sep:
             # Check and/or change state
             state_title = "Node length creation / Node attribute creation"
             if current_state not in [
@@ -447,23 +551,20 @@ def newick_to_tree(
                 assert (
                     not cumulative_string_value
                 ), f"{state_title}, should not have cumulative_string_value"
-                tree_string_idx += 1
-                continue
             else:
                 current_state = constants.NewickState.PARSE_ATTRIBUTE_NAME
                 assert current_node, f"{state_title}, should not have current_node"
                 current_node.set_attrs({cumulative_string: cumulative_string_value})
                 cumulative_string = ""
                 cumulative_string_value = ""
-                tree_string_idx += 1
-                continue
 
-        if current_state == constants.NewickState.PARSE_ATTRIBUTE_VALUE:
-            cumulative_string_value += character
+        elif current_state == constants.NewickState.PARSE_ATTRIBUTE_VALUE:
+            cumulative_string_value += token
         else:
-            cumulative_string += character
-        tree_string_idx += 1
+            cumulative_string += token
 
+    if not tree_string_idx:
+        assertions.assert_length_not_empty("", "Tree string", "tree_string")
     if current_depth != 1:
         _raise_value_error(tree_string_idx)
 
@@ -480,6 +581,66 @@ def newick_to_tree(
     return current_node
 
 
+def _iter_newick_tokens(
+    tree_string: str | IO[str], attr_prefix: str, chunk_size: int = 65536
+) -> Iterator[tuple[str, int]]:
+    """Iterate tokens of Newick notation, reading file object in chunks. Tokens are Newick special characters, quoted
+    strings, and strings between them. Strings may be split into multiple tokens across chunks.
+
+    Attribute prefix after the start of attribute is skipped, and an unclosed quote is returned as a single quote
+    character. The last token is an empty string with the length of Newick notation.
+
+    Args:
+        tree_string: Newick notation, or file object containing Newick notation
+        attr_prefix: prefix before all attributes, within square bracket
+        chunk_size: number of characters to read from file object at a time
+
+    Returns:
+        Token and its index in Newick notation
+    """
+    if isinstance(tree_string, str):
+        chunks: Iterator[str] = iter([tree_string])
+    else:
+        chunks = iter(lambda: tree_string.read(chunk_size), "")
+
+    buffer = ""
+    buffer_idx = 0
+    pos = 0
+    eof = False
+    while True:
+        if pos == len(buffer):
+            if eof:
+                break
+            buffer_idx += pos
+            buffer, pos = next(chunks, ""), 0
+            eof = not buffer
+            continue
+
+        match = _NEWICK_TOKEN_PATTERN.match(buffer, pos)
+        assert match
+        token, end = match.group(), match.end()
+        if not eof and (
+            token == constants.NewickCharacter.ATTR_QUOTE
+            or (
+                token == constants.NewickCharacter.ATTR_START
+                and len(buffer) - end < len(attr_prefix)
+            )
+        ):
+            # Token may continue in next chunk
+            chunk = next(chunks, "")
+            eof = not chunk
+            buffer, buffer_idx, pos = buffer[pos:] + chunk, buffer_idx + pos, 0
+            continue
+
+        yield token, buffer_idx + pos
+        pos = end
+        if token == constants.NewickCharacter.ATTR_START and buffer.startswith(
+            attr_prefix, pos
+        ):
+            pos += len(attr_prefix)
+    yield "", buffer_idx + pos
+
+
 @exceptions.optional_dependencies_rich
 def rich_to_tree(
     rich_tree: rich.tree.Tree, node_format_attr: str = "style"
@@ -1,38 +1,101 @@
-from .dataframes import tree_to_dataframe, tree_to_polars  # noqa
-from .dictionaries import (  # noqa
-    tree_to_dict,
-    tree_to_nested_dict,
-    tree_to_nested_dict_key,
-)
-from .html import iprint_tree, tree_to_html  # noqa
-from .images import (  # noqa
-    tree_to_dot,
-    tree_to_mermaid,
-    tree_to_pillow,
-    tree_to_pillow_graph,
-)
-from .stdout import (  # noqa
-    hprint_tree,
-    hyield_tree,
-    print_rich,
-    print_tree,
-    tree_to_newick,
-    vprint_tree,
-    vyield_tree,
-    yield_tree,
-)
-from .vis import tree_to_vis  # noqa
+from typing import TYPE_CHECKING
+
+from bigtree._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from bigtree.tree.export.binary import save_tree, tree_to_bytes
+    from bigtree.tree.export.dataframes import (
+        tree_to_csv,
+        tree_to_dataframe,
+        tree_to_jsonl,
+        tree_to_parquet,
+        tree_to_polars,
+    )
+    from bigtree.tree.export.dictionaries import (
+        tree_to_dict,
+        tree_to_nested_dict,
+        tree_to_nested_dict_key,
+        tree_to_nested_json,
+    )
+    from bigtree.tree.export.html import iprint_tree, tree_to_html
+    from bigtree.tree.export.images import (
+        tree_to_dot,
+        tree_to_dot_file,
+        tree_to_mermaid,
+        tree_to_mermaid_file,
+        tree_to_pillow,
+        tree_to_pillow_graph,
+        tree_to_pillow_graph_tiles,
+        tree_to_pillow_tiles,
+    )
+    from bigtree.tree.export.stdout import (
+        hprint_tree,
+        hyield_tree,
+        print_rich,
+        print_tree,
+        tree_to_newick,
+        tree_to_newick_file,
+        vprint_tree,
+        vyield_tree,
+        yield_tree,
+    )
+    from bigtree.tree.export.vis import tree_to_vis, tree_to_vis_json
+
+_LAZY_EXPORTS = {
+    "save_tree": "bigtree.tree.export.binary",
+    "tree_to_bytes": "bigtree.tree.export.binary",
+    "tree_to_dataframe": "bigtree.tree.export.dataframes",
+    "tree_to_polars": "bigtree.tree.export.dataframes",
+    "tree_to_parquet": "bigtree.tree.export.dataframes",
+    "tree_to_csv": "bigtree.tree.export.dataframes",
+    "tree_to_jsonl": "bigtree.tree.export.dataframes",
+    "tree_to_dict": "bigtree.tree.export.dictionaries",
+    "tree_to_nested_dict": "bigtree.tree.export.dictionaries",
+    "tree_to_nested_dict_key": "bigtree.tree.export.dictionaries",
+    "tree_to_nested_json": "bigtree.tree.export.dictionaries",
+    "iprint_tree": "bigtree.tree.export.html",
+    "tree_to_html": "bigtree.tree.export.html",
+    "tree_to_dot": "bigtree.tree.export.images",
+    "tree_to_dot_file": "bigtree.tree.export.images",
+    "tree_to_mermaid": "bigtree.tree.export.images",
+    "tree_to_mermaid_file": "bigtree.tree.export.images",
+    "tree_to_pillow": "bigtree.tree.export.images",
+    "tree_to_pillow_graph": "bigtree.tree.export.images",
+    "tree_to_pillow_graph_tiles": "bigtree.tree.export.images",
+    "tree_to_pillow_tiles": "bigtree.tree.export.images",
+    "hprint_tree": "bigtree.tree.export.stdout",
+    "hyield_tree": "bigtree.tree.export.stdout",
+    "print_rich": "bigtree.tree.export.stdout",
+    "print_tree": "bigtree.tree.export.stdout",
+    "tree_to_newick": "bigtree.tree.export.stdout",
+    "tree_to_newick_file": "bigtree.tree.export.stdout",
+    "vprint_tree": "bigtree.tree.export.stdout",
+    "vyield_tree": "bigtree.tree.export.stdout",
+    "yield_tree": "bigtree.tree.export.stdout",
+    "tree_to_vis": "bigtree.tree.export.vis",
+    "tree_to_vis_json": "bigtree.tree.export.vis",
+}
 
 __all__ = [
+    "tree_to_bytes",
+    "save_tree",
     "tree_to_dataframe",
     "tree_to_polars",
+    "tree_to_parquet",
+    "tree_to_csv",
+    "tree_to_jsonl",
     "tree_to_dict",
     "tree_to_nested_dict",
     "tree_to_nested_dict_key",
+    "tree_to_nested_json",
     "tree_to_dot",
+    "tree_to_dot_file",
     "tree_to_mermaid",
+    "tree_to_mermaid_file",
     "tree_to_pillow",
     "tree_to_pillow_graph",
+    "tree_to_pillow_graph_tiles",
+    "tree_to_pillow_tiles",
     "iprint_tree",
     "tree_to_html",
     "print_rich",
@@ -43,5 +106,9 @@ __all__ = [
     "vprint_tree",
     "vyield_tree",
     "tree_to_newick",
+    "tree_to_newick_file",
     "tree_to_vis",
+    "tree_to_vis_json",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
@@ -1,5 +1,5 @@
 TREE_HTML_TEMPLATE = """
-<div id="{tree_id}" style="width: 100%; height: {height}px; overflow: hidden;">
+<div id="{tree_id}" style="width: 100%; height: {height}px; overflow: hidden;">{tree_chunks}
     <script>
         (function() {{
             const loadD3 = (callback) => {{
@@ -29,68 +29,103 @@ TREE_HTML_TEMPLATE = """
 
                 const g = svg.append("g");
                 const tree = d3.tree().nodeSize([nodeW + 40, nodeH]);
-                const root = d3.hierarchy(data);
-                tree(root);
 
                 // Dynamic calculation for centering
                 const initialTransform = d3.zoomIdentity.translate(width/2, 60).scale(0.9);
                 svg.call(d3.zoom().transform, initialTransform);
                 g.attr("transform", initialTransform);
 
-                // Draw Links
-                g.selectAll(".link")
-                    .data(root.links())
-                    .join("path")
-                    .attr("fill", "none")
-                    .attr("stroke", "{edge_colour}")
-                    .attr("stroke-width", {edge_width})
-                    .attr("d", d3.linkVertical().x(d => d.x).y(d => d.y));
-
-                // Create Nodes
-                const node = g.selectAll(".node")
-                    .data(root.descendants())
-                    .join("g")
-                    .attr("transform", d => `translate(${{d.x}},${{d.y}})`);
+                // Children of collapsed nodes are parsed from their data chunk on first expand
+                const chunkSize = {chunk_size};
+                const chunks = {{}};
+                const loadChildren = (id) => {{
+                    const chunkId = Math.floor(id / chunkSize);
+                    if (!(chunkId in chunks)) {{
+                        const chunk = document.getElementById(`{tree_id}-chunk-${{chunkId}}`);
+                        chunks[chunkId] = JSON.parse(chunk.textContent);
+                    }}
+                    return chunks[chunkId][id];
+                }};
+                const isCollapsed = (d) => d.data._children || d.data._id !== undefined;
 
                 // Calculate attributes to display (excluding structural keys)
                 const getAttrs = (d) => Object.entries(d.data)
-                    .filter(([k]) => !['name', 'children'{attr_to_ignore}].includes(k));
+                    .filter(([k]) => !['name', 'children', '_children', '_id'{attr_to_ignore}].includes(k));
+
+                const render = () => {{
+                    g.selectAll("*").remove();
+                    const root = d3.hierarchy(data);
+                    tree(root);
+
+                    // Draw Links
+                    g.selectAll(".link")
+                        .data(root.links())
+                        .join("path")
+                        .attr("fill", "none")
+                        .attr("stroke", "{edge_colour}")
+                        .attr("stroke-width", {edge_width})
+                        .attr("d", d3.linkVertical().x(d => d.x).y(d => d.y));
+
+                    // Create Nodes, click to expand or collapse children
+                    const node = g.selectAll(".node")
+                        .data(root.descendants())
+                        .join("g")
+                        .attr("transform", d => `translate(${{d.x}},${{d.y}})`)
+                        .style("cursor", d => d.data.children || isCollapsed(d) ? "pointer" : null)
+                        .on("click", (event, d) => {{
+                            if (d.data.children) {{
+                                d.data._children = d.data.children;
+                                delete d.data.children;
+                            }} else if (d.data._children) {{
+                                d.data.children = d.data._children;
+                                delete d.data._children;
+                            }} else if (d.data._id !== undefined) {{
+                                d.data.children = loadChildren(d.data._id);
+                                delete d.data._id;
+                            }} else {{
+                                return;
+                            }}
+                            render();
+                        }});
 
-                // Node Background
-                node.append("rect")
-                    .attr("x", -nodeW / 2)
-                    .attr("y", d => -20)
-                    .attr("width", nodeW)
-                    .attr("height", d => 40 + (getAttrs(d).length * 15))
-                    .attr("rx", rx)
-                    .style("fill", d => d.data.{node_colour_attr} || "{node_colour}")
-                    .style("stroke", d => d.data.{border_colour_attr} || "{border_colour}")
-                    .style("stroke-width", d => d.data.{border_width_attr} || "{border_width}px");
+                    // Node Background, dashed border if children are collapsed
+                    node.append("rect")
+                        .attr("x", -nodeW / 2)
+                        .attr("y", d => -20)
+                        .attr("width", nodeW)
+                        .attr("height", d => 40 + (getAttrs(d).length * 15))
+                        .attr("rx", rx)
+                        .style("fill", d => d.data.{node_colour_attr} || "{node_colour}")
+                        .style("stroke", d => d.data.{border_colour_attr} || "{border_colour}")
+                        .style("stroke-width", d => d.data.{border_width_attr} || "{border_width}px")
+                        .style("stroke-dasharray", d => isCollapsed(d) ? "4 2" : null);
 
-                // Node Title (Name)
-                node.append("text")
-                    .attr("dy", "3")
-                    .attr("text-anchor", "middle")
-                    .style("font-family", "sans-serif")
-                    .style("font-weight", "bold")
-                    .style("font-size", "{font_title_size}px")
-                    .style("fill", d => d.data.{font_colour_attr} || "{font_colour}")
-                    .text(d => d.data.name);
+                    // Node Title (Name)
+                    node.append("text")
+                        .attr("dy", "3")
+                        .attr("text-anchor", "middle")
+                        .style("font-family", "sans-serif")
+                        .style("font-weight", "bold")
+                        .style("font-size", "{font_title_size}px")
+                        .style("fill", d => d.data.{font_colour_attr} || "{font_colour}")
+                        .text(d => d.data.name);
 
-                // Dynamic Attributes (Loop through anything else)
-                node.each(function(d) {{
-                    const attrs = getAttrs(d);
-                    const el = d3.select(this);
-                    attrs.forEach(([key, val], i) => {{
-                        el.append("text")
-                            .attr("dy", 20 + (i * 15))
-                            .attr("text-anchor", "middle")
-                            .style("font-family", "monospace")
-                            .style("font-size", "{font_size}px")
-                            .style("fill", d.data.{font_colour_attr} || "{font_colour}")
-                            .text(`${{key}}: ${{val}}`);
+                    // Dynamic Attributes (Loop through anything else)
+                    node.each(function(d) {{
+                        const attrs = getAttrs(d);
+                        const el = d3.select(this);
+                        attrs.forEach(([key, val], i) => {{
+                            el.append("text")
+                                .attr("dy", 20 + (i * 15))
+                                .attr("text-anchor", "middle")
+                                .style("font-family", "monospace")
+                                .style("font-size", "{font_size}px")
+                                .style("fill", d.data.{font_colour_attr} || "{font_colour}")
+                                .text(`${{key}}: ${{val}}`);
+                        }});
                     }});
-                }});
+                }};
+                render();
             }});
         }})();
     </script>
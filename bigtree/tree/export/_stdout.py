@@ -8,8 +8,6 @@ from bigtree.utils.constants import BaseHPrintStyle, BaseVPrintStyle, BorderStyl
 __all__ = [
     "calculate_stem_pos",
     "format_node",
-    "horizontal_join",
-    "vertical_join",
 ]
 
 T = TypeVar("T", bound=node.Node)
@@ -123,63 +121,20 @@ def format_node(
             prefix_line[node_mid] = style.BRANCH
             prefix_line2 = [" "] * height
             if intermediate_node_name or _node.is_leaf:
-                node_display_lines = horizontal_join(
-                    [prefix_line, prefix_line2, node_display_lines]
-                )
+                node_display_lines = [
+                    f"{prefix}{prefix2}{node_display_line}"
+                    for prefix, prefix2, node_display_line in zip(
+                        prefix_line, prefix_line2, node_display_lines, strict=True
+                    )
+                ]
             else:
                 prefix_line2 = prefix_line
             # If there are subsequent children
             if any(_node.children):
-                node_display_lines = horizontal_join(
-                    [node_display_lines, prefix_line2, prefix_line]
-                )
+                node_display_lines = [
+                    f"{node_display_line}{prefix2}{prefix}"
+                    for node_display_line, prefix2, prefix in zip(
+                        node_display_lines, prefix_line2, prefix_line, strict=True
+                    )
+                ]
     return node_display_lines
-
-
-def horizontal_join(node_displays: list[list[str]], spacing: int = 0) -> list[str]:
-    """Horizontally join multiple node displays, for displaying tree vertically.
-
-    Args:
-        node_displays: multiple node displays belonging to the same row
-        spacing: spacing between node displays
-
-    Returns:
-        Node display of the row
-    """
-    space = " "
-    height = max([len(node_display) for node_display in node_displays])
-    row_display = {idx: "" for idx in range(height)}
-    for node_display_idx, node_display in enumerate(node_displays):
-        width = len(node_display[0])
-
-        # Add node content
-        for row_idx, node_display_row in enumerate(node_display):
-            if node_display_idx:
-                row_display[row_idx] += spacing * space
-            row_display[row_idx] += node_display_row
-
-        # Add node buffer
-        for row_idx_buffer in range(len(node_display), height):
-            if node_display_idx:
-                row_display[row_idx_buffer] += spacing * space
-            row_display[row_idx_buffer] += width * space
-    return [row_display[k] for k in sorted(row_display)]
-
-
-def vertical_join(node_displays: list[list[str]]) -> list[str]:
-    """Vertically join multiple node displays, for displaying tree horizontally.
-
-    Args:
-        node_displays: multiple node displays belonging to the same column
-
-    Returns:
-        Node display of the row
-    """
-    space = " "
-    width = max([len(node_display[0]) for node_display in node_displays])
-    rows_display = []
-    for node_display in node_displays:
-        for node_display_row in node_display:
-            spacing = width - len(node_display_row)
-            rows_display.append(node_display_row + spacing * space)
-    return rows_display
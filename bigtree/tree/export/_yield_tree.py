@@ -1,14 +1,13 @@
 import collections
-from typing import Iterable, TypeVar, Union
+import itertools
+from typing import Callable, Iterable, NamedTuple, TypeVar, Union
 
 from bigtree.node import node
 from bigtree.tree.export._stdout import (
     calculate_stem_pos,
     format_node,
-    horizontal_join,
-    vertical_join,
 )
-from bigtree.tree.helper import get_subtree
+from bigtree.tree.helper import get_subtree_view
 from bigtree.utils import constants, iterators
 
 __all__ = [
@@ -56,6 +55,151 @@ def _get_style_class(
     return style
 
 
+def _get_children(_node: T) -> list[T]:
+    """Get children of node, excluding empty children of binary node.
+
+    Args:
+        _node: node to get children
+
+    Returns:
+        Child node(s)
+    """
+    return [_child for _child in _node.children if _child is not None]
+
+
+class Layout(NamedTuple):
+    """Layout of node display and its descendants within a block of rows and columns, computed once in postorder.
+    Layout only holds tuples, strings, and integers, hence layout of a large tree is not traversed by the garbage
+    collector.
+
+    Node display lines are placed at `lines_row` and `lines_col`, segments of branch characters are placed at their
+    row and column, written along the row for `segments` and down the column for `column_segments`, and layout of
+    children are placed at their row and column, relative to the block.
+    """
+
+    lines: tuple[str, ...]
+    width: int
+    height: int
+    branch_idx: int
+    lines_row: int = 0
+    lines_col: int = 0
+    segments: tuple[tuple[int, int, str], ...] = ()
+    column_segments: tuple[tuple[int, int, str], ...] = ()
+    children: tuple[tuple["Layout", int, int], ...] = ()
+    gap: tuple[int, int] | None = None
+
+    def render(self, strip: bool) -> list[str]:
+        """Render layout in a single preorder pass. Node displays and branches are written left to right into the
+        buffer of each row, hence each character is written once.
+
+        Args:
+            strip: whether to strip results
+
+        Returns:
+            List of tree string to print
+        """
+        space = " "
+        rows: list[list[str]] = [[] for _ in range(self.height)]
+        rows_width = [0] * self.height
+        # Padding and branch characters are shared by rows instead of creating a string for each write
+        texts: dict[str, str] = {}
+
+        stack: list[tuple[Layout, int, int]] = [(self, 0, 0)]
+        while stack:
+            layout, row_idx, col_idx = stack.pop()
+            lines_col = col_idx + layout.lines_col
+            for write_row, line in enumerate(layout.lines, row_idx + layout.lines_row):
+                row_width = rows_width[write_row]
+                if lines_col > row_width:
+                    padding = space * (lines_col - row_width)
+                    rows[write_row].append(texts.setdefault(padding, padding))
+                rows[write_row].append(line)
+                rows_width[write_row] = lines_col + len(line)
+            if not layout.children:
+                continue
+
+            writes = itertools.chain(
+                (
+                    (row_idx + segment_row, col_idx + segment_col, segment)
+                    for segment_row, segment_col, segment in layout.segments
+                ),
+                (
+                    (write_row, col_idx + segment_col, char)
+                    for segment_row, segment_col, segment in layout.column_segments
+                    for write_row, char in enumerate(segment, row_idx + segment_row)
+                ),
+            )
+            for write_row, write_col, text in writes:
+                row_width = rows_width[write_row]
+                if write_col > row_width:
+                    padding = space * (write_col - row_width)
+                    rows[write_row].append(texts.setdefault(padding, padding))
+                rows[write_row].append(
+                    texts.setdefault(text, text) if len(text) == 1 else text
+                )
+                rows_width[write_row] = write_col + len(text)
+            stack.extend(
+                (child_layout, row_idx + child_row, col_idx + child_col)
+                for child_layout, child_row, child_col in reversed(layout.children)
+            )
+
+        widths = [self.width] * self.height
+        if self.gap:
+            # Gap between two children of root does not extend into the children
+            gap_row, gap_col = self.gap
+            widths[gap_row] = gap_col
+        result = []
+        for row, row_width, width in zip(rows, rows_width, widths, strict=True):
+            line = "".join(row)
+            if strip:
+                result.append(line.rstrip())
+            else:
+                result.append(line + space * (width - row_width))
+        return result
+
+
+def _layout_tree(
+    tree: node.Node,
+    layout_node: Callable[[node.Node, int, list[Layout]], Layout],
+    empty_node: Callable[[], node.Node],
+) -> Layout:
+    """Get layout of tree in postorder without recursion, where the layout of each node is computed once from the
+    layout of its children.
+
+    Args:
+        tree: tree to get layout
+        layout_node: function that takes in node, depth, and layout of its children, and returns layout of node
+        empty_node: function that returns node to display in place of empty children of binary node
+
+    Returns:
+        Layout of tree
+    """
+    # Nodes in preorder with their depth and number of children
+    nodes: list[tuple[node.Node, int, int]] = []
+    stack: list[tuple[node.Node, int]] = [(tree, 1)]
+    while stack:
+        _node, _depth = stack.pop()
+        children = _node.children
+        if any(children):
+            stack.extend(
+                (_child or empty_node(), _depth + 1) for _child in reversed(children)
+            )
+            nodes.append((_node, _depth, len(children)))
+        else:
+            nodes.append((_node, _depth, 0))
+
+    # Layout of children are at the end of layouts, in reverse order
+    layouts: list[Layout] = []
+    for _node, _depth, n_children in reversed(nodes):
+        if n_children:
+            children_layout = layouts[: -n_children - 1 : -1]
+            del layouts[-n_children:]
+        else:
+            children_layout = []
+        layouts.append(layout_node(_node, _depth, children_layout))
+    return layouts[0]
+
+
 class BaseYieldTree:
     def __init__(
         self,
@@ -82,7 +226,9 @@ class BaseYieldTree:
         """
         self._style_class: type[constants.BaseStyle]
         if node_name_or_path or max_depth:
-            tree = get_subtree(tree, node_name_or_path, max_depth)
+            tree = get_subtree_view(  # type: ignore[assignment]
+                tree, node_name_or_path, max_depth
+            )
 
         # Set style
         style_class = _get_style_class(self._style_class, style, "style")
@@ -116,6 +262,7 @@ class YieldTree(BaseYieldTree):
         node_name_or_path: str | None = None,
         max_depth: int = 0,
         style: str | Iterable[str] | constants.BasePrintStyle = "const",
+        collapse_after: int = 0,
     ):
         """Initialise yield tree class.
 
@@ -124,13 +271,15 @@ class YieldTree(BaseYieldTree):
             node_name_or_path: node to print from, becomes the root node of printing
             max_depth: maximum depth of tree to print, based on `depth` attribute
             style: style of print
+            collapse_after: maximum number of children to print for each node, remaining children are collapsed
         """
         self._style_class = constants.BasePrintStyle
         super().__init__(tree, node_name_or_path, max_depth, style, None)
         self.style_class: constants.BasePrintStyle
+        self.collapse_after = collapse_after
 
     def yield_tree(self, strip: bool = True) -> Iterable[tuple[str, str, T]]:
-        """Yield tree.
+        """Yield tree lazily in preorder, keeping only the children of nodes on the current path and their prefix.
 
         Args:
             strip: whether to strip results
@@ -140,34 +289,40 @@ class YieldTree(BaseYieldTree):
         """
         space = self.space
         style_class: constants.BasePrintStyle = self.style_class
+        collapse_after = self.collapse_after
 
         gap_str = space * len(style_class.STEM)
-        unclosed_depth = set()
-        initial_depth = self.tree.depth
-        for _node in iterators.preorder_iter(self.tree):
-            pre_str = ""
-            fill_str = ""
-            if _node != self.tree:
-                node_depth = _node.depth - initial_depth
-
-                # Get fill_str (style_branch or style_stem_final)
-                if _node.right_sibling:
-                    unclosed_depth.add(node_depth)
-                    fill_str = style_class.BRANCH
-                else:
-                    if node_depth in unclosed_depth:
-                        unclosed_depth.remove(node_depth)
-                    fill_str = style_class.STEM_FINAL
-
-                # Get pre_str (style_stem, style_branch, style_stem_final, or gap)
-                pre_str = ""
-                for _depth in range(1, node_depth):
-                    if _depth in unclosed_depth:
-                        pre_str += style_class.STEM
-                    else:
-                        pre_str += gap_str
-
-            yield pre_str, fill_str, _node
+        yield "", "", self.tree
+
+        # Stack of children of nodes on the current path, position of next child, and pre_str of children
+        stack: list[tuple[list[T], int, str]] = [
+            (_get_children(self.tree), 0, "")  # type: ignore[arg-type]
+        ]
+        while stack:
+            children, child_idx, pre_str = stack.pop()
+            n_children = len(children)
+            if collapse_after and child_idx == collapse_after < n_children:
+                n_collapsed = n_children - child_idx
+                collapsed_node = node.Node(
+                    f"... {n_collapsed:,} more {'child' if n_collapsed == 1 else 'children'}"
+                )
+                yield pre_str, style_class.STEM_FINAL, collapsed_node  # type: ignore[misc]
+                continue
+            if child_idx == n_children:
+                continue
+
+            _node = children[child_idx]
+            stack.append((children, child_idx + 1, pre_str))
+            if child_idx == n_children - 1:
+                yield pre_str, style_class.STEM_FINAL, _node
+                node_children = _get_children(_node)
+                if node_children:
+                    stack.append((node_children, 0, pre_str + gap_str))
+            else:
+                yield pre_str, style_class.BRANCH, _node
+                node_children = _get_children(_node)
+                if node_children:
+                    stack.append((node_children, 0, pre_str + style_class.STEM))
 
 
 class HYieldTree(BaseYieldTree):
@@ -200,7 +355,7 @@ class HYieldTree(BaseYieldTree):
 
         padding_depths = collections.defaultdict(int)
         if intermediate_node_name:
-            for _idx, _children in enumerate(iterators.levelordergroup_iter(tree)):
+            for _idx, _children in enumerate(iterators.levelordergroup_iter(self.tree)):
                 padding_depths[_idx + 1] = max(
                     [
                         len(
@@ -221,22 +376,22 @@ class HYieldTree(BaseYieldTree):
         self.intermediate_node_name = intermediate_node_name
         self.spacing = spacing
 
-    def recursive(self, _node: T | node.Node, _cur_depth: int) -> tuple[list[str], int]:
-        """Get string for tree horizontally. Recursively iterate the nodes in post-order traversal manner.
+    def layout_node(
+        self, _node: T | node.Node, _cur_depth: int, children_layout: list[Layout]
+    ) -> Layout:
+        """Get layout of node horizontally, from the layout of its children which are placed in a column.
 
         Args:
-            _node: node to get string
+            _node: node to get layout
             _cur_depth: current depth of node
+            children_layout: layout of children of node
 
         Returns:
-            Intermediate/final result for node, index of branch
+            Layout of node and its children
         """
-        space = self.space
+        spacing = self.spacing
         style_class: constants.BaseHPrintStyle = self.style_class
 
-        if not _node:
-            # For binary node
-            _node = node.Node(" ")
         node_display_lines = format_node(
             _node,
             self.alias,
@@ -245,83 +400,87 @@ class HYieldTree(BaseYieldTree):
             self.border_style_class,
             self.padding_depths[_cur_depth],
         )
-        node_mid = calculate_stem_pos(len(node_display_lines))
-
-        children = list(_node.children) if any(list(_node.children)) else []
-        if not len(children):
-            return node_display_lines, node_mid
+        node_width, node_height = len(node_display_lines[0]), len(node_display_lines)
+        node_mid = calculate_stem_pos(node_height)
+        if not children_layout:
+            return Layout(tuple(node_display_lines), node_width, node_height, node_mid)
 
-        result_children, result_idx = [], []
+        children_pos, result_idx = [], []
         cumulative_height = 0
-        for child in children:
-            result_child, result_branch_idx = self.recursive(child, _cur_depth + 1)
-            result_idx.append(cumulative_height + result_branch_idx)
-            cumulative_height += len(result_child)
-            result_children.append(result_child)
+        for child_layout in children_layout:
+            children_pos.append(cumulative_height)
+            result_idx.append(cumulative_height + child_layout.branch_idx)
+            cumulative_height += child_layout.height
 
-        # Join children column
-        children_display_lines = vertical_join(result_children)
-
-        # Calculate index of first branch, last branch, total length, and midpoint
-        first, last, total = (
-            result_idx[0],
-            result_idx[-1],
-            len(children_display_lines),
-        )
+        # Calculate index of first branch, last branch, and midpoint
+        first, last = result_idx[0], result_idx[-1]
         mid = (first + last) // 2
 
-        if len(children) == 1:
+        # Branches of the columns before, at, and after the line, from the first branch
+        gap_idx = None
+        if len(children_layout) == 1:
             # Special case for one child (need only one branch)
-            line = space * first + style_class.BRANCH + space * (total - first - 1)
-            line_prefix = line_suffix = line
-        elif len(children) == 2 and (last - first == 1):
+            line = style_class.BRANCH
+            prefix_idx = suffix_idx = [first]
+        elif len(children_layout) == 2 and (last - first == 1):
             # Special case for two children (need split_branch)
             # Create gap if two children occupy two rows
-            children_display_lines.insert(last, "")
+            gap_idx = last
+            children_pos[1] += 1
+            cumulative_height += 1
             last = first + 2
             mid = (last - first) // 2
-            line_prefix = space * (first + 1) + style_class.BRANCH + space
             line = (
-                space * first
-                + style_class.FIRST_CHILD
+                style_class.FIRST_CHILD
                 + style_class.SPLIT_BRANCH
                 + style_class.LAST_CHILD
             )
-            line_suffix = (
-                space * first + style_class.BRANCH + space + style_class.BRANCH
-            )
+            prefix_idx, suffix_idx = [first + 1], [first, last]
         else:
-            line_prefix = space * (first + 1)
-            line = space * first + style_class.FIRST_CHILD
-            line_suffix = space * first + style_class.BRANCH
+            line = style_class.FIRST_CHILD
             for bef, aft in zip(result_idx, result_idx[1:], strict=False):
-                line_prefix += space * (aft - bef)
                 line += (
                     style_class.STEM * (aft - bef - 1) + style_class.SUBSEQUENT_CHILD
                 )
-                line_suffix += space * (aft - bef - 1) + style_class.BRANCH
             line = line[:-1] + style_class.LAST_CHILD
-            line_suffix = line_suffix[:-1] + style_class.BRANCH
             if mid in result_idx:
                 stem = style_class.MIDDLE_CHILD if mid else style_class.FIRST_CHILD
             else:
                 stem = style_class.SPLIT_BRANCH
-            line_prefix = (
-                line_prefix[:mid] + style_class.BRANCH + line_prefix[mid + 1 :]  # noqa
-            )
-            line = line[:mid] + stem + line[mid + 1 :]  # noqa
+            line = line[: mid - first] + stem + line[mid - first + 1 :]  # noqa
+            prefix_idx, suffix_idx = [mid], result_idx
+
         display_buffer = max(0, mid - node_mid)
         line_buffer = max(0, node_mid - mid)
-        node_display_buffer = [len(node_display_lines[0]) * space] * display_buffer
-        child_display_buffer = [len(children_display_lines[0]) * space] * line_buffer
-        result = horizontal_join(
-            [node_display_buffer + node_display_lines]
-            + [list(" " * line_buffer + line_prefix)] * self.spacing
-            + [list(" " * line_buffer + line)]
-            + [list(" " * line_buffer + line_suffix)] * self.spacing
-            + [child_display_buffer + children_display_lines]
+        line_col = node_width + spacing
+        children_col = line_col + 1 + spacing
+        # Segments are written in order of column
+        column_segments = [
+            (line_buffer + idx, col, style_class.BRANCH)
+            for col in range(node_width, line_col)
+            for idx in prefix_idx
+        ]
+        column_segments.append((line_buffer + first, line_col, line))
+        column_segments.extend(
+            (line_buffer + idx, col, style_class.BRANCH)
+            for col in range(line_col + 1, children_col)
+            for idx in suffix_idx
+        )
+        return Layout(
+            tuple(node_display_lines),
+            children_col + max(child_layout.width for child_layout in children_layout),
+            max(display_buffer + node_height, line_buffer + cumulative_height),
+            mid + line_buffer,
+            lines_row=display_buffer,
+            column_segments=tuple(column_segments),
+            children=tuple(
+                (child_layout, line_buffer + child_pos, children_col)
+                for child_layout, child_pos in zip(
+                    children_layout, children_pos, strict=True
+                )
+            ),
+            gap=None if gap_idx is None else (line_buffer + gap_idx, children_col),
         )
-        return result, mid + line_buffer
 
     def yield_tree(self, strip: bool = True) -> list[str]:
         """Yield tree.
@@ -332,10 +491,8 @@ class HYieldTree(BaseYieldTree):
         Returns:
             List of tree string to print
         """
-        result_tree, _ = self.recursive(self.tree, 1)
-        if strip:
-            return [result.rstrip() for result in result_tree]
-        return result_tree
+        tree_layout = _layout_tree(self.tree, self.layout_node, lambda: node.Node(" "))
+        return tree_layout.render(strip)
 
 
 class VYieldTree(BaseYieldTree):
@@ -369,21 +526,21 @@ class VYieldTree(BaseYieldTree):
         self.intermediate_node_name = intermediate_node_name
         self.spacing = spacing
 
-    def recursive(self, _node: T | node.Node) -> tuple[list[str], int]:
-        """Get string for tree vertically. Recursively iterate the nodes in post-order traversal manner.
+    def layout_node(
+        self, _node: T | node.Node, _cur_depth: int, children_layout: list[Layout]
+    ) -> Layout:
+        """Get layout of node vertically, from the layout of its children which are placed in a row.
 
         Args:
-            _node: node to get string
+            _node: node to get layout
+            _cur_depth: current depth of node
+            children_layout: layout of children of node
 
         Returns:
-            Intermediate/final result for node, index of branch
+            Layout of node and its children
         """
-        space = self.space
         style_class: constants.BaseVPrintStyle = self.style_class
 
-        if not _node:
-            # For binary node
-            _node = node.Node(" ", parent=node.Node(" "))
         node_display_lines = format_node(
             _node,
             self.alias,
@@ -391,64 +548,60 @@ class VYieldTree(BaseYieldTree):
             self.style_class,
             self.border_style_class,
         )
-        node_width = len(node_display_lines[0])
+        node_width, node_height = len(node_display_lines[0]), len(node_display_lines)
         node_mid = calculate_stem_pos(node_width)
+        if not children_layout:
+            return Layout(tuple(node_display_lines), node_width, node_height, node_mid)
 
-        children = list(_node.children) if any(list(_node.children)) else []
-        if not len(children):
-            return node_display_lines, node_mid
-
-        result_children, result_idx = [], []
+        children_pos, result_idx = [], []
         cumulative_width = 0
-        for child in children:
-            result_child, result_branch_idx = self.recursive(child)
-            result_idx.append(cumulative_width + result_branch_idx)
-            cumulative_width += len(result_child[0]) + self.spacing
-            result_children.append(result_child)
-
-        # Join children row
-        children_display_lines = horizontal_join(result_children, self.spacing)
+        for child_layout in children_layout:
+            children_pos.append(cumulative_width)
+            result_idx.append(cumulative_width + child_layout.branch_idx)
+            cumulative_width += child_layout.width + self.spacing
 
         # Calculate index of first branch, last branch, total length, and midpoint
         first, last, total = (
             result_idx[0],
             result_idx[-1],
-            len(children_display_lines[0]),
+            cumulative_width - self.spacing,
         )
         mid = (first + last) // 2
 
-        if len(children) == 1:
+        # Line from first branch to last branch
+        if len(children_layout) == 1:
             # Special case for one child (need only one branch)
-            line = space * first + style_class.BRANCH + space * (total - first - 1)
+            line = style_class.BRANCH
         else:
-            line = space * first + style_class.FIRST_CHILD
+            line = style_class.FIRST_CHILD
             for bef, aft in zip(result_idx, result_idx[1:], strict=False):
                 line += style_class.STEM * (aft - bef - 1)
                 line += style_class.SUBSEQUENT_CHILD
             line = line[:-1] + style_class.LAST_CHILD
-            line += space * (total - result_idx[-1] - 1)
             stem = (
                 style_class.MIDDLE_CHILD
                 if mid in result_idx
                 else style_class.SPLIT_BRANCH
             )
-            line = line[:mid] + stem + line[mid + 1 :]  # noqa
+            line = line[: mid - first] + stem + line[mid - first + 1 :]  # noqa
         display_buffer = max(0, mid - node_mid)
         line_buffer = max(0, node_mid - mid)
-        result = vertical_join(
-            [
-                [
-                    display_buffer * space + result_line
-                    for result_line in node_display_lines
-                ],
-                [line_buffer * space + line],
-                [
-                    line_buffer * space + result_line
-                    for result_line in children_display_lines
-                ],
-            ]
+        return Layout(
+            tuple(node_display_lines),
+            max(display_buffer + node_width, line_buffer + total),
+            node_height
+            + 1
+            + max(child_layout.height for child_layout in children_layout),
+            mid + line_buffer,
+            lines_col=display_buffer,
+            segments=((node_height, line_buffer + first, line),),
+            children=tuple(
+                (child_layout, node_height + 1, line_buffer + child_pos)
+                for child_layout, child_pos in zip(
+                    children_layout, children_pos, strict=True
+                )
+            ),
         )
-        return result, mid + line_buffer
 
     def yield_tree(self, strip: bool = False) -> list[str]:
         """Yield tree.
@@ -459,7 +612,9 @@ class VYieldTree(BaseYieldTree):
         Returns:
             List of tree string to print
         """
-        result_tree, _ = self.recursive(self.tree)
-        if strip:
-            return [result.rstrip() for result in result_tree]
-        return result_tree
+        tree_layout = _layout_tree(
+            self.tree,
+            self.layout_node,
+            lambda: node.Node(" ", parent=node.Node(" ")),
+        )
+        return tree_layout.render(strip)
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import os
+import pickle
+import struct
+import sys
+from array import array
+from typing import IO, Any, TypeVar
+
+from bigtree.node import basenode, node
+from bigtree.utils import common
+from bigtree.utils.constants import BinaryConstants
+
+__all__ = [
+    "tree_to_bytes",
+    "save_tree",
+]
+
+T = TypeVar("T", bound=basenode.BaseNode)
+
+_ABSENT = object()
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+
+def _pad(length: int) -> bytes:
+    """Get padding bytes to align `length` to 8 bytes.
+
+    Args:
+        length: length of data
+
+    Returns:
+        Padding bytes
+    """
+    return b"\x00" * (-length % 8)
+
+
+def _array_to_bytes(values: array) -> bytes:  # type: ignore[type-arg]
+    """Convert array to little-endian bytes.
+
+    Args:
+        values: array of values
+
+    Returns:
+        Little-endian bytes
+    """
+    if sys.byteorder != "little":  # pragma: no cover
+        values.byteswap()
+    return values.tobytes()
+
+
+def _get_column_type(values: list[Any]) -> bytes:
+    """Get type code of column from the exact types of its values, ignoring absent and None values.
+
+    Args:
+        values: values of column, one for each node
+
+    Returns:
+        Type code of column
+    """
+    value_types = {
+        type(value) for value in values if value is not _ABSENT and value is not None
+    }
+    if value_types == {bool}:
+        return BinaryConstants.TYPE_BOOL
+    if value_types == {int} and all(
+        _INT64_MIN <= value <= _INT64_MAX
+        for value in values
+        if value is not _ABSENT and value is not None
+    ):
+        return BinaryConstants.TYPE_INT
+    if value_types == {float}:
+        return BinaryConstants.TYPE_FLOAT
+    if value_types == {str}:
+        return BinaryConstants.TYPE_STR
+    return BinaryConstants.TYPE_OBJECT
+
+
+def tree_to_bytes(tree: T) -> bytes:
+    """Export tree to compact binary snapshot, which can be loaded back with ``bytes_to_tree``.
+
+    All descendants from `tree` will be exported, `tree` can be the root node or child node of tree. Node name and all
+    attributes are exported, except attributes starting with underscore.
+
+    The snapshot is versioned and consists of a preorder structure array, an interned string table and one typed
+    column for each attribute, refer to ``BinaryConstants`` for the binary layout. Columns of bool, int, float, and str
+    values are stored as arrays, other values are pickled.
+
+    Examples:
+        >>> from bigtree import Node, bytes_to_tree, tree_to_bytes
+        >>> root = Node("a", age=90)
+        >>> b = Node("b", age=65, parent=root)
+        >>> c = Node("c", age=60, parent=root)
+        >>> d = Node("d", age=40, parent=b)
+        >>> data = tree_to_bytes(root)
+        >>> data[:8]
+        b'BIGTREE\\x00'
+        >>> bytes_to_tree(data).show(attr_list=["age"])
+        a [age=90]
+        ├── b [age=65]
+        │   └── d [age=40]
+        └── c [age=60]
+
+    Args:
+        tree: tree to be exported
+
+    Returns:
+        Binary snapshot of tree
+    """
+    # Structure in preorder
+    nodes: list[T] = []
+    parents = array("q")
+    stack: list[tuple[T, int]] = [(tree, -1)]
+    while stack:
+        _node, parent_idx = stack.pop()
+        node_idx = len(nodes)
+        nodes.append(_node)
+        parents.append(parent_idx)
+        stack.extend(
+            (_child, node_idx) for _child in reversed(_node.children) if _child
+        )
+    n_nodes = len(nodes)
+    sizes = array("q", [1]) * n_nodes
+    for node_idx in range(n_nodes - 1, 0, -1):
+        sizes[parents[node_idx]] += sizes[node_idx]
+
+    # Columns and string table
+    strings: dict[str, int] = {}
+
+    def _intern(value: str) -> int:
+        """Get index of string in string table, adding it to string table if it is new.
+
+        Args:
+            value: string to be stored
+
+        Returns:
+            Index of string in string table
+        """
+        if value not in strings:
+            strings[value] = len(strings)
+        return strings[value]
+
+    columns: dict[str, list[Any]] = {}
+    for node_idx, _node in enumerate(nodes):
+        for attr_name, attr_value in _node.describe(exclude_prefix="_"):
+            if attr_name not in columns:
+                columns[attr_name] = [_ABSENT] * n_nodes
+            columns[attr_name][node_idx] = attr_value
+
+    column_data: list[bytes] = []
+    for attr_name, values in columns.items():
+        mask = bytes(
+            (
+                BinaryConstants.MASK_ABSENT
+                if value is _ABSENT
+                else (
+                    BinaryConstants.MASK_NONE
+                    if value is None
+                    else BinaryConstants.MASK_VALUE
+                )
+            )
+            for value in values
+        )
+        type_code = _get_column_type(values)
+        if type_code == BinaryConstants.TYPE_OBJECT:
+            data = pickle.dumps(
+                [
+                    value
+                    for value in values
+                    if value is not _ABSENT and value is not None
+                ]
+            )
+        elif type_code == BinaryConstants.TYPE_STR:
+            data = _array_to_bytes(
+                array(
+                    "I",
+                    [
+                        _intern(value) if isinstance(value, str) else 0
+                        for value in values
+                    ],
+                )
+            )
+        else:
+            values = [
+                0 if value is _ABSENT or value is None else value for value in values
+            ]
+            if type_code == BinaryConstants.TYPE_BOOL:
+                data = bytes(values)
+            else:
+                data = _array_to_bytes(array(type_code.decode(), values))
+        column_data.append(
+            struct.pack(
+                BinaryConstants.COLUMN_FORMAT,
+                _intern(attr_name),
+                type_code,
+                len(data),
+            )
+            + mask
+            + _pad(n_nodes)
+            + data
+            + _pad(len(data))
+        )
+
+    sep = tree.sep if isinstance(tree, node.Node) else None
+    sep_idx = BinaryConstants.NO_INDEX if sep is None else _intern(sep)
+    encoded_strings = [
+        string.encode("utf-8", errors="surrogatepass") for string in strings
+    ]
+    offsets = array("Q", [0])
+    for encoded_string in encoded_strings:
+        offsets.append(offsets[-1] + len(encoded_string))
+
+    header = struct.pack(
+        BinaryConstants.HEADER_FORMAT,
+        BinaryConstants.MAGIC,
+        BinaryConstants.VERSION,
+        0,
+        len(columns),
+        sep_idx,
+        0,
+        n_nodes,
+        len(strings),
+    )
+    return b"".join(
+        [
+            header,
+            _array_to_bytes(offsets),
+            *encoded_strings,
+            _pad(offsets[-1]),
+            _array_to_bytes(parents),
+            _array_to_bytes(sizes),
+            *column_data,
+        ]
+    )
+
+
+def save_tree(tree: T, file: str | os.PathLike[str] | IO[bytes]) -> None:
+    """Save tree to file as compact binary snapshot, which can be loaded back with ``load_tree``.
+
+    Refer to ``tree_to_bytes`` for the binary snapshot.
+
+    Examples:
+        >>> import io
+        >>> from bigtree import Node, load_tree, save_tree
+        >>> root = Node("a", age=90)
+        >>> b = Node("b", age=65, parent=root)
+        >>> tree_file = io.BytesIO()
+        >>> save_tree(root, tree_file)
+        >>> _ = tree_file.seek(0)
+        >>> load_tree(tree_file).show(attr_list=["age"])
+        a [age=90]
+        └── b [age=65]
+
+    Args:
+        tree: tree to be saved
+        file: path of file, or file object opened in binary mode
+    """
+    data = tree_to_bytes(tree)
+    with common.open_file(file, "wb") as fp:
+        fp.write(data)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import TypeVar
+import csv
+import json
+import os
+from typing import IO, Any, Callable, Iterator, TypeVar
 
 from bigtree.node import node
 from bigtree.utils import common, exceptions
@@ -23,6 +26,9 @@ except ImportError:  # pragma: no cover
 __all__ = [
     "tree_to_dataframe",
     "tree_to_polars",
+    "tree_to_parquet",
+    "tree_to_csv",
+    "tree_to_jsonl",
 ]
 
 T = TypeVar("T", bound=node.Node)
@@ -83,34 +89,24 @@ def tree_to_dataframe(
     Returns:
         pandas DataFrame containing tree information
     """
-    data_list = []
-
-    def _recursive_append(_node: T) -> None:
-        """Recursively iterate through node and its children to export to dataframe.
-
-        Args:
-            _node: current node
-        """
-        if _node:
-            if (
-                (not max_depth or _node.depth <= max_depth)
-                and (not skip_depth or _node.depth > skip_depth)
-                and (not leaf_only or _node.is_leaf)
-            ):
-                data_child = common.assemble_attributes(
-                    _node,
-                    attr_dict,
-                    all_attrs,
-                    path_key=path_col,
-                    name_key=name_col,
-                    parent_key=parent_col,
-                )
-                data_list.append(data_child)
-            for _child in _node.children:
-                _recursive_append(_child)
-
-    _recursive_append(tree)
-    return pd.DataFrame(data_list)
+    n_rows, data = next(
+        _iter_tree_columns(
+            tree,
+            path_col=path_col,
+            name_col=name_col,
+            parent_col=parent_col,
+            attr_dict=attr_dict,
+            all_attrs=all_attrs,
+            max_depth=max_depth,
+            skip_depth=skip_depth,
+            leaf_only=leaf_only,
+            missing_value=float("nan"),
+        ),
+        (0, {}),
+    )
+    if not n_rows or not data:
+        return pd.DataFrame([{}] * n_rows)
+    return pd.DataFrame(data)
 
 
 @exceptions.optional_dependencies_polars
@@ -180,31 +176,481 @@ def tree_to_polars(
     Returns:
         polars DataFrame containing tree information
     """
-    data_list = []
-
-    def _recursive_append(_node: T) -> None:
-        """Recursively iterate through node and its children to export to dataframe.
-
-        Args:
-            _node: current node
-        """
-        if _node:
-            if (
-                (not max_depth or _node.depth <= max_depth)
-                and (not skip_depth or _node.depth > skip_depth)
-                and (not leaf_only or _node.is_leaf)
-            ):
-                data_child = common.assemble_attributes(
-                    _node,
-                    attr_dict,
-                    all_attrs,
-                    path_key=path_col,
-                    name_key=name_col,
-                    parent_key=parent_col,
+    n_rows, data = next(
+        _iter_tree_columns(
+            tree,
+            path_col=path_col,
+            name_col=name_col,
+            parent_col=parent_col,
+            attr_dict=attr_dict,
+            all_attrs=all_attrs,
+            max_depth=max_depth,
+            skip_depth=skip_depth,
+            leaf_only=leaf_only,
+            missing_value=None,
+        ),
+        (0, {}),
+    )
+    if not n_rows or not data:
+        return pl.DataFrame([{}] * n_rows)
+    return pl.DataFrame(data, strict=False)
+
+
+@exceptions.optional_dependencies_polars
+def tree_to_parquet(
+    tree: T,
+    file: str | os.PathLike[str] | IO[bytes],
+    path_col: str | None = "path",
+    name_col: str | None = "name",
+    parent_col: str | None = None,
+    attr_dict: dict[str, str] | None = None,
+    all_attrs: bool = False,
+    max_depth: int = 0,
+    skip_depth: int = 0,
+    leaf_only: bool = False,
+    chunk_size: int = 10_000,
+) -> None:
+    """Export tree to Parquet file using polars, streaming rows in chunks such that memory is bounded by `chunk_size`
+    instead of the size of tree.
+
+    All descendants from `tree` will be exported, `tree` can be the root node or child node of tree.
+
+    The tree is traversed twice, first to infer the schema, then to write the rows in chunks. Columns of bool, int,
+    float, or str values are written with their type, and columns with other or mixed types are written as string.
+
+    Examples:
+        >>> import io
+        >>> import polars as pl
+        >>> from bigtree import Node, tree_to_parquet
+        >>> root = Node("a", age=90)
+        >>> b = Node("b", age=65, parent=root)
+        >>> c = Node("c", age=60, parent=root)
+        >>> d = Node("d", age=40, parent=b)
+        >>> e = Node("e", age=35, parent=b)
+        >>> parquet_file = io.BytesIO()
+        >>> tree_to_parquet(root, parquet_file, parent_col="parent", attr_dict={"age": "person age"}, chunk_size=2)
+        >>> _ = parquet_file.seek(0)
+        >>> pl.read_parquet(parquet_file)
+        shape: (5, 4)
+        ┌────────┬──────┬────────┬────────────┐
+        │ path   ┆ name ┆ parent ┆ person age │
+        │ ---    ┆ ---  ┆ ---    ┆ ---        │
+        │ str    ┆ str  ┆ str    ┆ i64        │
+        ╞════════╪══════╪════════╪════════════╡
+        │ /a     ┆ a    ┆ null   ┆ 90         │
+        │ /a/b   ┆ b    ┆ a      ┆ 65         │
+        │ /a/b/d ┆ d    ┆ b      ┆ 40         │
+        │ /a/b/e ┆ e    ┆ b      ┆ 35         │
+        │ /a/c   ┆ c    ┆ a      ┆ 60         │
+        └────────┴──────┴────────┴────────────┘
+
+    Args:
+        tree: tree to be exported
+        file: path of Parquet file, or file object opened in binary mode
+        path_col: column name for `node.path_name`
+        name_col: column name for `node.node_name`
+        parent_col: column name for `node.parent.node_name`
+        attr_dict: node attributes mapped to column name, key: node attributes, value: corresponding column in file
+        all_attrs: indicator whether to retrieve all ``Node`` attributes, overrides `attr_dict`
+        max_depth: maximum depth to export tree
+        skip_depth: number of initial depths to skip
+        leaf_only: indicator to retrieve only information from leaf nodes
+        chunk_size: maximum number of rows in each chunk
+    """
+    from polars.io.plugins import register_io_source
+
+    def iter_chunks() -> Iterator[tuple[int, dict[str, list[Any]]]]:
+        return _iter_tree_columns(
+            tree,
+            path_col=path_col,
+            name_col=name_col,
+            parent_col=parent_col,
+            attr_dict=attr_dict,
+            all_attrs=all_attrs,
+            max_depth=max_depth,
+            skip_depth=skip_depth,
+            leaf_only=leaf_only,
+            missing_value=None,
+            chunk_size=chunk_size,
+        )
+
+    # Infer schema from types of values of all chunks
+    column_types: dict[str, set[type]] = {
+        col: set()
+        for col in (
+            [] if all_attrs else _get_columns(path_col, name_col, parent_col, attr_dict)
+        )
+    }
+    for _, data in iter_chunks():
+        for col, values in data.items():
+            column_types.setdefault(col, set()).update(
+                type(value) for value in values if value is not None
+            )
+    schema = {col: _get_polars_dtype(types) for col, types in column_types.items()}
+    str_cols = [
+        col
+        for col, types in column_types.items()
+        if schema[col] == pl.String and types != {str}
+    ]
+
+    def io_source(
+        _with_columns: list[str] | None,
+        _predicate: Any,
+        _n_rows: int | None,
+        _chunk_size: int | None,
+    ) -> Iterator[pl.DataFrame]:
+        """Yield chunks of tree as polars DataFrame, the source is only sunk to file hence there are no projections or
+        predicates to apply."""
+        for n_rows, data in iter_chunks():
+            for col in str_cols:
+                if col in data:
+                    data[col] = [
+                        None if value is None else str(value) for value in data[col]
+                    ]
+            yield pl.DataFrame(
+                {col: data.get(col, [None] * n_rows) for col in schema},
+                schema=schema,
+                strict=False,
+            )
+
+    register_io_source(io_source, schema=schema).sink_parquet(
+        os.fspath(file) if isinstance(file, os.PathLike) else file
+    )
+
+
+def tree_to_csv(
+    tree: T,
+    file: str | os.PathLike[str] | IO[str],
+    path_col: str | None = "path",
+    name_col: str | None = "name",
+    parent_col: str | None = None,
+    attr_dict: dict[str, str] | None = None,
+    all_attrs: bool = False,
+    max_depth: int = 0,
+    skip_depth: int = 0,
+    leaf_only: bool = False,
+    delimiter: str = ",",
+    chunk_size: int = 10_000,
+) -> None:
+    """Export tree to CSV file, streaming rows in chunks such that memory is bounded by `chunk_size` instead of the
+    size of tree.
+
+    All descendants from `tree` will be exported, `tree` can be the root node or child node of tree.
+
+    If `all_attrs` is True, the tree is traversed twice, first to get the columns for the header row, then to write the
+    rows in chunks. Missing attributes and None values are written as empty strings.
+
+    Examples:
+        >>> import io
+        >>> from bigtree import Node, tree_to_csv
+        >>> root = Node("a", age=90)
+        >>> b = Node("b", age=65, parent=root)
+        >>> c = Node("c", age=60, parent=root)
+        >>> d = Node("d", age=40, parent=b)
+        >>> e = Node("e", age=35, parent=b)
+        >>> csv_file = io.StringIO()
+        >>> tree_to_csv(root, csv_file, parent_col="parent", attr_dict={"age": "person age"})
+        >>> print(csv_file.getvalue())
+        path,name,parent,person age
+        /a,a,,90
+        /a/b,b,a,65
+        /a/b/d,d,b,40
+        /a/b/e,e,b,35
+        /a/c,c,a,60
+        <BLANKLINE>
+
+    Args:
+        tree: tree to be exported
+        file: path of CSV file, or file object opened in text mode
+        path_col: column name for `node.path_name`
+        name_col: column name for `node.node_name`
+        parent_col: column name for `node.parent.node_name`
+        attr_dict: node attributes mapped to column name, key: node attributes, value: corresponding column in file
+        all_attrs: indicator whether to retrieve all ``Node`` attributes, overrides `attr_dict`
+        max_depth: maximum depth to export tree
+        skip_depth: number of initial depths to skip
+        leaf_only: indicator to retrieve only information from leaf nodes
+        delimiter: delimiter of CSV file
+        chunk_size: maximum number of rows in each chunk
+    """
+
+    def iter_chunks() -> Iterator[tuple[int, dict[str, list[Any]]]]:
+        return _iter_tree_columns(
+            tree,
+            path_col=path_col,
+            name_col=name_col,
+            parent_col=parent_col,
+            attr_dict=attr_dict,
+            all_attrs=all_attrs,
+            max_depth=max_depth,
+            skip_depth=skip_depth,
+            leaf_only=leaf_only,
+            missing_value=None,
+            chunk_size=chunk_size,
+        )
+
+    if all_attrs:
+        columns = list(dict.fromkeys(col for _, data in iter_chunks() for col in data))
+    else:
+        columns = _get_columns(path_col, name_col, parent_col, attr_dict)
+
+    with common.open_file(file, "w", newline="") as fp:
+        writer = csv.writer(fp, delimiter=delimiter, lineterminator="\n")
+        writer.writerow(columns)
+        for n_rows, data in iter_chunks():
+            writer.writerows(zip(*[data.get(col, [None] * n_rows) for col in columns]))
+
+
+def tree_to_jsonl(
+    tree: T,
+    file: str | os.PathLike[str] | IO[str],
+    path_col: str | None = "path",
+    name_col: str | None = "name",
+    parent_col: str | None = None,
+    attr_dict: dict[str, str] | None = None,
+    all_attrs: bool = False,
+    max_depth: int = 0,
+    skip_depth: int = 0,
+    leaf_only: bool = False,
+    chunk_size: int = 10_000,
+    default: Callable[[Any], Any] | None = str,
+) -> None:
+    """Export tree to JSON Lines file with one JSON object per node, streaming rows in chunks such that memory is
+    bounded by `chunk_size` instead of the size of tree.
+
+    All descendants from `tree` will be exported, `tree` can be the root node or child node of tree.
+
+    If `all_attrs` is True, attributes that are missing from a node are omitted from its JSON object. Attribute values
+    that are not JSON serializable, such as dates, are converted with `default`, which writes them as strings by
+    default.
+
+    Examples:
+        >>> import io
+        >>> from bigtree import Node, tree_to_jsonl
+        >>> root = Node("a", age=90)
+        >>> b = Node("b", age=65, parent=root)
+        >>> c = Node("c", age=60, parent=root)
+        >>> d = Node("d", age=40, parent=b)
+        >>> e = Node("e", age=35, parent=b)
+        >>> jsonl_file = io.StringIO()
+        >>> tree_to_jsonl(root, jsonl_file, parent_col="parent", attr_dict={"age": "person age"})
+        >>> print(jsonl_file.getvalue())
+        {"path": "/a", "name": "a", "parent": null, "person age": 90}
+        {"path": "/a/b", "name": "b", "parent": "a", "person age": 65}
+        {"path": "/a/b/d", "name": "d", "parent": "b", "person age": 40}
+        {"path": "/a/b/e", "name": "e", "parent": "b", "person age": 35}
+        {"path": "/a/c", "name": "c", "parent": "a", "person age": 60}
+        <BLANKLINE>
+
+    Args:
+        tree: tree to be exported
+        file: path of JSON Lines file, or file object opened in text mode
+        path_col: key for `node.path_name`
+        name_col: key for `node.node_name`
+        parent_col: key for `node.parent.node_name`
+        attr_dict: node attributes mapped to key, key: node attributes, value: corresponding key in JSON object
+        all_attrs: indicator whether to retrieve all ``Node`` attributes, overrides `attr_dict`
+        max_depth: maximum depth to export tree
+        skip_depth: number of initial depths to skip
+        leaf_only: indicator to retrieve only information from leaf nodes
+        chunk_size: maximum number of rows in each chunk
+        default: function that returns a JSON serializable version of attribute values that cannot be serialized,
+            raises TypeError for such values if None
+    """
+    encode = json.JSONEncoder(default=default).encode
+    missing = object()
+
+    with common.open_file(file, "w") as fp:
+        for _, data in _iter_tree_columns(
+            tree,
+            path_col=path_col,
+            name_col=name_col,
+            parent_col=parent_col,
+            attr_dict=attr_dict,
+            all_attrs=all_attrs,
+            max_depth=max_depth,
+            skip_depth=skip_depth,
+            leaf_only=leaf_only,
+            missing_value=missing,
+            chunk_size=chunk_size,
+        ):
+            columns = list(data)
+            fp.write(
+                "".join(
+                    encode(
+                        {
+                            col: value
+                            for col, value in zip(columns, row)
+                            if value is not missing
+                        }
+                    )
+                    + "\n"
+                    for row in zip(*data.values())
                 )
-                data_list.append(data_child)
-            for _child in _node.children:
-                _recursive_append(_child)
+            )
 
-    _recursive_append(tree)
-    return pl.DataFrame(data_list)
+
+def _get_columns(
+    path_col: str | None,
+    name_col: str | None,
+    parent_col: str | None,
+    attr_dict: dict[str, str] | None,
+) -> list[str]:
+    """Get column names of exported tree, if not exporting all attributes.
+
+    Args:
+        path_col: column name for `node.path_name`
+        name_col: column name for `node.node_name`
+        parent_col: column name for `node.parent.node_name`
+        attr_dict: node attributes mapped to column name, key: node attributes, value: corresponding column
+
+    Returns:
+        Column names
+    """
+    return list(
+        dict.fromkeys(
+            [
+                *[col for col in (path_col, name_col, parent_col) if col],
+                *(attr_dict or {}).values(),
+            ]
+        )
+    )
+
+
+def _get_polars_dtype(types: set[type]) -> Any:
+    """Get polars data type of column from types of its non-null values.
+
+    Args:
+        types: types of non-null values of column
+
+    Returns:
+        polars data type, string for other or mixed types
+    """
+    if not types:
+        return pl.Null
+    if types == {bool}:
+        return pl.Boolean
+    if types == {int}:
+        return pl.Int64
+    if types <= {int, float}:
+        return pl.Float64
+    return pl.String
+
+
+def _iter_tree_columns(
+    tree: T,
+    path_col: str | None,
+    name_col: str | None,
+    parent_col: str | None,
+    attr_dict: dict[str, str] | None,
+    all_attrs: bool,
+    max_depth: int,
+    skip_depth: int,
+    leaf_only: bool,
+    missing_value: Any,
+    chunk_size: int = 0,
+) -> Iterator[tuple[int, dict[str, list[Any]]]]:
+    """Iterate tree in preorder and yield chunks of columns of values, to construct dataframe column-wise or to stream
+    rows to file.
+
+    Path and depth of nodes are carried down the traversal instead of being computed for each node, and values are
+    appended to one list per column instead of assembling a dictionary per node. Columns are ordered as `path_col`,
+    `name_col`, `parent_col`, followed by node attributes, where node attributes overwrite values of columns with the
+    same name.
+
+    Args:
+        tree: tree to be exported
+        path_col: column name for `node.path_name`
+        name_col: column name for `node.node_name`
+        parent_col: column name for `node.parent.node_name`
+        attr_dict: node attributes mapped to column name, key: node attributes, value: corresponding column in dataframe
+        all_attrs: indicator whether to retrieve all ``Node`` attributes, overrides `attr_dict`
+        max_depth: maximum depth to export tree
+        skip_depth: number of initial depths to skip
+        leaf_only: indicator to retrieve only information from leaf nodes
+        missing_value: value of node attribute that is missing, if `all_attrs` is True
+        chunk_size: maximum number of rows in each chunk, all rows are yielded in one chunk if 0
+
+    Returns:
+        Number of rows, and column name mapped to values of column, of each chunk with at least one row
+    """
+    tree_ancestors = [tree, *tree.ancestors]
+    sep = tree_ancestors[-1].sep
+    missing = object()
+
+    def new_chunk() -> tuple[list[str], list[Any], list[Any], dict[str, list[Any]]]:
+        attr_values: dict[str, list[Any]] = (
+            {} if all_attrs else {attr: [] for attr in attr_dict or {}}
+        )
+        return [], [], [], attr_values
+
+    def get_chunk_data(n_rows: int) -> dict[str, list[Any]]:
+        data: dict[str, list[Any]] = {}
+        if path_col:
+            data[path_col] = paths
+        if name_col:
+            data[name_col] = names
+        if parent_col:
+            data[parent_col] = parents
+        if all_attrs:
+            for attr, values in attr_values.items():
+                values.extend([missing] * (n_rows - len(values)))
+                if any(value is missing for value in values):
+                    # Missing attributes do not overwrite path, name, or parent of node
+                    default_values = data.get(attr, [missing_value] * n_rows)
+                    values = [
+                        default_value if value is missing else value
+                        for value, default_value in zip(values, default_values)
+                    ]
+                data[attr] = values
+        elif attr_dict:
+            for attr, col in attr_dict.items():
+                data[col] = attr_values[attr]
+        return data
+
+    paths, names, parents, attr_values = new_chunk()
+    n_rows = 0
+    stack: list[tuple[T, str, int]] = [
+        (tree, tree.path_name if path_col else "", len(tree_ancestors))
+    ]
+    while stack:
+        _node, path, depth = stack.pop()
+        if (
+            (not max_depth or depth <= max_depth)
+            and (not skip_depth or depth > skip_depth)
+            and (not leaf_only or _node.is_leaf)
+        ):
+            if path_col:
+                paths.append(path)
+            if name_col:
+                names.append(_node.node_name)
+            if parent_col:
+                parents.append(_node.parent.node_name if _node.parent else None)
+            if all_attrs:
+                for attr, value in _node.describe(
+                    exclude_attributes=["name"], exclude_prefix="_"
+                ):
+                    values = attr_values.setdefault(attr, [])
+                    if len(values) < n_rows:
+                        values.extend([missing] * (n_rows - len(values)))
+                    values.append(value)
+            else:
+                for attr, values in attr_values.items():
+                    values.append(_node.get_attr(attr))
+            n_rows += 1
+            if n_rows == chunk_size:
+                yield n_rows, get_chunk_data(n_rows)
+                paths, names, parents, attr_values = new_chunk()
+                n_rows = 0
+        if not max_depth or depth < max_depth:
+            stack.extend(
+                (
+                    _child,
+                    f"{path}{sep}{_child.node_name}" if path_col else "",
+                    depth + 1,
+                )
+                for _child in reversed(_node.children)
+                if _child
+            )
+    if n_rows:
+        yield n_rows, get_chunk_data(n_rows)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, TypeVar
+import json
+import os
+from typing import IO, Any, TypeVar
 
 from bigtree.node import node
 from bigtree.utils import common
@@ -9,6 +11,7 @@ __all__ = [
     "tree_to_dict",
     "tree_to_nested_dict",
     "tree_to_nested_dict_key",
+    "tree_to_nested_json",
 ]
 
 T = TypeVar("T", bound=node.Node)
@@ -126,28 +129,20 @@ def tree_to_nested_dict(
         Dictionary containing tree information
     """
     data_dict: dict[str, list[dict[str, Any]]] = {}
-
-    def _recursive_append(_node: T, parent_dict: dict[str, Any]) -> None:
-        """Recursively iterate through node and its children to export to nested dictionary.
-
-        Args:
-            _node: current node
-            parent_dict: parent dictionary
-        """
-        if _node:
-            if not max_depth or _node.depth <= max_depth:
-                data_child = common.assemble_attributes(
-                    _node, attr_dict, all_attrs, name_key=name_key
-                )
-                if child_key in parent_dict:
-                    parent_dict[child_key].append(data_child)
-                else:
-                    parent_dict[child_key] = [data_child]
-
-                for _child in _node.children:
-                    _recursive_append(_child, data_child)
-
-    _recursive_append(tree, data_dict)
+    stack: list[tuple[T, dict[str, Any], int]] = [(tree, data_dict, tree.depth)]
+    while stack:
+        _node, parent_dict, depth = stack.pop()
+        if _node and (not max_depth or depth <= max_depth):
+            data_child = common.assemble_attributes(
+                _node, attr_dict, all_attrs, name_key=name_key
+            )
+            if child_key in parent_dict:
+                parent_dict[child_key].append(data_child)
+            else:
+                parent_dict[child_key] = [data_child]
+            stack.extend(
+                (_child, data_child, depth + 1) for _child in reversed(_node.children)
+            )
     return data_dict[child_key][0]
 
 
@@ -189,34 +184,96 @@ def tree_to_nested_dict_key(
     Returns:
         Dictionary containing tree information
     """
+    if child_key is None:
+        if attr_dict or all_attrs:
+            raise ValueError("If child_key is None, no node attributes can be exported")
+
     data_dict: dict[str, dict[str, Any]] = {}
+    stack: list[tuple[T, dict[str, Any], int]] = [(tree, data_dict, tree.depth)]
+    while stack:
+        _node, parent_dict, depth = stack.pop()
+        if _node and (not max_depth or depth <= max_depth):
+            data_child = common.assemble_attributes(_node, attr_dict, all_attrs)
+            if child_key:
+                if child_key in parent_dict:
+                    parent_dict[child_key][_node.node_name] = data_child
+                else:
+                    parent_dict[child_key] = {_node.node_name: data_child}
+            else:
+                parent_dict[_node.node_name] = data_child
+            stack.extend(
+                (_child, data_child, depth + 1) for _child in reversed(_node.children)
+            )
+    return data_dict[child_key] if child_key else data_dict
 
-    def _recursive_append(_node: T, parent_dict: dict[str, Any]) -> None:
-        """Recursively iterate through node and its children to export to nested dictionary.
 
-        Args:
-            _node: current node
-            parent_dict: parent dictionary
-        """
-        if child_key is None:
-            if attr_dict or all_attrs:
-                raise ValueError(
-                    "If child_key is None, no node attributes can be exported"
-                )
+def tree_to_nested_json(
+    tree: T,
+    file: str | os.PathLike[str] | IO[str],
+    name_key: str = "name",
+    child_key: str = "children",
+    attr_dict: dict[str, str] | None = None,
+    all_attrs: bool = False,
+    max_depth: int = 0,
+) -> None:
+    """Export tree to nested dictionary in JSON format, writing to file as the tree is traversed without building the
+    nested dictionary in memory.
 
-        if _node:
-            if not max_depth or _node.depth <= max_depth:
-                data_child = common.assemble_attributes(_node, attr_dict, all_attrs)
-                if child_key:
-                    if child_key in parent_dict:
-                        parent_dict[child_key][_node.node_name] = data_child
-                    else:
-                        parent_dict[child_key] = {_node.node_name: data_child}
-                else:
-                    parent_dict[_node.node_name] = data_child
+    All descendants from `tree` will be exported, `tree` can be the root node or child node of tree.
 
-                for _child in _node.children:
-                    _recursive_append(_child, data_child)
+    Written JSON is the same as ``json.dump(tree_to_nested_dict(tree, ...), file)``, and can be loaded back with
+    ``nested_dict_to_tree(json.load(file))``.
 
-    _recursive_append(tree, data_dict)
-    return data_dict[child_key] if child_key else data_dict
+    Examples:
+        >>> import io
+        >>> from bigtree import Node, tree_to_nested_json
+        >>> root = Node("a", age=90)
+        >>> b = Node("b", age=65, parent=root)
+        >>> c = Node("c", age=60, parent=root)
+        >>> d = Node("d", age=40, parent=b)
+        >>> e = Node("e", age=35, parent=b)
+        >>> json_file = io.StringIO()
+        >>> tree_to_nested_json(root, json_file, all_attrs=True)
+        >>> print(json_file.getvalue())
+        {"name": "a", "age": 90, "children": [{"name": "b", "age": 65, "children": [{"name": "d", "age": 40}, {"name": "e", "age": 35}]}, {"name": "c", "age": 60}]}
+
+    Args:
+        tree: tree to be exported
+        file: path of JSON file, or file object opened in text mode
+        name_key: dictionary key for `node.node_name`
+        child_key: dictionary key for list of children
+        attr_dict: node attributes mapped to dictionary key, key: node attributes, value: corresponding dictionary key
+        all_attrs: indicator whether to retrieve all ``Node`` attributes, overrides `attr_dict`
+        max_depth: maximum depth to export tree
+    """
+    encode = json.JSONEncoder().encode
+    child_key_str = f", {encode(child_key)}: ["
+
+    with common.open_file(file, "w") as fp:
+        buffer: list[str] = []
+        stack: list[tuple[T, int] | str] = [(tree, tree.depth)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                buffer.append(item)
+                continue
+            _node, depth = item
+            data_child = common.assemble_attributes(
+                _node, attr_dict, all_attrs, name_key=name_key
+            )
+            data_str = encode(data_child)
+            children = [_child for _child in _node.children if _child]
+            if children and (not max_depth or depth < max_depth):
+                buffer.append(data_str[:-1])
+                buffer.append(child_key_str if data_child else child_key_str[2:])
+                stack.append("]}")
+                for idx, _child in enumerate(reversed(children)):
+                    if idx:
+                        stack.append(", ")
+                    stack.append((_child, depth + 1))
+            else:
+                buffer.append(data_str)
+            if len(buffer) >= 1024:
+                fp.write("".join(buffer))
+                buffer.clear()
+        fp.write("".join(buffer))
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Iterable, TypeVar
+from collections import deque
+from typing import Any, Iterable, Mapping, TypeVar
 
 from bigtree.node import node
 from bigtree.tree.export._html import TREE_HTML_TEMPLATE
+from bigtree.utils import common
 
 try:
     import json
@@ -40,6 +42,7 @@ def iprint_tree(
     - Border colour, radius, width
     - Edge colour, width
     - Font colour, title size, size
+    - Number of levels to embed expanded, with deeper levels loaded on expand
 
     Customisations available on a per-node basis include
 
@@ -90,8 +93,14 @@ def tree_to_html(
     font_size: int = 11,
     height: int = 500,
     width: int = 900,
+    expand_depth: int = 0,
+    chunk_size: int = 1000,
 ) -> str:
-    """Get html tree diagram.
+    """Get html tree diagram. Clicking on a node collapses or expands its children.
+
+    For large trees, set `expand_depth` so that only the top levels are rendered initially. Children of nodes at
+    `expand_depth` are stored in separate data blocks of `chunk_size` nodes each, which are parsed only when the node
+    is expanded. This bounds the number of nodes drawn on first render and the amount of data parsed upfront.
 
     Args:
         tree: tree to display
@@ -113,6 +122,9 @@ def tree_to_html(
         font_size: font size of attribute text in node
         height: height of diagram
         width: width of diagram
+        expand_depth: number of levels to render initially, deeper levels are loaded on expand. If 0, whole tree is
+            rendered
+        chunk_size: number of collapsed nodes per data block, if `expand_depth` is set
 
     Returns:
         HTML string to display
@@ -159,13 +171,21 @@ def tree_to_html(
     attr_dict: dict[str, str] = dict(
         zip(attr_list + additional_attr_list, attr_list + additional_attr_list)
     )
-    tree_information = tree_to_nested_dict(
-        tree, attr_dict=attr_dict, all_attrs=all_attrs
-    )
+    tree_chunks = ""
+    if expand_depth:
+        tree_information, tree_chunks = _get_lazy_tree_data(
+            tree, tree_id, attr_dict, all_attrs, expand_depth, chunk_size
+        )
+    else:
+        tree_information = tree_to_nested_dict(
+            tree, attr_dict=attr_dict, all_attrs=all_attrs
+        )
     tree_data = json.dumps(tree_information)
     return TREE_HTML_TEMPLATE.format(
         tree_id=tree_id,
         tree_data=tree_data,
+        tree_chunks=tree_chunks,
+        chunk_size=chunk_size,
         node_width=node_width,
         node_radius=border_radius,
         node_colour=node_colour,
@@ -184,3 +204,90 @@ def tree_to_html(
         width=width,
         attr_to_ignore=f""", '{"', '".join(additional_attr_list)}'""",
     )
+
+
+def _get_lazy_tree_data(
+    tree: T,
+    tree_id: str,
+    attr_dict: Mapping[str, str],
+    all_attrs: bool,
+    expand_depth: int,
+    chunk_size: int,
+) -> tuple[dict[str, Any], str]:
+    """Get nested dictionary of the top `expand_depth` levels of tree, and data blocks of children of collapsed nodes.
+
+    Collapsed nodes, which have children that are not embedded in the nested dictionary, are assigned an integer id
+    under the key `_id` in breadth-first order. Children of collapsed node with id `i` are stored as a list of
+    dictionaries under key `i` of data block `i // chunk_size`, and children that are collapsed nodes are assigned
+    their own id.
+
+    Args:
+        tree: tree to export
+        tree_id: id of html element, used as prefix of id of data blocks
+        attr_dict: node attributes mapped to dictionary key
+        all_attrs: indicator whether to retrieve all ``Node`` attributes, overrides `attr_dict`
+        expand_depth: number of levels in nested dictionary
+        chunk_size: number of collapsed nodes per data block
+
+    Returns:
+        Nested dictionary of top levels of tree, and html script elements containing data blocks
+    """
+    if expand_depth < 1 or chunk_size < 1:
+        raise ValueError(
+            f"Invalid expand_depth {expand_depth} or chunk_size {chunk_size}, check `expand_depth` and `chunk_size` "
+            "to be positive integers"
+        )
+    collapsed_nodes: deque[tuple[int, T]] = deque()
+    next_id = 0
+
+    def _get_node_data(_node: T, depth: int) -> dict[str, Any]:
+        """Get attributes of node, and queue its children to be embedded separately if node is collapsed.
+
+        Args:
+            _node: node to get attributes
+            depth: depth of node, where `tree` has depth 1
+
+        Returns:
+            Attributes of node, with key `_id` if node is collapsed
+        """
+        nonlocal next_id
+        data_node = common.assemble_attributes(
+            _node, attr_dict, all_attrs, name_key="name"
+        )
+        if depth >= expand_depth and any(_node.children):
+            data_node["_id"] = next_id
+            collapsed_nodes.append((next_id, _node))
+            next_id += 1
+        return data_node
+
+    # Top levels of tree
+    tree_information = _get_node_data(tree, 1)
+    stack: list[tuple[T, dict[str, Any], int]] = [(tree, tree_information, 1)]
+    while stack:
+        _node, data_node, depth = stack.pop()
+        if depth < expand_depth:
+            children = [_child for _child in _node.children if _child]
+            if children:
+                data_node["children"] = [
+                    _get_node_data(_child, depth + 1) for _child in children
+                ]
+                stack.extend(
+                    zip(children, data_node["children"], [depth + 1] * len(children))
+                )
+
+    # Children of collapsed nodes, in data blocks of chunk_size nodes
+    tree_chunks: list[str] = []
+    chunk: dict[int, list[dict[str, Any]]] = {}
+    while collapsed_nodes:
+        collapsed_id, _node = collapsed_nodes.popleft()
+        chunk[collapsed_id] = [
+            _get_node_data(_child, expand_depth) for _child in _node.children if _child
+        ]
+        if len(chunk) == chunk_size or not collapsed_nodes:
+            chunk_data = json.dumps(chunk).replace("</", "<\\/")
+            tree_chunks.append(
+                f'\n    <script type="application/json" id="{tree_id}-chunk-{len(tree_chunks)}">'
+                f"{chunk_data}</script>"
+            )
+            chunk = {}
+    return tree_information, "".join(tree_chunks)
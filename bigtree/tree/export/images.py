@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import collections
+import functools
+import os
 import re
-from typing import Any, Callable, TypeVar
+from typing import IO, Any, Callable, Iterator, NamedTuple, TypeVar
 
 from bigtree.node import node
 from bigtree.tree.export.stdout import yield_tree
 from bigtree.utils import assertions, common, constants, exceptions
+from bigtree.utils.dot import DotWriter
 
 try:
     import pydot
@@ -34,9 +37,13 @@ except ImportError:  # pragma: no cover
 
 __all__ = [
     "tree_to_dot",
+    "tree_to_dot_file",
     "tree_to_pillow_graph",
+    "tree_to_pillow_graph_tiles",
     "tree_to_pillow",
+    "tree_to_pillow_tiles",
     "tree_to_mermaid",
+    "tree_to_mermaid_file",
 ]
 
 T = TypeVar("T", bound=node.Node)
@@ -160,9 +167,6 @@ def tree_to_dot(
     """
     # Get style
     graph_style = dict(bgcolor=bg_colour) if bg_colour else {}
-    node_style = dict(style="filled", fillcolor=node_colour) if node_colour else {}
-    node_style.update({"shape": node_shape} if node_shape else {})
-    edge_style = dict(color=edge_colour) if edge_colour else {}
 
     _graph = (
         pydot.Dot(graph_type="digraph", strict=True, rankdir=rankdir, **graph_style)
@@ -176,57 +180,168 @@ def tree_to_dot(
     for _tree in tree:
         assertions.assert_tree_type(_tree, node.Node, "Node")
 
-        name_dict: dict[str, list[str]] = collections.defaultdict(list)
-
-        def _recursive_append(
-            parent_name: str | None,
-            child_node: T,
-            _name_dict: dict[str, list[str]],
-        ) -> None:
-            """Recursively iterate through node and its children to export to dot by creating node and edges.
-
-            Args:
-                parent_name: parent name
-                child_node: current node
-            """
-            _node_style = node_style.copy()
-            _edge_style = edge_style.copy()
-
-            if node_attr:
-                if isinstance(node_attr, str) and child_node.get_attr(node_attr):
-                    _node_style.update(child_node.get_attr(node_attr))
-                elif isinstance(node_attr, Callable):  # type: ignore
-                    _node_style.update(node_attr(child_node))  # type: ignore
-            if edge_attr:
-                if isinstance(edge_attr, str) and child_node.get_attr(edge_attr):
-                    _edge_style.update(child_node.get_attr(edge_attr))
-                elif isinstance(edge_attr, Callable):  # type: ignore
-                    _edge_style.update(edge_attr(child_node))  # type: ignore
-
-            child_label = child_node.node_name
-            if child_node.path_name not in _name_dict[child_label]:  # pragma: no cover
-                _name_dict[child_label].append(child_node.path_name)
-            child_name = child_label + str(
-                _name_dict[child_label].index(child_node.path_name)
-            )
-            pydot_child_node = pydot.Node(
-                name=child_name, label=child_label, **_node_style
-            )
+        for parent_name, child_name, _node_style, _edge_style in _iter_dot_elements(
+            _tree, node_colour, node_shape, edge_colour, node_attr, edge_attr
+        ):
+            pydot_child_node = pydot.Node(name=child_name, **_node_style)
             _graph.add_node(pydot_child_node)
             if parent_name is not None:
                 edge = pydot.Edge(parent_name, child_name, **_edge_style)
                 _graph.add_edge(edge)
-            for _child in child_node.children:
-                if _child:
-                    _recursive_append(child_name, _child, _name_dict)
-
-        _recursive_append(None, _tree.root, name_dict)
     return _graph
 
 
+def tree_to_dot_file(
+    tree: T | list[T],
+    file: str | os.PathLike[str] | IO[str],
+    directed: bool = True,
+    rankdir: str = "TB",
+    bg_colour: str | None = None,
+    node_colour: str | None = None,
+    node_shape: str | None = None,
+    edge_colour: str | None = None,
+    node_attr: Callable[[T], dict[str, Any]] | str | None = None,
+    edge_attr: Callable[[T], dict[str, Any]] | str | None = None,
+) -> None:
+    """Export tree(s) to dot file, writing DOT statements to file as the tree is traversed without creating pydot
+    objects, hence pydot is not required.
+
+    Written DOT source is the same as ``tree_to_dot(...).to_string()``, with identifiers and attribute values quoted
+    by the same rules as pydot, except that attributes with None value are omitted. Refer to ``tree_to_dot`` for the
+    customisations. Dot file can be rendered to image with Graphviz, or loaded with ``pydot.graph_from_dot_file``.
+
+    Examples:
+        >>> import io
+        >>> from bigtree import Node, tree_to_dot_file
+        >>> root = Node("a", age=90)
+        >>> b = Node("b", age=65, parent=root)
+        >>> c = Node("c", age=60, parent=root)
+        >>> d = Node("d", age=40, parent=b)
+        >>> e = Node("e", age=35, parent=b)
+        >>> dot_file = io.StringIO()
+        >>> tree_to_dot_file(root, dot_file, node_colour="gold", edge_attr=lambda node: {"label": node.age})
+        >>> print(dot_file.getvalue())
+        strict digraph G {
+        rankdir=TB;
+        a0 [label=a, style=filled, fillcolor=gold];
+        b0 [label=b, style=filled, fillcolor=gold];
+        a0 -> b0 [label=65];
+        d0 [label=d, style=filled, fillcolor=gold];
+        b0 -> d0 [label=40];
+        e0 [label=e, style=filled, fillcolor=gold];
+        b0 -> e0 [label=35];
+        c0 [label=c, style=filled, fillcolor=gold];
+        a0 -> c0 [label=60];
+        }
+        <BLANKLINE>
+
+    Args:
+        tree: tree(s) to be exported
+        file: path of file, or file object opened in text mode
+        directed: indicator whether graph should be directed or undirected
+        rankdir: layout direction, accepts 'TB' (top to bottom), 'BT' (bottom to top), 'LR' (left to right), or 'RL'
+            (right to left)
+        bg_colour: background color of image
+        node_colour: fill colour of nodes
+        node_shape: shape of nodes. Possible node_shape include "circle", "square", "diamond", "triangle"
+        edge_colour: colour of edges
+        node_attr: If string type, it refers to ``Node`` attribute for node style. If callable type, it takes in the
+            node itself and returns the node style. This overrides `node_colour` and `node_shape`
+        edge_attr: If string type, it refers to ``Node`` attribute for edge style. If callable type, it takes in the
+            node itself and returns the edge style. This overrides `edge_colour`
+    """
+    # Get style
+    graph_style = dict(rankdir=rankdir)
+    graph_style.update(dict(bgcolor=bg_colour) if bg_colour else {})
+
+    if not isinstance(tree, list):
+        tree = [tree]
+    for _tree in tree:
+        assertions.assert_tree_type(_tree, node.Node, "Node")
+
+    with common.open_file(file, "w") as fp:
+        writer = DotWriter(fp, directed=directed, graph_attr=graph_style)
+        for _tree in tree:
+            for parent_name, child_name, _node_style, _edge_style in _iter_dot_elements(
+                _tree, node_colour, node_shape, edge_colour, node_attr, edge_attr
+            ):
+                writer.add_node(child_name, _node_style)
+                if parent_name is not None:
+                    writer.add_edge(parent_name, child_name, _edge_style)
+        writer.close()
+
+
+def _iter_dot_elements(
+    tree: T,
+    node_colour: str | None,
+    node_shape: str | None,
+    edge_colour: str | None,
+    node_attr: Callable[[T], dict[str, Any]] | str | None,
+    edge_attr: Callable[[T], dict[str, Any]] | str | None,
+) -> Iterator[tuple[str | None, str, dict[str, Any], dict[str, Any]]]:
+    """Iterate through nodes of tree in preorder without recursion, yielding the name of parent node, name and style of
+    node, and style of edge to node. Nodes with the same name are suffixed by the order of their path.
+
+    Args:
+        tree: tree to be exported, from its root
+        node_colour: fill colour of nodes
+        node_shape: shape of nodes
+        edge_colour: colour of edges
+        node_attr: ``Node`` attribute or callable for node style, overrides `node_colour` and `node_shape`
+        edge_attr: ``Node`` attribute or callable for edge style, overrides `edge_colour`
+
+    Returns:
+        Iterator of parent node name, node name, node style, and edge style
+    """
+    node_style = dict(style="filled", fillcolor=node_colour) if node_colour else {}
+    node_style.update({"shape": node_shape} if node_shape else {})
+    edge_style = dict(color=edge_colour) if edge_colour else {}
+
+    root = tree.root
+    sep = root.sep
+    name_dict: dict[str, dict[str, int]] = collections.defaultdict(dict)
+    stack: list[tuple[str | None, str, T]] = [(None, root.path_name, root)]
+    while stack:
+        parent_name, path_name, child_node = stack.pop()
+        child_label = child_node.node_name
+        _node_style = {"label": child_label, **node_style}
+        _edge_style = edge_style.copy()
+
+        if node_attr:
+            if isinstance(node_attr, str) and child_node.get_attr(node_attr):
+                _node_style.update(child_node.get_attr(node_attr))
+            elif isinstance(node_attr, Callable):  # type: ignore
+                _node_style.update(node_attr(child_node))  # type: ignore
+        if edge_attr:
+            if isinstance(edge_attr, str) and child_node.get_attr(edge_attr):
+                _edge_style.update(child_node.get_attr(edge_attr))
+            elif isinstance(edge_attr, Callable):  # type: ignore
+                _edge_style.update(edge_attr(child_node))  # type: ignore
+
+        path_dict = name_dict[child_label]
+        child_name = child_label + str(path_dict.setdefault(path_name, len(path_dict)))
+        yield parent_name, child_name, _node_style, _edge_style
+        stack.extend(
+            (child_name, f"{path_name}{sep}{_child.node_name}", _child)
+            for _child in reversed(child_node.children)
+            if _child
+        )
+
+
+@functools.lru_cache(maxsize=16)
 def _load_font(
     font_family: str | None = None, font_size: int = 12
-) -> ImageFont.truetype:
+) -> ImageFont.FreeTypeFont:
+    """Load font, cached by font family and font size so that the default font is downloaded once, and text
+    measurements with the same font are reused across exports.
+
+    Args:
+        font_family: file path of font family, requires .ttf file, defaults to DejaVuSans
+        font_size: font size
+
+    Returns:
+        Font
+    """
     if not font_family:
         from urllib.request import urlopen
 
@@ -241,6 +356,107 @@ def _load_font(
     return font
 
 
+@functools.lru_cache(maxsize=65536)
+def _get_text_bbox(
+    font: ImageFont.FreeTypeFont, text: str
+) -> tuple[float, float, float, float]:
+    """Get bounding box of text drawn at (0, 0), cached by font and text as node names and lines of text repeat in
+    large trees.
+
+    Args:
+        font: font
+        text: text, can be multi-line
+
+    Returns:
+        Bounding box dimensions (left, top, right, bottom)
+    """
+    _draw = ImageDraw.Draw(Image.new("RGB", (0, 0)))
+    return _draw.multiline_textbbox((0, 0), text, font=font)
+
+
+class _PillowDiagram(NamedTuple):
+    """Pillow diagram of image size and background colour, and elements to draw with their bounding box. Each element
+    is drawn by `draw_element(image_draw, element, offset)` onto an image with top-left corner at `offset` of the
+    diagram, so that the diagram can be drawn as one image or as tiles.
+    """
+
+    size: tuple[int, int]
+    bg_colour: tuple[int, int, int] | str
+    elements: list[tuple[tuple[int, int, int, int], Any]]
+    draw_element: Callable[[ImageDraw.ImageDraw, Any, tuple[int, int]], None]
+
+
+def _draw_pillow_diagram(diagram: _PillowDiagram) -> Image.Image:
+    """Draw pillow diagram as one image.
+
+    Args:
+        diagram: pillow diagram
+
+    Returns:
+        Pillow object of diagram
+    """
+    image = Image.new("RGB", diagram.size, diagram.bg_colour)
+    image_draw = ImageDraw.Draw(image)
+    for _, element in diagram.elements:
+        diagram.draw_element(image_draw, element, (0, 0))
+    return image
+
+
+def _save_pillow_diagram_tiles(
+    diagram: _PillowDiagram,
+    directory: str | os.PathLike[str],
+    tile_size: tuple[int, int],
+    file_format: str,
+) -> list[str]:
+    """Draw pillow diagram as grid of tiles, saving each tile to `directory` as `tile_{row}_{col}.{file_format}`.
+    Elements are grouped by the tiles that their bounding box overlaps, and tiles are drawn and saved one at a time.
+
+    Args:
+        diagram: pillow diagram
+        directory: directory to save tiles, created if it does not exist
+        tile_size: width and height of tiles, tiles at the right and bottom edges are cropped to the diagram
+        file_format: file extension of tiles, which determines the image format
+
+    Returns:
+        File paths of tiles, row by row
+    """
+    tile_width, tile_height = tile_size
+    if tile_width < 1 or tile_height < 1:
+        raise ValueError(
+            f"Invalid tile_size {tile_size}, check `tile_size` to be positive integers"
+        )
+    width, height = diagram.size
+    tile_elements: dict[tuple[int, int], list[Any]] = collections.defaultdict(list)
+    for (left, top, right, bottom), element in diagram.elements:
+        for row in range(
+            max(top, 0) // tile_height, min(bottom, height - 1) // tile_height + 1
+        ):
+            for col in range(
+                max(left, 0) // tile_width, min(right, width - 1) // tile_width + 1
+            ):
+                tile_elements[(row, col)].append(element)
+
+    os.makedirs(directory, exist_ok=True)
+    tile_paths = []
+    for row, tile_top in enumerate(range(0, height, tile_height)):
+        for col, tile_left in enumerate(range(0, width, tile_width)):
+            tile = Image.new(
+                "RGB",
+                (
+                    min(tile_width, width - tile_left),
+                    min(tile_height, height - tile_top),
+                ),
+                diagram.bg_colour,
+            )
+            tile_draw = ImageDraw.Draw(tile)
+            for element in tile_elements.pop((row, col), []):
+                diagram.draw_element(tile_draw, element, (tile_left, tile_top))
+            tile_path = os.path.join(directory, f"tile_{row}_{col}.{file_format}")
+            tile.save(tile_path)
+            tile_paths.append(tile_path)
+    return tile_paths
+
+
 @exceptions.optional_dependencies_image("Pillow")
 def tree_to_pillow_graph(
     tree: T,
@@ -308,6 +524,94 @@ def tree_to_pillow_graph(
     Returns:
         Pillow object of tree, in graph format
     """
+    diagram = _get_pillow_graph_diagram(
+        tree,
+        node_content,
+        margin=margin,
+        height_buffer=height_buffer,
+        width_buffer=width_buffer,
+        font_family=font_family,
+        font_size=font_size,
+        font_colour=font_colour,
+        text_align=text_align,
+        bg_colour=bg_colour,
+        rect_margin=rect_margin,
+        rect_fill=rect_fill,
+        rect_cmap_attr=rect_cmap_attr,
+        rect_outline=rect_outline,
+        rect_width=rect_width,
+        **kwargs,
+    )
+    return _draw_pillow_diagram(diagram)
+
+
+@exceptions.optional_dependencies_image("Pillow")
+def tree_to_pillow_graph_tiles(
+    tree: T,
+    directory: str | os.PathLike[str],
+    tile_size: tuple[int, int] = (1024, 1024),
+    file_format: str = "png",
+    **kwargs: Any,
+) -> list[str]:
+    r"""Export tree to image in graph format as a grid of tiles saved to `directory`, for trees that are too large to
+    draw as one image. Tiles are drawn and saved one at a time, hence memory used for drawing is bounded by the tile
+    size instead of the image size. Stitching the tiles gives the image of ``tree_to_pillow_graph``.
+
+    Tiles are saved as `tile_{row}_{col}.{file_format}`, and are `tile_size` except at the right and bottom edges.
+
+    Examples:
+        >>> import os
+        >>> import tempfile
+        >>> from bigtree import Node, tree_to_pillow_graph_tiles
+        >>> root = Node("a", age=90)
+        >>> b = Node("b", age=65, parent=root)
+        >>> c = Node("c", age=60, parent=root)
+        >>> with tempfile.TemporaryDirectory() as tmp_dir:
+        ...     tile_paths = tree_to_pillow_graph_tiles(root, tmp_dir, tile_size=(40, 40), font_family="assets/DejaVuSans.ttf")
+        ...     [os.path.basename(tile_path) for tile_path in tile_paths]
+        ['tile_0_0.png', 'tile_0_1.png', 'tile_1_0.png', 'tile_1_1.png', 'tile_2_0.png', 'tile_2_1.png']
+
+    Args:
+        tree: tree to be exported
+        directory: directory to save tiles, created if it does not exist
+        tile_size: width and height of tiles, in pixels
+        file_format: file extension of tiles, which determines the image format
+        **kwargs: refer to ``tree_to_pillow_graph`` for list of parameters
+
+    Returns:
+        File paths of tiles, row by row
+    """
+    diagram = _get_pillow_graph_diagram(tree, **kwargs)
+    return _save_pillow_diagram_tiles(diagram, directory, tile_size, file_format)
+
+
+def _get_pillow_graph_diagram(
+    tree: T,
+    node_content: str = "{node_name}",
+    *,
+    margin: dict[str, int] | None = None,
+    height_buffer: int | float = 20,
+    width_buffer: int | float = 10,
+    font_family: str | None = None,
+    font_size: int = 12,
+    font_colour: tuple[int, int, int] | str = "black",
+    text_align: str = "center",
+    bg_colour: tuple[int, int, int] | str = "white",
+    rect_margin: dict[str, int] | None = None,
+    rect_fill: tuple[int, int, int] | str | mpl.colors.Colormap = "white",
+    rect_cmap_attr: str | None = None,
+    rect_outline: tuple[int, int, int] | str = "black",
+    rect_width: int = 1,
+    **kwargs: Any,
+) -> _PillowDiagram:
+    """Get pillow diagram of tree in graph format, with one element for each node to draw its box, text, and line to
+    parent. Coordinates are rounded to whole pixels so that elements are drawn the same way on any tile.
+
+    Refer to ``tree_to_pillow_graph`` for list of parameters.
+
+    Returns:
+        Pillow diagram of tree, in graph format
+    """
     use_cmap = isinstance(rect_fill, mpl.colors.Colormap)
     if use_cmap and rect_cmap_attr is None:
         raise ValueError(
@@ -326,11 +630,9 @@ def tree_to_pillow_graph(
     # Calculate image dimension from text, get range for colourmap if applicable
     _max_text_width = 0
     _max_text_height = 0
-    _image = Image.new("RGB", (0, 0))
-    _draw = ImageDraw.Draw(_image)
+    pattern = re.compile(r"\{(.*)\}")
 
     def get_node_text(_node: T, _node_content: str) -> str:
-        pattern = re.compile(r"\{(.*)\}")
         matches = re.findall(pattern, _node_content)
         for match in matches:
             _node_content = _node_content.replace(
@@ -340,9 +642,7 @@ def tree_to_pillow_graph(
 
     cmap_range: set[float | int] = set()
     for _, _, _node in yield_tree(tree, **kwargs):
-        l, t, r, b = _draw.multiline_textbbox(
-            (0, 0), get_node_text(_node, node_content), font=font
-        )
+        l, t, r, b = _get_text_bbox(font, get_node_text(_node, node_content))
         _max_text_width = max(
             _max_text_width, l + r + rect_margin.get("l", 0) + rect_margin.get("r", 0)
         )
@@ -382,42 +682,89 @@ def tree_to_pillow_graph(
     _width = int(round(_width + 0.5, 0))
     _height = int(round(_height + 0.5, 0))
 
-    # Initialize and draw image
-    image = Image.new("RGB", (_width, _height), bg_colour)
-    image_draw = ImageDraw.Draw(image)
-
+    # Get elements of each node, coordinates of box and lines are truncated to pixels as drawn by pillow
+    half_width, half_height = 0.5 * _max_text_width, 0.5 * _max_text_height
+    elements: list[tuple[tuple[int, int, int, int], Any]] = []
     for _, _, _node in yield_tree(tree, **kwargs):
         _x, _y = _node.get_attr("x"), _node.get_attr("y")
-        x1, x2 = _x - 0.5 * _max_text_width, _x + 0.5 * _max_text_width
-        y1, y2 = _y - 0.5 * _max_text_height, _y + 0.5 * _max_text_height
-        # Draw box
+        x1, y1 = _x - half_width, _y - half_height
+        rect = (int(x1), int(y1), int(_x + half_width), int(_y + half_height))
+        text_xy = (x1 + rect_margin.get("l", 0), y1 + rect_margin.get("t", 0))
         _rect_fill = rect_fill
         if use_cmap:
             _rect_fill = mpl.colors.rgb2hex(
                 cmap_dict[norm(_node.get_attr(rect_cmap_attr, 0))]
             )
+        bbox = rect
+        parent_line = None
+        if _node.parent:
+            _child_x, _child_y = _x, _y - half_height
+            _parent_x, _parent_y = (
+                _node.parent.get_attr("x"),
+                _node.parent.get_attr("y") + half_height,
+            )
+            middle_y = (_child_y + _parent_y) / 2
+            parent_line = (
+                int(_parent_x),
+                int(_parent_y),
+                int(middle_y),
+                int(_child_x),
+                int(_child_y),
+            )
+            bbox = (
+                min(rect[0], parent_line[0], parent_line[3]),
+                parent_line[1],
+                max(rect[2], parent_line[0], parent_line[3]),
+                rect[3],
+            )
+        bbox = (
+            bbox[0] - rect_width,
+            bbox[1] - rect_width,
+            bbox[2] + rect_width,
+            bbox[3] + rect_width,
+        )
+        elements.append(
+            (
+                bbox,
+                (
+                    rect,
+                    _rect_fill,
+                    get_node_text(_node, node_content),
+                    text_xy,
+                    parent_line,
+                ),
+            )
+        )
+
+    def draw_node(
+        image_draw: ImageDraw.ImageDraw, element: Any, offset: tuple[int, int]
+    ) -> None:
+        (x1, y1, x2, y2), _rect_fill, node_text, (text_x, text_y), parent_line = element
+        _x_offset, _y_offset = offset
+        # Draw box
         image_draw.rectangle(
-            [x1, y1, x2, y2], fill=_rect_fill, outline=rect_outline, width=rect_width
+            [x1 - _x_offset, y1 - _y_offset, x2 - _x_offset, y2 - _y_offset],
+            fill=_rect_fill,
+            outline=rect_outline,
+            width=rect_width,
         )
         # Draw text
         image_draw.text(
-            (x1 + rect_margin.get("l", 0), y1 + rect_margin.get("t", 0)),
-            get_node_text(_node, node_content),
+            (text_x - _x_offset, text_y - _y_offset),
+            node_text,
             font=font,
             fill=font_colour,
             align=text_align,
         )
         # Draw line to parent
-        if _node.parent:
-            _child_x, _child_y = (
-                _node.get_attr("x"),
-                _node.get_attr("y") - 0.5 * _max_text_height,
+        if parent_line:
+            _parent_x, _parent_y, middle_y, _child_x, _child_y = parent_line
+            _parent_x, _child_x = _parent_x - _x_offset, _child_x - _x_offset
+            _parent_y, middle_y, _child_y = (
+                _parent_y - _y_offset,
+                middle_y - _y_offset,
+                _child_y - _y_offset,
             )
-            _parent_x, _parent_y = (
-                _node.parent.get_attr("x"),
-                _node.parent.get_attr("y") + 0.5 * _max_text_height,
-            )
-            middle_y = (_child_y + _parent_y) / 2
             image_draw.line(
                 (_parent_x, _parent_y, _parent_x, middle_y),
                 fill=rect_outline,
@@ -434,7 +781,7 @@ def tree_to_pillow_graph(
                 width=rect_width,
             )
 
-    return image
+    return _PillowDiagram((_width, _height), bg_colour, elements, draw_node)
 
 
 @exceptions.optional_dependencies_image("Pillow")
@@ -482,6 +829,79 @@ def tree_to_pillow(
     Returns:
         Pillow object of tree, in condensed text format
     """
+    diagram = _get_pillow_diagram(
+        tree,
+        width=width,
+        height=height,
+        start_pos=start_pos,
+        font_family=font_family,
+        font_size=font_size,
+        font_colour=font_colour,
+        bg_colour=bg_colour,
+        **kwargs,
+    )
+    return _draw_pillow_diagram(diagram)
+
+
+@exceptions.optional_dependencies_image("Pillow")
+def tree_to_pillow_tiles(
+    tree: T,
+    directory: str | os.PathLike[str],
+    tile_size: tuple[int, int] = (1024, 1024),
+    file_format: str = "png",
+    **kwargs: Any,
+) -> list[str]:
+    """Export tree to image in the same format as `print_tree` as a grid of tiles saved to `directory`, for trees
+    that are too large to draw as one image. Tiles are drawn and saved one at a time, hence memory used for drawing is
+    bounded by the tile size instead of the image size. Stitching the tiles gives the image of ``tree_to_pillow``.
+
+    Tiles are saved as `tile_{row}_{col}.{file_format}`, and are `tile_size` except at the right and bottom edges.
+
+    Examples:
+        >>> import os
+        >>> import tempfile
+        >>> from bigtree import Node, tree_to_pillow_tiles
+        >>> root = Node("a", age=90)
+        >>> b = Node("b", age=65, parent=root)
+        >>> c = Node("c", age=60, parent=root)
+        >>> with tempfile.TemporaryDirectory() as tmp_dir:
+        ...     tile_paths = tree_to_pillow_tiles(root, tmp_dir, tile_size=(40, 40), font_family="assets/DejaVuSans.ttf")
+        ...     [os.path.basename(tile_path) for tile_path in tile_paths]
+        ['tile_0_0.png', 'tile_0_1.png', 'tile_1_0.png', 'tile_1_1.png']
+
+    Args:
+        tree: tree to be exported
+        directory: directory to save tiles, created if it does not exist
+        tile_size: width and height of tiles, in pixels
+        file_format: file extension of tiles, which determines the image format
+        **kwargs: refer to ``tree_to_pillow`` for list of parameters
+
+    Returns:
+        File paths of tiles, row by row
+    """
+    diagram = _get_pillow_diagram(tree, **kwargs)
+    return _save_pillow_diagram_tiles(diagram, directory, tile_size, file_format)
+
+
+def _get_pillow_diagram(
+    tree: T,
+    width: int = 0,
+    height: int = 0,
+    start_pos: tuple[int, int] = (10, 10),
+    font_family: str | None = None,
+    font_size: int = 12,
+    font_colour: tuple[int, int, int] | str = "black",
+    bg_colour: tuple[int, int, int] | str = "white",
+    **kwargs: Any,
+) -> _PillowDiagram:
+    """Get pillow diagram of tree in the same format as `print_tree`, with one element for each line of text. Lines
+    are drawn one at a time with the line spacing of multi-line text, so that lines can be drawn on any tile.
+
+    Refer to ``tree_to_pillow`` for list of parameters.
+
+    Returns:
+        Pillow diagram of tree, in condensed text format
+    """
     # Initialize font
     font = _load_font(font_family, font_size)
 
@@ -491,39 +911,53 @@ def tree_to_pillow(
         image_text.append(f"{branch}{stem}{_node.node_name}\n")
 
     # Calculate image dimension from text, otherwise override with argument
-    def get_list_of_text_dimensions(
-        text_lines: list[str],
-    ) -> list[tuple[int, int, int, int]]:
-        """Get list dimensions.
-
-        Args:
-            text_lines: texts
-
-        Returns:
-            Bounding box dimensions (left, top, right, bottom)
-        """
-        _image = Image.new("RGB", (0, 0))
-        _draw = ImageDraw.Draw(_image)
-        return [
-            _draw.textbbox((0, 0), text_line, font=font) for text_line in text_lines
-        ]
-
-    text_dimensions = get_list_of_text_dimensions(image_text)
-    text_height = sum(
-        [text_dimension[3] + text_dimension[1] for text_dimension in text_dimensions]
+    text_dimensions = [_get_text_bbox(font, text_line) for text_line in image_text]
+    text_height = int(
+        sum(
+            [
+                text_dimension[3] + text_dimension[1]
+                for text_dimension in text_dimensions
+            ]
+        )
     )
-    text_width = max(
-        [text_dimension[2] + text_dimension[0] for text_dimension in text_dimensions]
+    text_width = int(
+        max(
+            [
+                text_dimension[2] + text_dimension[0]
+                for text_dimension in text_dimensions
+            ]
+        )
     )
-    image_text_str = "".join(image_text)
     width = max(width, text_width + 2 * start_pos[0])
     height = max(height, text_height + 2 * start_pos[1])
 
-    # Initialize and draw image
-    image = Image.new("RGB", (width, height), bg_colour)
-    image_draw = ImageDraw.Draw(image)
-    image_draw.text(start_pos, image_text_str, font=font, fill=font_colour)
-    return image
+    # Get elements of each line, spaced the same as multi-line text. Node names with line breaks span multiple lines
+    line_spacing = round(_get_text_bbox(font, "A\nA")[3] - _get_text_bbox(font, "A")[3])
+    x, y = start_pos
+    elements: list[tuple[tuple[int, int, int, int], Any]] = []
+    text_lines = "".join(image_text).split("\n")[:-1]
+    for idx, text_line in enumerate(text_lines):
+        line_y = y + idx * line_spacing
+        l, t, r, b = _get_text_bbox(font, text_line)
+        elements.append(
+            (
+                (x + int(l), line_y + int(t), x + int(r), line_y + int(b)),
+                ((x, line_y), text_line),
+            )
+        )
+
+    def draw_line(
+        image_draw: ImageDraw.ImageDraw, element: Any, offset: tuple[int, int]
+    ) -> None:
+        (line_x, line_y), text_line = element
+        image_draw.text(
+            (line_x - offset[0], line_y - offset[1]),
+            text_line,
+            font=font,
+            fill=font_colour,
+        )
+
+    return _PillowDiagram((width, height), bg_colour, elements, draw_line)
 
 
 def tree_to_mermaid(
@@ -744,16 +1178,10 @@ def tree_to_mermaid(
         Returns:
             Style
         """
-        style = []
-        if _node_colour:
-            style.append(f"fill:{_node_colour}")
-        if _node_border_colour:
-            style.append(f"stroke:{_node_border_colour}")
-        if _node_border_width:
-            style.append(f"stroke-width:{_node_border_width}")
-        if not style:
-            raise ValueError("Unable to construct style!")
-        return style_template.format(style_name=_style_name, style=",".join(style))
+        style = _construct_mermaid_style(
+            _node_colour, _node_border_colour, _node_border_width
+        )
+        return style_template.format(style_name=_style_name, style=style)
 
     default_style = _construct_style(
         "default", node_colour, node_border_colour, node_border_width
@@ -838,3 +1266,216 @@ def tree_to_mermaid(
         flows="\n".join(flows),
         styles="\n".join(styles),
     )
+
+
+def tree_to_mermaid_file(
+    tree: T,
+    file: str | os.PathLike[str] | IO[str],
+    title: str | None = None,
+    theme: str | None = None,
+    rankdir: str = "TB",
+    line_shape: str = "basis",
+    node_colour: str | None = None,
+    node_border_colour: str | None = None,
+    node_border_width: float = 1,
+    node_shape: str = "rounded_edge",
+    node_shape_attr: Callable[[T], str] | str | None = None,
+    edge_arrow: str = "normal",
+    edge_arrow_attr: Callable[[T], str] | str | None = None,
+    edge_label: str | None = None,
+    node_attr: Callable[[T], str] | str | None = None,
+    node_name_or_path: str = "",
+    max_depth: int = 0,
+) -> None:
+    """Export tree to mermaid Markdown file, writing flowchart lines to file as the tree is traversed without building
+    the mermaid string in memory.
+
+    Customisations are the same as ``tree_to_mermaid``, refer to ``tree_to_mermaid`` for the accepted parameter values.
+    Nodes are referenced by their order in preorder traversal instead of their path, and nodes with the same style share
+    one class definition, which is written before the first node with the style.
+
+    Examples:
+        >>> import io
+        >>> from bigtree import Node, tree_to_mermaid_file
+        >>> root = Node("a", node_shape="rhombus")
+        >>> b = Node("b", edge_arrow="bold", edge_label="Child 1", parent=root)
+        >>> c = Node("c", edge_arrow="dotted", edge_label="Child 2", parent=root)
+        >>> d = Node("d", node_style="fill:yellow, stroke:black", parent=b)
+        >>> e = Node("e", node_style="fill:yellow, stroke:black", parent=b)
+        >>> mermaid_file = io.StringIO()
+        >>> tree_to_mermaid_file(
+        ...     root,
+        ...     mermaid_file,
+        ...     node_shape_attr="node_shape",
+        ...     edge_label="edge_label",
+        ...     edge_arrow_attr="edge_arrow",
+        ...     node_attr="node_style",
+        ... )
+        >>> print(mermaid_file.getvalue())
+        ```mermaid
+        %%{ init: { 'flowchart': { 'curve': 'basis' } } }%%
+        flowchart TB
+        classDef default stroke-width:1
+        0{"a"} ==>|Child 1| 1("b")
+        classDef class0 fill:yellow, stroke:black
+        1 --> 2("d"):::class0
+        1 --> 3("e"):::class0
+        0 -.->|Child 2| 4("c")
+        ```
+
+    Args:
+        tree: tree to be exported
+        file: path of file, or file object opened in text mode
+        title: title
+        theme: theme or colour scheme
+        rankdir: layout direction, accepts 'TB' (top to bottom), 'BT' (bottom to top), 'LR' (left to right), 'RL' (right
+            to left)
+        line_shape: line shape or curvature
+        node_colour: fill colour of nodes, can be colour name or hexcode
+        node_border_colour: border colour of nodes, can be colour name or hexcode
+        node_border_width: width of node border
+        node_shape: node shape, sets the shape of every node
+        node_shape_attr: If string type, it refers to ``Node`` attribute for node shape. If callable type, it takes in
+            the node itself and returns the node shape. This sets the shape of custom nodes, and overrides default
+            `node_shape`
+        edge_arrow: edge arrow style from parent to itself, sets the arrow style of every edge
+        edge_arrow_attr: If string type, it refers to ``Node`` attribute for edge arrow style. If callable type, it takes
+            in the node itself and returns the edge arrow style. This sets the edge arrow style of custom nodes from
+            parent to itself, and overrides default `edge_arrow`
+        edge_label: ``Node`` attribute for edge label from parent to itself
+        node_attr: If string type, it refers to ``Node`` attribute for node style. If callable type, it takes in the node
+            itself and returns the node style. This overrides `node_colour`, `node_border_colour`, and `node_border_width`
+        node_name_or_path: node to export from, becomes the root node of flowchart
+        max_depth: maximum depth of tree to export, based on `depth` attribute of node to export from
+    """
+    node_shapes = constants.MermaidConstants.NODE_SHAPES
+    edge_arrows = constants.MermaidConstants.EDGE_ARROWS
+
+    # Assertions
+    if theme:
+        assertions.assert_str_in_list("theme", theme, constants.MermaidConstants.THEMES)
+    assertions.assert_str_in_list(
+        "rankdir", rankdir, constants.MermaidConstants.RANK_DIR
+    )
+    assertions.assert_key_in_dict("node_shape", node_shape, node_shapes)
+    assertions.assert_str_in_list(
+        "line_shape", line_shape, constants.MermaidConstants.LINE_SHAPES
+    )
+    assertions.assert_key_in_dict("edge_arrow", edge_arrow, edge_arrows)
+    default_style = _construct_mermaid_style(
+        node_colour, node_border_colour, node_border_width
+    )
+    if node_name_or_path:
+        from bigtree.tree import search
+
+        tree_node = search.find_path(tree, node_name_or_path)
+        if not tree_node:
+            raise ValueError(f"Node name or path {node_name_or_path} not found")
+        tree = tree_node
+
+    theme_mermaid = f", 'theme': '{theme}'" if theme else ""
+    line_style = f"%%{{ init: {{ 'flowchart': {{ 'curve': '{line_shape}' }}{theme_mermaid} }} }}%%"
+
+    with common.open_file(file, "w") as fp:
+        buffer: list[str] = []
+        style_classes: dict[str, str] = {}
+
+        def write(line: str) -> None:
+            """Buffer line and write buffered lines to file when buffer is full.
+
+            Args:
+                line: line of mermaid flowchart
+            """
+            buffer.append(f"{line}\n")
+            if len(buffer) >= 1024:
+                fp.write("".join(buffer))
+                buffer.clear()
+
+        def get_node_ref(_node: T, node_id: str) -> str:
+            """Get reference of node with its shape and style class, writing class definition of a new style.
+
+            Args:
+                _node: node to reference
+                node_id: interned id of node
+
+            Returns:
+                Reference of node in flowchart
+            """
+            node_ref = node_id + node_shapes[
+                common.get_attr(_node, node_shape_attr, node_shape)
+            ].format(label=_node.node_name)
+            _style = common.get_attr(_node, node_attr, "")
+            if _style:
+                if _style not in style_classes:
+                    style_classes[_style] = f"class{len(style_classes)}"
+                    write(f"classDef {style_classes[_style]} {_style}")
+                node_ref = f"{node_ref}:::{style_classes[_style]}"
+            return node_ref
+
+        write("```mermaid")
+        if title:
+            write(f"---\ntitle: {title}\n---")
+        write(line_style)
+        write(f"flowchart {rankdir}")
+        write(f"classDef default {default_style}")
+
+        # Intern node id as counter in preorder, root node is referenced with its shape on its first edge
+        root_ref: str | None = get_node_ref(tree, "0")
+        node_count = 1
+        stack: list[tuple[str, T, int]] = (
+            []
+            if max_depth == 1
+            else [("0", _child, 2) for _child in reversed(tree.children) if _child]
+        )
+        while stack:
+            parent_id, _node, _depth = stack.pop()
+            node_id = str(node_count)
+            node_count += 1
+            parent_ref = parent_id
+            if root_ref and parent_id == "0":
+                parent_ref, root_ref = root_ref, None
+
+            _arrow = edge_arrows[common.get_attr(_node, edge_arrow_attr, edge_arrow)]
+            _arrow_label = (
+                f"|{_node.get_attr(edge_label)}|"
+                if edge_label and _node.get_attr(edge_label)
+                else ""
+            )
+            write(f"{parent_ref} {_arrow}{_arrow_label} {get_node_ref(_node, node_id)}")
+            if not max_depth or _depth < max_depth:
+                stack.extend(
+                    (node_id, _child, _depth + 1)
+                    for _child in reversed(_node.children)
+                    if _child
+                )
+        if root_ref:
+            write(root_ref)
+        buffer.append("```")
+        fp.write("".join(buffer))
+
+
+def _construct_mermaid_style(
+    node_colour: str | None,
+    node_border_colour: str | None,
+    node_border_width: float,
+) -> str:
+    """Construct node style for Mermaid class definition.
+
+    Args:
+        node_colour: node colour
+        node_border_colour: node border colour
+        node_border_width: node border width
+
+    Returns:
+        Style
+    """
+    style = []
+    if node_colour:
+        style.append(f"fill:{node_colour}")
+    if node_border_colour:
+        style.append(f"stroke:{node_border_colour}")
+    if node_border_width:
+        style.append(f"stroke-width:{node_border_width}")
+    if not style:
+        raise ValueError("Unable to construct style!")
+    return ",".join(style)
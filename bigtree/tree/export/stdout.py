@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Iterable, TypeVar
+import itertools
+import os
+from typing import IO, Any, Callable, Iterable, Iterator, TypeVar
 
 from bigtree.node import node
 from bigtree.utils import common, constants, exceptions
@@ -22,6 +24,7 @@ __all__ = [
     "vprint_tree",
     "vyield_tree",
     "tree_to_newick",
+    "tree_to_newick_file",
 ]
 
 T = TypeVar("T", bound=node.Node)
@@ -89,6 +92,9 @@ def print_tree(
     attr_omit_null: bool = False,
     attr_bracket: tuple[str, str] = ("[", "]"),
     style: str | Iterable[str] | constants.BasePrintStyle = "const",
+    offset: int = 0,
+    limit: int | None = None,
+    collapse_after: int = 0,
     **kwargs: Any,
 ) -> None:
     """Print tree to console, starting from `tree`. Accepts kwargs for print() function.
@@ -101,6 +107,8 @@ def print_tree(
     - Able to omit showing of attributes if it is null, using `attr_omit_null`
     - Able to customise open and close brackets if attributes are shown, using `attr_bracket`
     - Able to customise style, to choose from str, list[str], or inherit from constants.BasePrintStyle, using `style`
+    - Able to print a page of lines, using `offset` and `limit`
+    - Able to collapse children after a number of children of each node, using `collapse_after`
     - Able to support rich format, using `rich=True`
 
     For style,
@@ -227,6 +235,22 @@ def print_tree(
         |   `-- e
         `-- c
 
+        **Printing Page of Tree**
+
+        Lines are printed as they are yielded, hence printing the first page does not traverse the whole tree
+
+        >>> tree.show(offset=1, limit=3)
+        ├── b
+        │   ├── d
+        │   └── e
+
+        >>> tree.show(collapse_after=1)
+        a
+        ├── b
+        │   ├── d
+        │   └── ... 1 more child
+        └── ... 1 more child
+
         **Printing to a file**
 
         >>> import io
@@ -265,7 +289,16 @@ def print_tree(
         attr_omit_null: indicator whether to omit showing of null attributes
         attr_bracket: open and close bracket for `all_attrs` or `attr_list`
         style: style of print
+        offset: number of lines to skip before printing
+        limit: maximum number of lines to print, prints all lines if None
+        collapse_after: maximum number of children to print for each node, remaining children are printed as one
+            line with the number of children collapsed, prints all children if 0
     """
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError(
+            f"Invalid offset {offset} or limit {limit}, check `offset` and `limit` to be non-negative integers"
+        )
+
     # Backwards-compatible, so signature does not change
     rich_display = kwargs.pop("rich", False)
     if rich_display:
@@ -284,11 +317,16 @@ def print_tree(
             else attr_bracket
         )
 
-    for pre_str, fill_str, _node in yield_tree(
-        tree=tree,
-        node_name_or_path=node_name_or_path,
-        max_depth=max_depth,
-        style=style,
+    for pre_str, fill_str, _node in itertools.islice(
+        yield_tree(
+            tree=tree,
+            node_name_or_path=node_name_or_path,
+            max_depth=max_depth,
+            style=style,
+            collapse_after=collapse_after,
+        ),
+        offset,
+        None if limit is None else offset + limit,
     ):
         # Get node_str (node name and attributes)
         attr_str = ""
@@ -334,12 +372,15 @@ def yield_tree(
     node_name_or_path: str | None = None,
     max_depth: int = 0,
     style: str | Iterable[str] | constants.BasePrintStyle = "const",
+    collapse_after: int = 0,
 ) -> Iterable[tuple[str, str, T]]:
-    """Generator method for customizing printing of tree, starting from `tree`.
+    """Generator method for customizing printing of tree, starting from `tree`. Nodes are yielded lazily in preorder,
+    hence the first lines are yielded without traversing the whole tree.
 
     - Able to select which node to print from, resulting in a subtree, using `node_name_or_path`
     - Able to customise for maximum depth to print, using `max_depth`
     - Able to customise style, to choose from str, list[str], or inherit from constants.BasePrintStyle, using `style`
+    - Able to collapse children after a number of children of each node, using `collapse_after`
 
     For style,
 
@@ -379,6 +420,16 @@ def yield_tree(
         ├── b
         └── c
 
+        **Yield Collapsed Children**
+
+        >>> for branch, stem, node in yield_tree(root, collapse_after=1):
+        ...     print(f"{branch}{stem}{node.node_name}")
+        a
+        ├── b
+        │   ├── d
+        │   └── ... 1 more child
+        └── ... 1 more child
+
         **Available Styles**
 
         >>> for branch, stem, node in yield_tree(root, style="ansi"):
@@ -455,6 +506,8 @@ def yield_tree(
         node_name_or_path: node to print from, becomes the root node of printing
         max_depth: maximum depth of tree to print, based on `depth` attribute
         style: style of print
+        collapse_after: maximum number of children to yield for each node, remaining children are yielded as one node
+            named with the number of children collapsed, yields all children if 0
 
     Returns:
         Yields tree in format branch, stem, and node
@@ -466,6 +519,7 @@ def yield_tree(
         node_name_or_path,
         max_depth,
         style,
+        collapse_after,
     )
     yield from yield_class.yield_tree()
 
@@ -1294,10 +1348,108 @@ def tree_to_newick(
     """
     if not tree:
         return ""
+    return "".join(
+        _iter_newick(
+            tree,
+            intermediate_node_name=intermediate_node_name,
+            length_attr=length_attr,
+            length_sep=length_sep,
+            attr_list=attr_list,
+            attr_prefix=attr_prefix,
+            attr_sep=attr_sep,
+        )
+    )
+
+
+def tree_to_newick_file(
+    tree: T,
+    file: str | os.PathLike[str] | IO[str],
+    intermediate_node_name: bool = True,
+    length_attr: str | None = None,
+    length_sep: str | constants.NewickCharacter = constants.NewickCharacter.SEP,
+    attr_list: Iterable[str] | None = None,
+    attr_prefix: str = "&&NHX:",
+    attr_sep: str | constants.NewickCharacter = constants.NewickCharacter.SEP,
+) -> None:
+    """Export tree to Newick notation, writing to file as the tree is traversed without building the Newick string in
+    memory.
+
+    Written Newick notation is the same as ``tree_to_newick``, refer to ``tree_to_newick`` for the customisations, and
+    can be loaded back with ``newick_to_tree(file)``.
+
+    Examples:
+        >>> import io
+        >>> from bigtree import Node, tree_to_newick_file
+        >>> root = Node("a", species="human")
+        >>> b = Node("b", age=65, species="human", parent=root)
+        >>> c = Node("c", age=60, species="human", parent=root)
+        >>> d = Node("d", age=40, species="human", parent=b)
+        >>> e = Node("e", age=35, species="human", parent=b)
+        >>> newick_file = io.StringIO()
+        >>> tree_to_newick_file(root, newick_file, length_attr="age")
+        >>> newick_file.getvalue()
+        '((d:40,e:35)b:65,c:60)a'
+
+    Args:
+        tree: tree to be exported
+        file: path of file, or file object opened in text mode
+        intermediate_node_name: indicator if intermediate nodes have node names
+        length_attr: node length attribute to extract to beside name
+        length_sep: separator between node name and length, used if length_attr is non-empty
+        attr_list: node attributes to extract into square bracket
+        attr_prefix: prefix before all attributes, within square bracket, used if attr_list is non-empty
+        attr_sep: separator between attributes, within square brackets, used if attr_list is non-empty
+    """
+    with common.open_file(file, "w") as fp:
+        if not tree:
+            return
+        buffer: list[str] = []
+        for newick_str in _iter_newick(
+            tree,
+            intermediate_node_name=intermediate_node_name,
+            length_attr=length_attr,
+            length_sep=length_sep,
+            attr_list=attr_list,
+            attr_prefix=attr_prefix,
+            attr_sep=attr_sep,
+        ):
+            buffer.append(newick_str)
+            if len(buffer) >= 1024:
+                fp.write("".join(buffer))
+                buffer.clear()
+        fp.write("".join(buffer))
+
+
+def _iter_newick(
+    tree: T,
+    intermediate_node_name: bool,
+    length_attr: str | None,
+    length_sep: str | constants.NewickCharacter,
+    attr_list: Iterable[str] | None,
+    attr_prefix: str,
+    attr_sep: str | constants.NewickCharacter,
+) -> Iterator[str]:
+    """Iterate parts of Newick notation of tree in order, traversing tree with an explicit stack.
+
+    Args:
+        tree: tree to be exported
+        intermediate_node_name: indicator if intermediate nodes have node names
+        length_attr: node length attribute to extract to beside name
+        length_sep: separator between node name and length, used if length_attr is non-empty
+        attr_list: node attributes to extract into square bracket
+        attr_prefix: prefix before all attributes, within square bracket, used if attr_list is non-empty
+        attr_sep: separator between attributes, within square brackets, used if attr_list is non-empty
+
+    Returns:
+        Part of Newick notation
+    """
     if isinstance(length_sep, constants.NewickCharacter):
         length_sep = length_sep.value
     if isinstance(attr_sep, constants.NewickCharacter):
         attr_sep = attr_sep.value
+    if attr_list:
+        attr_list = list(attr_list)
+    newick_characters = set(constants.NewickCharacter.values())
 
     def _serialize(item: Any) -> Any:
         """Serialise item if it contains special Newick characters.
@@ -1308,45 +1460,55 @@ def tree_to_newick(
         Returns:
             Serialised item
         """
-        if isinstance(item, str) and set(item).intersection(
-            constants.NewickCharacter.values()
-        ):
+        if isinstance(item, str) and not newick_characters.isdisjoint(item):
             item = f"""'{item.replace(constants.NewickCharacter.ATTR_QUOTE, '"')}'"""
         return item
 
-    node_name_str = ""
-    if intermediate_node_name or (not intermediate_node_name and tree.is_leaf):
-        node_name_str = _serialize(tree.node_name)
-    if length_attr and not tree.is_root:
-        if not tree.get_attr(length_attr):
-            raise ValueError(f"Length attribute does not exist for node {tree}")
-        node_name_str += f"{length_sep}{tree.get_attr(length_attr)}"
+    def _get_node_str(_node: T) -> str:
+        """Get node name, length, and attributes of node in Newick notation.
 
-    attr_str = ""
-    if attr_list:
-        attr_str = attr_sep.join(
-            [
-                f"{_serialize(k)}={_serialize(tree.get_attr(k))}"
-                for k in attr_list
-                if tree.get_attr(k)
-            ]
-        )
-        if attr_str:
-            attr_str = f"[{attr_prefix}{attr_str}]"
+        Args:
+            _node: node to export
+
+        Returns:
+            Newick notation of node, excluding its children
+        """
+        node_name_str = ""
+        if intermediate_node_name or (not intermediate_node_name and _node.is_leaf):
+            node_name_str = _serialize(_node.node_name)
+        if length_attr and not _node.is_root:
+            if not _node.get_attr(length_attr):
+                raise ValueError(f"Length attribute does not exist for node {_node}")
+            node_name_str += f"{length_sep}{_node.get_attr(length_attr)}"
 
-    if tree.is_leaf:
+        attr_str = ""
+        if attr_list:
+            attr_str = attr_sep.join(
+                [
+                    f"{_serialize(k)}={_serialize(_node.get_attr(k))}"
+                    for k in attr_list
+                    if _node.get_attr(k)
+                ]
+            )
+            if attr_str:
+                attr_str = f"[{attr_prefix}{attr_str}]"
         return f"{node_name_str}{attr_str}"
 
-    children_newick = ",".join(
-        tree_to_newick(
-            child,
-            intermediate_node_name=intermediate_node_name,
-            length_attr=length_attr,
-            length_sep=length_sep,
-            attr_list=attr_list,
-            attr_prefix=attr_prefix,
-            attr_sep=attr_sep,
-        )
-        for child in tree.children
-    )
-    return f"({children_newick}){node_name_str}{attr_str}"
+    stack: list[T | str] = [tree]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+            continue
+        if not item:
+            continue
+        node_str = _get_node_str(item)
+        if item.is_leaf:
+            yield node_str
+            continue
+        yield "("
+        stack.append(f"){node_str}")
+        for idx, child in enumerate(reversed(item.children)):
+            if idx:
+                stack.append(",")
+            stack.append(child)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, TypeVar
+import json
+import os
+from collections import deque
+from typing import IO, Any, Iterator, TypeVar
 
 from bigtree.node import node
-from bigtree.tree.export.stdout import yield_tree
-from bigtree.utils import constants, exceptions, plot
+from bigtree.utils import common, constants, exceptions, plot
 
 try:
     import pyvis
@@ -16,6 +18,7 @@ except ImportError:  # pragma: no cover
 
 __all__ = [
     "tree_to_vis",
+    "tree_to_vis_json",
 ]
 
 T = TypeVar("T", bound=node.Node)
@@ -31,6 +34,7 @@ def tree_to_vis(
     custom_edge_kwargs: dict[str, str] | None = None,
     edge_kwargs: dict[str, Any] | None = None,
     network_kwargs: dict[str, Any] | None = None,
+    max_nodes: int = 0,
     **kwargs: Any,
 ) -> pyvis.network.Network:
     """Export tree to pyvis for visualisations.
@@ -40,6 +44,8 @@ def tree_to_vis(
     - Able to have generic node attributes using `node_kwargs`, and individualised node attributes using `custom_node_kwargs`
     - Able to have generic edge attributes using `edge_kwargs`, and individualised edge attributes using `custom_edge_kwargs`
     - Able to have generic network attributes using `network_kwargs`
+    - Able to limit number of nodes for large trees using `max_nodes`, descendants beyond the limit are collapsed into
+      cluster nodes labelled with the number of nodes collapsed
 
     Refer to pyvis [documentation](https://pyvis.readthedocs.io/en/latest/documentation.html) for more information.
 
@@ -73,55 +79,293 @@ def tree_to_vis(
             attributes to be set. Possible keys include width (for edge weight)
         edge_kwargs: kwargs for Edge for all edges, accept keys: weight etc.
         network_kwargs: kwargs for Network, accepts keys: height, width, bgcolor, font_color, notebook, select_menu etc.
+        max_nodes: maximum number of tree nodes to display, nodes are added level by level and children of a node
+            that exceed the limit are collapsed into one cluster node, and nodes displayed are laid out again.
+            Displays all nodes if 0
+        **kwargs: kwargs for ``get_subtree_view``, accepts keys: node_name_or_path, max_depth etc.
 
     Returns:
         pyvis object for display
     """
+    vis_tree, vis_root_id = _get_vis_tree(tree, plot_kwargs, max_nodes, **kwargs)
+    vis_elements_kwargs = _get_vis_elements_kwargs(
+        custom_node_kwargs, node_kwargs, custom_edge_kwargs, edge_kwargs
+    )
+
+    from pyvis.network import Network
+
+    _net = Network(**(network_kwargs or {}))
+
+    # Nodes and edges are added in bulk, as adding one at a time searches the list of existing node ids
+    for vis_node, vis_edge in _iter_vis_elements(
+        vis_tree, vis_root_id, alias, *vis_elements_kwargs
+    ):
+        vis_node.setdefault("shape", "dot")
+        if "group" not in vis_node:
+            vis_node.setdefault("color", "#97c2fc")
+        if _net.font_color:
+            vis_node["font"] = {"color": _net.font_color}
+        _net.nodes.append(vis_node)
+        _net.node_ids.append(vis_node["id"])
+        _net.node_map[vis_node["id"]] = vis_node
+        if vis_edge:
+            if _net.directed:
+                vis_edge.setdefault("arrows", "to")
+            _net.edges.append(vis_edge)
+
+    # Pyvis settings
+    _net.toggle_physics(False)  # stick to x, y coordinates
+    return _net
+
+
+def tree_to_vis_json(
+    tree: T,
+    file: str | os.PathLike[str] | IO[str],
+    alias: str = "node_name",
+    plot_kwargs: dict[str, Any] | None = None,
+    custom_node_kwargs: dict[str, str] | None = None,
+    node_kwargs: dict[str, Any] | None = None,
+    custom_edge_kwargs: dict[str, str] | None = None,
+    edge_kwargs: dict[str, Any] | None = None,
+    max_nodes: int = 0,
+    **kwargs: Any,
+) -> None:
+    """Export tree to nodes and edges of vis-network in JSON format, writing to file as the tree is traversed without
+    creating pyvis objects. Does not require pyvis.
+
+    Written JSON is an object with `nodes` and `edges` arrays that can be passed to ``vis.Network`` in a custom html
+    page, and has the same nodes and edges as ``tree_to_vis``. Node ids are the node paths, and edges are from child
+    to parent.
+
+    Examples:
+        >>> import io
+        >>> from bigtree import Node, tree_to_vis_json
+        >>> root = Node("a", age=90)
+        >>> b = Node("b", age=65, parent=root)
+        >>> c = Node("c", age=60, parent=root)
+        >>> json_file = io.StringIO()
+        >>> tree_to_vis_json(root, json_file, custom_node_kwargs={"title": ""})
+        >>> print(json_file.getvalue())
+        {"nodes": [{"id": "/a", "label": "a", "x": 50.0, "y": 0.0, "value": 10}, {"id": "/a/b", "label": "b", "x": 0.0, "y": 100.0, "value": 10}, {"id": "/a/c", "label": "c", "x": 100.0, "y": 100.0, "value": 10}], "edges": [{"from": "/a/b", "to": "/a"}, {"from": "/a/c", "to": "/a"}]}
+
+    Args:
+        tree: tree to be exported
+        file: path of JSON file, or file object opened in text mode
+        alias: node attribute to use for node name in tree as alias to `node_name`
+        plot_kwargs: kwargs for reingold_tilford function to retrieve x, y coordinates
+        custom_node_kwargs: mapping of vis-network node option to tree node attribute if present
+        node_kwargs: vis-network node options for all nodes
+        custom_edge_kwargs: mapping of vis-network edge option to tree node attribute if present
+        edge_kwargs: vis-network edge options for all edges
+        max_nodes: maximum number of tree nodes to export, nodes are added level by level and children of a node that
+            exceed the limit are collapsed into one cluster node, and nodes exported are laid out again. Exports all
+            nodes if 0
+        **kwargs: kwargs for ``get_subtree_view``, accepts keys: node_name_or_path, max_depth etc.
+    """
+    vis_tree, vis_root_id = _get_vis_tree(tree, plot_kwargs, max_nodes, **kwargs)
+    vis_elements_kwargs = _get_vis_elements_kwargs(
+        custom_node_kwargs, node_kwargs, custom_edge_kwargs, edge_kwargs
+    )
+    encode = json.JSONEncoder().encode
+
+    with common.open_file(file, "w") as fp:
+        # Traverse twice to write nodes then edges, instead of keeping edges in memory
+        for idx, key in enumerate(["nodes", "edges"]):
+            fp.write(f"{', ' if idx else '{'}{encode(key)}: [")
+            separator = ""
+            buffer: list[str] = []
+            for vis_elements in _iter_vis_elements(
+                vis_tree, vis_root_id, alias, *vis_elements_kwargs
+            ):
+                vis_element = vis_elements[idx]
+                if vis_element:
+                    buffer.append(encode(vis_element))
+                    if len(buffer) >= 1024:
+                        fp.write(separator + ", ".join(buffer))
+                        separator = ", "
+                        buffer.clear()
+            if buffer:
+                fp.write(separator + ", ".join(buffer))
+            fp.write("]")
+        fp.write("}")
+
+
+def _get_vis_elements_kwargs(
+    custom_node_kwargs: dict[str, str] | None,
+    node_kwargs: dict[str, Any] | None,
+    custom_edge_kwargs: dict[str, str] | None,
+    edge_kwargs: dict[str, Any] | None,
+) -> tuple[dict[str, str], dict[str, Any], dict[str, str], dict[str, Any]]:
+    """Get node and edge kwargs with default values.
+
+    Args:
+        custom_node_kwargs: mapping of node option to tree node attribute
+        node_kwargs: node options for all nodes
+        custom_edge_kwargs: mapping of edge option to tree node attribute
+        edge_kwargs: edge options for all edges
+
+    Returns:
+        Node and edge kwargs
+    """
     pyvis_params = constants.PyVisParameters
-    plot_kwargs = {**pyvis_params.DEFAULT_PLOT_KWARGS, **(plot_kwargs or {})}
     custom_node_kwargs = {
         **pyvis_params.DEFAULT_CUSTOM_NODE_KWARGS,
         **(custom_node_kwargs or {}),
     }
     node_kwargs = {**pyvis_params.DEFAULT_NODE_KWARGS, **(node_kwargs or {})}
-    custom_edge_kwargs = custom_edge_kwargs or {}
-    edge_kwargs = edge_kwargs or {}
-    network_kwargs = network_kwargs or {}
+    return custom_node_kwargs, node_kwargs, custom_edge_kwargs or {}, edge_kwargs or {}
 
-    # Get x, y, coordinates of diagram
-    plot.reingold_tilford(tree, reverse=True, **plot_kwargs)
 
-    from pyvis.network import Network
+def _get_vis_tree(
+    tree: T,
+    plot_kwargs: dict[str, Any] | None,
+    max_nodes: int,
+    **kwargs: Any,
+) -> tuple[node.Node, str]:
+    """Get tree to display with x, y coordinates, and the node id of its root.
+
+    If `max_nodes` is not set, x, y coordinates are computed for `tree` before selecting the nodes to display with
+    `kwargs`, hence nodes keep their position in the full tree.
+
+    If `max_nodes` is set, a tree of at most `max_nodes` nodes is built in breadth-first order, where each node refers
+    to the node of `tree` in attribute `vis_node`. Children of a node that exceed the limit are not added, and instead
+    the node has one cluster child with the number of descendants in attribute `vis_count`. x, y coordinates are
+    computed for the tree built, as clustered nodes do not have a position in the full tree.
+
+    Args:
+        tree: tree to be exported
+        plot_kwargs: kwargs for reingold_tilford function to retrieve x, y coordinates
+        max_nodes: maximum number of tree nodes to display, displays all nodes if 0
+        **kwargs: kwargs for ``get_subtree_view``
+
+    Returns:
+        Tree to display, and node id of its root
+    """
+    from bigtree.tree.helper import get_subtree_view
 
-    _net = Network(**network_kwargs)
-
-    for _, _, _node in yield_tree(tree, **kwargs):
-        name_str = _node.get_attr(alias) or _node.node_name
-        _custom_node_kwargs = {
-            k: _node.get_attr(v)
-            for k, v in custom_node_kwargs.items()
-            if v and _node.get_attr(v)
-        }
-        _node_kwargs = {**node_kwargs, **_custom_node_kwargs}
-
-        _custom_edge_kwargs = {
-            k: _node.get_attr(v)
-            for k, v in custom_edge_kwargs.items()
-            if v and _node.get_attr(v)
-        }
-        _edge_kwargs = {**edge_kwargs, **_custom_edge_kwargs}
-
-        _net.add_node(
-            _node.path_name,
-            label=name_str,
-            x=_node.get_attr("x"),
-            y=_node.get_attr("y"),
-            **_node_kwargs,
+    if max_nodes < 0:
+        raise ValueError(
+            f"Invalid max_nodes {max_nodes}, check `max_nodes` to be non-negative integer"
         )
-        # Add edge to parent
-        if _node.parent:
-            _net.add_edge(_node.path_name, _node.parent.path_name, **_edge_kwargs)
+    plot_kwargs = {
+        **constants.PyVisParameters.DEFAULT_PLOT_KWARGS,
+        **(plot_kwargs or {}),
+    }
+    if not max_nodes:
+        plot.reingold_tilford(tree, reverse=True, **plot_kwargs)
+    if kwargs:
+        tree = get_subtree_view(tree, **kwargs)  # type: ignore[assignment]
+    vis_tree: node.Node = tree
+    if max_nodes:
+        vis_tree = node.Node("0", sep=tree.sep, vis_node=tree)
+        n_nodes = 1
+        queue: deque[node.Node] = deque([vis_tree])
+        while queue:
+            vis_node = queue.popleft()
+            children = [
+                _child for _child in vis_node.get_attr("vis_node").children if _child
+            ]
+            if not children:
+                continue
+            if n_nodes + len(children) <= max_nodes:
+                vis_children = [
+                    node.Node(str(n_nodes + idx), vis_node=_child)
+                    for idx, _child in enumerate(children)
+                ]
+                vis_node.children = vis_children
+                queue.extend(vis_children)
+                n_nodes += len(children)
+            else:
+                n_descendants = 0
+                stack = children
+                while stack:
+                    _node = stack.pop()
+                    n_descendants += 1
+                    stack.extend(_child for _child in _node.children if _child)
+                vis_node.children = [node.Node("+", vis_count=n_descendants)]
+        plot.reingold_tilford(vis_tree, reverse=True, **plot_kwargs)
+    return vis_tree, tree.path_name
 
-    # Pyvis settings
-    _net.toggle_physics(False)  # stick to x, y coordinates
-    return _net
+
+def _iter_vis_elements(
+    vis_tree: node.Node,
+    vis_root_id: str,
+    alias: str,
+    custom_node_kwargs: dict[str, str],
+    node_kwargs: dict[str, Any],
+    custom_edge_kwargs: dict[str, str],
+    edge_kwargs: dict[str, Any],
+) -> Iterator[tuple[dict[str, Any], dict[str, Any] | None]]:
+    """Iterate vis-network node and edge to parent of each node in preorder, carrying node ids down the traversal.
+    Node id is the node path, and the node id of a cluster node is the path of its parent followed by separator.
+
+    Args:
+        vis_tree: tree to display, from ``_get_vis_tree``
+        vis_root_id: node id of root
+        alias: node attribute to use for node name in tree as alias to `node_name`
+        custom_node_kwargs: mapping of node option to tree node attribute if present
+        node_kwargs: node options for all nodes
+        custom_edge_kwargs: mapping of edge option to tree node attribute if present
+        edge_kwargs: edge options for all edges
+
+    Returns:
+        Node and edge to parent, edge is None for root
+    """
+    sep = vis_tree.sep
+    is_clustered = vis_tree.get_attr("vis_node") is not None
+    n_descendants = 0
+    stack: list[tuple[node.Node, str | None]] = [(vis_tree, None)]
+    while stack:
+        vis_node, parent_id = stack.pop()
+        if is_clustered:
+            n_descendants = vis_node.get_attr("vis_count")
+            _node = vis_node.get_attr("vis_node", vis_node)
+        else:
+            _node = vis_node
+        if parent_id is None:
+            node_id = vis_root_id
+        elif n_descendants:
+            node_id = f"{parent_id}{sep}"
+        else:
+            node_id = f"{parent_id}{sep}{_node.node_name}"
+
+        if n_descendants:
+            label = f"+{n_descendants}"
+            vis_node_kwargs = {
+                **node_kwargs,
+                "title": f"{n_descendants} nodes collapsed",
+                "shape": "box",
+            }
+            vis_edge_kwargs = edge_kwargs
+        else:
+            label = _node.get_attr(alias) or _node.node_name
+            vis_node_kwargs = {
+                **node_kwargs,
+                **{
+                    k: value
+                    for k, v in custom_node_kwargs.items()
+                    if v and (value := _node.get_attr(v))
+                },
+            }
+            vis_edge_kwargs = {
+                **edge_kwargs,
+                **{
+                    k: value
+                    for k, v in custom_edge_kwargs.items()
+                    if v and (value := _node.get_attr(v))
+                },
+            }
+        yield {
+            "id": node_id,
+            "label": label,
+            "x": vis_node.get_attr("x"),
+            "y": vis_node.get_attr("y"),
+            **vis_node_kwargs,
+        }, (
+            {"from": node_id, "to": parent_id, **vis_edge_kwargs}
+            if parent_id is not None
+            else None
+        )
+        stack.extend(
+            (_child, node_id) for _child in reversed(vis_node.children) if _child
+        )
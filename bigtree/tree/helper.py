@@ -1,8 +1,17 @@
-from typing import Any, Iterable, TypeVar
+import hashlib
+from collections import Counter
+from typing import Any, Callable, Iterable, Iterator, Mapping, TypeVar
 
-from bigtree.node import basenode, binarynode, node
+from bigtree.node import basenode, binarynode, node, viewnode
 from bigtree.tree import construct, export, search
-from bigtree.utils import assertions, exceptions, iterators
+from bigtree.utils import assertions, common, exceptions, iterators
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    from unittest.mock import MagicMock
+
+    np = MagicMock()
 
 try:
     import pandas as pd
@@ -14,9 +23,15 @@ except ImportError:  # pragma: no cover
 __all__ = [
     "clone_tree",
     "get_subtree",
+    "get_subtree_view",
     "prune_tree",
     "get_tree_diff_dataframe",
     "get_tree_diff",
+    "get_subtree_hashes",
+    "get_tree_diff_by_hash",
+    "get_leaf_distance_matrix",
+    "diff_to_patch",
+    "apply_patch",
 ]
 BaseNodeT = TypeVar("BaseNodeT", bound=basenode.BaseNode)
 BinaryNodeT = TypeVar("BinaryNodeT", bound=binarynode.BinaryNode)
@@ -124,6 +139,59 @@ def get_subtree(
     return tree
 
 
+def get_subtree_view(
+    tree: node.Node,
+    node_name_or_path: str | None = None,
+    max_depth: int = 0,
+    filter_condition: Callable[[node.Node], bool] | None = None,
+) -> viewnode.ViewNode:
+    """Get read-only view of subtree based on node name or node path, maximum depth of tree, and/or filter condition.
+    Unlike ``get_subtree``, nodes are not copied; nodes of the view wrap nodes of the original tree and are created
+    only when traversed. Nodes that do not fulfil the filter condition are excluded together with their descendants.
+
+    Examples:
+        >>> from bigtree import Node, get_subtree_view
+        >>> root = Node("a")
+        >>> b = Node("b", parent=root)
+        >>> c = Node("c", parent=b)
+        >>> d = Node("d", parent=b)
+        >>> e = Node("e", parent=root)
+
+        Get subtree view
+
+        >>> root_view = get_subtree_view(root, "b")
+        >>> root_view.show()
+        b
+        ├── c
+        └── d
+
+        Get view of tree by maximum depth and filter condition
+
+        >>> root_view = get_subtree_view(root, max_depth=2, filter_condition=lambda node: node.node_name != "e")
+        >>> root_view.show()
+        a
+        └── b
+
+    Args:
+        tree: existing tree
+        node_name_or_path: node name or path to get subtree view
+        max_depth: maximum depth of subtree view, based on `depth` attribute of view
+        filter_condition: function that takes in node as argument, nodes that return False are excluded together with
+            their descendants. The view root is always included
+
+    Returns:
+        Read-only view of subtree
+    """
+    tree_sep = tree.sep
+    if node_name_or_path:
+        tree = search.find_path(tree, node_name_or_path)
+        if not tree:
+            raise ValueError(f"Node name or path {node_name_or_path} not found")
+
+    # Assign original tree's sep to subtree view
+    return viewnode.ViewNode(tree, max_depth, filter_condition, tree_sep)
+
+
 def prune_tree(
     tree: BinaryNodeT | NodeT,
     prune_path: Iterable[str] | str | None = None,
@@ -693,3 +761,798 @@ def get_tree_diff(
                 _node.name += " (~)"
         return tree_diff
     return None
+
+
+def _get_node_attrs(
+    _node: basenode.BaseNode, attr_list: Iterable[str], all_attrs: bool
+) -> list[tuple[str, Any]]:
+    """Get attributes of node used for hashing and comparison, sorted by attribute name if `all_attrs`.
+
+    Args:
+        _node: node
+        attr_list: node attributes to retrieve
+        all_attrs: indicator whether to retrieve all node attributes, overrides `attr_list`
+
+    Returns:
+        List of attribute name and attribute value pairs
+    """
+    if all_attrs:
+        return _node.describe(exclude_attributes=["name"], exclude_prefix="_")
+    return [(attr, _node.get_attr(attr)) for attr in attr_list]
+
+
+def _get_hash(
+    name: Any, attrs: list[tuple[str, Any]], child_hashes: Iterable[str]
+) -> str:
+    """Get content hash from node name, node attributes, and hashes of child nodes. Child hashes are combined
+    regardless of their order.
+
+    Args:
+        name: node name, can be None to hash the content of node without its name
+        attrs: list of attribute name and attribute value pairs
+        child_hashes: hashes of child nodes
+
+    Returns:
+        Hexadecimal hash
+    """
+    _hash = hashlib.blake2b(repr(name).encode(), digest_size=16)
+    for attr_name, attr_value in attrs:
+        _hash.update(f"\x00{attr_name}={attr_value!r}".encode())
+    for child_hash in sorted(child_hashes):
+        _hash.update(f"\x01{child_hash}".encode())
+    return _hash.hexdigest()
+
+
+def get_subtree_hashes(
+    tree: basenode.BaseNode,
+    attr_list: Iterable[str] | None = None,
+    all_attrs: bool = False,
+) -> dict[basenode.BaseNode, str]:
+    """Get content hash of every subtree in tree, computed in one postorder pass without recursion.
+
+    The hash of a node is computed over its name, the attributes in `attr_list`, and the hashes of its children.
+    Children hashes are combined regardless of their order, hence two subtrees have the same hash if they have the
+    same paths and the same attribute values.
+
+    Examples:
+        >>> from bigtree import Node, get_subtree_hashes
+        >>> root = Node("a")
+        >>> b = Node("b", age=65, parent=root)
+        >>> c = Node("c", age=65, parent=root)
+        >>> other_root = Node("a", children=[Node("c", age=65), Node("b", age=65)])
+        >>> get_subtree_hashes(root)[root] == get_subtree_hashes(other_root)[other_root]
+        True
+        >>> get_subtree_hashes(root)[b] == get_subtree_hashes(root)[c]
+        False
+
+    Args:
+        tree: tree to hash
+        attr_list: node attributes to include in the hash
+        all_attrs: indicator whether to include all node attributes in the hash, overrides `attr_list`
+
+    Returns:
+        Dictionary of node to hexadecimal hash of its subtree
+    """
+    attr_list = list(attr_list or [])
+    hashes: dict[basenode.BaseNode, str] = {}
+    stack: list[tuple[basenode.BaseNode, bool]] = [(tree, False)]
+    while stack:
+        _node, children_visited = stack.pop()
+        if not children_visited:
+            stack.append((_node, True))
+            stack.extend((_child, False) for _child in _node.children)
+            continue
+        hashes[_node] = _get_hash(
+            _node.get_attr("node_name"),
+            _get_node_attrs(_node, attr_list, all_attrs),
+            (hashes[_child] for _child in _node.children),
+        )
+    return hashes
+
+
+def _walk_tree_diff(
+    tree: NodeT,
+    other_tree: NodeT,
+    path: str,
+    hashes: dict[basenode.BaseNode, str],
+    other_hashes: dict[basenode.BaseNode, str],
+) -> Iterable[tuple[str, NodeT | None, NodeT | None]]:
+    """Walk tree and other tree together by matching child names, without descending into identical subtrees.
+
+    Yields (path, node, other node) for every pair of nodes with the same path that is visited, (path, node, None) for
+    the top node of every subtree only present in tree, and (path, None, other node) for the top node of every subtree
+    only present in other tree.
+
+    Args:
+        tree: tree to be compared against
+        other_tree: tree to be compared with, its root is paired with the root of `tree`
+        path: path of the paired roots
+        hashes: subtree hashes of tree
+        other_hashes: subtree hashes of other tree
+
+    Returns:
+        Iterable of path and paired nodes
+    """
+    sep = tree.sep
+    stack = [(tree, other_tree, path)]
+    while stack:
+        _node, _other_node, path = stack.pop()
+        yield path, _node, _other_node
+
+        # Identical subtree, skip comparison
+        if hashes[_node] == other_hashes[_other_node]:
+            continue
+
+        other_children = {_child.node_name: _child for _child in _other_node.children}
+        for _child in _node.children:
+            child_path = f"{path}{sep}{_child.node_name}"
+            _other_child = other_children.pop(_child.node_name, None)
+            if _other_child is None:
+                yield child_path, _child, None
+            else:
+                stack.append((_child, _other_child, child_path))
+        for _other_child in other_children.values():
+            yield f"{path}{sep}{_other_child.node_name}", None, _other_child
+
+
+def _iterate_subtree_paths(tree: NodeT, path: str) -> Iterable[tuple[str, NodeT]]:
+    """Iterate through subtree in preorder without recursion, carrying the path down the traversal.
+
+    Args:
+        tree: subtree root
+        path: path of subtree root
+
+    Returns:
+        Iterable of path and node
+    """
+    sep = tree.sep
+    stack = [(tree, path)]
+    while stack:
+        _node, path = stack.pop()
+        yield path, _node
+        stack.extend(
+            (_child, f"{path}{sep}{_child.node_name}")
+            for _child in reversed(_node.children)
+        )
+
+
+def get_tree_diff_by_hash(
+    tree: node.Node,
+    other_tree: node.Node,
+    only_diff: bool = True,
+    detail: bool = False,
+    aggregate: bool = False,
+    attr_list: Iterable[str] | None = None,
+) -> node.Node | None:
+    """Get difference of `tree` to `other_tree`, changes are relative to `tree`. Works similar to `get_tree_diff`, but
+    compares subtree hashes instead of exporting both trees to pandas DataFrame.
+
+    Subtrees that are identical in both trees (same paths and same attribute values in `attr_list`) are skipped,
+    hence the comparison only walks the ancestors of the nodes that changed. This does not require pandas.
+
+    - (+) and (-) will be added to node name relative to `tree`
+    - If `detail=True`, (added) and (moved to) will be used instead of (+), (removed) and (moved from) will be used
+        instead of (-)
+    - If `aggregate=True`, differences will only be indicated at the parent-level
+    - (~) will be added to node name if there are differences in tree attributes defined in `attr_list`, and the
+        node's attributes will be a tuple of (value in `tree`, value in `other_tree`)
+
+    Examples:
+        >>> from bigtree import Tree
+        >>> tree = Tree.from_list(["Downloads/Pictures/photo1.jpg", "Downloads/file1.doc", "Downloads/Trip/photo2.jpg"])
+        >>> tree_other = Tree.from_list(
+        ...     ["Downloads/Pictures/photo1.jpg", "Downloads/Pictures/Trip/photo2.jpg", "Downloads/file1.doc", "Downloads/file2.doc"]
+        ... )
+        >>> tree_diff = tree.diff_by_hash(tree_other, detail=True, aggregate=True)
+        >>> tree_diff.show()
+        Downloads
+        ├── Pictures
+        │   └── Trip (moved to)
+        │       └── photo2.jpg
+        ├── Trip (moved from)
+        └── file2.doc (added)
+
+    !!! note
+
+        - tree and other_tree must have the same `sep` symbol, otherwise this will raise ValueError
+        - Node names in tree and other_tree must not contain the `sep` symbol
+        - Attribute values that are not present are compared as None
+        - If `only_diff` and `aggregate` are True, differences are aggregated as in `get_tree_diff`, which walks the
+            subtrees that are identical as well. Nodes that are only in one tree and have the same name and parent
+            name are shown once, for the node that is first by path, whereas `get_tree_diff` shows one of them
+            depending on the sort order of its dataframe
+
+    Args:
+        tree: tree to be compared against
+        other_tree: tree to be compared with
+        only_diff: indicator to show all nodes or only nodes that are different (+/-)
+        detail: indicator to differentiate between different types of diff e.g., added or removed or moved
+        aggregate: indicator to only add difference indicator to parent-level e.g., when shifting subtrees
+        attr_list: tree attributes to check for difference
+
+    Returns:
+        Tree highlighting the difference between tree and other_tree
+    """
+    if tree.sep != other_tree.sep:
+        raise ValueError("`sep` must be the same for tree and other_tree")
+    attr_list = list(attr_list or [])
+    sep = tree.sep
+    hashes = get_subtree_hashes(tree, attr_list)
+    other_hashes = get_subtree_hashes(other_tree, attr_list)
+
+    # Each entry is (path, name, parent name)
+    left_only: list[tuple[str, str, str | None]] = []
+    right_only: list[tuple[str, str, str | None]] = []
+    both_paths: list[str] = []
+    path_attr_diff: dict[str, dict[str, tuple[Any, Any]]] = {}
+
+    def _collect_subtree(
+        _node: node.Node, _path: str, _rows: list[tuple[str, str, str | None]]
+    ) -> None:
+        """Collect path, name, and parent name of all nodes in subtree.
+
+        Args:
+            _node: subtree root
+            _path: path of subtree root
+            _rows: list to append to
+        """
+        for _current_path, _current in _iterate_subtree_paths(_node, _path):
+            _parent = _current.parent
+            _rows.append(
+                (
+                    _current_path,
+                    _current.node_name,
+                    _parent.node_name if _parent else None,
+                )
+            )
+
+    # Name and parent name of nodes in both trees, only required to aggregate differences
+    both_keys: set[tuple[str, str | None]] = set()
+    collect_both_keys = aggregate and only_diff
+
+    tree_path, other_tree_path = tree.path_name, other_tree.path_name
+    if tree_path != other_tree_path:
+        _collect_subtree(tree, tree_path, left_only)
+        _collect_subtree(other_tree, other_tree_path, right_only)
+    else:
+        for path, _node, _other_node in _walk_tree_diff(
+            tree, other_tree, tree_path, hashes, other_hashes
+        ):
+            if _other_node is None:
+                _collect_subtree(_node, path, left_only)
+            elif _node is None:
+                _collect_subtree(_other_node, path, right_only)
+            elif hashes[_node] == other_hashes[_other_node]:
+                if not only_diff:
+                    both_paths.extend(
+                        _path for _path, _ in _iterate_subtree_paths(_node, path)
+                    )
+                elif collect_both_keys:
+                    both_keys.update(
+                        (_current.node_name, _current.parent.node_name)
+                        for _, _current in _iterate_subtree_paths(_node, path)
+                        if _current.parent
+                    )
+            else:
+                if not only_diff:
+                    both_paths.append(path)
+                elif collect_both_keys and _node.parent:
+                    both_keys.add((_node.node_name, _node.parent.node_name))
+                attr_diff = {}
+                for attr in attr_list:
+                    old_value = _node.get_attr(attr)
+                    new_value = _other_node.get_attr(attr)
+                    if old_value != new_value and not (
+                        common.isnull(old_value) and common.isnull(new_value)
+                    ):
+                        attr_diff[attr] = (old_value, new_value)
+                if attr_diff:
+                    path_attr_diff[path] = attr_diff
+
+    # Determine the type of shift, nodes with same name and parent name are not indicated if aggregate
+    left_suffix_rows, right_suffix_rows = left_only, right_only
+    if aggregate:
+        key_count = Counter((row[1], row[2]) for row in left_only + right_only)
+        left_suffix_rows = [row for row in left_only if key_count[row[1:]] == 1]
+        right_suffix_rows = [row for row in right_only if key_count[row[1:]] == 1]
+        if only_diff:
+            # Keep first node by path for each name and parent name, where nodes in both trees are kept over nodes
+            # in other_tree, which are kept over nodes in tree. This removes children under (moved from)
+            right_keys = {row[1:] for row in right_only}
+            right_only = _get_first_rows_by_key(right_only, both_keys)
+            left_only = _get_first_rows_by_key(left_only, both_keys | right_keys)
+
+    path_to_suffix: dict[str, str] = {}
+    if detail:
+        left_names = {row[1] for row in left_suffix_rows}
+        right_names = {row[1] for row in right_suffix_rows}
+        for row in left_suffix_rows:
+            path_to_suffix[row[0]] = (
+                "moved from" if row[1] in right_names else "removed"
+            )
+        for row in right_suffix_rows:
+            path_to_suffix[row[0]] = "moved to" if row[1] in left_names else "added"
+    else:
+        path_to_suffix.update({row[0]: "-" for row in left_suffix_rows})
+        path_to_suffix.update({row[0]: "+" for row in right_suffix_rows})
+
+    paths = (
+        both_paths
+        + list(path_attr_diff)
+        + [row[0] for row in left_only]
+        + [row[0] for row in right_only]
+    )
+    if not paths:
+        return None
+
+    # Construct tree, sorted by path to be consistent with `get_tree_diff`
+    paths = sorted(set(paths))
+    tree_diff = tree.__class__(paths[0].lstrip(sep).split(sep)[0])
+    tree_diff.sep = sep
+    path_to_node = {
+        path: construct.add_path_to_tree(tree_diff, path, sep=sep) for path in paths
+    }
+    for path, suffix in path_to_suffix.items():
+        if path in path_to_node:
+            path_to_node[path].name += f" ({suffix})"
+    for path, attr_diff in path_attr_diff.items():
+        _node = path_to_node[path]
+        _node.set_attrs(attr_diff)
+        _node.name += " (~)"
+    return tree_diff
+
+
+def _get_first_rows_by_key(
+    rows: list[tuple[str, str, str | None]],
+    excluded_keys: set[tuple[str, str | None]],
+) -> list[tuple[str, str, str | None]]:
+    """Get first row by path for each name and parent name, excluding rows with name and parent name in
+    `excluded_keys`.
+
+    Args:
+        rows: path, name, and parent name of nodes
+        excluded_keys: name and parent name of nodes to exclude
+
+    Returns:
+        Path, name, and parent name of first node for each name and parent name
+    """
+    first_rows: list[tuple[str, str, str | None]] = []
+    keys = set(excluded_keys)
+    for row in sorted(rows):
+        if row[1:] not in keys:
+            keys.add(row[1:])
+            first_rows.append(row)
+    return first_rows
+
+
+def diff_to_patch(tree: NodeT, other_tree: NodeT) -> list[dict[str, Any]]:
+    """Get list of operations that modifies `tree` into `other_tree`, to be applied with `apply_patch`.
+
+    Trees are compared using subtree hashes over all node attributes, hence identical subtrees are skipped. Each
+    operation is a dictionary with key `op` and full path(s) of nodes with the `sep` of `tree`, and is JSON
+    serializable if the node attributes are JSON serializable.
+
+    - ``{"op": "rename", "path": path, "name": new_name}``: subtree with same parent and content but different name
+    - ``{"op": "move", "from": from_path, "path": to_path}``: subtree with same content but different parent
+    - ``{"op": "add", "path": path, "attrs": attrs}``: node only present in `other_tree`, `attrs` is omitted if empty
+    - ``{"op": "remove", "path": path}``: subtree only present in `tree`
+    - ``{"op": "set_attrs", "path": path, "attrs": attrs, "unset": attr_names}``: node with different attributes,
+        `attrs` or `unset` is omitted if empty
+
+    Examples:
+        >>> import json
+        >>> from bigtree import Node, Tree
+        >>> tree = Tree.from_list(["Downloads/Pictures/photo1.jpg", "Downloads/file1.doc", "Downloads/Trip/photo2.jpg"])
+        >>> tree_other = Tree.from_list(
+        ...     ["Downloads/Pictures/photo1.jpg", "Downloads/Pictures/Trip/photo2.jpg", "Downloads/file1.doc", "Downloads/file2.doc"]
+        ... )
+        >>> tree_other.node.set_attrs({"size": 100})
+        >>> patch = tree.diff_to_patch(tree_other)
+        >>> print("\\n".join(json.dumps(op) for op in patch))
+        {"op": "add", "path": "/Downloads/file2.doc"}
+        {"op": "move", "from": "/Downloads/Trip", "path": "/Downloads/Pictures/Trip"}
+        {"op": "set_attrs", "path": "/Downloads", "attrs": {"size": 100}}
+
+        >>> tree.apply_patch(patch)
+        >>> tree.show(all_attrs=True)
+        Downloads [size=100]
+        ├── Pictures
+        │   ├── photo1.jpg
+        │   └── Trip
+        │       └── photo2.jpg
+        ├── file1.doc
+        └── file2.doc
+
+    !!! note
+
+        - tree and other_tree must have the same `sep` symbol, otherwise this will raise ValueError
+        - Order of children is not part of the patch
+
+    Args:
+        tree: tree to be modified
+        other_tree: tree to be modified into
+
+    Returns:
+        List of operations
+    """
+    if tree.sep != other_tree.sep:
+        raise ValueError("`sep` must be the same for tree and other_tree")
+    sep = tree.sep
+    hashes = get_subtree_hashes(tree, all_attrs=True)
+    other_hashes = get_subtree_hashes(other_tree, all_attrs=True)
+
+    patch: list[dict[str, Any]] = []
+    tree_path = tree.path_name
+    if tree.node_name != other_tree.node_name:
+        patch.append({"op": "rename", "path": tree_path, "name": other_tree.node_name})
+        tree_path = f"{tree_path[: -len(tree.node_name)]}{other_tree.node_name}"
+
+    removed: list[tuple[str, NodeT]] = []
+    added: list[tuple[str, NodeT]] = []
+    set_attrs_patch: list[dict[str, Any]] = []
+    for path, _node, _other_node in _walk_tree_diff(
+        tree, other_tree, tree_path, hashes, other_hashes
+    ):
+        if _other_node is None:
+            removed.append((path, _node))
+        elif _node is None:
+            added.append((path, _other_node))
+        elif hashes[_node] != other_hashes[_other_node]:
+            node_attrs = dict(_get_node_attrs(_node, [], True))
+            other_node_attrs = dict(_get_node_attrs(_other_node, [], True))
+            attrs = {
+                k: v
+                for k, v in other_node_attrs.items()
+                if k not in node_attrs
+                or (
+                    node_attrs[k] != v
+                    and not (common.isnull(node_attrs[k]) and common.isnull(v))
+                )
+            }
+            unset = [k for k in node_attrs if k not in other_node_attrs]
+            if attrs or unset:
+                op: dict[str, Any] = {"op": "set_attrs", "path": path}
+                if attrs:
+                    op["attrs"] = attrs
+                if unset:
+                    op["unset"] = unset
+                set_attrs_patch.append(op)
+
+    # Nodes that are shifted or renamed, and cannot be shifted again together with their ancestors or descendants
+    claimed: set[NodeT] = set()
+    claimed_ancestors: set[NodeT] = set()
+
+    def _claim(_node: NodeT) -> None:
+        """Claim node to be shifted or renamed.
+
+        Args:
+            _node: node to claim
+        """
+        claimed.add(_node)
+        claimed_ancestors.update(_node.ancestors)
+
+    # Rename subtrees with same parent and same content
+    def _get_nameless_hash(_node: NodeT, _hashes: dict[basenode.BaseNode, str]) -> str:
+        """Get content hash of subtree without the name of subtree root.
+
+        Args:
+            _node: subtree root
+            _hashes: subtree hashes of tree
+
+        Returns:
+            Hexadecimal hash
+        """
+        return _get_hash(
+            None,
+            _get_node_attrs(_node, [], True),
+            (_hashes[_child] for _child in _node.children),
+        )
+
+    removed_by_content: dict[tuple[str, str], list[tuple[str, NodeT]]] = {}
+    for path, _node in removed:
+        parent_path = path[: -len(f"{sep}{_node.node_name}")]
+        key = (parent_path, _get_nameless_hash(_node, hashes))
+        removed_by_content.setdefault(key, []).append((path, _node))
+    added_remaining: list[tuple[str, NodeT]] = []
+    for path, _other_node in added:
+        parent_path = path[: -len(f"{sep}{_other_node.node_name}")]
+        key = (parent_path, _get_nameless_hash(_other_node, other_hashes))
+        if removed_by_content.get(key):
+            from_path, _node = removed_by_content[key].pop()
+            patch.append(
+                {"op": "rename", "path": from_path, "name": _other_node.node_name}
+            )
+            _claim(_node)
+        else:
+            added_remaining.append((path, _other_node))
+
+    # Shift subtrees with same content, otherwise add nodes
+    removed_by_hash: dict[str, list[tuple[str, NodeT]]] = {}
+    for path, _node in removed:
+        if _node not in claimed:
+            for _path, _descendant in _iterate_subtree_paths(_node, path):
+                removed_by_hash.setdefault(hashes[_descendant], []).append(
+                    (_path, _descendant)
+                )
+    for path, _other_node in added_remaining:
+        stack = [(_other_node, path)]
+        while stack:
+            _other_node, path = stack.pop()
+            from_path = ""
+            for _path, _node in removed_by_hash.get(other_hashes[_other_node], []):
+                if _node not in claimed_ancestors and not any(
+                    _ancestor in claimed for _ancestor in (_node, *_node.ancestors)
+                ):
+                    from_path = _path
+                    _claim(_node)
+                    break
+            if from_path:
+                patch.append({"op": "move", "from": from_path, "path": path})
+                continue
+            op = {"op": "add", "path": path}
+            attrs = dict(_get_node_attrs(_other_node, [], True))
+            if attrs:
+                op["attrs"] = attrs
+            patch.append(op)
+            stack.extend(
+                (_child, f"{path}{sep}{_child.node_name}")
+                for _child in reversed(_other_node.children)
+            )
+
+    # Remove subtrees after their descendants are shifted out
+    patch.extend(
+        {"op": "remove", "path": path}
+        for path, _node in removed
+        if _node not in claimed
+    )
+    return patch + set_attrs_patch
+
+
+def apply_patch(
+    tree: NodeT, patch: Iterable[Mapping[str, Any]], sep: str | None = None
+) -> None:
+    """Apply list of operations from `diff_to_patch` to tree *in-place*.
+
+    Operations are applied in order in one pass. Consecutive `move` and `remove` operations are shifted in one batch
+    with `copy_or_shift_logic`. Patch can be an iterator, for example when it is streamed from JSON lines.
+
+    Examples:
+        >>> from bigtree import Node, Tree
+        >>> tree = Tree.from_list(["a/b/d", "a/c"])
+        >>> patch = [
+        ...     {"op": "move", "from": "a/b/d", "path": "a/c/d"},
+        ...     {"op": "add", "path": "a/c/e", "attrs": {"age": 10}},
+        ...     {"op": "rename", "path": "a/b", "name": "f"},
+        ...     {"op": "set_attrs", "path": "a", "attrs": {"age": 90}},
+        ... ]
+        >>> tree.apply_patch(patch)
+        >>> tree.show(all_attrs=True)
+        a [age=90]
+        ├── f
+        └── c
+            ├── d
+            └── e [age=10]
+
+    Args:
+        tree: tree to modify
+        patch: operations, each with key `op` and full path(s) of nodes
+        sep: path separator for paths in `patch`, defaults to `sep` of tree, which is used by `diff_to_patch`
+    """
+    from bigtree.tree import modify
+
+    sep = sep or tree.sep
+
+    from_paths: list[str] = []
+    to_paths: list[str | None] = []
+
+    def _shift_batch() -> None:
+        """Shift or remove nodes that are batched."""
+        if from_paths:
+            modify.copy_or_shift_logic(
+                tree,
+                list(from_paths),
+                list(to_paths),
+                sep=sep,
+                with_full_path=True,
+            )
+            from_paths.clear()
+            to_paths.clear()
+
+    for op in patch:
+        op_type = op["op"]
+        if op_type == "move":
+            from_paths.append(op["from"])
+            to_paths.append(op["path"])
+            continue
+        if op_type == "remove":
+            from_paths.append(op["path"])
+            to_paths.append(None)
+            continue
+
+        _shift_batch()
+        if op_type == "add":
+            construct.add_path_to_tree(
+                tree, op["path"], sep=sep, node_attrs=op.get("attrs")
+            )
+            continue
+
+        path = op["path"].rstrip(sep).replace(sep, tree.sep)
+        _node = search.find_full_path(tree, path)
+        if not _node:
+            raise exceptions.NotFoundError(f"Unable to find path {op['path']}")
+        if op_type == "rename":
+            _node.rename(op["name"])
+        elif op_type == "set_attrs":
+            _node.set_attrs(op.get("attrs", {}))
+            for attr in op.get("unset", []):
+                delattr(_node, attr)
+        else:
+            raise ValueError(
+                f"Invalid patch operation {op_type}, check `op` to be one of "
+                f"add, remove, move, rename, set_attrs"
+            )
+    _shift_batch()
+
+
+def _get_leaf_merges(
+    tree: BaseNodeT, weight_attr: str | None
+) -> tuple[list[BaseNodeT], Any, list[tuple[int, int, int, Any]]]:
+    """Get leaves of tree, distance of each leaf from root, and the leaf ranges merged at each node, computed in one
+    postorder pass without recursion.
+
+    Leaves of every subtree are contiguous in the leaf order. At each node, the leaves of a child are merged with the
+    leaves of its subsequent siblings, hence each merge is a tuple of (start of child, end of child, end of node,
+    distance of node from root).
+
+    Args:
+        tree: tree to get leaves
+        weight_attr: node attribute for length of branch to parent node, defaults to 1 for every branch if not given
+
+    Returns:
+        Leaves, distance of leaves from root, and merges
+    """
+    leaves: list[BaseNodeT] = []
+    leaf_distances: list[Any] = []
+    merges: list[tuple[int, int, int, Any]] = []
+    stack: list[tuple[BaseNodeT, Any, list[int] | None]] = [(tree, 0, None)]
+    child_ends: list[list[int]] = []
+    while stack:
+        _node, distance, child_end = stack.pop()
+        if child_end is None:
+            children = [_child for _child in _node.children if _child]
+            if not children:
+                leaves.append(_node)
+                leaf_distances.append(distance)
+                if child_ends:
+                    child_ends[-1].append(len(leaves))
+                continue
+            child_ends.append([len(leaves)])
+            stack.append((_node, distance, child_ends[-1]))
+            for _child in reversed(children):
+                weight = (_child.get_attr(weight_attr) or 0) if weight_attr else 1
+                stack.append((_child, distance + weight, None))
+            continue
+
+        # Postorder: all children are visited, merge each child with its subsequent siblings
+        child_ends.pop()
+        for start, end in zip(child_end, child_end[1:-1]):
+            merges.append((start, end, child_end[-1], distance))
+        if child_ends:
+            child_ends[-1].append(len(leaves))
+    return (
+        leaves,
+        np.array(leaf_distances, dtype=float if weight_attr else int),
+        merges,
+    )
+
+
+def _iter_leaf_distance_blocks(
+    leaf_distances: Any,
+    merges: list[tuple[int, int, int, Any]],
+    chunk_size: int,
+) -> Iterator[Any]:
+    """Iterate rows of leaf distance matrix in blocks of `chunk_size` rows.
+
+    Args:
+        leaf_distances: distance of leaves from root
+        merges: leaf ranges merged at each node
+        chunk_size: number of rows in each block
+
+    Returns:
+        Blocks of leaf distance matrix
+    """
+    n_leaves = len(leaf_distances)
+    for row_start in range(0, n_leaves, chunk_size):
+        row_end = min(row_start + chunk_size, n_leaves)
+        block = np.zeros((row_end - row_start, n_leaves), dtype=leaf_distances.dtype)
+        for start, end, node_end, distance in merges:
+            if node_end <= row_start or start >= row_end:
+                continue
+
+            # Rows of child against columns of subsequent siblings
+            _start, _end = max(start, row_start), min(end, row_end)
+            if _start < _end:
+                block[_start - row_start : _end - row_start, end:node_end] = (
+                    leaf_distances[_start:_end, None]
+                    + leaf_distances[None, end:node_end]
+                    - 2 * distance
+                )
+
+            # Rows of subsequent siblings against columns of child
+            _start, _end = max(end, row_start), min(node_end, row_end)
+            if _start < _end:
+                block[_start - row_start : _end - row_start, start:end] = (
+                    leaf_distances[_start:_end, None]
+                    + leaf_distances[None, start:end]
+                    - 2 * distance
+                )
+        yield block
+
+
+@exceptions.optional_dependencies_numpy
+def get_leaf_distance_matrix(
+    tree: BaseNodeT,
+    weight_attr: str | None = None,
+    chunk_size: int | None = None,
+) -> tuple[Any, list[BaseNodeT]]:
+    """Get pairwise distance between all leaves of tree, returning the distance matrix and leaf order.
+
+    Distance between two leaves is the sum of branch lengths on the path between them. If `weight_attr` is given,
+    branch length is the attribute value of the child node (e.g., `length` from ``newick_to_tree``), which gives the
+    patristic distance. Otherwise, every branch has length 1, which gives the topological distance.
+
+    Only leaves under `tree` are considered, `tree` can be the root node or child node of tree.
+
+    Distances are computed in one postorder pass, filling the block of leaf pairs meeting at each node as a vectorized
+    operation instead of finding the path between each pair of leaves.
+
+    For trees too large for one dense matrix, set `chunk_size` to return an iterator of row blocks instead, where each
+    block has up to `chunk_size` rows and one column for each leaf.
+
+    Examples:
+        >>> from bigtree import Tree, get_leaf_distance_matrix
+        >>> root = Tree.from_newick("((d:40,(g:10,h:6)e:35)b:65,(f:38)c:60)a", length_attr="length").node
+        >>> matrix, leaves = get_leaf_distance_matrix(root)
+        >>> [leaf.node_name for leaf in leaves]
+        ['d', 'g', 'h', 'f']
+        >>> matrix.tolist()
+        [[0, 3, 3, 4], [3, 0, 2, 5], [3, 2, 0, 5], [4, 5, 5, 0]]
+        >>> matrix, leaves = get_leaf_distance_matrix(root, weight_attr="length")
+        >>> matrix.tolist()
+        [[0.0, 85.0, 81.0, 203.0], [85.0, 0.0, 16.0, 208.0], [81.0, 16.0, 0.0, 204.0], [203.0, 208.0, 204.0, 0.0]]
+        >>> blocks, leaves = get_leaf_distance_matrix(root, chunk_size=3)
+        >>> [block.shape for block in blocks]
+        [(3, 4), (1, 4)]
+
+    Args:
+        tree: tree to compute leaf distance
+        weight_attr: node attribute for length of branch to parent node, missing values are taken as 0
+        chunk_size: number of rows in each block, returns the full matrix if not given
+
+    Returns:
+        Leaf distance matrix (or iterator of row blocks if `chunk_size` is given), and list of leaves in the order of
+        rows and columns
+    """
+    if chunk_size is not None and (
+        not isinstance(chunk_size, int)
+        or isinstance(chunk_size, bool)
+        or chunk_size <= 0
+    ):
+        raise ValueError(
+            f"Invalid chunk size {chunk_size}, check `chunk_size` to be a positive integer"
+        )
+
+    leaves, leaf_distances, merges = _get_leaf_merges(tree, weight_attr)
+    if chunk_size:
+        return _iter_leaf_distance_blocks(leaf_distances, merges, chunk_size), leaves
+
+    matrix = np.zeros((len(leaves), len(leaves)), dtype=leaf_distances.dtype)
+    for start, end, node_end, distance in merges:
+        block = (
+            leaf_distances[start:end, None]
+            + leaf_distances[None, end:node_end]
+            - 2 * distance
+        )
+        matrix[start:end, end:node_end] = block
+        matrix[end:node_end, start:end] = block.T
+    return matrix, leaves
@@ -1,9 +1,11 @@
+import bisect
 import logging
-from typing import Any, Collection, Sequence, TypeVar
+from typing import Any, Callable, Collection, Generic, Literal, Sequence, TypeVar
 
+from bigtree._globals import Globals
 from bigtree.node import node
 from bigtree.tree import construct, search
-from bigtree.utils import exceptions
+from bigtree.utils import common, exceptions, iterators
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
@@ -21,9 +23,85 @@ __all__ = [
 T = TypeVar("T", bound=node.Node)
 
 
+def _merge_attrs(
+    attrs_list: list[dict[str, Any]],
+    conflict: str | Callable[[str, list[Any]], Any],
+) -> dict[str, Any]:
+    """Merge attributes of nodes with the same path, null values are not considered as conflicts.
+
+    Args:
+        attrs_list: attributes of each node, in order of trees
+        conflict: policy to resolve attributes with different values, "first", "last", or callable
+
+    Returns:
+        Merged attributes
+    """
+    if len(attrs_list) == 1:
+        return attrs_list[0]
+    attr_values: dict[str, list[Any]] = {}
+    for attrs in attrs_list:
+        for attr_name, attr_value in attrs.items():
+            attr_values.setdefault(attr_name, []).append(attr_value)
+
+    merged_attrs = {}
+    for attr_name, attr_value_list in attr_values.items():
+        values = [value for value in attr_value_list if not common.isnull(value)]
+        if not values:
+            merged_attrs[attr_name] = attr_value_list[-1]
+        elif len(values) == 1 or conflict == "last":
+            merged_attrs[attr_name] = values[-1]
+        elif conflict == "first":
+            merged_attrs[attr_name] = values[0]
+        else:
+            merged_attrs[attr_name] = conflict(attr_name, values)  # type: ignore[operator]
+    return merged_attrs
+
+
+def _merge_node_group(
+    group: list[T],
+    parent: T | None,
+    node_type: type[T],
+    copy: bool,
+    conflict: str | Callable[[str, list[Any]], Any],
+) -> T:
+    """Merge nodes with the same path into a single node under `parent`, children are not merged.
+
+    Args:
+        group: nodes with the same path, in order of trees
+        parent: merged parent node
+        node_type: node type of merged node, if nodes are copied
+        copy: indicator to create new node, otherwise the first node is reused
+        conflict: policy to resolve attributes with different values
+
+    Returns:
+        Merged node
+    """
+    if copy or len(group) > 1:
+        attrs = _merge_attrs(
+            [
+                dict(_node.describe(exclude_attributes=["name"], exclude_prefix="_"))
+                for _node in group
+            ],
+            conflict,
+        )
+    if copy:
+        if parent is None:
+            return node_type(group[0].node_name, sep=group[0].sep, **attrs)
+        return node_type(group[0].node_name, parent=parent, **attrs)
+
+    merged_node = group[0]
+    if len(group) > 1:
+        merged_node.set_attrs(attrs)
+    if merged_node.parent is not parent:
+        merged_node.parent = parent
+    return merged_node
+
+
 def merge_trees(
     trees: Sequence[T],
     exact: bool = False,
+    copy: bool = True,
+    conflict: Literal["first", "last"] | Callable[[str, list[Any]], Any] = "last",
 ) -> T:
     """Merge multiple trees into a single tree. Returns a new tree.
 
@@ -33,6 +111,14 @@ def merge_trees(
     - Able to merge only the tree/branches provided exactly, defaults to False (the whole tree is merged), in the case
         when it is True, it is meant to merge tree branches and only the paths and attributes in the branches are retained.
         All branches must have the same root name
+    - Able to reuse nodes of the trees, defaults to True (nodes are copied; trees are not modified), in the case when it
+        is False, the trees are modified and the merged tree reuses the first node found for each path
+    - Able to resolve attributes with different values by `conflict`, defaults to "last" (priority given to later tree),
+        it can be "first" (priority given to earlier tree) or a callable that takes in attribute name and list of
+        values in order of trees, and returns the merged value. Null values are not considered as conflicts
+
+    All trees are merged at once by walking the trees level by level and matching nodes by name, in time linear to the
+    total size of the trees. Children are ordered by their first appearance in the trees.
 
     Examples:
         >>> from bigtree import list_to_tree, merge_trees
@@ -59,6 +145,16 @@ def merge_trees(
         │   └── photo2.jpg
         └── file1.doc [size=100]
 
+        To resolve attributes with different values,
+
+        >>> downloads_folder["file1.doc"].size = 20
+        >>> root = merge_trees([downloads_folder, documents_folder], conflict="first")
+        >>> root["file1.doc"].size
+        20
+        >>> root = merge_trees([downloads_folder, documents_folder], conflict=lambda _, values: sum(values))
+        >>> root["file1.doc"].size
+        120
+
         In ``exact=True`` case, only path and attributes of branches are retained.
 
         >>> from bigtree import dict_to_tree, merge_trees, find_attrs
@@ -99,39 +195,56 @@ def merge_trees(
         trees: trees to merge, it can be the tree root or a branch of the tree
         exact: whether to merge the trees provided exactly; only the paths and attributes of the trees/branches are used.
             If false, the whole tree is merged
+        copy: whether to copy nodes of the trees; if false, the trees are modified and nodes are reused in merged tree.
+            Only applicable if ``exact=False``
+        conflict: policy to resolve attributes with different values, "first", "last", or callable
 
     Returns:
         Merged tree
     """
+    if not (conflict in ("first", "last") or callable(conflict)):
+        raise ValueError(
+            f"Invalid conflict {conflict}, check `conflict` to be one of first, last, or a callable"
+        )
+
     if not exact:
-        merged_tree = trees[0].copy()
-        root_name = merged_tree.root.node_name
-        for _tree in trees[1:]:
-            _tree = _tree.root
-            child_names = [_child.node_name for _child in _tree.children]
-            for child_name in child_names:
-                path = f"{root_name}/{child_name}"
-                kwargs = (
-                    {"merge_children": True}
-                    if search.find_full_path(merged_tree, path)
-                    else {}
-                )
-                copy_nodes_from_tree_to_tree(
-                    from_tree=_tree,
-                    to_tree=merged_tree,
-                    from_paths=[f"{_tree.node_name}/{child_name}"],
-                    to_paths=[f"{root_name}/{child_name}"],
-                    merge_attribute=True,
-                    **kwargs,  # type: ignore
-                )
+        roots = list(dict.fromkeys(_tree.root for _tree in trees))
+        node_type = roots[0].__class__
+
+        # Merged tree is built without node-level assertions as nodes with the same name are merged
+        assertions = Globals.ASSERTIONS
+        Globals.ASSERTIONS = False
+        try:
+            merged_tree = _merge_node_group(roots, None, node_type, copy, conflict)
+            stack = [(roots, merged_tree)]
+            while stack:
+                group, merged_node = stack.pop()
+                child_groups: dict[str, list[T]] = {}
+                for _node in group:
+                    for child in _node.children:
+                        child_groups.setdefault(child.node_name, []).append(child)
+                if not copy:
+                    # Detach children of nodes that are not reused, so that they can be reassigned
+                    for _node in group[1:]:
+                        del _node.children
+                    for child_group in child_groups.values():
+                        for child in child_group[1:]:
+                            if child.parent is merged_node:
+                                child.parent = None
+                for child_group in child_groups.values():
+                    merged_child = _merge_node_group(
+                        child_group, merged_node, node_type, copy, conflict
+                    )
+                    stack.append((child_group, merged_child))
+        finally:
+            Globals.ASSERTIONS = assertions
     else:
         path_attrs: dict[str, dict[str, Any]] = {}
         for tree in trees:
             tree_attr = dict(tree.describe(exclude_prefix="_"))
-            path_attrs[tree.path_name] = {
-                **path_attrs.get(tree.path_name, {}),
-                **tree_attr,
-            }
+            path_attrs[tree.path_name] = _merge_attrs(
+                [path_attrs.get(tree.path_name, {}), tree_attr], conflict
+            )
         merged_tree = construct.dict_to_tree(path_attrs)
     return merged_tree
 
@@ -148,7 +261,8 @@ def shift_nodes(
     merge_leaves: bool = False,
     delete_children: bool = False,
     with_full_path: bool = False,
-) -> None:
+    plan: bool = False,
+) -> list[dict[str, Any]] | None:
     """Shift nodes from `from_paths` to `to_paths` *in-place*.
 
     - Creates intermediate nodes if to-path is not present
@@ -158,6 +272,7 @@ def shift_nodes(
     - Able to merge children and remove intermediate parent node, defaults to False (nodes are shifted; not merged)
     - Able to merge leaf nodes and remove all intermediate nodes, defaults to False (nodes are shifted; not merged)
     - Able to shift node only and delete children, defaults to False (nodes are shifted together with children)
+    - Able to plan operations without modifying tree, defaults to False (nodes are shifted)
 
     For paths in `from_paths` and `to_paths`,
 
@@ -373,6 +488,14 @@ def shift_nodes(
         │   └── photo1.jpg
         └── Applications
 
+        To plan shifting without modifying tree,
+
+        >>> planned = shift_nodes(root, ["photo1.jpg"], ["Downloads/Misc/Pictures/photo1.jpg"], plan=True)
+        >>> [(op["action"], op["to_path_action"], op["created_paths"]) for op in planned]
+        [('shift', 'create', ['/Downloads/Misc/Pictures'])]
+        >>> planned[0]["from_node"]
+        Node(/Downloads/Pictures/photo1.jpg, )
+
     Args:
         tree: tree to modify
         from_paths: original paths to shift nodes from
@@ -385,6 +508,10 @@ def shift_nodes(
         merge_leaves: indicator to merge from-path's leaf nodes and remove intermediate parent node(s)
         delete_children: indicator to shift node only without children
         with_full_path: indicator to shift node with full path in `from_paths`, results in faster search
+        plan: indicator to return planned operations without modifying tree
+
+    Returns:
+        Planned operations if ``plan=True``, see `copy_or_shift_logic`
     """
     return copy_or_shift_logic(
         tree=tree,
@@ -400,6 +527,7 @@ def shift_nodes(
         delete_children=delete_children,
         to_tree=None,
         with_full_path=with_full_path,
+        plan=plan,
     )  # pragma: no cover
 
 
@@ -415,7 +543,8 @@ def copy_nodes(
     merge_leaves: bool = False,
     delete_children: bool = False,
     with_full_path: bool = False,
-) -> None:
+    plan: bool = False,
+) -> list[dict[str, Any]] | None:
     """Copy nodes from `from_paths` to `to_paths` *in-place*.
 
     - Creates intermediate nodes if to-path is not present
@@ -425,6 +554,7 @@ def copy_nodes(
     - Able to merge children and remove intermediate parent node, defaults to False (nodes are copied; not merged)
     - Able to merge only leaf nodes and remove all intermediate nodes, defaults to False (nodes are copied; not merged)
     - Able to copy node only and delete children, defaults to False (nodes are copied together with children)
+    - Able to plan operations without modifying tree, defaults to False (nodes are copied)
 
     For paths in `from_paths` and `to_paths`,
 
@@ -652,6 +782,10 @@ def copy_nodes(
         merge_leaves: indicator to merge from-path's leaf nodes and remove intermediate parent node(s)
         delete_children: indicator to copy node only without children
         with_full_path: indicator to copy node with full path in `from_paths`, results in faster search
+        plan: indicator to return planned operations without modifying tree
+
+    Returns:
+        Planned operations if ``plan=True``, see `copy_or_shift_logic`
     """
     return copy_or_shift_logic(
         tree=tree,
@@ -667,6 +801,7 @@ def copy_nodes(
         delete_children=delete_children,
         to_tree=None,
         with_full_path=with_full_path,
+        plan=plan,
     )  # pragma: no cover
 
 
@@ -678,12 +813,14 @@ def shift_and_replace_nodes(
     skippable: bool = False,
     delete_children: bool = False,
     with_full_path: bool = False,
-) -> None:
+    plan: bool = False,
+) -> list[dict[str, Any]] | None:
     """Shift nodes from `from_paths` to *replace* `to_paths` *in-place*.
 
     - Creates intermediate nodes if to-path is not present
     - Able to skip nodes if from-path is not found, defaults to False (from-nodes must be found; not skippable)
     - Able to shift node only and delete children, defaults to False (nodes are shifted together with children)
+    - Able to plan operations without modifying tree, defaults to False (nodes are shifted)
 
     For paths in `from_paths` and `to_paths`,
 
@@ -753,6 +890,10 @@ def shift_and_replace_nodes(
         skippable: indicator to skip if from-path is not found
         delete_children: indicator to shift node only without children
         with_full_path: indicator to shift node with full path in `from_paths`, results in faster search
+        plan: indicator to return planned operations without modifying tree
+
+    Returns:
+        Planned operations if ``plan=True``, see `replace_logic`
     """
     return replace_logic(
         tree=tree,
@@ -764,6 +905,7 @@ def shift_and_replace_nodes(
         delete_children=delete_children,
         to_tree=None,
         with_full_path=with_full_path,
+        plan=plan,
     )  # pragma: no cover
 
 
@@ -780,7 +922,8 @@ def copy_nodes_from_tree_to_tree(
     merge_leaves: bool = False,
     delete_children: bool = False,
     with_full_path: bool = False,
-) -> None:
+    plan: bool = False,
+) -> list[dict[str, Any]] | None:
     """Copy nodes from `from_paths` to `to_paths` *in-place*.
 
     - Creates intermediate nodes if to-path is not present
@@ -790,6 +933,7 @@ def copy_nodes_from_tree_to_tree(
     - Able to merge children and remove intermediate parent node, defaults to False (nodes are shifted; not merged)
     - Able to merge leaf nodes and remove all intermediate nodes, defaults to False (nodes are shifted; not merged)
     - Able to copy node only and delete children, defaults to False (nodes are copied together with children)
+    - Able to plan operations without modifying tree, defaults to False (nodes are copied)
 
     For paths in `from_paths` and `to_paths`,
 
@@ -976,6 +1120,10 @@ def copy_nodes_from_tree_to_tree(
         merge_leaves: indicator to merge from-path's leaf nodes and remove intermediate parent node(s)
         delete_children: indicator to copy node only without children
         with_full_path: indicator to copy node with full path in `from_paths`, results in faster search
+        plan: indicator to return planned operations without modifying tree
+
+    Returns:
+        Planned operations if ``plan=True``, see `copy_or_shift_logic`
     """
     return copy_or_shift_logic(
         tree=from_tree,
@@ -991,6 +1139,7 @@ def copy_nodes_from_tree_to_tree(
         delete_children=delete_children,
         to_tree=to_tree,
         with_full_path=with_full_path,
+        plan=plan,
     )  # pragma: no cover
 
 
@@ -1003,12 +1152,14 @@ def copy_and_replace_nodes_from_tree_to_tree(
     skippable: bool = False,
     delete_children: bool = False,
     with_full_path: bool = False,
-) -> None:
+    plan: bool = False,
+) -> list[dict[str, Any]] | None:
     """Copy nodes from `from_paths` to *replace* `to_paths` *in-place*.
 
     - Creates intermediate nodes if to-path is not present
     - Able to skip nodes if from-path is not found, defaults to False (from-nodes must be found; not skippable)
     - Able to copy node only and delete children, defaults to False (nodes are copied together with children)
+    - Able to plan operations without modifying tree, defaults to False (nodes are copied)
 
     For paths in `from_paths` and `to_paths`,
 
@@ -1108,6 +1259,10 @@ def copy_and_replace_nodes_from_tree_to_tree(
         skippable: indicator to skip if from path is not found
         delete_children: indicator to copy node only without children
         with_full_path: indicator to copy node with full path in `from_paths`, results in faster search
+        plan: indicator to return planned operations without modifying tree
+
+    Returns:
+        Planned operations if ``plan=True``, see `replace_logic`
     """
     return replace_logic(
         tree=from_tree,
@@ -1119,6 +1274,7 @@ def copy_and_replace_nodes_from_tree_to_tree(
         delete_children=delete_children,
         to_tree=to_tree,
         with_full_path=with_full_path,
+        plan=plan,
     )  # pragma: no cover
 
 
@@ -1177,6 +1333,313 @@ def _merge_attribute(
     return construct.dataframe_to_tree(merged_data)
 
 
+class _PathIndex(Generic[T]):
+    """Index of full path to node of a tree, kept in sync as nodes are shifted, copied or deleted.
+
+    Built once per batch so that each path resolves in O(1) instead of searching the tree per path.
+    """
+
+    def __init__(self, tree: T):
+        self.root = tree.root
+        self.sep = self.root.sep
+        self.node_by_path: dict[str, T] = {}
+        self.path_by_node: dict[T, str] = {}
+        self._reversed_paths: list[str] | None = None
+        self._reversed_nodes: list[T] = []
+        self.add(self.root)
+
+    def key(self, path: str) -> str:
+        """Full path with leading separator, as stored in index."""
+        return self.sep + path.strip(self.sep)
+
+    def get(self, path: str) -> T | None:
+        """Get node from full path."""
+        return self.node_by_path.get(self.key(path))
+
+    def find_suffix(self, path: str) -> list[T]:
+        """Get nodes whose full path ends with `path`, equivalent to `search.find_path` but with bisection over
+        reversed paths."""
+        if self._reversed_paths is None:
+            reversed_paths = sorted(
+                (_path[::-1], _node) for _node, _path in self.path_by_node.items()
+            )
+            self._reversed_paths = [_path for _path, _ in reversed_paths]
+            self._reversed_nodes = [_node for _, _node in reversed_paths]
+        reversed_path = path[::-1]
+        idx = bisect.bisect_left(self._reversed_paths, reversed_path)
+        nodes = []
+        while idx < len(self._reversed_paths) and self._reversed_paths[idx].startswith(
+            reversed_path
+        ):
+            nodes.append(self._reversed_nodes[idx])
+            idx += 1
+        return nodes
+
+    def add(self, tree: T) -> None:
+        """Add node and its descendants to index, if node belongs to the indexed tree."""
+        if tree.root is not self.root:
+            return
+        stack = [(tree, tree.path_name)]
+        while stack:
+            _node, _path = stack.pop()
+            self.node_by_path[_path] = _node
+            self.path_by_node[_node] = _path
+            stack.extend(
+                (child, f"{_path}{self.sep}{child.node_name}")
+                for child in _node.children
+            )
+
+    def remove(self, tree: T) -> None:
+        """Remove node and its descendants from index."""
+        stack = [tree]
+        while stack:
+            _node = stack.pop()
+            _path = self.path_by_node.pop(_node, None)
+            if _path is not None and self.node_by_path.get(_path) is _node:
+                del self.node_by_path[_path]
+            stack.extend(_node.children)
+
+    def add_path(self, path: str) -> T:
+        """Get node from full path, creating intermediate nodes if they are not present. Equivalent to
+        `construct.add_path_to_tree` without searching the tree."""
+        path_list = path.strip(self.sep).split(self.sep)
+        parent_node = self.root
+        for idx in range(1, len(path_list)):
+            _path = self.sep + self.sep.join(path_list[: idx + 1])
+            _node = self.node_by_path.get(_path)
+            if _node is None:
+                _node = self.root.__class__(path_list[idx])
+                _node.parent = parent_node
+                self.node_by_path[_path] = _node
+                self.path_by_node[_node] = _path
+            parent_node = _node
+        return parent_node
+
+
+def _get_path_indexes(tree: T, to_tree: T) -> tuple[_PathIndex[T], _PathIndex[T]]:
+    """Get path index of tree and to_tree, which are the same index if both belongs to the same tree."""
+    from_index = _PathIndex(tree)
+    if to_tree.root is tree.root:
+        return from_index, from_index
+    return from_index, _PathIndex(to_tree)
+
+
+def _resolve_from_paths(
+    tree: T, from_index: _PathIndex[T], from_paths: list[str], with_full_path: bool
+) -> list[list[T]]:
+    """Resolve all `from_paths` to their candidate nodes against the path index, before any node is shifted."""
+    if with_full_path:
+        return [
+            [_node] if (_node := from_index.get(from_path)) else []
+            for from_path in from_paths
+        ]
+    if not tree.is_root:
+        return [
+            [
+                _node
+                for _node in iterators.preorder_iter(tree)
+                if _node.path_name.endswith(from_path)
+            ]
+            for from_path in from_paths
+        ]
+    return [from_index.find_suffix(from_path) for from_path in from_paths]
+
+
+def _get_from_node(
+    tree: T,
+    from_index: _PathIndex[T],
+    from_path: str,
+    from_nodes: list[T],
+    with_full_path: bool,
+    modified: bool,
+) -> T | None:
+    """Get from-node of `from_path` from its candidate nodes, which are resolved before shifting but may have been
+    shifted by an earlier path."""
+    if with_full_path:
+        return from_index.get(from_path) if modified else next(iter(from_nodes), None)
+    if len(from_nodes) == 1:
+        _path = from_index.path_by_node.get(from_nodes[0])
+        if _path is not None and _path.endswith(from_path):
+            return from_nodes[0]
+    if not from_nodes and not modified:
+        return None
+    # Raise error for multiple nodes found, or search the modified tree
+    return search.find_path(tree, from_path)
+
+
+def _check_shift_conflicts(
+    from_paths: list[str],
+    to_paths: list[str | None],
+    from_nodes: list[list[T]],
+    from_index: _PathIndex[T],
+    to_index: _PathIndex[T],
+    copy: bool,
+    delete_children: bool,
+) -> None:
+    """Check that paths to copy/shift to do not clash with each other or with the from-node, before any node is
+    shifted.
+
+    Checks are only done if all paths are independent of each other, i.e., all from-nodes are found and no from-node
+    is shifted together with, or shifted to below, another from-node. Otherwise, clashes are only known as the nodes
+    are shifted in sequence.
+    """
+    if any(len(from_candidates) != 1 for from_candidates in from_nodes):
+        return
+    from_keys = [
+        from_index.path_by_node[from_candidates[0]] for from_candidates in from_nodes
+    ]
+    if len(set(from_keys)) != len(from_keys):
+        return
+    sep = from_index.sep
+    from_keys_set = set(from_keys)
+    for from_key, to_path in zip(from_keys, to_paths, strict=True):
+        paths = [from_key.rsplit(sep, 1)[0]]
+        if to_path and from_index is to_index:
+            paths.append(to_index.key(to_path))
+        for path in paths:
+            path_list = path.split(sep)
+            for idx in range(2, len(path_list) + 1):
+                path_prefix = sep.join(path_list[:idx])
+                if path_prefix != from_key and path_prefix in from_keys_set:
+                    return
+
+    to_keys = set()
+    for from_path, to_path, from_candidates, from_key in zip(
+        from_paths, to_paths, from_nodes, from_keys, strict=True
+    ):
+        if not to_path:
+            continue
+        from_node = from_candidates[0]
+        to_key = to_index.key(to_path)
+        if to_key in to_keys:
+            raise exceptions.TreeError(
+                f"Path {to_path} already exists and unable to override\n"
+                f"Set `overriding` or `merge_attribute` to True to handle node name clashes\n"
+                f"Alternatively, set `merge_children` to True if nodes are to be merged"
+            )
+        to_keys.add(to_key)
+        if from_index is to_index:
+            if to_key == from_key:
+                raise exceptions.TreeError(
+                    f"Attempting to shift the same node {from_node.node_name} back to the same position\n"
+                    f"Check from path {from_path} and to path {to_path}\n"
+                    f"Alternatively, set `merge_children` or `merge_leaves` to True if intermediate node is to be removed"
+                )
+            if not copy and not delete_children and to_key.startswith(from_key + sep):
+                raise exceptions.LoopError(
+                    f"Error setting parent: Node cannot be ancestor of itself\n"
+                    f"Check from path {from_path} and to path {to_path}"
+                )
+
+
+def _shift_node_unchecked(from_node: T, to_node: T) -> None:
+    """Assign parent without node-level assertions, for shifts that are checked against the path index to not
+    result in loops or clashing node names."""
+    assertions = Globals.ASSERTIONS
+    Globals.ASSERTIONS = False
+    try:
+        from_node.parent = to_node
+    finally:
+        Globals.ASSERTIONS = assertions
+
+
+def _get_skeleton_trees(tree: T, to_tree: T) -> tuple[T, T, dict[T, T]]:
+    """Get copy of tree and to_tree with node names only, which is shifted in place of the trees when planning.
+
+    Returns:
+        Skeleton of tree and to_tree, and mapping of skeleton node to original node
+    """
+    skeleton_nodes: dict[T, T] = {}
+    assertions = Globals.ASSERTIONS
+    Globals.ASSERTIONS = False
+    try:
+        for root in dict.fromkeys([tree.root, to_tree.root]):
+            skeleton_nodes[root] = node.Node(root.node_name, sep=root.sep)  # type: ignore[assignment]
+            stack = [root]
+            while stack:
+                _node = stack.pop()
+                skeleton_parent = skeleton_nodes[_node]
+                for child in _node.children:
+                    skeleton_nodes[child] = node.Node(child.node_name, parent=skeleton_parent)  # type: ignore[assignment]
+                    stack.append(child)
+    finally:
+        Globals.ASSERTIONS = assertions
+    original_nodes = {
+        skeleton_node: _node for _node, skeleton_node in skeleton_nodes.items()
+    }
+    return skeleton_nodes[tree], skeleton_nodes[to_tree], original_nodes
+
+
+def _get_planned_operation(
+    from_path: str,
+    to_path: str | None,
+    from_node: T | None,
+    to_index: _PathIndex[T],
+    original_nodes: dict[T, T],
+    copy: bool,
+    overriding: bool,
+    merge_children: bool,
+    merge_leaves: bool,
+    delete_children: bool,
+    replace: bool = False,
+) -> dict[str, Any]:
+    """Get planned operation of shifting/copying from-node to `to_path`, before the skeleton tree is modified."""
+    if from_node is None:
+        return {
+            "from_path": from_path,
+            "to_path": to_path,
+            "from_node": None,
+            "to_node": None,
+            "action": "skip",
+            "to_path_action": None,
+            "created_paths": [],
+            "nodes_touched": 0,
+            "nodes_copied": 0,
+        }
+
+    to_node = to_index.get(to_path) if to_path else None
+    from_node_count = (
+        1 if delete_children else 1 + sum(1 for _ in from_node.descendants)
+    )
+    to_node_count = 0
+    created_paths = []
+    if not to_path:
+        action, to_path_action = "delete", None
+    else:
+        action = "copy" if copy else "shift"
+        if replace:
+            to_path_action = "replace"
+        elif merge_children or merge_leaves:
+            to_path_action = "merge"
+        elif to_node is None:
+            to_path_action = "create"
+        elif overriding:
+            to_path_action = "override"
+        else:
+            to_path_action = "merge"
+        if to_node is not None and (
+            replace or (overriding and to_node is not from_node)
+        ):
+            to_node_count = 1 + sum(1 for _ in to_node.descendants)
+        if to_node is None and not replace:
+            path_list = to_index.key(to_path).split(to_index.sep)
+            for idx in range(3, len(path_list)):
+                _path = to_index.sep.join(path_list[:idx])
+                if _path not in to_index.node_by_path:
+                    created_paths.append(_path)
+    return {
+        "from_path": from_path,
+        "to_path": to_path,
+        "from_node": original_nodes.get(from_node),
+        "to_node": original_nodes.get(to_node) if to_node is not None else None,
+        "action": action,
+        "to_path_action": to_path_action,
+        "created_paths": created_paths,
+        "nodes_touched": from_node_count + to_node_count,
+        "nodes_copied": from_node_count if copy else 0,
+    }
+
+
 def copy_or_shift_logic(
     tree: T,
     from_paths: Collection[str],
@@ -1191,7 +1654,8 @@ def copy_or_shift_logic(
     delete_children: bool = False,
     to_tree: T | None = None,
     with_full_path: bool = False,
-) -> None:
+    plan: bool = False,
+) -> list[dict[str, Any]] | None:
     """Shift or copy nodes from `from_paths` to `to_paths` *in-place*.
 
     - Creates intermediate nodes if to-path is not present
@@ -1203,6 +1667,7 @@ def copy_or_shift_logic(
     - Able to merge only leaf nodes and remove all intermediate nodes, defaults to False (nodes are shifted; not merged)
     - Able to shift/copy node only and delete children, defaults to False (nodes are shifted/copied together with children)
     - Able to shift/copy nodes from one tree to another tree, defaults to None (shifting/copying happens within same tree)
+    - Able to plan operations without modifying tree, defaults to False (nodes are shifted/copied)
 
     For paths in `from_paths` and `to_paths`,
 
@@ -1213,6 +1678,8 @@ def copy_or_shift_logic(
     - Path name can be partial path (trailing part of path) or node name
     - If ``with_full_path=True``, path name must be full path
     - Path name must be unique to one node
+    - Paths are resolved against the tree before any node is shifted, nodes that are not found are searched again
+        after earlier paths are shifted
 
     For paths in `to_paths`,
 
@@ -1236,6 +1703,7 @@ def copy_or_shift_logic(
 
     - `merge_children` and `merge_leaves` cannot be both True at the same time
     - `overriding` and `merge_attribute` cannot be both True at the same time
+    - If all from-nodes are found and do not overlap, clashes in `to_paths` are checked before any node is shifted
 
     Args:
         tree: tree to modify
@@ -1251,6 +1719,17 @@ def copy_or_shift_logic(
         delete_children: indicator to copy/shift node only without children
         to_tree: tree to copy to
         with_full_path: indicator to copy/shift node with full path in `from_paths`, results in faster search
+        plan: indicator to return planned operations without modifying tree
+
+    Returns:
+        Planned operations if ``plan=True``, with one operation for each path in `from_paths` containing
+
+        - `from_path`, `to_path`: paths, with `sep` replaced by tree path separator symbol
+        - `from_node`, `to_node`: node resolved from `from_path`, and node at `to_path` if it exists
+        - `action`: "shift", "copy", "delete", or "skip" if from-path is not found
+        - `to_path_action`: "create", "override" or "merge" for `to_path`, None if node is deleted or skipped
+        - `created_paths`: intermediate paths that will be created
+        - `nodes_touched`, `nodes_copied`: number of nodes shifted or removed, and number of nodes copied
     """
     if merge_children and merge_leaves:
         raise ValueError(
@@ -1315,12 +1794,33 @@ def copy_or_shift_logic(
             "Invalid path in `to_paths` not starting with the root node. Check your `to_paths` parameter."
         )
 
+    # Plan on skeleton of tree with node names only, which is shifted in place of the tree
+    planned: list[dict[str, Any]] = []
+    if plan:
+        tree, to_tree, original_nodes = _get_skeleton_trees(tree, to_tree)
+
+    # Resolve all paths with path index built once, and check for clashes before shifting
+    from_index, to_index = _get_path_indexes(tree, to_tree)
+    from_nodes = _resolve_from_paths(tree, from_index, from_paths, with_full_path)
+    if not (overriding or merge_attribute or merge_children or merge_leaves):
+        _check_shift_conflicts(
+            from_paths,
+            to_paths,
+            from_nodes,
+            from_index,
+            to_index,
+            copy,
+            delete_children,
+        )
+
     # Perform shifting/copying
-    for from_path, to_path in zip(from_paths, to_paths, strict=True):
-        if with_full_path:
-            from_node = search.find_full_path(tree, from_path)
-        else:
-            from_node = search.find_path(tree, from_path)
+    modified = False
+    for from_path, to_path, from_candidates in zip(
+        from_paths, to_paths, from_nodes, strict=True
+    ):
+        from_node = _get_from_node(
+            tree, from_index, from_path, from_candidates, with_full_path, modified
+        )
 
         # From node not found
         if not from_node:
@@ -1331,20 +1831,54 @@ def copy_or_shift_logic(
                 )
             else:
                 logging.info(f"Unable to find from_path {from_path}")
+            if plan:
+                planned.append(
+                    _get_planned_operation(
+                        from_path,
+                        to_path,
+                        None,
+                        to_index,
+                        original_nodes,
+                        copy,
+                        overriding,
+                        merge_children,
+                        merge_leaves,
+                        delete_children,
+                    )
+                )
 
         # From node found
         else:
+            if plan:
+                planned.append(
+                    _get_planned_operation(
+                        from_path,
+                        to_path,
+                        from_node,
+                        to_index,
+                        original_nodes,
+                        copy,
+                        overriding,
+                        merge_children,
+                        merge_leaves,
+                        delete_children,
+                    )
+                )
+            modified = True
+            rebuild_index = False
+            to_node_created = False
             # Node to be deleted
             if not to_path:
                 to_node = None
             # Node to be copied/shifted
             else:
-                to_node = search.find_full_path(to_tree, to_path)
+                to_node = to_index.get(to_path)
 
                 # To node found
                 if to_node:
                     if from_node == to_node:
                         if merge_children:
+                            to_index.remove(to_node)
                             parent = to_node.parent
                             to_node.parent = None
                             to_node = parent
@@ -1361,6 +1895,8 @@ def copy_or_shift_logic(
                             logging.info(
                                 f"Path {to_path} already exists and its children be overridden by the merge"
                             )
+                            for child in to_node.children:
+                                to_index.remove(child)
                             del to_node.children
                         elif merge_attribute:
                             logging.info(
@@ -1373,6 +1909,7 @@ def copy_or_shift_logic(
                                 merge_children=merge_children,
                                 merge_leaves=merge_leaves,
                             )
+                            rebuild_index = True
                             to_node.set_attrs(
                                 dict(from_node.describe(exclude_prefix="_"))
                             )
@@ -1386,6 +1923,8 @@ def copy_or_shift_logic(
                             logging.info(
                                 f"Path {to_path} already exists and its leaves be overridden by the merge"
                             )
+                            for child in to_node.children:
+                                to_index.remove(child)
                             del to_node.children
                         elif merge_attribute:
                             logging.info(
@@ -1398,6 +1937,7 @@ def copy_or_shift_logic(
                                 merge_children=merge_children,
                                 merge_leaves=merge_leaves,
                             )
+                            rebuild_index = True
                             to_node.set_attrs(
                                 dict(from_node.describe(exclude_prefix="_"))
                             )
@@ -1411,6 +1951,7 @@ def copy_or_shift_logic(
                             logging.info(
                                 f"Path {to_path} already exists and will be overridden"
                             )
+                            to_index.remove(to_node)
                             parent = to_node.parent
                             to_node.parent = None
                             to_node = parent
@@ -1425,6 +1966,7 @@ def copy_or_shift_logic(
                                 merge_children=merge_children,
                                 merge_leaves=merge_leaves,
                             )
+                            rebuild_index = True
                             parent = to_node.parent
                             to_node.parent = None
                             to_node = parent
@@ -1437,13 +1979,25 @@ def copy_or_shift_logic(
 
                 # To node not found
                 else:
+                    if (
+                        not (copy or merge_children or merge_leaves or delete_children)
+                        and from_index is to_index
+                        and to_index.key(to_path).startswith(
+                            from_index.path_by_node[from_node] + tree_sep
+                        )
+                    ):
+                        raise exceptions.LoopError(
+                            f"Error setting parent: Node cannot be ancestor of itself\n"
+                            f"Check from path {from_path} and to path {to_path}"
+                        )
                     # Find parent node, create intermediate parent node if applicable
                     to_path_parent = tree_sep.join(to_path.split(tree_sep)[:-1])
-                    to_node = construct.add_path_to_tree(
-                        to_tree, to_path_parent, sep=tree_sep
-                    )
+                    to_node = to_index.add_path(to_path_parent)
+                    to_node_created = True
 
             # Reassign from_node to new parent
+            if not copy:
+                from_index.remove(from_node)
             if copy:
                 logging.debug(f"Copying {from_node.node_name}")
                 from_node = from_node.copy()
@@ -1452,7 +2006,8 @@ def copy_or_shift_logic(
                 logging.debug(
                     f"Reassigning children from {from_node.node_name} to {to_node.node_name}"
                 )
-                for children in from_node.children:
+                shifted_nodes = list(from_node.children)
+                for children in shifted_nodes:
                     if delete_children:
                         del children.children
                     children.parent = to_node
@@ -1461,12 +2016,29 @@ def copy_or_shift_logic(
                 logging.debug(
                     f"Reassigning leaf nodes from {from_node.node_name} to {to_node.node_name}"
                 )
+                shifted_nodes = [from_node]
                 for children in from_node.leaves:
                     children.parent = to_node
+                    shifted_nodes.append(children)
             else:
                 if delete_children:
                     del from_node.children
-                from_node.parent = to_node
+                if to_node_created and not delete_children:
+                    # Path index ensures that to_path is not present and from_node is not an ancestor of to_node
+                    _shift_node_unchecked(from_node, to_node)
+                else:
+                    from_node.parent = to_node
+                shifted_nodes = [from_node]
+
+            # Update path index with new paths of shifted nodes
+            if rebuild_index:
+                from_index, to_index = _get_path_indexes(tree, to_tree)
+            else:
+                for shifted_node in shifted_nodes:
+                    to_index.add(shifted_node)
+                    if from_index is not to_index:
+                        from_index.add(shifted_node)
+    return planned if plan else None
 
 
 def replace_logic(
@@ -1479,7 +2051,8 @@ def replace_logic(
     delete_children: bool = False,
     to_tree: T | None = None,
     with_full_path: bool = False,
-) -> None:
+    plan: bool = False,
+) -> list[dict[str, Any]] | None:
     """Shift or copy nodes from `from_paths` to *replace* `to_paths` *in-place*.
 
     - Creates intermediate nodes if to-path is not present
@@ -1487,6 +2060,7 @@ def replace_logic(
     - Able to skip nodes if from-path is not found, defaults to False (from-nodes must be found; not skippable)
     - Able to replace node only and delete children, defaults to False (nodes are shifted/copied together with children)
     - Able to shift/copy nodes from one tree to another tree, defaults to None (shifting/copying happens within same tree)
+    - Able to plan operations without modifying tree, defaults to False (nodes are shifted/copied)
 
     For paths in `from_paths` and `to_paths`,
 
@@ -1497,6 +2071,8 @@ def replace_logic(
     - Path name can be partial path (trailing part of path) or node name
     - If ``with_full_path=True``, path name must be full path
     - Path name must be unique to one node
+    - Paths are resolved against the tree before any node is shifted, nodes that are not found are searched again
+        after earlier paths are shifted
 
     For paths in `to_paths`,
 
@@ -1513,6 +2089,11 @@ def replace_logic(
         delete_children: indicator to copy/shift node only without children
         to_tree: tree to copy to
         with_full_path: indicator to copy/shift node with full path in `from_paths`, results in faster search
+        plan: indicator to return planned operations without modifying tree
+
+    Returns:
+        Planned operations if ``plan=True``, see `copy_or_shift_logic` for the contents of each operation. The
+        `to_path_action` is "replace" for nodes that are replaced
     """
     if not (isinstance(from_paths, list) and isinstance(to_paths, list)):
         raise ValueError(
@@ -1555,12 +2136,23 @@ def replace_logic(
             "Invalid path in `to_paths` not starting with the root node. Check your `to_paths` parameter."
         )
 
+    # Plan on skeleton of tree with node names only, which is shifted in place of the tree
+    planned: list[dict[str, Any]] = []
+    if plan:
+        tree, to_tree, original_nodes = _get_skeleton_trees(tree, to_tree)
+
+    # Resolve all paths with path index built once
+    from_index, to_index = _get_path_indexes(tree, to_tree)
+    from_nodes = _resolve_from_paths(tree, from_index, from_paths, with_full_path)
+
     # Perform shifting/copying to replace destination node
-    for from_path, to_path in zip(from_paths, to_paths, strict=True):
-        if with_full_path:
-            from_node = search.find_full_path(tree, from_path)
-        else:
-            from_node = search.find_path(tree, from_path)
+    modified = False
+    for from_path, to_path, from_candidates in zip(
+        from_paths, to_paths, from_nodes, strict=True
+    ):
+        from_node = _get_from_node(
+            tree, from_index, from_path, from_candidates, with_full_path, modified
+        )
 
         # From node not found
         if not from_node:
@@ -1570,10 +2162,43 @@ def replace_logic(
                 )
             else:
                 logging.info(f"Unable to find from_path {from_path}")
+            if plan:
+                planned.append(
+                    _get_planned_operation(
+                        from_path,
+                        to_path,
+                        None,
+                        to_index,
+                        original_nodes,
+                        copy,
+                        False,
+                        False,
+                        False,
+                        delete_children,
+                        replace=True,
+                    )
+                )
 
         # From node found
         else:
-            to_node = search.find_full_path(to_tree, to_path)
+            if plan:
+                planned.append(
+                    _get_planned_operation(
+                        from_path,
+                        to_path,
+                        from_node,
+                        to_index,
+                        original_nodes,
+                        copy,
+                        False,
+                        False,
+                        False,
+                        delete_children,
+                        replace=True,
+                    )
+                )
+            modified = True
+            to_node = to_index.get(to_path) if to_path else None
 
             # To node found
             if to_node:
@@ -1588,6 +2213,9 @@ def replace_logic(
                 raise exceptions.NotFoundError(f"Unable to find to_path {to_path}")
 
             # Replace to_node with from_node
+            to_index.remove(to_node)
+            if not copy:
+                from_index.remove(from_node)
             if copy:
                 logging.debug(f"Copying {from_node.node_name}")
                 from_node = from_node.copy()
@@ -1603,3 +2231,9 @@ def replace_logic(
                 else:
                     _node.parent = None
                     _node.parent = parent
+
+            # Update path index with new path of replaced node
+            to_index.add(from_node)
+            if from_index is not to_index:
+                from_index.add(from_node)
+    return planned if plan else None
@@ -0,0 +1,593 @@
+from __future__ import annotations
+
+import os
+import pickle
+import sqlite3
+from typing import Any, Iterator, Mapping, TypeVar
+
+from bigtree._globals import Globals
+from bigtree.node import node
+from bigtree.utils import exceptions
+
+__all__ = ["TreeStore"]
+
+T = TypeVar("T", bound=node.Node)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS nodes (
+    id INTEGER PRIMARY KEY,
+    parent_id INTEGER,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE INDEX IF NOT EXISTS nodes_name ON nodes (name);
+CREATE INDEX IF NOT EXISTS nodes_parent ON nodes (parent_id, position);
+CREATE TABLE IF NOT EXISTS closure (
+    ancestor INTEGER NOT NULL,
+    descendant INTEGER NOT NULL,
+    depth INTEGER NOT NULL,
+    PRIMARY KEY (ancestor, descendant)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS closure_descendant ON closure (descendant, depth);
+CREATE TABLE IF NOT EXISTS attrs (
+    node_id INTEGER NOT NULL,
+    attr_name TEXT NOT NULL,
+    attr_value,
+    attr_kind TEXT,
+    PRIMARY KEY (node_id, attr_name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS attrs_value ON attrs (attr_name, attr_value);
+"""
+
+_KIND_BOOL = "bool"
+_KIND_OBJECT = "object"
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+
+def _encode_value(value: Any) -> tuple[Any, str | None]:
+    """Encode attribute value to SQLite value and kind, native values are stored as-is to be indexed and queried.
+
+    Args:
+        value: attribute value
+
+    Returns:
+        SQLite value and kind of value
+    """
+    if isinstance(value, bool):
+        return int(value), _KIND_BOOL
+    if value is None or type(value) in (float, str):
+        return value, None
+    if type(value) is int and _INT64_MIN <= value <= _INT64_MAX:
+        return value, None
+    return pickle.dumps(value), _KIND_OBJECT
+
+
+def _decode_value(value: Any, kind: str | None) -> Any:
+    """Decode SQLite value and kind to attribute value.
+
+    Args:
+        value: SQLite value
+        kind: kind of value
+
+    Returns:
+        Attribute value
+    """
+    if kind == _KIND_BOOL:
+        return bool(value)
+    if kind == _KIND_OBJECT:
+        return pickle.loads(value)
+    return value
+
+
+class TreeStore:
+    """
+    TreeStore persists a tree of ``Node`` into a local SQLite file, so that trees larger than memory can be kept on
+    disk and loaded partially.
+
+    Nodes are stored with a closure table of all (ancestor, descendant, depth) pairs, so that subtrees up to a depth
+    are loaded with one indexed query. Node attributes are stored one row per attribute, attributes of type bool, int,
+    float, str, and None are stored natively and can be queried, other attributes are pickled.
+
+    Modifications are written through and committed to the file immediately, without loading or rewriting the tree.
+
+    - Add tree or subtree with `add_tree`, remove subtree with `remove_node`
+    - Set attributes or rename node with `set_attrs`
+    - Reparent or reorder node with `shift_node`
+    - Load subtree with `load_subtree`
+    - Query paths by name, attribute, or path prefix with `find_names`, `find_attrs`, and `find_paths`
+
+    Examples:
+        >>> from bigtree import Node, TreeStore
+        >>> root = Node("a", age=90)
+        >>> b = Node("b", age=65, parent=root)
+        >>> c = Node("c", age=60, parent=root)
+        >>> d = Node("d", age=40, parent=b)
+        >>> store = TreeStore(":memory:")
+        >>> store.add_tree(root)
+        >>> store.load_subtree("a", depth=1).show(attr_list=["age"])
+        a [age=90]
+        ├── b [age=65]
+        └── c [age=60]
+
+        >>> store.set_attrs("a/b/d", {"age": 45})
+        >>> store.shift_node("a/b/d", "a/c")
+        >>> store.find_attrs("age", 45)
+        ['/a/c/d']
+        >>> store.load_subtree("a/c").show(attr_list=["age"])
+        c [age=60]
+        └── d [age=45]
+
+        >>> store.close()
+    """
+
+    def __init__(self, file: str | os.PathLike[str], sep: str = "/"):
+        """Open or create tree store in SQLite file.
+
+        Args:
+            file: path of SQLite file, or ":memory:" for in-memory database
+            sep: separator of path, used only if tree store is created
+        """
+        self._connection = sqlite3.connect(file)
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('sep', ?)", (sep,)
+            )
+        self.sep: str = self._connection.execute(
+            "SELECT value FROM meta WHERE key = 'sep'"
+        ).fetchone()[0]
+
+    def __enter__(self) -> TreeStore:
+        """Use tree store as context manager, which closes the connection on exit.
+
+        Returns:
+            Tree store
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Close connection to SQLite file.
+
+        Args:
+            args: exception type, value, and traceback, if an exception is raised
+        """
+        self.close()
+
+    def __len__(self) -> int:
+        """Get number of nodes in tree store.
+
+        Returns:
+            Number of nodes
+        """
+        return int(self._connection.execute("SELECT COUNT(*) FROM nodes").fetchone()[0])
+
+    def __contains__(self, path_name: str) -> bool:
+        """Check if path is in tree store.
+
+        Args:
+            path_name: path of node
+
+        Returns:
+            Indicator if path is in tree store
+        """
+        return self._get_node(path_name) is not None
+
+    def close(self) -> None:
+        """Close connection to SQLite file."""
+        self._connection.close()
+
+    def _normalize_path(self, path_name: str) -> str:
+        """Get path with leading separator and without trailing separator.
+
+        Args:
+            path_name: path of node
+
+        Returns:
+            Path stored in tree store
+        """
+        return f"{self.sep}{path_name.strip(self.sep)}"
+
+    def _get_node(self, path_name: str) -> tuple[int, int | None, int] | None:
+        """Get id, parent id, and position of node.
+
+        Args:
+            path_name: path of node
+
+        Returns:
+            Id, parent id, and position of node if path is in tree store
+        """
+        row: tuple[int, int | None, int] | None = self._connection.execute(
+            "SELECT id, parent_id, position FROM nodes WHERE path = ?",
+            (self._normalize_path(path_name),),
+        ).fetchone()
+        return row
+
+    def _get_node_or_raise(self, path_name: str) -> tuple[int, int | None, int]:
+        """Get id, parent id, and position of node, raise NotFoundError if path is not in tree store.
+
+        Args:
+            path_name: path of node
+
+        Returns:
+            Id, parent id, and position of node
+        """
+        row = self._get_node(path_name)
+        if row is None:
+            raise exceptions.NotFoundError(f"Unable to find path {path_name}")
+        return row
+
+    def _check_path_not_exist(self, path_name: str) -> None:
+        """Raise DuplicatedNodeError if path is in tree store.
+
+        Args:
+            path_name: path of node
+        """
+        if self._get_node(path_name) is not None:
+            raise exceptions.DuplicatedNodeError(f"Path {path_name} already exists")
+
+    def _get_next_position(self, parent_id: int | None) -> int:
+        """Get position to append child to parent.
+
+        Args:
+            parent_id: id of parent node, None for root
+
+        Returns:
+            Position of appended child
+        """
+        position: int = self._connection.execute(
+            "SELECT COALESCE(MAX(position) + 1, 0) FROM nodes WHERE parent_id IS ?",
+            (parent_id,),
+        ).fetchone()[0]
+        return position
+
+    def _replace_path_prefix(self, node_id: int, old_path: str, new_path: str) -> None:
+        """Replace path prefix of node and its descendants.
+
+        Args:
+            node_id: id of node
+            old_path: path of node before replacement
+            new_path: path of node after replacement
+        """
+        self._connection.execute(
+            "UPDATE nodes SET path = ? || substr(path, ?) "
+            "WHERE id IN (SELECT descendant FROM closure WHERE ancestor = ?)",
+            (new_path, len(old_path) + 1, node_id),
+        )
+
+    def add_tree(self, tree: node.Node, parent_path: str = "") -> None:
+        """Add tree to tree store, as root of tree store or as last child of node at `parent_path`.
+
+        All descendants of `tree` are added, `tree` can be the root node or child node of tree. Node name and all
+        attributes are added, except attributes starting with underscore.
+
+        Args:
+            tree: tree to be added
+            parent_path: path of parent node, leave empty to add tree as root of empty tree store
+        """
+        cursor = self._connection.cursor()
+        if parent_path:
+            parent_id, _, _ = self._get_node_or_raise(parent_path)
+            parent_path = self._normalize_path(parent_path)
+            ancestors = cursor.execute(
+                "SELECT ancestor, depth FROM closure WHERE descendant = ? ORDER BY depth DESC",
+                (parent_id,),
+            ).fetchall()
+            base_ids: list[int] = [ancestor for ancestor, _ in ancestors]
+            position = self._get_next_position(parent_id)
+        else:
+            if len(self):
+                raise exceptions.TreeError(
+                    "Tree store already has a root, set `parent_path` to add tree as child of node"
+                )
+            base_ids, parent_id, position = [], None, 0
+        tree_path = f"{parent_path}{self.sep}{tree.node_name}"
+        self._check_path_not_exist(tree_path)
+        next_id: int = cursor.execute(
+            "SELECT COALESCE(MAX(id) + 1, 0) FROM nodes"
+        ).fetchone()[0]
+
+        node_rows: list[tuple[int, int | None, int, str, str]] = []
+        closure_rows: list[tuple[int, int, int]] = []
+        attr_rows: list[tuple[int, str, Any, str | None]] = []
+        # Preorder with ids of ancestors of current node, from root of tree store
+        stack: list[tuple[node.Node, int | None, int, str, int]] = [
+            (tree, parent_id, position, tree_path, len(base_ids))
+        ]
+        ancestor_ids = base_ids
+        while stack:
+            _node, _parent_id, _position, _path, n_ancestors = stack.pop()
+            node_id = next_id
+            next_id += 1
+            del ancestor_ids[n_ancestors:]
+            ancestor_ids.append(node_id)
+            node_rows.append((node_id, _parent_id, _position, _node.node_name, _path))
+            closure_rows.extend(
+                (ancestor_id, node_id, len(ancestor_ids) - 1 - ancestor_idx)
+                for ancestor_idx, ancestor_id in enumerate(ancestor_ids)
+            )
+            attr_rows.extend(
+                (node_id, attr_name, *_encode_value(attr_value))
+                for attr_name, attr_value in _node.describe(exclude_prefix="_")
+                if attr_name != "name"
+            )
+            stack.extend(
+                (
+                    _child,
+                    node_id,
+                    child_position,
+                    f"{_path}{self.sep}{_child.node_name}",
+                    len(ancestor_ids),
+                )
+                for child_position, _child in reversed(list(enumerate(_node.children)))
+            )
+
+        with self._connection:
+            cursor.executemany("INSERT INTO nodes VALUES (?, ?, ?, ?, ?)", node_rows)
+            cursor.executemany("INSERT INTO closure VALUES (?, ?, ?)", closure_rows)
+            cursor.executemany("INSERT INTO attrs VALUES (?, ?, ?, ?)", attr_rows)
+
+    def remove_node(self, path_name: str) -> None:
+        """Remove node and its descendants from tree store.
+
+        Args:
+            path_name: path of node
+        """
+        node_id, parent_id, position = self._get_node_or_raise(path_name)
+        subtree = "SELECT descendant FROM closure WHERE ancestor = ?"
+        with self._connection:
+            # Close gap among siblings, such that positions of children run from 0
+            self._connection.execute(
+                "UPDATE nodes SET position = position - 1 "
+                "WHERE parent_id = ? AND position > ?",
+                (parent_id, position),
+            )
+            self._connection.execute(
+                f"DELETE FROM attrs WHERE node_id IN ({subtree})", (node_id,)
+            )
+            self._connection.execute(
+                f"DELETE FROM nodes WHERE id IN ({subtree})", (node_id,)
+            )
+            self._connection.execute(
+                f"DELETE FROM closure WHERE descendant IN ({subtree})", (node_id,)
+            )
+
+    def set_attrs(self, path_name: str, attrs: Mapping[str, Any]) -> None:
+        """Set node attributes, attribute `name` renames node and updates path of its descendants.
+
+        Args:
+            path_name: path of node
+            attrs: attribute name and attribute value
+        """
+        node_id, _, _ = self._get_node_or_raise(path_name)
+        with self._connection:
+            if "name" in attrs:
+                old_path = self._normalize_path(path_name)
+                new_path = f"{old_path.rsplit(self.sep, 1)[0]}{self.sep}{attrs['name']}"
+                if new_path != old_path:
+                    self._check_path_not_exist(new_path)
+                    self._connection.execute(
+                        "UPDATE nodes SET name = ? WHERE id = ?",
+                        (attrs["name"], node_id),
+                    )
+                    self._replace_path_prefix(node_id, old_path, new_path)
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO attrs VALUES (?, ?, ?, ?)",
+                [
+                    (node_id, attr_name, *_encode_value(attr_value))
+                    for attr_name, attr_value in attrs.items()
+                    if attr_name != "name"
+                ],
+            )
+
+    def remove_attrs(self, path_name: str, attr_names: list[str]) -> None:
+        """Remove node attributes.
+
+        Args:
+            path_name: path of node
+            attr_names: attribute names to remove
+        """
+        node_id, _, _ = self._get_node_or_raise(path_name)
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM attrs WHERE node_id = ? AND attr_name = ?",
+                [(node_id, attr_name) for attr_name in attr_names],
+            )
+
+    def shift_node(
+        self, path_name: str, new_parent_path: str, position: int | None = None
+    ) -> None:
+        """Shift node and its descendants to be child of node at `new_parent_path`, at `position` among its children.
+
+        Shifting node to its current parent reorders the node among its siblings.
+
+        Args:
+            path_name: path of node
+            new_parent_path: path of new parent node
+            position: position among children of new parent, defaults to last child
+        """
+        node_id, parent_id, old_position = self._get_node_or_raise(path_name)
+        if parent_id is None:
+            raise exceptions.TreeError(f"Unable to shift root node {path_name}")
+        new_parent_id, _, _ = self._get_node_or_raise(new_parent_path)
+        if self._connection.execute(
+            "SELECT 1 FROM closure WHERE ancestor = ? AND descendant = ?",
+            (node_id, new_parent_id),
+        ).fetchone():
+            raise exceptions.LoopError(
+                f"Unable to shift node {path_name} to itself or its descendant {new_parent_path}"
+            )
+        old_path = self._normalize_path(path_name)
+        node_name = old_path.rsplit(self.sep, 1)[1]
+        new_path = f"{self._normalize_path(new_parent_path)}{self.sep}{node_name}"
+        if new_path != old_path:
+            self._check_path_not_exist(new_path)
+
+        with self._connection:
+            # Close gap among old siblings, then make space among new siblings
+            self._connection.execute(
+                "UPDATE nodes SET position = position - 1 "
+                "WHERE parent_id = ? AND position > ?",
+                (parent_id, old_position),
+            )
+            n_siblings: int = self._connection.execute(
+                "SELECT COUNT(*) FROM nodes WHERE parent_id = ? AND id != ?",
+                (new_parent_id, node_id),
+            ).fetchone()[0]
+            if position is None or position > n_siblings:
+                position = n_siblings
+            position = max(position, 0)
+            self._connection.execute(
+                "UPDATE nodes SET position = position + 1 "
+                "WHERE parent_id = ? AND id != ? AND position >= ?",
+                (new_parent_id, node_id, position),
+            )
+            self._connection.execute(
+                "UPDATE nodes SET parent_id = ?, position = ? WHERE id = ?",
+                (new_parent_id, position, node_id),
+            )
+
+            if parent_id != new_parent_id:
+                # Detach subtree from old ancestors, then attach subtree to new ancestors
+                self._connection.execute(
+                    "DELETE FROM closure "
+                    "WHERE descendant IN (SELECT descendant FROM closure WHERE ancestor = ?) "
+                    "AND ancestor NOT IN (SELECT descendant FROM closure WHERE ancestor = ?)",
+                    (node_id, node_id),
+                )
+                self._connection.execute(
+                    "INSERT INTO closure (ancestor, descendant, depth) "
+                    "SELECT above.ancestor, below.descendant, above.depth + below.depth + 1 "
+                    "FROM closure above CROSS JOIN closure below "
+                    "WHERE above.descendant = ? AND below.ancestor = ?",
+                    (new_parent_id, node_id),
+                )
+                self._replace_path_prefix(node_id, old_path, new_path)
+
+    def load_subtree(
+        self,
+        path_name: str,
+        depth: int | None = None,
+        node_type: type[T] = node.Node,  # type: ignore[assignment]
+    ) -> T:
+        """Load subtree of node at `path_name` from tree store, up to `depth` levels of descendants.
+
+        Args:
+            path_name: path of node
+            depth: number of levels of descendants to load, 0 loads only the node, defaults to load all descendants
+            node_type: node type of loaded tree
+
+        Returns:
+            Root of subtree
+        """
+        node_id, _, _ = self._get_node_or_raise(path_name)
+        max_depth = -1 if depth is None else depth
+        params = (node_id, max_depth, max_depth)
+        depth_filter = "(? < 0 OR closure.depth <= ?)"
+        node_attrs: dict[int, dict[str, Any]] = {}
+        for _node_id, attr_name, attr_value, attr_kind in self._connection.execute(
+            "SELECT attrs.node_id, attrs.attr_name, attrs.attr_value, attrs.attr_kind "
+            "FROM closure JOIN attrs ON attrs.node_id = closure.descendant "
+            f"WHERE closure.ancestor = ? AND {depth_filter}",
+            params,
+        ):
+            node_attrs.setdefault(_node_id, {})[attr_name] = _decode_value(
+                attr_value, attr_kind
+            )
+
+        # Nodes are sorted by depth then position, hence parent is created before its children, in order
+        nodes: dict[int, T] = {}
+        assertions_ = Globals.ASSERTIONS
+        Globals.ASSERTIONS = False
+        try:
+            for _node_id, parent_id, name in self._connection.execute(
+                "SELECT nodes.id, nodes.parent_id, nodes.name "
+                "FROM closure JOIN nodes ON nodes.id = closure.descendant "
+                f"WHERE closure.ancestor = ? AND {depth_filter} "
+                "ORDER BY closure.depth, nodes.parent_id, nodes.position",
+                params,
+            ):
+                _node = node_type(name, **node_attrs.get(_node_id, {}))
+                if _node_id != node_id:
+                    _node.parent = nodes[parent_id]
+                nodes[_node_id] = _node
+        finally:
+            Globals.ASSERTIONS = assertions_
+
+        root_node = nodes[node_id]
+        root_node.sep = self.sep
+        return root_node
+
+    def _iter_paths(self, query: str, params: tuple[Any, ...]) -> Iterator[str]:
+        """Iterate paths returned by query, in order of path.
+
+        Args:
+            query: SQL query returning path in first column
+            params: parameters of query
+
+        Returns:
+            Paths
+        """
+        for (path,) in self._connection.execute(f"{query} ORDER BY path", params):
+            yield path
+
+    def find_names(self, name: str) -> list[str]:
+        """Find paths of nodes with name, using index on node name.
+
+        Args:
+            name: node name
+
+        Returns:
+            Paths of nodes
+        """
+        return list(self._iter_paths("SELECT path FROM nodes WHERE name = ?", (name,)))
+
+    def find_attrs(self, attr_name: str, attr_value: Any) -> list[str]:
+        """Find paths of nodes with attribute value, using index on attribute value. Only attributes stored natively,
+        of type bool, int, float, str, and None, can be queried.
+
+        Args:
+            attr_name: attribute name
+            attr_value: attribute value
+
+        Returns:
+            Paths of nodes
+        """
+        value, kind = _encode_value(attr_value)
+        if kind == _KIND_OBJECT:
+            raise TypeError(
+                f"Unable to query attribute value of type {type(attr_value).__name__}, "
+                "check `attr_value` to be of type bool, int, float, str, or None"
+            )
+        return list(
+            self._iter_paths(
+                "SELECT path FROM nodes JOIN attrs ON attrs.node_id = nodes.id "
+                "WHERE attrs.attr_name = ? AND attrs.attr_value IS ? AND attrs.attr_kind IS ?",
+                (attr_name, value, kind),
+            )
+        )
+
+    def find_paths(self, path_prefix: str) -> list[str]:
+        """Find paths of node at `path_prefix` and its descendants, using index on path.
+
+        Args:
+            path_prefix: path of node
+
+        Returns:
+            Paths of nodes
+        """
+        path_prefix = self._normalize_path(path_prefix)
+        return list(
+            self._iter_paths(
+                "SELECT path FROM nodes WHERE path = ? OR (path > ? AND path < ?)",
+                (
+                    path_prefix,
+                    f"{path_prefix}{self.sep}",
+                    f"{path_prefix}{self.sep[:-1]}{chr(ord(self.sep[-1]) + 1)}",
+                ),
+            )
+        )
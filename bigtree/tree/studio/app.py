@@ -306,9 +306,9 @@ def run_app_cli() -> None:
     if args.file:
         with open(args.file, "r") as f:
             data = json.load(f)
-        tree = BTTree.from_dict(data)  # type: ignore[attr-defined]
+        tree = BTTree.from_dict(data)
     else:
-        tree = BTTree.from_str("Root")  # type: ignore[attr-defined]
+        tree = BTTree.from_str("Root")
 
     run_app(tree, args.depth)
 
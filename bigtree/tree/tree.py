@@ -2,15 +2,13 @@ from __future__ import annotations
 
 import copy
 import functools
-from typing import Any, Callable, Literal, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Literal, TypeVar
 
-from bigtree._plugins import register_tree_plugins
+from bigtree._plugins import PluginMeta, register_tree_plugins
 from bigtree.node import basenode, binarynode, node
 
-try:
+if TYPE_CHECKING:
     import matplotlib.pyplot as plt
-except ImportError:  # pragma: no cover
-    plt = None
 
 
 BaseNodeT = TypeVar("BaseNodeT", bound=basenode.BaseNode)
@@ -18,7 +16,7 @@ BinaryNodeT = TypeVar("BinaryNodeT", bound=binarynode.BinaryNode)
 NodeT = TypeVar("NodeT", bound=node.Node)
 
 
-class Tree:
+class Tree(metaclass=PluginMeta):
     """
     Tree wraps around Node class to provide a quick, intuitive, Pythonic API for
 
@@ -176,4 +174,4 @@ class Tree:
 
 T = TypeVar("T", bound=Tree)
 
-register_tree_plugins()
+Tree.register_plugins_lazily(register_tree_plugins)
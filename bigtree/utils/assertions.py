@@ -1,23 +1,20 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Collection, Iterable, Mapping, Sequence
+import sys
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Collection,
+    Iterable,
+    Mapping,
+    Sequence,
+    TypeGuard,
+)
 
-try:
+if TYPE_CHECKING:
     import pandas as pd
-except ImportError:  # pragma: no cover
-    from unittest.mock import MagicMock
-
-    pd = MagicMock()
-
-try:
     import polars as pl
-except ImportError:  # pragma: no cover
-    from unittest.mock import MagicMock
-
-    pl = MagicMock()
 
-
-if TYPE_CHECKING:
     from bigtree.node.basenode import BaseNode
     from bigtree.node.dagnode import DAGNode
     from bigtree.node.node import Node
@@ -138,6 +135,19 @@ def assert_length(
         )
 
 
+def _is_pandas_dataframe(data: Any) -> TypeGuard[pd.DataFrame]:
+    """Check if data is pandas DataFrame, without importing pandas if it is not imported.
+
+    Args:
+        data: data to check
+
+    Returns:
+        Indicator if data is pandas DataFrame
+    """
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(data, pd.DataFrame)
+
+
 def assert_dataframe_not_empty(data: pd.DataFrame) -> None:
     """Raise ValueError is dataframe is empty.
 
@@ -164,7 +174,7 @@ def assert_dataframe_no_duplicate_attribute(
         id_col: column of data that is unique, can be name or path
         attribute_cols: columns of data containing node attribute information
     """
-    if pd and isinstance(data, pd.DataFrame):
+    if _is_pandas_dataframe(data):
         data_check = data[[id_col] + attribute_cols].astype(str).drop_duplicates()
         duplicate_check = (
             data_check[id_col]
@@ -197,7 +207,7 @@ def assert_dataframe_no_duplicate_children(
         parent_col: column of data containing parent name information
     """
     # Filter for child nodes that are parent of other nodes
-    if pd and isinstance(data, pd.DataFrame):
+    if _is_pandas_dataframe(data):
         data_check = data[[child_col, parent_col]].drop_duplicates()
         data_check = data_check[data_check[child_col].isin(data_check[parent_col])]
         duplicate_check = (
@@ -209,6 +219,8 @@ def assert_dataframe_no_duplicate_children(
         )
         duplicate_check = duplicate_check[duplicate_check["count"] > 1]
     else:
+        import polars as pl
+
         data_check = data.unique(subset=[child_col, parent_col]).filter(
             pl.col(child_col).is_in(pl.col(parent_col).implode())
         )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Collection, Mapping, TypeVar, Union
+import contextlib
+import os
+from typing import IO, Any, Callable, Collection, Iterator, Mapping, TypeVar, Union
 
 from bigtree.node import basenode, dagnode, node
 
@@ -12,6 +14,7 @@ __all__ = [
     "isnull",
     "filter_attributes",
     "assemble_attributes",
+    "open_file",
 ]
 
 
@@ -155,3 +158,26 @@ def assemble_attributes(
             data_attrs[v] = _node.get_attr(k)
 
     return data_attrs
+
+
+@contextlib.contextmanager
+def open_file(
+    file: str | os.PathLike[str] | IO[Any], mode: str = "r", newline: str | None = None
+) -> Iterator[IO[Any]]:
+    """Open file path, in text mode with utf-8 encoding unless `mode` is binary, or yield file object as-is without
+    closing it.
+
+    Args:
+        file: file path or file object
+        mode: mode to open file path in
+        newline: newline mode to open file path in
+
+    Returns:
+        File object
+    """
+    if hasattr(file, "read") or hasattr(file, "write"):
+        yield file  # type: ignore[misc]
+    else:
+        encoding = None if "b" in mode else "utf-8"
+        with open(file, mode, encoding=encoding, newline=newline) as fp:
+            yield fp
@@ -379,6 +379,38 @@ class MermaidConstants:
     }
 
 
+class BinaryConstants:
+    """Binary layout of tree bytes, all integers are little-endian and every section is padded to 8 bytes.
+
+    1. Header (``HEADER_FORMAT``): magic, version, flags, number of columns, string index of separator (``NO_INDEX``
+       if tree has no separator), reserved, number of nodes, number of strings
+    2. String table: uint64 byte offsets (number of strings + 1), followed by the utf-8 encoded strings
+    3. Structure: int64 parent index of each node in preorder (-1 for root), followed by int64 subtree size of each
+       node in preorder
+    4. Columns, one for each attribute (including name): column header (``COLUMN_FORMAT``) of string index of
+       attribute name, type code, and data length in bytes, followed by uint8 mask of each node (``MASK_*``) and the
+       column data
+    """
+
+    MAGIC = b"BIGTREE\x00"
+    VERSION = 1
+    HEADER_FORMAT = "<8sHHIIIQQ"
+    COLUMN_FORMAT = "<IcxxxQ"
+    NO_INDEX = 0xFFFFFFFF
+
+    # Mask of node in column
+    MASK_ABSENT = 0
+    MASK_VALUE = 1
+    MASK_NONE = 2
+
+    # Type code of column, column data has one value for every node except for object columns
+    TYPE_BOOL = b"?"  # uint8
+    TYPE_INT = b"q"  # int64
+    TYPE_FLOAT = b"d"  # float64
+    TYPE_STR = b"s"  # uint32 string index
+    TYPE_OBJECT = b"o"  # pickled list of values for nodes with MASK_VALUE
+
+
 class NewickState(Enum):
     PARSE_STRING = auto()
     PARSE_ATTRIBUTE_NAME = auto()
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import re
+from typing import IO, Any, Collection, Mapping
+
+__all__ = [
+    "quote_dot_id",
+    "quote_dot_attr",
+    "DotWriter",
+]
+
+DOT_KEYWORDS = {"graph", "subgraph", "digraph", "node", "edge", "strict"}
+DOT_ID_PATTERN = re.compile(r"^[_a-zA-Z][a-zA-Z0-9_]*$")
+DOT_ID_PORT_PATTERN = re.compile(r"^[_a-zA-Z][a-zA-Z0-9_:\"]*[a-zA-Z0-9_\"]+$")
+DOT_ID_WITH_PORT_PATTERN = re.compile(r"^([^:]*):([^:]*)$")
+DOT_NUMERAL_PATTERN = re.compile(r"^([0-9]+\.?[0-9]*|[0-9]*\.[0-9]+)$")
+DOT_QUOTED_PATTERN = re.compile(r'^".*"$')
+DOT_HTML_PATTERN = re.compile(r"^<.*>$")
+
+
+def _make_quoted(value: str) -> str:
+    """Enclose value in quotes, escaping quotes and line breaks.
+
+    Args:
+        value: identifier or attribute value
+
+    Returns:
+        Quoted identifier or attribute value
+    """
+    value = value.replace('"', r"\"").replace("\n", r"\n").replace("\r", r"\r")
+    return f'"{value}"'
+
+
+def _any_needs_quotes(value: str) -> bool | None:
+    """Check if identifier or attribute value needs to be quoted, following the rules of pydot.
+
+    Args:
+        value: identifier or attribute value
+
+    Returns:
+        Whether value needs to be quoted, None if it cannot be determined
+    """
+    if value.isdigit():
+        return False
+    if value.isalnum():
+        return value[0].isdigit()
+    if DOT_QUOTED_PATTERN.match(value) or DOT_HTML_PATTERN.match(value):
+        return False
+    if any(ord(char) > 0x7F or ord(char) == 0 for char in value):
+        return True
+    if DOT_NUMERAL_PATTERN.match(value):
+        return False
+    return None
+
+
+def _id_needs_quotes(value: str) -> bool:
+    """Check if identifier needs to be quoted, following the rules of pydot.
+
+    Args:
+        value: identifier
+
+    Returns:
+        Whether identifier needs to be quoted
+    """
+    if value.lower() in DOT_KEYWORDS:
+        return False
+    needs_quotes = _any_needs_quotes(value)
+    if needs_quotes is not None:
+        return needs_quotes
+    if DOT_ID_PATTERN.match(value) or DOT_ID_PORT_PATTERN.match(value):
+        return False
+    match = DOT_ID_WITH_PORT_PATTERN.match(value)
+    if match:
+        return _id_needs_quotes(match.group(1)) or _id_needs_quotes(match.group(2))
+    return True
+
+
+def quote_dot_id(value: Any, unquoted_keywords: Collection[str] = ()) -> str:
+    """Convert value to identifier in DOT language, enclosed in quotes if necessary. Follows the rules of
+    ``pydot.quote_id_if_necessary``, hence alphanumeric strings (including non-ASCII letters) that do not start with a
+    digit, numerals, quoted strings, and HTML strings are not quoted, while keywords are quoted.
+
+    Examples:
+        >>> from bigtree.utils.dot import quote_dot_id
+        >>> quote_dot_id("a0")
+        'a0'
+        >>> quote_dot_id("1a")
+        '"1a"'
+        >>> quote_dot_id("node")
+        '"node"'
+
+    Args:
+        value: identifier
+        unquoted_keywords: keywords that are not quoted
+
+    Returns:
+        Identifier in DOT language
+    """
+    if isinstance(value, bool):
+        return str(value).lower()
+    if not isinstance(value, str) or not value:
+        return str(value)
+    if value.lower() in {keyword.lower() for keyword in unquoted_keywords}:
+        return value
+    if value.lower() in DOT_KEYWORDS or _id_needs_quotes(value):
+        return _make_quoted(value)
+    return value
+
+
+def quote_dot_attr(value: Any) -> str:
+    """Convert value to attribute value in DOT language, enclosed in quotes if necessary. Follows the rules of
+    ``pydot.quote_attr_if_necessary``, hence only alphanumeric strings that do not start with a digit, positive
+    numerals, quoted strings, and HTML strings are not quoted.
+
+    Examples:
+        >>> from bigtree.utils.dot import quote_dot_attr
+        >>> quote_dot_attr("gold")
+        'gold'
+        >>> quote_dot_attr("edge label")
+        '"edge label"'
+        >>> quote_dot_attr(True)
+        'true'
+
+    Args:
+        value: attribute value
+
+    Returns:
+        Attribute value in DOT language
+    """
+    if isinstance(value, bool):
+        return str(value).lower()
+    if not isinstance(value, str):
+        return str(value)
+    if value == "":
+        return '""'
+    if value.lower() not in DOT_KEYWORDS and _any_needs_quotes(value) is False:
+        return value
+    return _make_quoted(value)
+
+
+def _quote_dot_node_ref(value: str) -> str:
+    """Convert node identifier in edge statement to DOT language, where text after the last colon is the port.
+
+    Args:
+        value: node identifier, optionally with port
+
+    Returns:
+        Node identifier in DOT language
+    """
+    if value.startswith('"') and value.endswith('"'):
+        return value
+    port_idx = value.rfind(":")
+    if port_idx > 0 and value[0] == '"' and value[port_idx - 1] == '"':
+        return value
+    if port_idx > 0:
+        return f"{quote_dot_id(value[:port_idx])}:{quote_dot_id(value[port_idx + 1:])}"
+    return quote_dot_id(value)
+
+
+class DotWriter:
+    """Write graph in DOT language to file object one statement at a time, in the same format as
+    ``pydot.Dot.to_string()``, without creating a pydot object for every node and edge.
+
+    Statements are buffered and written in chunks, the graph is closed when `close` is called.
+
+    Examples:
+        >>> import io
+        >>> from bigtree.utils.dot import DotWriter
+        >>> dot_file = io.StringIO()
+        >>> writer = DotWriter(dot_file, graph_attr={"rankdir": "TB"})
+        >>> writer.add_node("a", {"label": "a"})
+        >>> writer.add_node("b", {"label": "b", "shape": "square"})
+        >>> writer.add_edge("a", "b", {"label": "edge label"})
+        >>> writer.close()
+        >>> print(dot_file.getvalue())
+        strict digraph G {
+        rankdir=TB;
+        a [label=a];
+        b [label=b, shape=square];
+        a -> b [label="edge label"];
+        }
+        <BLANKLINE>
+    """
+
+    def __init__(
+        self,
+        file: IO[str],
+        directed: bool = True,
+        strict: bool = True,
+        graph_attr: Mapping[str, Any] | None = None,
+        chunk_size: int = 1024,
+    ):
+        """
+        Args:
+            file: file object opened in text mode
+            directed: indicator whether graph is directed or undirected
+            strict: indicator whether graph is strict, which merges duplicate edges
+            graph_attr: graph attributes
+            chunk_size: number of statements to buffer before writing to file
+        """
+        self.file = file
+        self.chunk_size = chunk_size
+        self.__edge_op = " -> " if directed else " -- "
+        self.__buffer: list[str] = [
+            f"{'strict ' if strict else ''}{'digraph' if directed else 'graph'} G {{\n"
+        ]
+        for key, value in (graph_attr or {}).items():
+            self.__write(f"{key}={quote_dot_attr(value)};\n")
+
+    @staticmethod
+    def format_attrs(attrs: Mapping[str, Any]) -> str:
+        """Format attributes of node or edge in DOT language, with a leading space if there are attributes. Attributes
+        with None value are omitted.
+
+        Args:
+            attrs: attributes of node or edge
+
+        Returns:
+            Attribute list in DOT language
+        """
+        attrs_str = ", ".join(
+            f"{key}={quote_dot_attr(value)}"
+            for key, value in attrs.items()
+            if value is not None
+        )
+        return f" [{attrs_str}]" if attrs_str else ""
+
+    def __write(self, statement: str) -> None:
+        """Buffer statement and write buffered statements to file when buffer is full.
+
+        Args:
+            statement: statement in DOT language
+        """
+        self.__buffer.append(statement)
+        if len(self.__buffer) >= self.chunk_size:
+            self.file.write("".join(self.__buffer))
+            self.__buffer.clear()
+
+    def add_node(self, name: str, attrs: Mapping[str, Any]) -> None:
+        """Write node statement.
+
+        Args:
+            name: node identifier
+            attrs: node attributes
+        """
+        # Compass point of node is not part of node identifier
+        port_idx = name.find(":")
+        if not name.startswith('"') and 0 < port_idx < len(name) - 1:
+            name = name[:port_idx]
+        self.__write(
+            f"{quote_dot_id(name, unquoted_keywords=('graph', 'node', 'edge'))}"
+            f"{self.format_attrs(attrs)};\n"
+        )
+
+    def add_edge(
+        self, parent_name: str, child_name: str, attrs: Mapping[str, Any]
+    ) -> None:
+        """Write edge statement.
+
+        Args:
+            parent_name: identifier of parent node
+            child_name: identifier of child node
+            attrs: edge attributes
+        """
+        self.__write(
+            f"{_quote_dot_node_ref(parent_name)}{self.__edge_op}{_quote_dot_node_ref(child_name)}"
+            f"{self.format_attrs(attrs)};\n"
+        )
+
+    def close(self) -> None:
+        """Close graph and write buffered statements to file. File object is not closed."""
+        self.__buffer.append("}\n")
+        self.file.write("".join(self.__buffer))
+        self.__buffer.clear()
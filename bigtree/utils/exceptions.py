@@ -141,6 +141,28 @@ def optional_dependencies_matplotlib(
     return wrapper
 
 
+def optional_dependencies_numpy(
+    func: Callable[..., T],
+) -> Callable[..., T]:  # pragma: no cover
+    """
+    This is a decorator which can be used to import optional numpy dependency. It will raise an ImportError if the
+    module is not found.
+    """
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        try:
+            import numpy as np  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "numpy not available. Please perform a\n\n"
+                "pip install 'bigtree[numpy]'\n\nto install required dependencies"
+            ) from None
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
 def optional_dependencies_pandas(
     func: Callable[..., T],
 ) -> Callable[..., T]:  # pragma: no cover
@@ -311,30 +311,24 @@ def levelordergroup_iter(
     Returns:
         List of iterable of nodes
     """
-
-    def _levelordergroup_iter(trees: list[BaseNodeT]) -> Iterable[Iterable[BaseNodeT]]:
-        """Iterate through all children of a tree.
-
-        Args:
-            trees: trees to get children for next level
-
-        Returns:
-            List of iterable of nodes
-        """
+    trees = [tree]
+    # Nodes on the same level have the same depth, tracked per level instead of getting depth of each node
+    depth = tree.depth if max_depth else 1
+    while trees:
         current_tree = []
         next_level = []
         for _tree in trees:
-            if (not max_depth or not _tree.depth > max_depth) and (
+            if (not max_depth or not depth > max_depth) and (
                 not stop_condition or not stop_condition(_tree)
             ):
                 if not filter_condition or filter_condition(_tree):
                     current_tree.append(_tree)
                 next_level.extend([_child for _child in _tree.children if _child])
         yield tuple(current_tree)
-        if len(next_level) and (not max_depth or not next_level[0].depth > max_depth):
-            yield from _levelordergroup_iter(next_level)
-
-    yield from _levelordergroup_iter([tree])
+        depth += 1
+        if len(next_level) and max_depth and depth > max_depth:
+            break
+        trees = next_level
 
 
 def zigzag_iter(
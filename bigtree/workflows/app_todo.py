@@ -253,7 +253,7 @@ class AppToDo:
         if not json_path.endswith(".json"):
             raise ValueError("Path should end with .json")
 
-        node_dict = export.tree_to_nested_dict(self._root, all_attrs=True)
-        app_dict = {"root": node_dict}
         with open(json_path, "w") as fp:
-            json.dump(app_dict, fp)
+            fp.write('{"root": ')
+            export.tree_to_nested_json(self._root, fp, all_attrs=True)
+            fp.write("}")
@@ -1,8 +1,13 @@
+import io
+import os
+import tempfile
+
 import pandas as pd
 import pydot
 import pytest
 
 from bigtree.dag import construct, export
+from bigtree.node import dagnode
 from tests.node.test_dagnode import (
     assert_dag_structure_root,
     assert_dag_structure_root_attr,
@@ -396,3 +401,91 @@ class TestDAGToDot:
             assert (
                 expected_str in actual
             ), f"Expected {expected_str} not in actual string"
+
+
+class TestDAGToDotFile:
+    @staticmethod
+    def test_dag_to_dot_file(dag_node):
+        dot_file = io.StringIO()
+        export.dag_to_dot_file(dag_node, dot_file)
+        expected = (
+            "strict digraph G {\n"
+            "rankdir=TB;\n"
+            "a [label=a];\n"
+            "a -> c;\n"
+            "a -> d;\n"
+            "c [label=c];\n"
+            "c -> d;\n"
+            "c -> f;\n"
+            "c -> g;\n"
+            "b [label=b];\n"
+            "b -> c;\n"
+            "f [label=f];\n"
+            "g [label=g];\n"
+            "g -> h;\n"
+            "h [label=h];\n"
+            "d [label=d];\n"
+            "d -> e;\n"
+            "d -> f;\n"
+            "e [label=e];\n"
+            "}\n"
+        )
+        assert dot_file.getvalue() == expected
+
+    @staticmethod
+    def test_dag_to_dot_file_style(dag_node, dag_node_style, dag_node_child):
+        for dag, kwargs in [
+            (dag_node, dict(rankdir="LR", bg_colour="beige")),
+            (
+                dag_node,
+                dict(node_colour="gold", node_shape="square", edge_colour="red"),
+            ),
+            (dag_node_style, dict(node_attr="node_style", edge_attr="edge_style")),
+            (dag_node_child, {}),
+        ]:
+            dot_file = io.StringIO()
+            export.dag_to_dot_file(dag, dot_file, **kwargs)
+            actual = dot_file.getvalue().splitlines()
+            assert len(actual) == len(set(actual))
+            assert set(actual) == set(
+                export.dag_to_dot(dag, **kwargs).to_string().splitlines()
+            )
+
+    @staticmethod
+    def test_dag_to_dot_file_multiple(dag_node, dag_node_plot):
+        dot_file = io.StringIO()
+        export.dag_to_dot_file([dag_node, dag_node_plot], dot_file)
+        assert set(dot_file.getvalue().splitlines()) == set(
+            export.dag_to_dot([dag_node, dag_node_plot]).to_string().splitlines()
+        )
+
+    @staticmethod
+    def test_dag_to_dot_file_path(dag_node):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "dag.dot")
+            export.dag_to_dot_file(dag_node, path)
+            with open(path, encoding="utf-8") as fp:
+                actual = fp.read()
+        dot_file = io.StringIO()
+        export.dag_to_dot_file(dag_node, dot_file)
+        assert actual == dot_file.getvalue()
+
+    @staticmethod
+    def test_dag_to_dot_file_deep():
+        depth = 5000
+        nodes = [dagnode.DAGNode(f"n{idx}") for idx in range(depth)]
+        for parent, child in reversed(list(zip(nodes, nodes[1:]))):
+            child.parents = [parent]
+        dot_file = io.StringIO()
+        export.dag_to_dot_file(nodes[depth // 2], dot_file)
+        lines = dot_file.getvalue().splitlines()
+        assert len(lines) == 2 * depth + 2
+        assert set(lines[2:-1]) == {
+            f"n{idx} [label=n{idx}];" for idx in range(depth)
+        } | {f"n{idx} -> n{idx + 1};" for idx in range(depth - 1)}
+
+    @staticmethod
+    def test_dag_to_dot_file_type_error(tree_node):
+        with pytest.raises(TypeError) as exc_info:
+            export.dag_to_dot_file(tree_node, io.StringIO())
+        assert str(exc_info.value) == Constants.ERROR_NODE_TYPE.format(type="DAGNode")
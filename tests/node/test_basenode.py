@@ -1,4 +1,5 @@
 import copy
+import pickle
 import unittest
 
 import matplotlib.pyplot as plt
@@ -399,6 +400,101 @@ class TestBaseNode(unittest.TestCase):
         assert_tree_structure_basenode_root(a2)
         assert_tree_structure_basenode_root_attr(a2)
 
+    def test_pickle(self):
+        self.a.children = [self.b, self.c]
+        self.b.children = [self.d, self.e]
+        self.c.children = [self.f]
+        self.e.children = [self.g, self.h]
+
+        a2 = pickle.loads(pickle.dumps(self.a))
+        assert a2 is not self.a
+        assert_tree_structure_basenode_root(a2)
+        assert_tree_structure_basenode_root_attr(a2)
+
+    def test_pickle_child(self):
+        self.a.children = [self.b, self.c]
+        self.b.children = [self.d, self.e]
+        self.c.children = [self.f]
+        self.e.children = [self.g, self.h]
+
+        e2, a2, h2, e3 = pickle.loads(pickle.dumps([self.e, self.a, self.h, self.e]))
+        assert e2 is e3
+        assert e2.root is a2
+        assert h2.parent is e2
+        assert e2.get_attr("name") == "e"
+        assert_tree_structure_basenode_root(a2)
+        assert_tree_structure_basenode_root_attr(a2)
+
+    def test_pickle_attr_reference(self):
+        self.a.children = [self.b, self.c]
+        self.b.children = [self.d]
+        self.b.link = self.d
+        self.c.link = [self.a, self.b]
+        self.d.link = {"root": self.a}
+
+        a2 = pickle.loads(pickle.dumps(self.a))
+        b2, c2 = a2.children
+        d2 = b2.children[0]
+        assert b2.link is d2
+        assert c2.link[0] is a2
+        assert c2.link[1] is b2
+        assert d2.link["root"] is a2
+        assert d2.get_attr("name") == "d"
+
+        d3 = pickle.loads(pickle.dumps(self.d))
+        assert d3.link["root"] is d3.root
+        assert d3.parent.link is d3
+
+    def test_pickle_deep(self):
+        depth = 5000
+        nodes = [basenode.BaseNode(name=str(idx)) for idx in range(depth)]
+        for parent, child in reversed(list(zip(nodes, nodes[1:]))):
+            child.parent = parent
+
+        leaf = pickle.loads(pickle.dumps(nodes[-1]))
+        assert leaf.get_attr("name") == str(depth - 1)
+        _node, n_nodes = leaf, 1
+        while _node.parent is not None:
+            _node, n_nodes = _node.parent, n_nodes + 1
+        assert n_nodes == depth
+        assert _node.get_attr("name") == "0"
+
+    def test_deep_copy_child(self):
+        self.a.children = [self.b, self.c]
+        self.b.children = [self.d, self.e]
+        self.c.children = [self.f]
+        self.e.children = [self.g, self.h]
+
+        e2 = self.e.copy()
+        assert e2 is not self.e
+        assert e2.get_attr("name") == "e"
+        assert [child.get_attr("name") for child in e2.children] == ["g", "h"]
+        assert_tree_structure_basenode_root(e2.root)
+        assert_tree_structure_basenode_root_attr(e2.root)
+
+    def test_deep_copy_attr_reference(self):
+        self.a.children = [self.b, self.c]
+        self.b.link = self.c
+        self.c.link = self.a
+
+        a2 = self.a.copy()
+        b2, c2 = a2.children
+        assert b2.link is c2
+        assert c2.link is a2
+
+    def test_deep_copy_deep(self):
+        depth = 5000
+        nodes = [basenode.BaseNode(name=str(idx)) for idx in range(depth)]
+        for parent, child in reversed(list(zip(nodes, nodes[1:]))):
+            child.parent = parent
+
+        root = nodes[0].copy()
+        _node, n_nodes = root, 1
+        while _node.children:
+            _node, n_nodes = _node.children[0], n_nodes + 1
+        assert n_nodes == depth
+        assert _node.get_attr("name") == str(depth - 1)
+
     def test_set_parent_type_error(self):
         parent = 1
         with pytest.raises(TypeError) as exc_info:
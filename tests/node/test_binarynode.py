@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 import pytest
@@ -479,6 +480,23 @@ class TestBinaryNode(unittest.TestCase):
         assert not a2.children == [self.b, self.c], "Copy does not copy child nodes"
         assert_binarytree_structure_root(a2)
 
+    def test_pickle(self):
+        self.a.children = [self.b, self.c]
+        self.b.children = [self.d, self.e]
+        self.c.children = [self.f, self.g]
+        self.d.children = [None, self.h]
+
+        a2 = pickle.loads(pickle.dumps(self.a))
+        assert a2 is not self.a
+        assert a2.children[0].children[0].children[0] is None
+        assert_binarytree_structure_root(a2)
+
+        h2 = pickle.loads(pickle.dumps(self.h))
+        assert h2.val == 8
+        assert h2.parent.left is None
+        assert h2.parent.right is h2
+        assert_binarytree_structure_root(h2.root)
+
     def test_set_parent_type_error(self):
         parent = 1
         with pytest.raises(TypeError) as exc_info:
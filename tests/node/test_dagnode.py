@@ -1,4 +1,5 @@
 import copy
+import pickle
 import unittest
 
 import pandas as pd
@@ -316,6 +317,64 @@ class TestDAGNode(unittest.TestCase):
             a2.children[0] == self.c or a2.children[1] == self.c
         ), "Shallow copy does not copy child nodes"
 
+    def test_pickle(self):
+        self.c.parents = [self.a, self.b]
+        self.d.parents = [self.a, self.c]
+        self.e.parents = [self.d]
+        self.f.parents = [self.c, self.d]
+        self.g.parents = [self.c]
+        self.h.parents = [self.g]
+
+        b2, f2, d2, b3 = pickle.loads(pickle.dumps([self.b, self.f, self.d, self.b]))
+        assert b2 is b3
+        assert b2.get_attr("age") == 65
+        assert [parent.node_name for parent in f2.parents] == ["c", "d"]
+        assert f2.parents[1] is d2
+        c2 = f2.parents[0]
+        assert [parent.node_name for parent in c2.parents] == ["a", "b"]
+        assert c2.parents[1] is b2
+        assert [child.node_name for child in c2.children] == ["d", "f", "g"]
+        assert [child.node_name for child in d2.children] == ["e", "f"]
+        assert d2.children[1] is f2
+
+    def test_pickle_attr_reference(self):
+        self.c.parents = [self.a, self.b]
+        self.d.parents = [self.c]
+        self.a.link = self.d
+        self.d.link = [self.a, self.c]
+
+        c2 = pickle.loads(pickle.dumps(self.c))
+        a2, b2 = c2.parents
+        d2 = c2.children[0]
+        assert a2.link is d2
+        assert d2.link[0] is a2
+        assert d2.link[1] is c2
+        assert b2.children == (c2,)
+        assert d2.get_attr("age") == 40
+
+    def test_pickle_deep(self):
+        depth = 5000
+        nodes = [dagnode.DAGNode(str(idx)) for idx in range(depth)]
+        for parent, child in reversed(list(zip(nodes, nodes[1:]))):
+            child.parents = [parent]
+
+        leaf = pickle.loads(pickle.dumps(nodes[-1]))
+        assert leaf.node_name == str(depth - 1)
+        _node, n_nodes = leaf, 1
+        while _node.parents:
+            _node, n_nodes = _node.parents[0], n_nodes + 1
+        assert n_nodes == depth
+
+    def test_deep_copy_attr_reference(self):
+        self.c.parents = [self.a, self.b]
+        self.a.link = self.c
+
+        c2 = copy.deepcopy(self.c)
+        a2, b2 = c2.parents
+        assert a2.link is c2
+        assert a2.children == (c2,)
+        assert b2.children == (c2,)
+
     def test_set_parents_type_error(self):
         parents = 1
         with pytest.raises(TypeError) as exc_info:
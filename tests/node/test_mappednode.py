@@ -0,0 +1,168 @@
+import copy
+import os
+import pickle
+import tempfile
+
+import pytest
+
+from bigtree.node import mappednode, node
+from bigtree.tree import construct, export, helper, search
+from bigtree.utils import exceptions, iterators
+from tests.conftest import assert_print_statement
+from tests.node.test_basenode import (
+    assert_tree_structure_basenode_root,
+    assert_tree_structure_basenode_root_attr,
+)
+from tests.node.test_node import assert_tree_structure_node_root
+from tests.test_constants import Constants
+
+
+@pytest.fixture
+def mapped_root(tree_node):
+    tree_node["b"]["d"].items = [1, 2]
+    tree_node["c"]["f"].items = None
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "tree.bin")
+        export.save_tree(tree_node, path)
+        yield construct.mmap_tree(path)
+
+
+class TestMappedNode:
+    @staticmethod
+    def test_mapped_node(mapped_root):
+        assert isinstance(mapped_root, mappednode.MappedNode)
+        assert isinstance(mapped_root, node.Node)
+        assert_tree_structure_basenode_root(mapped_root)
+        assert_tree_structure_basenode_root_attr(mapped_root)
+        assert_tree_structure_node_root(mapped_root)
+
+    @staticmethod
+    def test_mapped_node_materialize(mapped_root):
+        tree_bytes = mapped_root._tree_bytes
+        assert list(tree_bytes.nodes) == [0]
+
+        b = search.find_full_path(mapped_root, "a/b")
+        assert sorted(tree_bytes.nodes) == [0, 1, 6]
+        assert b.parent is mapped_root
+        assert b.children[0].parent is b
+        assert sorted(tree_bytes.nodes) == [0, 1, 2, 3, 6]
+
+    @staticmethod
+    def test_mapped_node_attrs(mapped_root):
+        d = search.find_full_path(mapped_root, "a/b/d")
+        assert d.get_attr("age") == 40
+        assert d.get_attr("items") == [1, 2]
+        f = search.find_full_path(mapped_root, "a/c/f")
+        assert f.get_attr("items") is None
+        assert "items" in dict(f.describe())
+        assert "items" not in dict(mapped_root.describe())
+
+    @staticmethod
+    def test_mapped_node_properties(mapped_root):
+        e = mapped_root["b"]["e"]
+        assert e.path_name == "/a/b/e"
+        assert e.depth == 3
+        assert e.root is mapped_root
+        assert not e.is_leaf
+        assert e["g"].is_leaf
+        assert [_node.node_name for _node in e.ancestors] == ["b", "a"]
+        assert [_node.node_name for _node in e.siblings] == ["d"]
+        assert e.left_sibling is mapped_root["b"]["d"]
+        assert e.right_sibling is None
+        assert mapped_root.max_depth == 4
+        assert mapped_root.diameter == 5
+
+    @staticmethod
+    def test_mapped_node_iterators(mapped_root):
+        assert [_node.node_name for _node in iterators.preorder_iter(mapped_root)] == [
+            "a",
+            "b",
+            "d",
+            "e",
+            "g",
+            "h",
+            "c",
+            "f",
+        ]
+        assert [
+            _node.node_name for _node in iterators.levelorder_iter(mapped_root)
+        ] == ["a", "b", "c", "d", "e", "f", "g", "h"]
+        assert [_node.node_name for _node in mapped_root.leaves] == ["d", "g", "h", "f"]
+
+    @staticmethod
+    def test_mapped_node_export(mapped_root, tree_node):
+        assert export.tree_to_newick(mapped_root) == export.tree_to_newick(tree_node)
+        assert_print_statement(
+            export.print_tree,
+            "a\n├── b\n│   ├── d\n│   └── e\n│       ├── g\n│       └── h\n└── c\n    └── f\n",
+            tree=mapped_root,
+        )
+
+    @staticmethod
+    def test_mapped_node_sep(tree_node):
+        tree_node.sep = "\\"
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tree.bin")
+            export.save_tree(tree_node, path)
+            mapped_root = construct.mmap_tree(path)
+        assert mapped_root["b"]["e"].path_name == "\\a\\b\\e"
+        assert search.find_full_path(mapped_root, "\\a\\b\\e").node_name == "e"
+
+    @staticmethod
+    def test_mapped_node_copy(mapped_root):
+        for new_root in [
+            mapped_root.copy(),
+            copy.deepcopy(mapped_root),
+            pickle.loads(pickle.dumps(mapped_root)),
+        ]:
+            assert type(new_root) is node.Node
+            assert new_root.is_root
+            assert_tree_structure_basenode_root(new_root)
+            assert_tree_structure_basenode_root_attr(new_root)
+            assert_tree_structure_node_root(new_root)
+            assert new_root["b"]["d"].get_attr("items") == [1, 2]
+            assert "_tree_bytes" not in dict(new_root.describe())
+
+    @staticmethod
+    def test_mapped_node_copy_child(mapped_root):
+        for new_e in [
+            copy.deepcopy(mapped_root["b"]["e"]),
+            pickle.loads(pickle.dumps(mapped_root["b"]["e"])),
+        ]:
+            assert type(new_e) is node.Node
+            assert new_e.path_name == "/a/b/e"
+            assert [_node.node_name for _node in new_e.children] == ["g", "h"]
+            assert_tree_structure_basenode_root(new_e.root)
+
+    @staticmethod
+    def test_mapped_node_get_subtree(mapped_root):
+        b = helper.get_subtree(mapped_root, "b")
+        assert type(b) is node.Node
+        assert b.is_root
+        assert [_node.path_name for _node in b.descendants] == [
+            "/b/d",
+            "/b/e",
+            "/b/e/g",
+            "/b/e/h",
+        ]
+        assert b["d"].get_attr("age") == 40
+        assert mapped_root["b"].parent is mapped_root
+
+    @staticmethod
+    def test_mapped_node_read_only_error(mapped_root):
+        b = mapped_root["b"]
+        for action in [
+            lambda: setattr(b, "parent", None),
+            lambda: setattr(mapped_root, "children", []),
+            lambda: delattr(mapped_root, "children"),
+            lambda: setattr(mapped_root, "sep", "."),
+            lambda: mapped_root.sort(key=lambda _node: _node.node_name),
+            lambda: mapped_root.append(node.Node("z")),
+            lambda: b.extend([node.Node("z")]),
+            lambda: node.Node("z", parent=b),
+            lambda: node.Node("z", children=[mapped_root]),
+        ]:
+            with pytest.raises(exceptions.TreeError) as exc_info:
+                action()
+            assert str(exc_info.value) == Constants.ERROR_NODE_MAPPED_READ_ONLY
+        assert [_node.node_name for _node in mapped_root.children] == ["b", "c"]
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from unittest.mock import patch
 
@@ -298,6 +299,18 @@ class TestNode(unittest.TestCase):
             self.b.rename("c")
         assert str(exc_info.value).startswith(Constants.ERROR_RENAME.format(name="c"))
 
+    def test_pickle_sep(self):
+        self.a.children = [self.b, self.c]
+        self.b.children = [self.d, self.e]
+        self.c.children = [self.f]
+        self.e.children = [self.g, self.h]
+        self.a.sep = "\\"
+
+        g2 = pickle.loads(pickle.dumps(self.g))
+        assert isinstance(g2, node.Node)
+        assert g2.path_name == "\\a\\b\\e\\g"
+        assert_tree_structure_node_root_sep(g2.root)
+
 
 def assert_tree_structure_node_root(
     root,
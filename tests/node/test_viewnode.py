@@ -0,0 +1,197 @@
+import copy
+import pickle
+
+import pytest
+
+from bigtree.node import node, viewnode
+from bigtree.tree import export, helper
+from bigtree.utils import exceptions, iterators
+from tests.conftest import assert_print_statement
+from tests.node.test_basenode import (
+    assert_tree_structure_basenode_root,
+    assert_tree_structure_basenode_root_attr,
+)
+from tests.node.test_node import assert_tree_structure_node_root
+from tests.test_constants import Constants
+
+
+class TestViewNode:
+    @staticmethod
+    def test_view_node(tree_node):
+        root_view = helper.get_subtree_view(tree_node)
+        assert isinstance(root_view, viewnode.ViewNode)
+        assert isinstance(root_view, node.Node)
+        assert_tree_structure_basenode_root(root_view)
+        assert_tree_structure_basenode_root_attr(root_view)
+        assert_tree_structure_node_root(root_view)
+
+    @staticmethod
+    def test_view_node_no_copy(tree_node):
+        root_view = helper.get_subtree_view(tree_node)
+        assert root_view._view_children is None
+        b_view = root_view.children[0]
+        assert b_view.viewed_node is tree_node["b"]
+        assert b_view._view_children is None
+        assert root_view.children[0] is b_view
+        assert b_view.parent is root_view
+        assert b_view.root is root_view
+
+    @staticmethod
+    def test_view_node_subtree(tree_node):
+        b_view = helper.get_subtree_view(tree_node, "b")
+        assert b_view.is_root
+        assert b_view.path_name == "/b"
+        assert b_view["e"]["g"].path_name == "/b/e/g"
+        assert b_view["e"]["g"].depth == 3
+        assert tree_node["b"].parent is tree_node
+
+    @staticmethod
+    def test_view_node_max_depth(tree_node):
+        root_view = helper.get_subtree_view(tree_node, max_depth=2)
+        assert [_node.node_name for _node in iterators.preorder_iter(root_view)] == [
+            "a",
+            "b",
+            "c",
+        ]
+        assert root_view.max_depth == 2
+
+    @staticmethod
+    def test_view_node_filter_condition(tree_node):
+        root_view = helper.get_subtree_view(
+            tree_node, filter_condition=lambda _node: _node.node_name != "e"
+        )
+        assert [_node.node_name for _node in iterators.preorder_iter(root_view)] == [
+            "a",
+            "b",
+            "d",
+            "c",
+            "f",
+        ]
+
+    @staticmethod
+    def test_view_node_attrs(tree_node):
+        b_view = helper.get_subtree_view(tree_node, "b")
+        assert b_view.get_attr("age") == 65
+        b_view.age = 1
+        assert b_view.get_attr("age") == 1
+        assert dict(b_view.describe())["age"] == 1
+        assert tree_node["b"].get_attr("age") == 65
+        assert "_view_node" not in dict(b_view.describe())
+
+    @staticmethod
+    def test_view_node_copy(tree_node):
+        b_view = helper.get_subtree_view(tree_node, "b", max_depth=2)
+        for new_root in [copy.deepcopy(b_view), pickle.loads(pickle.dumps(b_view))]:
+            assert type(new_root) is node.Node
+            assert new_root.is_root
+            assert new_root is not tree_node["b"]
+            assert [(_node.path_name, _node.age) for _node in new_root.descendants] == [
+                ("/b/d", 40),
+                ("/b/e", 35),
+            ]
+
+    @staticmethod
+    def test_view_node_copy_child(tree_node):
+        b_view = helper.get_subtree_view(tree_node, "b")
+        new_e = copy.deepcopy(b_view["e"])
+        assert type(new_e) is node.Node
+        assert new_e.path_name == "/b/e"
+        assert [_node.node_name for _node in new_e.children] == ["g", "h"]
+
+    @staticmethod
+    def test_view_node_subclass():
+        class PrefixNode(node.Node):
+            @property
+            def node_name(self) -> str:
+                return f"X{self.name}"
+
+        root = PrefixNode("a", age=90)
+        b = PrefixNode("b", parent=root)
+        _ = PrefixNode("c", parent=b)
+        root_view = helper.get_subtree_view(root, max_depth=2)
+        assert isinstance(root_view, viewnode.ViewNode)
+        assert isinstance(root_view, PrefixNode)
+        assert type(root_view.children[0]) is type(root_view)
+        assert root_view.node_name == "Xa"
+        assert root_view.path_name == "/Xa"
+        assert root_view.age == 90
+        assert type(helper.get_subtree_view(node.Node("a"))) is viewnode.ViewNode
+        assert type(copy.deepcopy(root_view)) is PrefixNode
+        assert_print_statement(
+            export.print_tree,
+            "Xa\n└── Xb\n",
+            tree=root,
+            max_depth=2,
+        )
+
+    @staticmethod
+    def test_view_node_export(tree_node):
+        b_view = helper.get_subtree_view(tree_node, "b")
+        assert export.tree_to_dict(b_view) == {
+            "/b": {"name": "b"},
+            "/b/d": {"name": "d"},
+            "/b/e": {"name": "e"},
+            "/b/e/g": {"name": "g"},
+            "/b/e/h": {"name": "h"},
+        }
+        assert export.tree_to_newick(b_view) == "(d,(g,h)e)b"
+        assert_print_statement(
+            export.print_tree,
+            "b [age=65]\n├── d [age=40]\n└── e [age=35]\n",
+            tree=b_view,
+            max_depth=2,
+            attr_list=["age"],
+        )
+
+    @staticmethod
+    def test_view_node_read_only_error(tree_node):
+        root_view = helper.get_subtree_view(tree_node)
+        b_view = root_view["b"]
+        for action in [
+            lambda: setattr(b_view, "parent", None),
+            lambda: setattr(root_view, "children", []),
+            lambda: delattr(root_view, "children"),
+            lambda: setattr(root_view, "sep", "."),
+            lambda: root_view.sort(key=lambda _node: _node.node_name),
+            lambda: b_view.rename("z"),
+        ]:
+            with pytest.raises(exceptions.TreeError) as exc_info:
+                action()
+            assert str(exc_info.value) == Constants.ERROR_NODE_VIEW_READ_ONLY
+        assert [_node.node_name for _node in root_view.children] == ["b", "c"]
+        assert tree_node["b"].node_name == "b"
+
+    @staticmethod
+    def test_view_node_add_node_error(tree_node):
+        root_view = helper.get_subtree_view(tree_node)
+        b_view = root_view["b"]
+        d = tree_node["b"]["d"]
+        for action in [
+            lambda: node.Node("z", parent=b_view),
+            lambda: node.Node("z", children=[root_view]),
+            lambda: setattr(d, "parent", b_view),
+            lambda: setattr(d, "children", [root_view]),
+            lambda: setattr(d, "children", [b_view]),
+            lambda: b_view.append(node.Node("z")),
+            lambda: b_view.extend([node.Node("z")]),
+        ]:
+            with pytest.raises(exceptions.TreeError) as exc_info:
+                action()
+            assert str(exc_info.value) == Constants.ERROR_NODE_VIEW_READ_ONLY
+        assert_tree_structure_basenode_root(tree_node)
+        assert_tree_structure_node_root(tree_node)
+        assert [_node.node_name for _node in b_view.children] == ["d", "e"]
+        assert root_view.parent is None
+
+    @staticmethod
+    def test_view_node_deep_tree():
+        root = node.Node("a", sep=".")
+        _node = root
+        for idx in range(2000):
+            _node = node.Node(str(idx), parent=_node)
+        root_view = helper.get_subtree_view(root)
+        leaf_view = root_view
+        while leaf_view.children:
+            leaf_view = leaf_view.children[0]
+        assert leaf_view.depth == 2001
+        assert leaf_view.sep == "."
@@ -134,6 +134,28 @@ class Constants:
     ERROR_NODE_DATAFRAME_DUPLICATE_PATH = (
         "There exists duplicate path with different attributes\nCheck "
     )
+    ERROR_NODE_STREAM_EMPTY = (
+        "Input does not contain any data, check input rows or file"
+    )
+    ERROR_NODE_STREAM_CHUNK_SIZE = (
+        "Invalid chunk size {chunk_size}, check `chunk_size` to be a positive integer"
+    )
+    ERROR_NODE_STREAM_ROW_TYPE = "Row {row} is not a mapping, rows should be mapping if constructing tree using adjacency list"
+    ERROR_NODE_MAPPED_READ_ONLY = (
+        "MappedNode is read-only, structure of memory-mapped tree cannot be modified"
+    )
+    ERROR_NODE_VIEW_READ_ONLY = (
+        "ViewNode is read-only, structure of view cannot be modified"
+    )
+    ERROR_NODE_BYTES_HEADER = (
+        "Invalid tree bytes, data does not start with header of tree bytes"
+    )
+    ERROR_NODE_BYTES_VERSION = "Unsupported tree bytes version {version}, supported version is up to {supported_version}"
+    ERROR_NODE_BYTES_TRUNCATED = "Invalid tree bytes, data is truncated at {section}"
+    ERROR_NODE_BYTES_EMPTY = "Invalid tree bytes, data does not contain any node"
+    ERROR_NODE_BYTES_PARENT = (
+        "Invalid tree bytes, parent of node {node_idx} is not before node in preorder"
+    )
     ERROR_NODE_DUPLICATED_INTERMEDIATE_NODE = "There exists duplicate child with different parent where the child is also a parent node.\nDuplicated node names should not happen, but can only exist in leaf nodes to avoid confusion.\nCheck "
 
     # tree/export
@@ -159,10 +181,18 @@ class Constants:
     ERROR_NODE_EXPORT_HPRINT_CUSTOM_STYLE_DIFFERENT_LENGTH = (
         "All style icons must have length 1"
     )
+    ERROR_NODE_EXPORT_PRINT_OFFSET_LIMIT = "Invalid offset {offset} or limit {limit}, check `offset` and `limit` to be non-negative integers"
     ERROR_NODE_EXPORT_PRINT_INVALID_PATH = (
         "Node name or path {node_name_or_path} not found"
     )
+    ERROR_NODE_EXPORT_HTML_EXPAND_DEPTH = "Invalid expand_depth {expand_depth} or chunk_size {chunk_size}, check `expand_depth` and `chunk_size` to be positive integers"
+    ERROR_NODE_EXPORT_VIS_MAX_NODES = (
+        "Invalid max_nodes {max_nodes}, check `max_nodes` to be non-negative integer"
+    )
     ERROR_NODE_EXPORT_PILLOW_FONT_FAMILY = "Font file {font_family} is not found, set `font_family` parameter to point to a valid .ttf file."
+    ERROR_NODE_EXPORT_PILLOW_TILE_SIZE = (
+        "Invalid tile_size {tile_size}, check `tile_size` to be positive integers"
+    )
     ERROR_NODE_EXPORT_PILLOW_CMAP = (
         "`rect_cmap_attr` cannot be None if rect_fill is mpl.colormaps"
     )
@@ -186,6 +216,8 @@ class Constants:
         "Cannot find any node matching path_name ending with {prune_path}"
     )
     ERROR_NODE_TREE_DIFF_DIFF_SEP = "`sep` must be the same for tree and other_tree"
+    ERROR_NODE_PATCH_NOT_FOUND = "Unable to find path {path}"
+    ERROR_NODE_PATCH_INVALID_OP = "Invalid patch operation {op}, check `op` to be one of add, remove, move, rename, set_attrs"
 
     # tree/modify
     ERROR_MODIFY_PARAM_TYPE = (
@@ -217,6 +249,7 @@ class Constants:
         "Alternatively, set `merge_children` to True if nodes are to be merged"
     )
 
+    ERROR_MODIFY_MERGE_CONFLICT = "Invalid conflict {conflict}, check `conflict` to be one of first, last, or a callable"
     ERROR_MODIFY_PATH_MISMATCH = "Unable to assign from_path "
     ERROR_MODIFY_SHIFT_SAME_NODE = "Attempting to shift the same node "
     ERROR_MODIFY_REPLACE_SAME_NODE = "Attempting to replace the same node "
@@ -242,6 +275,18 @@ class Constants:
         "Expected more than or equal to {count} element(s), found "
     )
 
+    # tree/store
+    ERROR_STORE_PATH_NOT_FOUND = "Unable to find path {path}"
+    ERROR_STORE_PATH_EXISTS = "Path {path} already exists"
+    ERROR_STORE_ROOT_EXISTS = (
+        "Tree store already has a root, set `parent_path` to add tree as child of node"
+    )
+    ERROR_STORE_SHIFT_ROOT = "Unable to shift root node {path}"
+    ERROR_STORE_SHIFT_LOOP = (
+        "Unable to shift node {path} to itself or its descendant {new_parent_path}"
+    )
+    ERROR_STORE_QUERY_TYPE = "Unable to query attribute value of type {type}, check `attr_value` to be of type bool, int, float, str, or None"
+
     # tree/utils
     ERROR_PLOT = (
         "No x or y coordinates detected. "
@@ -0,0 +1,84 @@
+import subprocess
+import sys
+
+import pytest
+
+import bigtree
+from bigtree.tree import construct, export
+
+
+def get_imported_modules(statement):
+    code = f"import sys\n{statement}\nprint(' '.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImport:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import bigtree",
+            "from bigtree import Node, Tree, find_path",
+        ],
+    )
+    def test_import_no_optional_dependencies(statement):
+        modules = get_imported_modules(statement)
+        for module in ["pandas", "polars", "matplotlib", "pydot", "PIL", "pyvis"]:
+            assert module not in modules, f"{statement} imports {module}"
+
+    @staticmethod
+    @pytest.mark.parametrize("package", [bigtree, construct, export])
+    def test_lazy_exports(package):
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+        assert set(package.__all__) <= set(dir(package))
+
+    @staticmethod
+    @pytest.mark.parametrize("package", [bigtree, construct, export])
+    def test_lazy_exports_error(package):
+        with pytest.raises(AttributeError):
+            _ = package.not_an_export
+
+
+class TestLazyPlugins:
+    @staticmethod
+    def test_plugins_registered_on_access():
+        code = (
+            "from bigtree import Tree\n"
+            "assert 'show' not in Tree.__dict__\n"
+            "tree = Tree.from_list(['a/b', 'a/c'])\n"
+            "assert 'show' in Tree.__dict__\n"
+            "tree.show()"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout == "a\n├── b\n└── c\n"
+
+    @staticmethod
+    def test_plugins_registered_on_instantiation():
+        code = (
+            "from bigtree import BinaryTree, BinaryNode\n"
+            "tree = BinaryTree(BinaryNode(1, left=BinaryNode(2)))\n"
+            "print([node.val for node in tree.inorder_iter()])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout == "[2, 1]\n"
+
+    @staticmethod
+    def test_plugins_dir():
+        code = "from bigtree import DAG\nprint('from_list' in dir(DAG))"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout == "True\n"
+
+    @staticmethod
+    def test_plugins_attribute_error():
+        with pytest.raises(AttributeError):
+            _ = bigtree.Tree.not_a_plugin
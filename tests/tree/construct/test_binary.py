@@ -0,0 +1,279 @@
+import io
+import os
+import struct
+import tempfile
+
+import pytest
+
+from bigtree.node import mappednode, node
+from bigtree.tree import construct, export
+from bigtree.utils.constants import BinaryConstants
+from tests.node.test_basenode import (
+    assert_tree_structure_basenode_root,
+    assert_tree_structure_basenode_root_attr,
+)
+from tests.node.test_node import (
+    assert_tree_structure_node_root,
+    assert_tree_structure_node_root_sep,
+)
+from tests.test_constants import Constants
+from tests.tree.construct.conftest import CustomNode, NodeA
+
+
+def get_nodes_info(tree):
+    nodes_info = []
+    sep = tree.sep
+    stack = [(tree, tree.path_name)]
+    while stack:
+        _node, path_name = stack.pop()
+        nodes_info.append((path_name, _node.describe(exclude_prefix="_")))
+        stack.extend(
+            (_child, f"{path_name}{sep}{_child.node_name}")
+            for _child in reversed(_node.children)
+        )
+    return nodes_info
+
+
+class TestBytesToTree:
+    @staticmethod
+    def test_bytes_to_tree(tree_node):
+        root = construct.bytes_to_tree(export.tree_to_bytes(tree_node))
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_basenode_root_attr(root)
+        assert_tree_structure_node_root(root)
+
+    @staticmethod
+    def test_bytes_to_tree_sep(tree_node):
+        tree_node.sep = "\\"
+        root = construct.bytes_to_tree(export.tree_to_bytes(tree_node))
+        assert_tree_structure_node_root_sep(root)
+
+    @staticmethod
+    def test_bytes_to_tree_subtree(tree_node):
+        root = construct.bytes_to_tree(export.tree_to_bytes(tree_node["b"]))
+        assert root.path_name == "/b"
+        assert get_nodes_info(root) == [
+            ("/b", [("age", 65), ("name", "b")]),
+            ("/b/d", [("age", 40), ("name", "d")]),
+            ("/b/e", [("age", 35), ("name", "e")]),
+            ("/b/e/g", [("age", 10), ("name", "g")]),
+            ("/b/e/h", [("age", 6), ("name", "h")]),
+        ]
+
+    @staticmethod
+    def test_bytes_to_tree_attr_types():
+        root = node.Node(
+            "a",
+            flag=True,
+            count=1,
+            weight=0.5,
+            label="",
+            big=2**70,
+            mixed=1,
+            items=[1, "2"],
+            mapping={"key": (1, 2)},
+            data=b"\x00\xff",
+            none=None,
+        )
+        _ = node.Node(
+            "ü 🌲",
+            flag=False,
+            count=-(2**63),
+            weight=float("inf"),
+            label="\udc80",
+            big=1,
+            mixed=1.5,
+            parent=root,
+        )
+        _ = node.Node(
+            "c",
+            flag=None,
+            count=None,
+            weight=None,
+            label=None,
+            mixed=None,
+            parent=root,
+        )
+        new_root = construct.bytes_to_tree(export.tree_to_bytes(root))
+        assert get_nodes_info(new_root) == get_nodes_info(root)
+        for _node, new_node in zip(
+            [root, *root.children], [new_root, *new_root.children]
+        ):
+            for (_, value), (_, new_value) in zip(
+                _node.describe(exclude_prefix="_"),
+                new_node.describe(exclude_prefix="_"),
+            ):
+                assert type(value) is type(new_value)
+
+    @staticmethod
+    def test_bytes_to_tree_no_attr():
+        root = node.Node("a", children=[node.Node("b"), node.Node("c")])
+        new_root = construct.bytes_to_tree(export.tree_to_bytes(root))
+        assert get_nodes_info(new_root) == get_nodes_info(root)
+
+    @staticmethod
+    def test_bytes_to_tree_node_type(tree_node):
+        root = construct.bytes_to_tree(export.tree_to_bytes(tree_node), node_type=NodeA)
+        assert isinstance(root, NodeA)
+        assert all(isinstance(_node, NodeA) for _node in root.descendants)
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_basenode_root_attr(root)
+        assert_tree_structure_node_root(root)
+
+    @staticmethod
+    def test_bytes_to_tree_custom_node_type():
+        root = CustomNode("a", custom_field=1, custom_field_str="abc")
+        _ = CustomNode("b", custom_field=2, custom_field_str="def", parent=root)
+        new_root = construct.bytes_to_tree(
+            export.tree_to_bytes(root), node_type=CustomNode
+        )
+        assert isinstance(new_root, CustomNode)
+        assert get_nodes_info(new_root) == get_nodes_info(root)
+
+    @staticmethod
+    def test_bytes_to_tree_memoryview(tree_node):
+        root = construct.bytes_to_tree(memoryview(export.tree_to_bytes(tree_node)))
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_basenode_root_attr(root)
+        assert_tree_structure_node_root(root)
+
+    @staticmethod
+    def test_bytes_to_tree_deep():
+        depth = 5000
+        nested_dict = {"name": "0", "depth": 0}
+        _dict = nested_dict
+        for idx in range(1, depth):
+            _dict["children"] = [{"name": str(idx), "depth": idx}]
+            _dict = _dict["children"][0]
+        root = construct.nested_dict_to_tree(nested_dict)
+        new_root = construct.bytes_to_tree(export.tree_to_bytes(root))
+        assert get_nodes_info(new_root) == get_nodes_info(root)
+
+    @staticmethod
+    def test_bytes_to_tree_header_error(tree_node):
+        data = export.tree_to_bytes(tree_node)
+        with pytest.raises(ValueError) as exc_info:
+            construct.bytes_to_tree(b"NOTATREE" + data[8:])
+        assert str(exc_info.value) == Constants.ERROR_NODE_BYTES_HEADER
+
+    @staticmethod
+    def test_bytes_to_tree_version_error(tree_node):
+        data = export.tree_to_bytes(tree_node)
+        version = BinaryConstants.VERSION + 1
+        with pytest.raises(ValueError) as exc_info:
+            construct.bytes_to_tree(data[:8] + struct.pack("<H", version) + data[10:])
+        assert str(exc_info.value) == Constants.ERROR_NODE_BYTES_VERSION.format(
+            version=version, supported_version=BinaryConstants.VERSION
+        )
+
+    @staticmethod
+    def test_bytes_to_tree_truncated_error(tree_node):
+        data = export.tree_to_bytes(tree_node)
+        for length, section in [
+            (10, "header"),
+            (50, "string table"),
+            (len(data) - 100, "column"),
+        ]:
+            with pytest.raises(ValueError) as exc_info:
+                construct.bytes_to_tree(data[:length])
+            assert str(exc_info.value) == Constants.ERROR_NODE_BYTES_TRUNCATED.format(
+                section=section
+            )
+
+    @staticmethod
+    def test_bytes_to_tree_empty_error():
+        data = struct.pack(
+            BinaryConstants.HEADER_FORMAT,
+            BinaryConstants.MAGIC,
+            BinaryConstants.VERSION,
+            0,
+            0,
+            BinaryConstants.NO_INDEX,
+            0,
+            0,
+            0,
+        ) + struct.pack("<Q", 0)
+        with pytest.raises(ValueError) as exc_info:
+            construct.bytes_to_tree(data)
+        assert str(exc_info.value) == Constants.ERROR_NODE_BYTES_EMPTY
+
+    @staticmethod
+    def test_bytes_to_tree_parent_error():
+        root = node.Node("a", children=[node.Node("b")])
+        data = bytearray(export.tree_to_bytes(root))
+        parents = struct.pack("<qq", -1, 0)
+        parents_idx = data.index(parents)
+        data[parents_idx : parents_idx + 16] = struct.pack("<qq", -1, 1)
+        with pytest.raises(ValueError) as exc_info:
+            construct.bytes_to_tree(bytes(data))
+        assert str(exc_info.value) == Constants.ERROR_NODE_BYTES_PARENT.format(
+            node_idx=1
+        )
+
+
+class TestLoadTree:
+    @staticmethod
+    def test_load_tree_file(tree_node):
+        tree_file = io.BytesIO()
+        export.save_tree(tree_node, tree_file)
+        tree_file.seek(0)
+        root = construct.load_tree(tree_file)
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_basenode_root_attr(root)
+        assert_tree_structure_node_root(root)
+
+    @staticmethod
+    def test_load_tree_path(tree_node):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tree.bin")
+            export.save_tree(tree_node, path)
+            root = construct.load_tree(path, node_type=NodeA)
+        assert isinstance(root, NodeA)
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_basenode_root_attr(root)
+        assert_tree_structure_node_root(root)
+
+
+class TestMmapTree:
+    @staticmethod
+    def test_mmap_tree(tree_node):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tree.bin")
+            export.save_tree(tree_node, path)
+            root = construct.mmap_tree(path)
+        assert isinstance(root, mappednode.MappedNode)
+        assert get_nodes_info(root) == get_nodes_info(tree_node)
+
+    @staticmethod
+    def test_mmap_tree_file(tree_node):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tree.bin")
+            export.save_tree(tree_node, path)
+            with open(path, "rb") as fp:
+                root = construct.mmap_tree(fp)
+        assert get_nodes_info(root) == get_nodes_info(tree_node)
+
+    @staticmethod
+    def test_mmap_tree_deep():
+        depth = 5000
+        nested_dict = {"name": "0", "depth": 0}
+        _dict = nested_dict
+        for idx in range(1, depth):
+            _dict["children"] = [{"name": str(idx), "depth": idx}]
+            _dict = _dict["children"][0]
+        tree = construct.nested_dict_to_tree(nested_dict)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tree.bin")
+            export.save_tree(tree, path)
+            root = construct.mmap_tree(path)
+        assert get_nodes_info(root) == get_nodes_info(tree)
+
+    @staticmethod
+    def test_mmap_tree_header_error():
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tree.bin")
+            with open(path, "wb") as fp:
+                fp.write(b"NOTATREE" + b"\x00" * 40)
+            with pytest.raises(ValueError) as exc_info:
+                construct.mmap_tree(path)
+        assert str(exc_info.value) == Constants.ERROR_NODE_BYTES_HEADER
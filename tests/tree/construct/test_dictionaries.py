@@ -749,6 +749,28 @@ class TestNestedDictToTree(unittest.TestCase):
         assert_tree_structure_basenode_root_attr(root)
         assert_tree_structure_node_root(root)
 
+    @staticmethod
+    def test_nested_dict_to_tree_duplicate_children_error():
+        nested_dict = {"name": "a", "children": [{"name": "b"}, {"name": "b"}]}
+        with pytest.raises(exceptions.TreeError) as exc_info:
+            construct.nested_dict_to_tree(nested_dict)
+        assert str(exc_info.value) == Constants.ERROR_NODE_SAME_PARENT_PATH.format(
+            path="/a/b"
+        )
+
+    @staticmethod
+    def test_nested_dict_to_tree_deep():
+        depth = 5000
+        nested_dict = {"name": f"n{depth - 1}"}
+        for idx in reversed(range(depth - 1)):
+            nested_dict = {"name": f"n{idx}", "children": [nested_dict]}
+        _node = construct.nested_dict_to_tree(nested_dict)
+        for idx in range(depth - 1):
+            assert _node.node_name == f"n{idx}"
+            _node = _node.children[0]
+        assert len(list(_node.ancestors)) == depth - 1
+        assert _node.is_leaf
+
     def test_nested_dict_to_tree_node_type(self):
         root = construct.nested_dict_to_tree(self.nested_dict, node_type=NodeA)
         assert isinstance(root, NodeA), Constants.ERROR_CUSTOM_TYPE.format(type="NodeA")
@@ -955,6 +977,19 @@ class TestNestedDictKeyToTree(unittest.TestCase):
         assert_tree_structure_basenode_root_attr(root)
         assert_tree_structure_node_root(root)
 
+    @staticmethod
+    def test_nested_dict_key_to_tree_deep():
+        depth = 5000
+        nested_dict = {f"n{depth - 1}": {}}
+        for idx in reversed(range(depth - 1)):
+            nested_dict = {f"n{idx}": {"children": nested_dict}}
+        _node = construct.nested_dict_key_to_tree(nested_dict)
+        for idx in range(depth - 1):
+            assert _node.node_name == f"n{idx}"
+            _node = _node.children[0]
+        assert len(list(_node.ancestors)) == depth - 1
+        assert _node.is_leaf
+
     def test_nested_dict_key_to_tree_node_type(self):
         root = construct.nested_dict_key_to_tree(self.nested_dict, node_type=NodeA)
         assert isinstance(root, NodeA), Constants.ERROR_CUSTOM_TYPE.format(type="NodeA")
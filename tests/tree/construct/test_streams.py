@@ -0,0 +1,357 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import pytest
+
+from bigtree.tree import construct
+from bigtree.utils import exceptions, iterators
+from tests.node.test_basenode import (
+    assert_tree_structure_basenode_root,
+    assert_tree_structure_basenode_root_attr,
+)
+from tests.node.test_node import (
+    assert_tree_structure_node_root,
+    assert_tree_structure_node_root_sep,
+)
+from tests.test_constants import Constants
+from tests.tree.construct.conftest import NodeA
+
+
+class TestIterToTree(unittest.TestCase):
+    def setUp(self):
+        """
+        Tree should have structure
+        a (age=90)
+        |-- b (age=65)
+        |   |-- d (age=40)
+        |   +-- e (age=35)
+        |       |-- g (age=10)
+        |       +-- h (age=6)
+        +-- c (age=60)
+            +-- f (age=38)
+        """
+        self.path_rows = [
+            {"path": "a", "age": 90},
+            {"path": "a/b", "age": 65},
+            {"path": "a/c", "age": 60},
+            {"path": "a/b/d", "age": 40},
+            {"path": "a/b/e", "age": 35},
+            {"path": "a/c/f", "age": 38},
+            {"path": "a/b/e/g", "age": 10},
+            {"path": "a/b/e/h", "age": 6},
+        ]
+        self.relation_rows = [
+            {"child": "a", "parent": None, "age": 90},
+            {"child": "b", "parent": "a", "age": 65},
+            {"child": "c", "parent": "a", "age": 60},
+            {"child": "d", "parent": "b", "age": 40},
+            {"child": "e", "parent": "b", "age": 35},
+            {"child": "f", "parent": "c", "age": 38},
+            {"child": "g", "parent": "e", "age": 10},
+            {"child": "h", "parent": "e", "age": 6},
+        ]
+
+    def tearDown(self):
+        self.path_rows = None
+        self.relation_rows = None
+
+    def test_iter_to_tree(self):
+        root = construct.iter_to_tree(iter(self.path_rows))
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_basenode_root_attr(root)
+        assert_tree_structure_node_root(root)
+
+    def test_iter_to_tree_path_string(self):
+        paths = ["a/b/d", "a/b/e", "a/b/e/g", "a/b/e/h", "a/c/f"]
+        root = construct.iter_to_tree(paths)
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_node_root(root)
+
+    def test_iter_to_tree_child_before_parent(self):
+        root = construct.iter_to_tree(reversed(self.path_rows), chunk_size=3)
+        for node in iterators.preorder_iter(root):
+            node.sort(key=lambda _node: _node.node_name)
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_basenode_root_attr(root)
+        assert_tree_structure_node_root(root)
+
+    def test_iter_to_tree_sep(self):
+        rows = [
+            {"path": row["path"].replace("/", "\\"), "age": row["age"]}
+            for row in self.path_rows
+        ]
+        root = construct.iter_to_tree(rows, sep="\\")
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_basenode_root_attr(root)
+        assert_tree_structure_node_root_sep(root)
+
+    def test_iter_to_tree_attribute_cols(self):
+        rows = [dict(row, extra=1) for row in self.path_rows]
+        root = construct.iter_to_tree(rows, path_col="path", attribute_cols=["age"])
+        assert_tree_structure_basenode_root_attr(root)
+        assert not root.get_attr("extra")
+
+    def test_iter_to_tree_null_attribute(self):
+        rows = [{"path": "a", "age": None}, {"path": "a/b", "age": float("nan")}]
+        root = construct.iter_to_tree(rows)
+        assert not hasattr(root, "age")
+        assert not hasattr(root["b"], "age")
+
+    def test_iter_to_tree_progress(self):
+        progress = []
+        construct.iter_to_tree(
+            iter(self.path_rows), chunk_size=3, progress=progress.append
+        )
+        assert progress == [3, 6, 8]
+
+    def test_iter_to_tree_lazy(self):
+        consumed = []
+
+        def _rows():
+            for row in self.path_rows:
+                consumed.append(row["path"])
+                yield row
+
+        def _progress(n_rows):
+            assert len(consumed) == n_rows
+
+        construct.iter_to_tree(_rows(), chunk_size=3, progress=_progress)
+
+    def test_iter_to_tree_node_type(self):
+        root = construct.iter_to_tree(self.path_rows, node_type=NodeA)
+        assert isinstance(root, NodeA), Constants.ERROR_CUSTOM_TYPE.format(type="NodeA")
+        assert all(isinstance(node, NodeA) for node in root.children)
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_node_root(root)
+
+    def test_iter_to_tree_empty_error(self):
+        with pytest.raises(ValueError) as exc_info:
+            construct.iter_to_tree(iter([]))
+        assert str(exc_info.value) == Constants.ERROR_NODE_STREAM_EMPTY
+
+    def test_iter_to_tree_empty_path_error(self):
+        with pytest.raises(ValueError) as exc_info:
+            construct.iter_to_tree([{"path": "a"}, {"path": None}])
+        assert str(exc_info.value) == Constants.ERROR_NODE_PATH_EMPTY
+
+    def test_iter_to_tree_chunk_size_error(self):
+        with pytest.raises(ValueError) as exc_info:
+            construct.iter_to_tree(self.path_rows, chunk_size=0)
+        assert str(exc_info.value) == Constants.ERROR_NODE_STREAM_CHUNK_SIZE.format(
+            chunk_size=0
+        )
+
+    def test_iter_to_tree_different_root_error(self):
+        with pytest.raises(exceptions.TreeError) as exc_info:
+            construct.iter_to_tree(["a/b", "b/c"])
+        assert str(exc_info.value) == Constants.ERROR_NODE_DIFFERENT_ROOT.format(
+            root1="a", root2="b"
+        )
+
+    def test_iter_to_tree_duplicate_name_error(self):
+        paths = ["a/b/d", "a/c/d"]
+        construct.iter_to_tree(paths)
+        with pytest.raises(exceptions.DuplicatedNodeError) as exc_info:
+            construct.iter_to_tree(paths, duplicate_name_allowed=False)
+        assert str(exc_info.value) == Constants.ERROR_NODE_DUPLICATE_NAME.format(
+            name="d"
+        )
+
+    def test_iter_to_tree_by_relation(self):
+        root = construct.iter_to_tree(
+            self.relation_rows, child_col="child", parent_col="parent"
+        )
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_basenode_root_attr(root)
+        assert_tree_structure_node_root(root)
+
+    def test_iter_to_tree_by_relation_default_cols(self):
+        root = construct.iter_to_tree(self.relation_rows, parent_col="parent")
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_node_root(root)
+
+    def test_iter_to_tree_by_relation_child_before_parent(self):
+        rows = [row for row in reversed(self.relation_rows) if row["child"] != "a"]
+        root = construct.iter_to_tree(rows, child_col="child", parent_col="parent")
+        for node in iterators.preorder_iter(root):
+            node.sort(key=lambda _node: _node.node_name)
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_node_root(root)
+        assert not hasattr(root, "age")
+
+    def test_iter_to_tree_by_relation_duplicate_leaf(self):
+        rows = self.relation_rows + [
+            {"child": "h", "parent": "c"},
+            {"child": "h", "parent": "c", "age": 1},
+            {"child": "h", "parent": "e", "age": 2},
+        ]
+        root = construct.iter_to_tree(rows, child_col="child", parent_col="parent")
+        assert [node.node_name for node in root["c"].children] == ["f", "h"]
+        assert root["c"]["h"].age == 1
+        assert root["b"]["e"]["h"].age == 2
+
+    def test_iter_to_tree_by_relation_duplicate_intermediate_error(self):
+        rows = self.relation_rows + [{"child": "e", "parent": "c"}]
+        with pytest.raises(ValueError) as exc_info:
+            construct.iter_to_tree(rows, child_col="child", parent_col="parent")
+        assert str(exc_info.value).startswith(
+            Constants.ERROR_NODE_DUPLICATED_INTERMEDIATE_NODE
+        )
+
+    def test_iter_to_tree_by_relation_duplicate_parent_error(self):
+        rows = self.relation_rows + [
+            {"child": "h", "parent": "c"},
+            {"child": "i", "parent": "h"},
+        ]
+        with pytest.raises(ValueError) as exc_info:
+            construct.iter_to_tree(rows, child_col="child", parent_col="parent")
+        assert str(exc_info.value).startswith(
+            Constants.ERROR_NODE_DUPLICATED_INTERMEDIATE_NODE
+        )
+
+    def test_iter_to_tree_by_relation_multiple_root_error(self):
+        rows = self.relation_rows + [{"child": "i", "parent": "j"}]
+        with pytest.raises(ValueError) as exc_info:
+            construct.iter_to_tree(rows, child_col="child", parent_col="parent")
+        assert str(
+            exc_info.value
+        ) == Constants.ERROR_NODE_DATAFRAME_MULTIPLE_ROOT.format(root_nodes=["a", "j"])
+
+    def test_iter_to_tree_by_relation_loop_error(self):
+        rows = [
+            {"child": "b", "parent": "a"},
+            {"child": "c", "parent": "b"},
+            {"child": "a", "parent": "c"},
+        ]
+        with pytest.raises(exceptions.LoopError) as exc_info:
+            construct.iter_to_tree(rows, child_col="child", parent_col="parent")
+        assert str(exc_info.value) == Constants.ERROR_NODE_LOOP_ANCESTOR
+
+    def test_iter_to_tree_by_relation_row_type_error(self):
+        with pytest.raises(TypeError) as exc_info:
+            construct.iter_to_tree(["a/b"], parent_col="parent")
+        assert str(exc_info.value) == Constants.ERROR_NODE_STREAM_ROW_TYPE.format(
+            row="a/b"
+        )
+
+
+class TestCSVToTree(unittest.TestCase):
+    def setUp(self):
+        self.path_csv = (
+            "PATH,age\n"
+            "a,90\n"
+            "a/b,65\n"
+            "a/c,60\n"
+            "a/b/d,40\n"
+            "a/b/e,35\n"
+            "a/c/f,38\n"
+            "a/b/e/g,10\n"
+            "a/b/e/h,6\n"
+        )
+        self.relation_csv = (
+            "child;parent;age\n"
+            "a;;90\n"
+            "b;a;65\n"
+            "c;a;60\n"
+            "d;b;40\n"
+            "e;b;35\n"
+            "f;c;38\n"
+            "g;e;10\n"
+            "h;e;6\n"
+        )
+
+    def tearDown(self):
+        self.path_csv = None
+        self.relation_csv = None
+
+    def test_csv_to_tree(self):
+        root = construct.csv_to_tree(io.StringIO(self.path_csv))
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_node_root(root)
+        assert root.age == "90"
+
+    def test_csv_to_tree_file_path(self):
+        progress = []
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "tree.csv")
+            with open(file_path, "w", encoding="utf-8") as fp:
+                fp.write(self.path_csv)
+            root = construct.csv_to_tree(
+                file_path, path_col="PATH", chunk_size=5, progress=progress.append
+            )
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_node_root(root)
+        assert progress == [5, 8]
+
+    def test_csv_to_tree_empty_value(self):
+        root = construct.csv_to_tree(io.StringIO("path,age\na,\na/b,1\n"))
+        assert not hasattr(root, "age")
+        assert root["b"].age == "1"
+
+    def test_csv_to_tree_empty_error(self):
+        with pytest.raises(ValueError) as exc_info:
+            construct.csv_to_tree(io.StringIO("path,age\n"))
+        assert str(exc_info.value) == Constants.ERROR_NODE_STREAM_EMPTY
+
+    def test_csv_to_tree_by_relation(self):
+        root = construct.csv_to_tree(
+            io.StringIO(self.relation_csv),
+            child_col="child",
+            parent_col="parent",
+            delimiter=";",
+        )
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_node_root(root)
+        assert root["b"]["e"]["h"].age == "6"
+
+
+class TestJSONLToTree(unittest.TestCase):
+    def setUp(self):
+        self.path_jsonl = "\n".join(
+            json.dumps(row)
+            for row in [
+                {"path": "a", "age": 90},
+                {"path": "a/b", "age": 65},
+                {"path": "a/c", "age": 60},
+                {"path": "a/b/d", "age": 40},
+                {"path": "a/b/e", "age": 35},
+                {"path": "a/c/f", "age": 38},
+                {"path": "a/b/e/g", "age": 10},
+                {"path": "a/b/e/h", "age": 6},
+            ]
+        )
+
+    def tearDown(self):
+        self.path_jsonl = None
+
+    def test_jsonl_to_tree(self):
+        root = construct.jsonl_to_tree(io.StringIO(self.path_jsonl + "\n\n"))
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_basenode_root_attr(root)
+        assert_tree_structure_node_root(root)
+
+    def test_jsonl_to_tree_file_path(self):
+        progress = []
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "tree.jsonl")
+            with open(file_path, "w", encoding="utf-8") as fp:
+                fp.write(self.path_jsonl)
+            root = construct.jsonl_to_tree(
+                file_path, chunk_size=3, progress=progress.append
+            )
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_basenode_root_attr(root)
+        assert_tree_structure_node_root(root)
+        assert progress == [3, 6, 8]
+
+    def test_jsonl_to_tree_by_relation(self):
+        jsonl = (
+            '{"child": "b", "parent": "a", "age": 65}\n'
+            '{"child": "c", "parent": "a", "age": 60}\n'
+        )
+        root = construct.jsonl_to_tree(io.StringIO(jsonl), child_col="child")
+        assert [node.node_name for node in root.children] == ["b", "c"]
+        assert root["c"].age == 60
@@ -1,3 +1,4 @@
+import io
 import unittest
 
 import pytest
@@ -205,6 +206,51 @@ class TestStrToTree(unittest.TestCase):
         assert_tree_structure_basenode_root(root)
         assert_tree_structure_node_root(root)
 
+    def test_str_to_tree_file(self):
+        tree_file = io.StringIO("\n" + self.tree_str + "\n\n")
+        root = construct.str_to_tree(tree_file)
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_node_root(root)
+
+    def test_str_to_tree_file_lazy(self):
+        tree_lines = iter(self.tree_str.split("\n"))
+        lines_read = []
+
+        class TreeFile(io.StringIO):
+            def __iter__(self):
+                return self
+
+            def __next__(self):
+                line = next(tree_lines)
+                lines_read.append(line)
+                return line + "\n"
+
+        root = construct.str_to_tree(TreeFile())
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_node_root(root)
+        assert len(lines_read) == 8
+
+    @staticmethod
+    def test_str_to_tree_deep():
+        depth = 2000
+        tree_str = "\n".join(
+            ["n0"] + [f"{'    ' * (idx - 1)}└── n{idx}" for idx in range(1, depth)]
+        )
+        _node = construct.str_to_tree(tree_str)
+        for idx in range(depth - 1):
+            assert _node.node_name == f"n{idx}"
+            _node = _node.children[0]
+        assert len(list(_node.ancestors)) == depth - 1
+
+    @staticmethod
+    def test_str_to_tree_duplicate_children_error():
+        tree_str = "a\n├── b\n│   └── d\n└── b"
+        with pytest.raises(exceptions.TreeError) as exc_info:
+            construct.str_to_tree(tree_str)
+        assert str(exc_info.value) == Constants.ERROR_NODE_SAME_PARENT_PATH.format(
+            path="/a/b"
+        )
+
     def test_ascii_character_error(self):
         node_str = "|-- b"
         tree_str = "a\n|-- b\n|   |-- d\n|   +-- e\n|       |-- g\n|       +-- h\n+-- c\n    +-- f"
@@ -230,6 +276,11 @@ class TestStrToTree(unittest.TestCase):
             construct.str_to_tree("\n\n")
         assert str(exc_info.value) == Constants.ERROR_NODE_STRING_EMPTY
 
+    def test_empty_file_error(self):
+        with pytest.raises(ValueError) as exc_info:
+            construct.str_to_tree(io.StringIO("\n\n"))
+        assert str(exc_info.value) == Constants.ERROR_NODE_STRING_EMPTY
+
     def test_unequal_prefix_length_error(self):
         branch = "│  ├── d"
         tree_str = "a\n├── b\n│  ├── d\n│   └── e\n│       ├── g\n│       └── h\n└── c\n    └── f"
@@ -442,6 +493,76 @@ class TestNewickToTree(unittest.TestCase):
                 index=error_idx
             )
 
+    def test_newick_to_tree_file(self):
+        root = construct.newick_to_tree(io.StringIO(self.newick_str_with_attr))
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_basenode_root_attr(
+            root,
+            a=("a", "90"),
+            b=("b", "65"),
+            c=("c", "60"),
+            d=("d", "40"),
+            e=("e", "35"),
+            f=("f", "38"),
+            g=("g", "10"),
+            h=("h", "6"),
+        )
+        assert_tree_structure_node_root(root)
+
+    def test_newick_to_tree_file_chunk_boundary(self):
+        class SingleCharacterIO(io.StringIO):
+            def read(self, size=-1):
+                return super().read(1)
+
+        newick_strs = [
+            self.newick_str_with_attr,
+            "((d:40,(g:10,h:6)e:35)b:65,(f:38)c:60)a:90",
+            """(('d,',("g",'"h"')':e')'[b]',('f=')'c:')'(root)'""",
+            """((d[age='4,0'],(g,h)e)b,(f)c)a""",
+        ]
+        for newick_str in newick_strs:
+            expected = construct.newick_to_tree(newick_str, length_attr="length")
+            actual = construct.newick_to_tree(
+                SingleCharacterIO(newick_str), length_attr="length"
+            )
+            assert [
+                (_node.path_name, _node.describe(exclude_prefix="_"))
+                for _node in expected.descendants
+            ] == [
+                (_node.path_name, _node.describe(exclude_prefix="_"))
+                for _node in actual.descendants
+            ]
+
+    def test_newick_to_tree_file_bracket_error(self):
+        with pytest.raises(ValueError) as exc_info:
+            construct.newick_to_tree(
+                io.StringIO("((d:(40,(g:10,h:6)e:35)b:65,(f:38)c:60)a:90")
+            )
+        assert str(exc_info.value) == Constants.ERROR_NODE_NEWICK_NOT_CLOSED.format(
+            index=4
+        )
+
+    def test_newick_to_tree_file_empty_error(self):
+        with pytest.raises(ValueError) as exc_info:
+            construct.newick_to_tree(io.StringIO(""))
+        assert str(exc_info.value) == Constants.ERROR_NODE_STRING_EMPTY
+
+    def test_newick_to_tree_deep(self):
+        depth = 5000
+        newick_str = (
+            "(" * (depth - 1)
+            + f"{depth - 1}"
+            + "".join(f"){idx}" for idx in range(depth - 2, -1, -1))
+        )
+        root = construct.newick_to_tree(newick_str)
+        _node, n_levels = root, 1
+        while _node.children:
+            assert len(_node.children) == 1
+            _node = _node.children[0]
+            n_levels += 1
+        assert n_levels == depth
+        assert _node.node_name == str(depth - 1)
+
 
 def assert_tree_structure_phylogenetic(root):
     assert root.max_depth == 4, f"Expected max_depth 4, received {root.max_depth}"
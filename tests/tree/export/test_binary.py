@@ -0,0 +1,113 @@
+import io
+import struct
+
+from bigtree.node import basenode, node
+from bigtree.tree import export
+from bigtree.utils.constants import BinaryConstants
+
+
+def read_header(data):
+    return struct.unpack_from(BinaryConstants.HEADER_FORMAT, data)
+
+
+class TestTreeToBytes:
+    @staticmethod
+    def test_tree_to_bytes(tree_node):
+        data = export.tree_to_bytes(tree_node)
+        magic, version, flags, n_columns, sep_idx, _, n_nodes, n_strings = read_header(
+            data
+        )
+        assert magic == BinaryConstants.MAGIC
+        assert version == BinaryConstants.VERSION
+        assert flags == 0
+        assert n_columns == 2
+        assert n_nodes == 8
+        assert len(data) % 8 == 0
+
+        # String table has node names, column names and separator
+        header_size = struct.calcsize(BinaryConstants.HEADER_FORMAT)
+        offsets = struct.unpack_from(f"<{n_strings + 1}Q", data, header_size)
+        strings_start = header_size + 8 * (n_strings + 1)
+        strings = [
+            data[strings_start + start : strings_start + end].decode()
+            for start, end in zip(offsets, offsets[1:])
+        ]
+        assert sorted(strings) == sorted(
+            ["age", "name", "/", "a", "b", "c", "d", "e", "f", "g", "h"]
+        )
+        assert strings[sep_idx] == "/"
+
+        # Structure in preorder
+        structure_start = strings_start + offsets[-1] + (-offsets[-1] % 8)
+        parents = struct.unpack_from("<8q", data, structure_start)
+        sizes = struct.unpack_from("<8q", data, structure_start + 64)
+        assert parents == (-1, 0, 1, 1, 3, 3, 0, 6)
+        assert sizes == (8, 5, 1, 3, 1, 1, 2, 1)
+
+    @staticmethod
+    def test_tree_to_bytes_deterministic(tree_node):
+        assert export.tree_to_bytes(tree_node) == export.tree_to_bytes(tree_node)
+
+    @staticmethod
+    def test_tree_to_bytes_column_types():
+        root = node.Node(
+            "a", flag=True, count=1, weight=0.5, label="x", mixed=1, items=[1]
+        )
+        _ = node.Node("b", flag=None, count=2, mixed=1.5, parent=root)
+        data = export.tree_to_bytes(root)
+        _, _, _, n_columns, _, _, n_nodes, n_strings = read_header(data)
+        header_size = struct.calcsize(BinaryConstants.HEADER_FORMAT)
+        offsets = struct.unpack_from(f"<{n_strings + 1}Q", data, header_size)
+        offset = header_size + 8 * (n_strings + 1) + offsets[-1] + (-offsets[-1] % 8)
+        offset += 16 * n_nodes
+
+        type_codes = []
+        masks = []
+        column_header_size = struct.calcsize(BinaryConstants.COLUMN_FORMAT)
+        for _ in range(n_columns):
+            name_idx, type_code, data_length = struct.unpack_from(
+                BinaryConstants.COLUMN_FORMAT, data, offset
+            )
+            offset += column_header_size
+            masks.append(data[offset : offset + n_nodes])
+            offset += n_nodes + (-n_nodes % 8) + data_length + (-data_length % 8)
+            type_codes.append(type_code)
+        assert offset == len(data)
+        assert type_codes == [
+            BinaryConstants.TYPE_INT,
+            BinaryConstants.TYPE_BOOL,
+            BinaryConstants.TYPE_OBJECT,
+            BinaryConstants.TYPE_STR,
+            BinaryConstants.TYPE_OBJECT,
+            BinaryConstants.TYPE_STR,
+            BinaryConstants.TYPE_FLOAT,
+        ]
+        assert masks == [
+            b"\x01\x01",
+            b"\x01\x02",
+            b"\x01\x00",
+            b"\x01\x00",
+            b"\x01\x01",
+            b"\x01\x01",
+            b"\x01\x00",
+        ]
+
+    @staticmethod
+    def test_tree_to_bytes_basenode():
+        from bigtree.tree import construct
+
+        root = basenode.BaseNode(age=90)
+        _ = basenode.BaseNode(age=65, parent=root)
+        data = export.tree_to_bytes(root)
+        assert read_header(data)[4] == BinaryConstants.NO_INDEX
+        new_root = construct.bytes_to_tree(data, node_type=basenode.BaseNode)
+        assert new_root.age == 90
+        assert [child.age for child in new_root.children] == [65]
+
+
+class TestSaveTree:
+    @staticmethod
+    def test_save_tree(tree_node):
+        tree_file = io.BytesIO()
+        export.save_tree(tree_node, tree_file)
+        assert tree_file.getvalue() == export.tree_to_bytes(tree_node)
@@ -1,9 +1,17 @@
+import datetime
+import decimal
+import io
+import json
+import os
+import tempfile
 import unittest
 
 import pandas as pd
 import polars as pl
+import pytest
 
-from bigtree.tree import export
+from bigtree.node import node
+from bigtree.tree import construct, export
 from tests.node.test_basenode import (
     assert_tree_structure_basenode_root,
     assert_tree_structure_basenode_root_attr,
@@ -163,6 +171,34 @@ class TestTreeToDataFrame:
         actual = export.tree_to_dataframe(tree_node, all_attrs=True)
         pd.testing.assert_frame_equal(expected, actual)
 
+    @staticmethod
+    def test_tree_to_dataframe_all_attr_missing():
+        root = node.Node("a", age=90, path="custom")
+        _ = node.Node("b", label="x", parent=root)
+        expected = pd.DataFrame(
+            [
+                ["custom", "a", 90, None],
+                ["/a/b", "b", None, "x"],
+            ],
+            columns=["path", "name", "age", "label"],
+        )
+        actual = export.tree_to_dataframe(root, all_attrs=True)
+        pd.testing.assert_frame_equal(expected, actual)
+
+    @staticmethod
+    def test_tree_to_dataframe_deep():
+        depth = 5000
+        root = node.Node("0")
+        nodes = [root] + [node.Node(str(idx)) for idx in range(1, depth)]
+        for parent, child in reversed(list(zip(nodes, nodes[1:]))):
+            child.parent = parent
+        actual = export.tree_to_dataframe(root, skip_depth=depth - 1)
+        expected = pd.DataFrame(
+            [["/" + "/".join(map(str, range(depth))), str(depth - 1)]],
+            columns=["path", "name"],
+        )
+        pd.testing.assert_frame_equal(expected, actual)
+
     @staticmethod
     def test_tree_to_dataframe_max_depth(tree_node):
         expected = pd.DataFrame(
@@ -176,6 +212,22 @@ class TestTreeToDataFrame:
         actual = export.tree_to_dataframe(tree_node, max_depth=2)
         pd.testing.assert_frame_equal(expected, actual)
 
+    @staticmethod
+    def test_tree_to_dataframe_max_depth_subtree(tree_node):
+        expected = pd.DataFrame(
+            [
+                ["/a/b", "b"],
+                ["/a/b/d", "d"],
+                ["/a/b/e", "e"],
+            ],
+            columns=["path", "name"],
+        )
+        actual = export.tree_to_dataframe(tree_node["b"], max_depth=3)
+        pd.testing.assert_frame_equal(expected, actual)
+
+        actual = export.tree_to_dataframe(tree_node["b"]["e"], max_depth=2)
+        assert actual.empty
+
     @staticmethod
     def test_tree_to_dataframe_skip_depth(tree_node):
         expected = pd.DataFrame(
@@ -434,6 +486,21 @@ class TestTreeToPolars:
         actual = export.tree_to_polars(tree_node, all_attrs=True)
         assert expected.equals(actual)
 
+    @staticmethod
+    def test_tree_to_polars_all_attr_missing():
+        root = node.Node("a", age=90, path="custom")
+        _ = node.Node("b", label="x", parent=root)
+        expected = pl.DataFrame(
+            [
+                ["custom", "a", 90, None],
+                ["/a/b", "b", None, "x"],
+            ],
+            schema=["path", "name", "age", "label"],
+            orient="row",
+        )
+        actual = export.tree_to_polars(root, all_attrs=True)
+        assert expected.equals(actual)
+
     @staticmethod
     def test_tree_to_polars_max_depth(tree_node):
         expected = pl.DataFrame(
@@ -448,6 +515,40 @@ class TestTreeToPolars:
         actual = export.tree_to_polars(tree_node, max_depth=2)
         assert expected.equals(actual)
 
+    @staticmethod
+    def test_tree_to_polars_max_depth_subtree(tree_node):
+        expected = pl.DataFrame(
+            [
+                ["/a/b", "b"],
+                ["/a/b/d", "d"],
+                ["/a/b/e", "e"],
+            ],
+            schema=["path", "name"],
+            orient="row",
+        )
+        actual = export.tree_to_polars(tree_node["b"], max_depth=3)
+        assert expected.equals(actual)
+
+        actual = export.tree_to_polars(tree_node["b"]["e"], max_depth=2)
+        assert actual.is_empty()
+
+    @staticmethod
+    def test_tree_to_polars_all_attrs_mixed_type():
+        root = node.Node("a", value=1)
+        node.Node("b", value="x", parent=root)
+        node.Node("c", parent=root)
+        expected = pl.DataFrame(
+            [
+                ["/a", "a", "1"],
+                ["/a/b", "b", "x"],
+                ["/a/c", "c", None],
+            ],
+            schema=["path", "name", "value"],
+            orient="row",
+        )
+        actual = export.tree_to_polars(root, all_attrs=True)
+        assert expected.equals(actual)
+
     @staticmethod
     def test_tree_to_polars_skip_depth(tree_node):
         expected = pl.DataFrame(
@@ -535,3 +636,170 @@ class TestTreeToPolars:
         assert_tree_structure_basenode_root(tree)
         assert_tree_structure_basenode_root_attr(tree)
         assert_tree_structure_node_root(tree)
+
+
+class TestTreeToCsv:
+    @staticmethod
+    def test_tree_to_csv(tree_node):
+        csv_file = io.StringIO()
+        export.tree_to_csv(tree_node, csv_file, parent_col="parent", all_attrs=True)
+        assert csv_file.getvalue() == (
+            "path,name,parent,age\n"
+            "/a,a,,90\n"
+            "/a/b,b,a,65\n"
+            "/a/b/d,d,b,40\n"
+            "/a/b/e,e,b,35\n"
+            "/a/b/e/g,g,e,10\n"
+            "/a/b/e/h,h,e,6\n"
+            "/a/c,c,a,60\n"
+            "/a/c/f,f,c,38\n"
+        )
+
+    @staticmethod
+    def test_tree_to_csv_chunk_size(tree_node):
+        expected = io.StringIO()
+        export.tree_to_csv(tree_node, expected, attr_dict={"age": "AGE"})
+        for chunk_size in [1, 3, 8]:
+            actual = io.StringIO()
+            export.tree_to_csv(
+                tree_node, actual, attr_dict={"age": "AGE"}, chunk_size=chunk_size
+            )
+            assert actual.getvalue() == expected.getvalue()
+
+    @staticmethod
+    def test_tree_to_csv_all_attr_missing():
+        root = node.Node("a", age=90)
+        _ = node.Node("b", parent=root)
+        _ = node.Node("c", label="x", parent=root)
+        csv_file = io.StringIO()
+        export.tree_to_csv(root, csv_file, all_attrs=True, delimiter=";", chunk_size=2)
+        assert csv_file.getvalue() == (
+            "path;name;age;label\n/a;a;90;\n/a/b;b;;\n/a/c;c;;x\n"
+        )
+
+    @staticmethod
+    def test_tree_to_csv_depth(tree_node):
+        csv_file = io.StringIO()
+        export.tree_to_csv(tree_node, csv_file, max_depth=3, skip_depth=2)
+        assert csv_file.getvalue() == "path,name\n/a/b/d,d\n/a/b/e,e\n/a/c/f,f\n"
+
+    @staticmethod
+    def test_tree_to_csv_to_tree(tree_node):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tree.csv")
+            export.tree_to_csv(tree_node, path, name_col="", all_attrs=True)
+            root = construct.csv_to_tree(path)
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_node_root(root)
+        assert [_node.age for _node in root.descendants] == [
+            "65",
+            "40",
+            "35",
+            "10",
+            "6",
+            "60",
+            "38",
+        ]
+
+
+class TestTreeToJsonl:
+    @staticmethod
+    def test_tree_to_jsonl(tree_node):
+        jsonl_file = io.StringIO()
+        export.tree_to_jsonl(tree_node, jsonl_file, leaf_only=True, all_attrs=True)
+        assert [json.loads(line) for line in jsonl_file.getvalue().splitlines()] == [
+            {"path": "/a/b/d", "name": "d", "age": 40},
+            {"path": "/a/b/e/g", "name": "g", "age": 10},
+            {"path": "/a/b/e/h", "name": "h", "age": 6},
+            {"path": "/a/c/f", "name": "f", "age": 38},
+        ]
+
+    @staticmethod
+    def test_tree_to_jsonl_all_attr_missing():
+        root = node.Node("a", age=90)
+        _ = node.Node("b", parent=root)
+        _ = node.Node("c", label="x", parent=root)
+        jsonl_file = io.StringIO()
+        export.tree_to_jsonl(
+            root, jsonl_file, path_col="", parent_col="parent", all_attrs=True
+        )
+        assert jsonl_file.getvalue() == (
+            '{"name": "a", "parent": null, "age": 90}\n'
+            '{"name": "b", "parent": "a"}\n'
+            '{"name": "c", "parent": "a", "label": "x"}\n'
+        )
+
+    @staticmethod
+    def test_tree_to_jsonl_not_serializable():
+        root = node.Node(
+            "a",
+            date=datetime.date(2024, 1, 31),
+            amount=decimal.Decimal("1.50"),
+            tags={"x"},
+        )
+        jsonl_file = io.StringIO()
+        export.tree_to_jsonl(root, jsonl_file, all_attrs=True)
+        assert jsonl_file.getvalue() == (
+            '{"path": "/a", "name": "a", "amount": "1.50", "date": "2024-01-31", '
+            '"tags": "{\'x\'}"}\n'
+        )
+
+    @staticmethod
+    def test_tree_to_jsonl_not_serializable_default():
+        root = node.Node("a", tags={"y", "x"})
+        jsonl_file = io.StringIO()
+        export.tree_to_jsonl(
+            root, jsonl_file, attr_dict={"tags": "tags"}, default=sorted
+        )
+        assert (
+            jsonl_file.getvalue() == '{"path": "/a", "name": "a", "tags": ["x", "y"]}\n'
+        )
+
+    @staticmethod
+    def test_tree_to_jsonl_not_serializable_error():
+        root = node.Node("a", tags={"x"})
+        jsonl_file = io.StringIO()
+        with pytest.raises(TypeError):
+            export.tree_to_jsonl(root, jsonl_file, all_attrs=True, default=None)
+
+    @staticmethod
+    def test_tree_to_jsonl_to_tree(tree_node):
+        jsonl_file = io.StringIO()
+        export.tree_to_jsonl(tree_node, jsonl_file, all_attrs=True, chunk_size=3)
+        jsonl_file.seek(0)
+        root = construct.jsonl_to_tree(jsonl_file, attribute_cols=["age"])
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_basenode_root_attr(root)
+        assert_tree_structure_node_root(root)
+
+
+class TestTreeToParquet:
+    @staticmethod
+    def test_tree_to_parquet(tree_node):
+        parquet_file = io.BytesIO()
+        export.tree_to_parquet(tree_node, parquet_file, all_attrs=True, chunk_size=3)
+        parquet_file.seek(0)
+        actual = pl.read_parquet(parquet_file)
+        assert actual.equals(export.tree_to_polars(tree_node, all_attrs=True))
+
+    @staticmethod
+    def test_tree_to_parquet_column_types():
+        root = node.Node("a", flag=True, count=1, weight=1, mixed=1, items=[1])
+        _ = node.Node("b", flag=None, count=2, weight=0.5, mixed="x", parent=root)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tree.parquet")
+            export.tree_to_parquet(root, path, all_attrs=True, chunk_size=1)
+            actual = pl.read_parquet(path)
+        assert actual.schema == {
+            "path": pl.String,
+            "name": pl.String,
+            "count": pl.Int64,
+            "flag": pl.Boolean,
+            "items": pl.String,
+            "mixed": pl.String,
+            "weight": pl.Float64,
+        }
+        assert actual.rows() == [
+            ("/a", "a", 1, True, "[1]", "1", 1.0),
+            ("/a/b", "b", 2, None, None, "x", 0.5),
+        ]
@@ -1,3 +1,8 @@
+import io
+import json
+import os
+import tempfile
+
 import pytest
 
 from bigtree.node import node
@@ -368,6 +373,21 @@ class TestTreeToNestedDict:
         assert_tree_structure_basenode_root_attr(tree)
         assert_tree_structure_node_root(tree)
 
+    @staticmethod
+    def test_tree_to_nested_dict_deep():
+        from bigtree.tree.construct import nested_dict_to_tree
+
+        depth = 5000
+        expected = {"name": f"n{depth - 1}"}
+        for idx in reversed(range(depth - 1)):
+            expected = {"name": f"n{idx}", "children": [expected]}
+        actual = export.tree_to_nested_dict(nested_dict_to_tree(expected))
+        for _ in range(depth - 1):
+            assert actual.keys() == expected.keys()
+            assert actual["name"] == expected["name"]
+            actual, expected = actual["children"][0], expected["children"][0]
+        assert actual == expected
+
 
 class TestTreeToNestedDictKey:
     @staticmethod
@@ -543,6 +563,21 @@ class TestTreeToNestedDictKey:
         assert_tree_structure_basenode_root_attr(tree)
         assert_tree_structure_node_root(tree)
 
+    @staticmethod
+    def test_tree_to_nested_dict_key_deep():
+        from bigtree.tree.construct import nested_dict_key_to_tree
+
+        depth = 5000
+        expected = {f"n{depth - 1}": {}}
+        for idx in reversed(range(depth - 1)):
+            expected = {f"n{idx}": {"children": expected}}
+        actual = export.tree_to_nested_dict_key(nested_dict_key_to_tree(expected))
+        for idx in range(depth - 1):
+            assert actual.keys() == expected.keys()
+            actual = actual[f"n{idx}"]["children"]
+            expected = expected[f"n{idx}"]["children"]
+        assert actual == expected
+
 
 class TestTreeToNestedDictKeyNullKey:
     @staticmethod
@@ -597,3 +632,76 @@ class TestTreeToNestedDictKeyNullKey:
         tree = nested_dict_key_to_tree(d, child_key=None)
         assert_tree_structure_basenode_root(tree)
         assert_tree_structure_node_root(tree)
+
+
+class TestTreeToNestedJSON:
+    @staticmethod
+    def test_tree_to_nested_json(tree_node):
+        expected = json.dumps(export.tree_to_nested_dict(tree_node))
+        actual = io.StringIO()
+        export.tree_to_nested_json(tree_node, actual)
+        assert actual.getvalue() == expected
+
+    @staticmethod
+    def test_tree_to_nested_json_empty():
+        root = node.Node("a")
+        actual = io.StringIO()
+        export.tree_to_nested_json(root, actual)
+        assert actual.getvalue() == '{"name": "a"}'
+
+    @staticmethod
+    def test_tree_to_nested_json_all_attr(tree_node):
+        expected = json.dumps(export.tree_to_nested_dict(tree_node, all_attrs=True))
+        actual = io.StringIO()
+        export.tree_to_nested_json(tree_node, actual, all_attrs=True)
+        assert actual.getvalue() == expected
+
+    @staticmethod
+    def test_tree_to_nested_json_max_depth(tree_node):
+        expected = json.dumps(export.tree_to_nested_dict(tree_node, max_depth=2))
+        actual = io.StringIO()
+        export.tree_to_nested_json(tree_node, actual, max_depth=2)
+        assert actual.getvalue() == expected
+
+    @staticmethod
+    def test_tree_to_nested_json_multiple_keys_subset_tree(tree_node):
+        kwargs = dict(name_key="NAME", child_key="CHILDREN", attr_dict={"age": "AGE"})
+        expected = json.dumps(
+            export.tree_to_nested_dict(tree_node.children[0], **kwargs)
+        )
+        actual = io.StringIO()
+        export.tree_to_nested_json(tree_node.children[0], actual, **kwargs)
+        assert actual.getvalue() == expected
+
+    @staticmethod
+    def test_tree_to_nested_json_file_path(tree_node):
+        from bigtree.tree.construct import nested_dict_to_tree
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "tree.json")
+            export.tree_to_nested_json(tree_node, file_path, all_attrs=True)
+            with open(file_path, encoding="utf-8") as fp:
+                tree = nested_dict_to_tree(json.load(fp))
+        assert_tree_structure_basenode_root(tree)
+        assert_tree_structure_basenode_root_attr(tree)
+        assert_tree_structure_node_root(tree)
+
+    @staticmethod
+    def test_tree_to_nested_json_deep():
+        from bigtree.tree.construct import nested_dict_to_tree
+
+        depth = 5000
+        nested_dict = {"name": f"n{depth - 1}"}
+        for idx in reversed(range(depth - 1)):
+            nested_dict = {"name": f"n{idx}", "children": [nested_dict]}
+        actual = io.StringIO()
+        export.tree_to_nested_json(nested_dict_to_tree(nested_dict), actual)
+        assert actual.getvalue().count('"children"') == depth - 1
+        assert actual.getvalue().endswith("]}" * (depth - 1))
+
+    @staticmethod
+    def test_tree_to_nested_json_binarytree(binarytree_node):
+        expected = json.dumps(export.tree_to_nested_dict(binarytree_node))
+        actual = io.StringIO()
+        export.tree_to_nested_json(binarytree_node, actual)
+        assert actual.getvalue() == expected
@@ -1,6 +1,11 @@
+import json
+import re
 from unittest.mock import patch
 
+import pytest
+
 from bigtree.tree import export
+from tests.test_constants import Constants
 
 PATCH_UUID_PATH = "bigtree.tree.export.html.uuid.uuid4"
 
@@ -154,3 +159,85 @@ class TestTreeToHtml:
         with open(f"{self.folder_path}/tree_font_custom.html", "r") as file:
             expected_html = file.read()
         assert html == expected_html
+
+    @staticmethod
+    def get_lazy_tree_data(html):
+        tree_data = json.loads(re.search(r"const data = (.*);", html).group(1))
+        tree_chunks = [
+            json.loads(chunk)
+            for chunk in re.findall(
+                r'<script type="application/json" id="tree_123456-chunk-\d+">(.*)</script>',
+                html,
+            )
+        ]
+        return tree_data, tree_chunks
+
+    @patch(PATCH_UUID_PATH)
+    def test_tree_to_html_expand_depth(self, mock_uuid4, tree_node_style2):
+        mock_uuid4.return_value.hex = "123456"
+        html = export.tree_to_html(
+            tree_node_style2, attr_list=["age"], expand_depth=2, chunk_size=1
+        )
+        tree_data, tree_chunks = self.get_lazy_tree_data(html)
+        assert tree_data == {
+            "name": "a",
+            "age": 90,
+            "children": [
+                {"name": "b", "age": "65", "_id": 0},
+                {"name": "c", "age": 60, "_id": 1},
+            ],
+        }
+        assert tree_chunks == [
+            {"0": [{"name": "d", "age": None}, {"name": "e", "age": None, "_id": 2}]},
+            {"1": [{"name": "f", "age": None}]},
+            {"2": [{"name": "g", "age": 10}, {"name": "h", "age": 6}]},
+        ]
+        assert "const chunkSize = 1;" in html
+
+    @patch(PATCH_UUID_PATH)
+    def test_tree_to_html_expand_depth_chunk_size(self, mock_uuid4, tree_node_style2):
+        mock_uuid4.return_value.hex = "123456"
+        html = export.tree_to_html(tree_node_style2, expand_depth=1)
+        tree_data, tree_chunks = self.get_lazy_tree_data(html)
+        assert tree_data == {"name": "a", "_id": 0}
+        assert tree_chunks == [
+            {
+                "0": [{"name": "b", "_id": 1}, {"name": "c", "_id": 2}],
+                "1": [{"name": "d"}, {"name": "e", "_id": 3}],
+                "2": [{"name": "f"}],
+                "3": [{"name": "g"}, {"name": "h"}],
+            }
+        ]
+
+    @patch(PATCH_UUID_PATH)
+    def test_tree_to_html_expand_depth_whole_tree(self, mock_uuid4, tree_node_style2):
+        mock_uuid4.return_value.hex = "123456"
+        html = export.tree_to_html(tree_node_style2, expand_depth=4)
+        tree_data, tree_chunks = self.get_lazy_tree_data(html)
+        assert tree_data == export.tree_to_nested_dict(tree_node_style2)
+        assert not tree_chunks
+
+    @patch(PATCH_UUID_PATH)
+    def test_tree_to_html_expand_depth_escape(self, mock_uuid4, tree_node_style2):
+        mock_uuid4.return_value.hex = "123456"
+        tree_node_style2["b"].name = "</script>"
+        html = export.tree_to_html(tree_node_style2, expand_depth=1)
+        assert html.count("</script>") == 2
+        _, tree_chunks = self.get_lazy_tree_data(html)
+        assert tree_chunks[0]["0"][0]["name"] == "</script>"
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "expand_depth, chunk_size",
+        [(-1, 1000), (1, 0)],
+    )
+    def test_tree_to_html_expand_depth_error(tree_node, expand_depth, chunk_size):
+        with pytest.raises(ValueError) as exc_info:
+            export.tree_to_html(
+                tree_node, expand_depth=expand_depth, chunk_size=chunk_size
+            )
+        assert str(
+            exc_info.value
+        ) == Constants.ERROR_NODE_EXPORT_HTML_EXPAND_DEPTH.format(
+            expand_depth=expand_depth, chunk_size=chunk_size
+        )
@@ -1,11 +1,28 @@
+import io
+import os
+import tempfile
+
 import matplotlib as mpl
 import pydot
 import pytest
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 
+from bigtree.node import node
 from bigtree.tree import export
 from tests.test_constants import Constants
 
 LOCAL = Constants.LOCAL
+FONT_FAMILY = "assets/DejaVuSans.ttf"
+
+
+def assert_tiles_equal_image(tile_paths, tile_size, image):
+    stitched_image = Image.new("RGB", image.size)
+    for tile_path in tile_paths:
+        row, col = os.path.splitext(os.path.basename(tile_path))[0].split("_")[1:]
+        tile = Image.open(tile_path)
+        assert tile.width <= tile_size[0] and tile.height <= tile_size[1]
+        stitched_image.paste(tile, (int(col) * tile_size[0], int(row) * tile_size[1]))
+    assert ImageChops.difference(stitched_image, image).getbbox() is None
 
 
 class TestTreeToDot:
@@ -719,6 +736,140 @@ class TestTreeToDot:
             ), f"Expected {expected_str} not in actual string"
 
 
+class TestTreeToDotFile:
+    @staticmethod
+    def test_tree_to_dot_file(tree_node):
+        dot_file = io.StringIO()
+        export.tree_to_dot_file(tree_node, dot_file)
+        assert dot_file.getvalue() == export.tree_to_dot(tree_node).to_string()
+
+    @staticmethod
+    def test_tree_to_dot_file_style(tree_node_style, tree_node_style_callable):
+        for tree, kwargs in [
+            (tree_node_style, dict(directed=False, rankdir="LR", bg_colour="beige")),
+            (
+                tree_node_style,
+                dict(node_colour="gold", node_shape="square", edge_colour="red"),
+            ),
+            (tree_node_style, dict(node_attr="node_style", edge_attr="edge_style")),
+            (
+                tree_node_style_callable,
+                dict(
+                    node_colour="gold",
+                    node_attr=lambda _node: (
+                        {"shape": "square"} if _node.is_leaf else {"shape": "circle"}
+                    ),
+                    edge_attr=lambda _node: {"label": _node.get_attr("style", "")},
+                ),
+            ),
+        ]:
+            dot_file = io.StringIO()
+            export.tree_to_dot_file(tree, dot_file, **kwargs)
+            assert dot_file.getvalue() == export.tree_to_dot(tree, **kwargs).to_string()
+
+    @staticmethod
+    def test_tree_to_dot_file_multiple(tree_node, tree_node_plot):
+        dot_file = io.StringIO()
+        export.tree_to_dot_file([tree_node, tree_node_plot], dot_file)
+        assert (
+            dot_file.getvalue()
+            == export.tree_to_dot([tree_node, tree_node_plot]).to_string()
+        )
+
+    @staticmethod
+    def test_tree_to_dot_file_duplicate_names(tree_node_duplicate_names):
+        dot_file = io.StringIO()
+        export.tree_to_dot_file(tree_node_duplicate_names, dot_file)
+        assert (
+            dot_file.getvalue()
+            == export.tree_to_dot(tree_node_duplicate_names).to_string()
+        )
+
+    @staticmethod
+    def test_tree_to_dot_file_quote():
+        root = node.Node("a b", edge_style={"label": "edge label"})
+        _ = node.Node('say "hi"', parent=root, edge_style={"label": 'say "hi"'})
+        _ = node.Node("node", parent=root, edge_style={"penwidth": 1.5})
+        _ = node.Node("1", parent=root, edge_style={"constraint": False})
+        dot_file = io.StringIO()
+        export.tree_to_dot_file(root, dot_file, edge_attr="edge_style")
+        expected = (
+            "strict digraph G {\n"
+            "rankdir=TB;\n"
+            '"a b0" [label="a b"];\n'
+            '"say \\"hi\\"0" [label="say \\"hi\\""];\n'
+            '"a b0" -> "say \\"hi\\"0" [label="say \\"hi\\""];\n'
+            'node0 [label="node"];\n'
+            '"a b0" -> node0 [penwidth=1.5];\n'
+            "10 [label=1];\n"
+            '"a b0" -> 10 [constraint=false];\n'
+            "}\n"
+        )
+        assert dot_file.getvalue() == expected
+        assert dot_file.getvalue() == (
+            export.tree_to_dot(root, edge_attr="edge_style").to_string()
+        )
+
+    @staticmethod
+    def test_tree_to_dot_file_quote_same_as_pydot():
+        root = node.Node("ab_1", edge_style={"label": "ab_1"})
+        _ = node.Node("ü", parent=root, edge_style={"label": "ü"})
+        _ = node.Node("1a", parent=root, edge_style={"label": "-1.5"})
+        _ = node.Node("a:b", parent=root, edge_style={"label": "graph"})
+        _ = node.Node("<b>", parent=root, edge_style={"label": "<<b>a</b>>"})
+        dot_file = io.StringIO()
+        export.tree_to_dot_file(root, dot_file, edge_attr="edge_style")
+        expected = (
+            "strict digraph G {\n"
+            "rankdir=TB;\n"
+            'ab_10 [label="ab_1"];\n'
+            "ü0 [label=ü];\n"
+            "ab_10 -> ü0 [label=ü];\n"
+            '"1a0" [label="1a"];\n'
+            'ab_10 -> "1a0" [label="-1.5"];\n'
+            'a [label="a:b"];\n'
+            'ab_10 -> a:b0 [label="graph"];\n'
+            '"<b>0" [label=<b>];\n'
+            'ab_10 -> "<b>0" [label=<<b>a</b>>];\n'
+            "}\n"
+        )
+        assert dot_file.getvalue() == expected
+        assert dot_file.getvalue() == (
+            export.tree_to_dot(root, edge_attr="edge_style").to_string()
+        )
+
+    @staticmethod
+    def test_tree_to_dot_file_path(tree_node):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tree.dot")
+            export.tree_to_dot_file(tree_node, path, node_colour="gold")
+            with open(path, encoding="utf-8") as fp:
+                actual = fp.read()
+        assert actual == export.tree_to_dot(tree_node, node_colour="gold").to_string()
+
+    @staticmethod
+    def test_tree_to_dot_file_deep():
+        depth = 5000
+        nodes = [node.Node(str(idx)) for idx in range(depth)]
+        for parent, child in reversed(list(zip(nodes, nodes[1:]))):
+            child.parent = parent
+        dot_file = io.StringIO()
+        export.tree_to_dot_file(nodes[0], dot_file)
+        lines = dot_file.getvalue().splitlines()
+        assert len(lines) == 2 * depth + 2
+        assert lines[-3:] == [
+            f"{depth - 1}0 [label={depth - 1}];",
+            f"{depth - 2}0 -> {depth - 1}0;",
+            "}",
+        ]
+
+    @staticmethod
+    def test_tree_to_dot_file_type_error(dag_node):
+        with pytest.raises(TypeError) as exc_info:
+            export.tree_to_dot_file(dag_node, io.StringIO())
+        assert str(exc_info.value) == Constants.ERROR_NODE_TYPE.format(type="Node")
+
+
 class TestTreeToPillowGraph:
     @staticmethod
     def test_tree_to_pillow_graph(tree_node):
@@ -859,6 +1010,86 @@ class TestTreeToPillowGraph:
             )
 
 
+class TestTreeToPillowGraphTiles:
+    @staticmethod
+    def test_tree_to_pillow_graph_tiles(tree_node):
+        tile_size = (50, 30)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tile_paths = export.tree_to_pillow_graph_tiles(
+                tree_node, tmp_dir, tile_size=tile_size, font_family=FONT_FAMILY
+            )
+            pillow_image = export.tree_to_pillow_graph(
+                tree_node, font_family=FONT_FAMILY
+            )
+            assert len(tile_paths) == -(-pillow_image.width // 50) * -(
+                -pillow_image.height // 30
+            )
+            assert tile_paths[:2] == [
+                os.path.join(tmp_dir, "tile_0_0.png"),
+                os.path.join(tmp_dir, "tile_0_1.png"),
+            ]
+            assert_tiles_equal_image(tile_paths, tile_size, pillow_image)
+
+    @staticmethod
+    def test_tree_to_pillow_graph_tiles_kwargs(tree_node):
+        tile_size = (64, 41)
+        kwargs = dict(
+            node_content="{node_name}\nAge: {age}",
+            rect_fill=mpl.colormaps["Blues"],
+            rect_cmap_attr="age",
+            rect_width=3,
+            width_buffer=13.5,
+            height_buffer=7.3,
+            text_align="left",
+            font_family=FONT_FAMILY,
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tile_paths = export.tree_to_pillow_graph_tiles(
+                tree_node, tmp_dir, tile_size=tile_size, file_format="bmp", **kwargs
+            )
+            assert all(tile_path.endswith(".bmp") for tile_path in tile_paths)
+            assert_tiles_equal_image(
+                tile_paths, tile_size, export.tree_to_pillow_graph(tree_node, **kwargs)
+            )
+
+    @staticmethod
+    def test_tree_to_pillow_graph_tiles_new_directory(tree_node):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tile_dir = os.path.join(tmp_dir, "tiles", "graph")
+            tile_paths = export.tree_to_pillow_graph_tiles(
+                tree_node, tile_dir, font_family=FONT_FAMILY
+            )
+            assert tile_paths == [os.path.join(tile_dir, "tile_0_0.png")]
+            assert os.path.isfile(tile_paths[0])
+
+    @staticmethod
+    @pytest.mark.parametrize("tile_size", [(0, 10), (10, -1)])
+    def test_tree_to_pillow_graph_tiles_tile_size_error(tree_node, tile_size):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with pytest.raises(ValueError) as exc_info:
+                export.tree_to_pillow_graph_tiles(
+                    tree_node, tmp_dir, tile_size=tile_size, font_family=FONT_FAMILY
+                )
+            assert not os.listdir(tmp_dir)
+        assert str(
+            exc_info.value
+        ) == Constants.ERROR_NODE_EXPORT_PILLOW_TILE_SIZE.format(tile_size=tile_size)
+
+    @staticmethod
+    def test_tree_to_pillow_graph_text_cache(tree_node):
+        from bigtree.tree.export import images
+
+        for _node in tree_node.descendants:
+            _node.label = "same label"
+        images._get_text_bbox.cache_clear()
+        export.tree_to_pillow_graph(
+            tree_node, node_content="{label}", font_family=FONT_FAMILY
+        )
+        cache_info = images._get_text_bbox.cache_info()
+        assert cache_info.misses == 2
+        assert cache_info.hits == 6
+
+
 class TestTreeToPillow:
     @staticmethod
     def test_tree_to_pillow(tree_node):
@@ -896,6 +1127,24 @@ class TestTreeToPillow:
         if LOCAL:
             pillow_image.save(f"{Constants.LOCAL_FILE}/test_tree_to_pillow_kwargs.png")
 
+    @staticmethod
+    def test_tree_to_pillow_multiline_name(tree_node):
+        tree_node["b"].name = "line1\nline2"
+        _ = node.Node("i\nj\nk", parent=tree_node["c"])
+        pillow_image = export.tree_to_pillow(tree_node, font_family=FONT_FAMILY)
+
+        # Same pixels as drawing the text of print_tree as one multi-line text
+        font = ImageFont.truetype(FONT_FAMILY, 12)
+        expected_image = Image.new("RGB", pillow_image.size, "white")
+        image_text = "".join(
+            f"{branch}{stem}{_node.node_name}\n"
+            for branch, stem, _node in export.yield_tree(tree_node)
+        )
+        ImageDraw.Draw(expected_image).text(
+            (10, 10), image_text, font=font, fill="black"
+        )
+        assert ImageChops.difference(pillow_image, expected_image).getbbox() is None
+
     @staticmethod
     def test_tree_to_pillow_font_family(tree_node):
         font_family = "invalid.ttf"
@@ -1439,3 +1688,223 @@ class TestTreeToMermaid:
             """classDef class0-0-1-1 fill:red,stroke:black,stroke-width:2\n```"""
         )
         assert mermaid_md == expected_str
+
+
+class TestTreeToMermaidFile:
+    @staticmethod
+    def test_tree_to_mermaid_file(tree_node):
+        mermaid_file = io.StringIO()
+        export.tree_to_mermaid_file(tree_node, mermaid_file)
+        expected_str = (
+            """```mermaid\n"""
+            """%%{ init: { \'flowchart\': { \'curve\': \'basis\' } } }%%\n"""
+            """flowchart TB\n"""
+            """classDef default stroke-width:1\n"""
+            """0("a") --> 1("b")\n"""
+            """1 --> 2("d")\n"""
+            """1 --> 3("e")\n"""
+            """3 --> 4("g")\n"""
+            """3 --> 5("h")\n"""
+            """0 --> 6("c")\n"""
+            """6 --> 7("f")\n"""
+            """```"""
+        )
+        assert mermaid_file.getvalue() == expected_str
+
+    @staticmethod
+    def test_tree_to_mermaid_file_style(tree_node_mermaid_style):
+        mermaid_file = io.StringIO()
+        export.tree_to_mermaid_file(
+            tree_node_mermaid_style,
+            mermaid_file,
+            title="Mermaid Diagram",
+            theme="forest",
+            rankdir="LR",
+            line_shape="linear",
+            node_colour="gold",
+            node_border_colour="black",
+            node_border_width=2,
+            node_shape="stadium",
+            node_shape_attr="node_shape",
+            edge_arrow="bold",
+            edge_arrow_attr="edge_arrow",
+            edge_label="label",
+            node_attr="attr",
+        )
+        expected_str = (
+            """```mermaid\n"""
+            """---\ntitle: Mermaid Diagram\n---\n"""
+            """%%{ init: { \'flowchart\': { \'curve\': \'linear\' }, \'theme\': \'forest\' } }%%\n"""
+            """flowchart LR\n"""
+            """classDef default fill:gold,stroke:black,stroke-width:2\n"""
+            """classDef class0 fill:green,stroke:black\n"""
+            """0{"a"} -.-> 1(["b"]):::class0\n"""
+            """1 ==>|c-d link| 2(["d"])\n"""
+            """1 ==>|c-e link| 3(["e"])\n"""
+            """classDef class1 fill:red,stroke:black,stroke-width:2\n"""
+            """3 ==> 4(["g"]):::class1\n"""
+            """3 ==> 5(["h"]):::class1\n"""
+            """0 -.- 6(["c"])\n"""
+            """6 ==> 7(["f"])\n"""
+            """```"""
+        )
+        assert mermaid_file.getvalue() == expected_str
+
+    @staticmethod
+    def test_tree_to_mermaid_file_node_attr_root(tree_node_no_attr):
+        def get_node_attr(_node):
+            if _node.node_name in ["a", "b"]:
+                return "fill:green,stroke:black"
+            return ""
+
+        mermaid_file = io.StringIO()
+        export.tree_to_mermaid_file(
+            tree_node_no_attr,
+            mermaid_file,
+            node_attr=get_node_attr,
+            node_shape_attr=lambda _node: "circle" if _node.is_leaf else "rhombus",
+            edge_arrow_attr=lambda _node: "dotted" if _node.is_leaf else "normal",
+            max_depth=2,
+        )
+        expected_str = (
+            """```mermaid\n"""
+            """%%{ init: { \'flowchart\': { \'curve\': \'basis\' } } }%%\n"""
+            """flowchart TB\n"""
+            """classDef default stroke-width:1\n"""
+            """classDef class0 fill:green,stroke:black\n"""
+            """0{"a"}:::class0 --> 1{"b"}:::class0\n"""
+            """0 --> 2{"c"}\n"""
+            """```"""
+        )
+        assert mermaid_file.getvalue() == expected_str
+
+    @staticmethod
+    def test_tree_to_mermaid_file_node_name_or_path(tree_node):
+        mermaid_file = io.StringIO()
+        export.tree_to_mermaid_file(tree_node, mermaid_file, node_name_or_path="e")
+        expected_str = (
+            """```mermaid\n"""
+            """%%{ init: { \'flowchart\': { \'curve\': \'basis\' } } }%%\n"""
+            """flowchart TB\n"""
+            """classDef default stroke-width:1\n"""
+            """0("e") --> 1("g")\n"""
+            """0 --> 2("h")\n"""
+            """```"""
+        )
+        assert mermaid_file.getvalue() == expected_str
+
+    @staticmethod
+    def test_tree_to_mermaid_file_root(tree_node):
+        mermaid_file = io.StringIO()
+        export.tree_to_mermaid_file(tree_node, mermaid_file, max_depth=1)
+        expected_str = (
+            """```mermaid\n"""
+            """%%{ init: { \'flowchart\': { \'curve\': \'basis\' } } }%%\n"""
+            """flowchart TB\n"""
+            """classDef default stroke-width:1\n"""
+            """0("a")\n"""
+            """```"""
+        )
+        assert mermaid_file.getvalue() == expected_str
+
+    @staticmethod
+    def test_tree_to_mermaid_file_path(tree_node):
+        mermaid_file = io.StringIO()
+        export.tree_to_mermaid_file(tree_node, mermaid_file)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tree.md")
+            export.tree_to_mermaid_file(tree_node, path)
+            with open(path, encoding="utf-8") as fp:
+                assert fp.read() == mermaid_file.getvalue()
+
+    @staticmethod
+    def test_tree_to_mermaid_file_deep():
+        depth = 5000
+        nodes = [node.Node(str(idx)) for idx in range(depth)]
+        for parent, child in reversed(list(zip(nodes, nodes[1:]))):
+            child.parent = parent
+        mermaid_file = io.StringIO()
+        export.tree_to_mermaid_file(nodes[0], mermaid_file)
+        lines = mermaid_file.getvalue().splitlines()
+        assert len(lines) == depth + 4
+        assert lines[-2] == f'{depth - 2} --> {depth - 1}("{depth - 1}")'
+
+    @staticmethod
+    def test_tree_to_mermaid_file_node_name_or_path_error(tree_node):
+        with pytest.raises(ValueError) as exc_info:
+            export.tree_to_mermaid_file(tree_node, io.StringIO(), node_name_or_path="z")
+        assert str(
+            exc_info.value
+        ) == Constants.ERROR_NODE_EXPORT_PRINT_INVALID_PATH.format(
+            node_name_or_path="z"
+        )
+
+    @staticmethod
+    def test_tree_to_mermaid_file_invalid_style_error(tree_node):
+        with pytest.raises(ValueError) as exc_info:
+            export.tree_to_mermaid_file(tree_node, io.StringIO(), node_border_width=0)
+        assert str(exc_info.value) == Constants.ERROR_NODE_MERMAID_INVALID_STYLE
+
+
+class TestTreeToPillowTiles:
+    @staticmethod
+    def test_tree_to_pillow_tiles(tree_node):
+        tile_size = (20, 40)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tile_paths = export.tree_to_pillow_tiles(
+                tree_node, tmp_dir, tile_size=tile_size, font_family=FONT_FAMILY
+            )
+            assert_tiles_equal_image(
+                tile_paths,
+                tile_size,
+                export.tree_to_pillow(tree_node, font_family=FONT_FAMILY),
+            )
+
+    @staticmethod
+    def test_tree_to_pillow_tiles_kwargs(tree_node):
+        tile_size = (33, 17)
+        kwargs = dict(
+            start_pos=(3, 7),
+            font_size=20,
+            font_colour="red",
+            bg_colour="lightblue",
+            max_depth=3,
+            style="const_bold",
+            font_family=FONT_FAMILY,
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tile_paths = export.tree_to_pillow_tiles(
+                tree_node, tmp_dir, tile_size=tile_size, **kwargs
+            )
+            assert_tiles_equal_image(
+                tile_paths, tile_size, export.tree_to_pillow(tree_node, **kwargs)
+            )
+
+    @staticmethod
+    def test_tree_to_pillow_tiles_multiline_name(tree_node):
+        tree_node["b"].name = "line1\nline2"
+        tile_size = (30, 15)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tile_paths = export.tree_to_pillow_tiles(
+                tree_node, tmp_dir, tile_size=tile_size, font_family=FONT_FAMILY
+            )
+            assert_tiles_equal_image(
+                tile_paths,
+                tile_size,
+                export.tree_to_pillow(tree_node, font_family=FONT_FAMILY),
+            )
+
+    @staticmethod
+    def test_tree_to_pillow_tiles_width_height(tree_node):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tile_paths = export.tree_to_pillow_tiles(
+                tree_node,
+                tmp_dir,
+                tile_size=(100, 100),
+                width=250,
+                height=220,
+                font_family=FONT_FAMILY,
+            )
+            assert len(tile_paths) == 9
+            assert os.path.basename(tile_paths[-1]) == "tile_2_2.png"
+            assert Image.open(tile_paths[-1]).size == (50, 20)
@@ -1,8 +1,11 @@
 import io
+import os
+import tempfile
 
 import pytest
 
-from bigtree.tree import export
+from bigtree.node import node
+from bigtree.tree import export, helper
 from tests.conftest import assert_print_statement
 from tests.test_constants import Constants
 
@@ -548,6 +551,79 @@ class TestPrintTree:
         export.print_tree(tree_node, file=output)
         assert output.getvalue() == tree_node_no_attr_str
 
+    @staticmethod
+    def test_print_tree_offset_limit(tree_node):
+        expected_str = "│   └── e\n" "│       ├── g\n" "│       └── h\n"
+        assert_print_statement(
+            export.print_tree,
+            expected_str,
+            tree=tree_node,
+            offset=3,
+            limit=3,
+        )
+
+    @staticmethod
+    def test_print_tree_offset_limit_out_of_range(tree_node):
+        assert_print_statement(
+            export.print_tree,
+            "    └── f\n",
+            tree=tree_node,
+            offset=7,
+            limit=10,
+        )
+        assert_print_statement(export.print_tree, "", tree=tree_node, limit=0)
+
+    @staticmethod
+    def test_print_tree_offset_limit_error(tree_node):
+        for offset, limit in [(-1, None), (0, -1)]:
+            with pytest.raises(ValueError) as exc_info:
+                export.print_tree(tree_node, offset=offset, limit=limit)
+            assert str(
+                exc_info.value
+            ) == Constants.ERROR_NODE_EXPORT_PRINT_OFFSET_LIMIT.format(
+                offset=offset, limit=limit
+            )
+
+    @staticmethod
+    def test_print_tree_collapse_after(tree_node):
+        expected_str = (
+            "a [age=90]\n"
+            "├── b [age=65]\n"
+            "│   ├── d [age=40]\n"
+            "│   └── ... 1 more child\n"
+            "└── ... 1 more child\n"
+        )
+        assert_print_statement(
+            export.print_tree,
+            expected_str,
+            tree=tree_node,
+            attr_list=["age"],
+            collapse_after=1,
+        )
+
+    @staticmethod
+    def test_print_tree_collapse_after_wide():
+        root = node.Node("a", children=[node.Node(str(idx)) for idx in range(12347)])
+        expected_str = "a\n" "├── 0\n" "├── 1\n" "└── ... 12,345 more children\n"
+        assert_print_statement(
+            export.print_tree,
+            expected_str,
+            tree=root,
+            collapse_after=2,
+        )
+
+    @staticmethod
+    def test_print_tree_deep():
+        depth = 5000
+        nodes = [node.Node(str(idx)) for idx in range(depth)]
+        for parent, child in reversed(list(zip(nodes, nodes[1:]))):
+            child.parent = parent
+        output = io.StringIO()
+        export.print_tree(nodes[0], file=output)
+        lines = output.getvalue().splitlines()
+        assert len(lines) == depth
+        assert lines[-1] == " " * 4 * (depth - 2) + f"└── {depth - 1}"
+
     # rich format
     @staticmethod
     def test_print_tree_rich(tree_node):
@@ -678,6 +754,23 @@ class TestPrintTree:
         )
 
 
+class TestYieldTree:
+    @staticmethod
+    def test_yield_tree_lazy(tree_node):
+        tree_view = helper.get_subtree_view(tree_node)
+        tree_iter = iter(export.yield_tree(tree_view))
+        assert [next(tree_iter)[2].node_name for _ in range(3)] == ["a", "b", "d"]
+        assert tree_view["c"]._view_children is None
+        assert tree_view["b"]["e"]._view_children is None
+
+    @staticmethod
+    def test_yield_tree_binary_node(binarytree_node):
+        assert [
+            f"{branch}{stem}{_node.node_name}"
+            for branch, stem, _node in export.yield_tree(binarytree_node["2"])
+        ] == ["2", "├── 4", "│   └── 8", "└── 5"]
+
+
 class TestHPrintTree:
     @staticmethod
     def test_hprint_tree(tree_node):
@@ -829,6 +922,18 @@ class TestHPrintTree:
             strip=False,
         )
 
+    @staticmethod
+    def test_hprint_tree_deep():
+        depth = 5000
+        nodes = [node.Node(str(idx % 10)) for idx in range(depth)]
+        for parent, child in reversed(list(zip(nodes, nodes[1:]))):
+            child.parent = parent
+        output = io.StringIO()
+        export.hprint_tree(nodes[0], file=output)
+        assert output.getvalue() == (
+            "─ " + " ─── ".join(_node.node_name for _node in nodes) + "\n"
+        )
+
     @staticmethod
     def test_hprint_tree_long_root_name_length(tree_node):
         tree_node.name = "abcdefghijkl"
@@ -871,6 +976,17 @@ class TestHPrintTree:
             node_name_or_path="b",
         )
 
+    @staticmethod
+    def test_hprint_tree_child_node_name_diff_node_name_length(tree_node):
+        # Padding of each depth is based on the nodes printed, not the nodes of the whole tree
+        tree_node["c"].name = "cccccc"
+        assert_print_statement(
+            export.hprint_tree,
+            tree_node_branch_hstr,
+            tree=tree_node,
+            node_name_or_path="b",
+        )
+
     @staticmethod
     def test_hprint_tree_child_node_name_error(tree_node):
         node_name_or_path = "bb"
@@ -1587,6 +1703,18 @@ class TestVPrintTree:
             spacing=4,
         )
 
+    @staticmethod
+    def test_vprint_tree_deep():
+        depth = 5000
+        nodes = [node.Node(str(idx % 10)) for idx in range(depth)]
+        for parent, child in reversed(list(zip(nodes, nodes[1:]))):
+            child.parent = parent
+        output = io.StringIO()
+        export.vprint_tree(nodes[0], file=output)
+        lines = output.getvalue().splitlines()
+        assert len(lines) == 4 * depth - 1
+        assert lines[-4:] == ["  │  ", "┌─┴─┐", "│ 9 │", "└───┘"]
+
     @staticmethod
     def test_vprint_tree_strip(tree_node):
         expected_str = (
@@ -2218,3 +2346,54 @@ class TestTreeToNewick:
         )
         expected_str = "(((ADH2:0.1[&&NHX:S=human;E=1.1.1.1],ADH1:0.11[&&NHX:S=human;E=1.1.1.1]):0.05[&&NHX:S=Primates;E=1.1.1.1;D=Y;B=100],ADHY:0.1[&&NHX:S=nematode;E=1.1.1.1],ADHX:0.12[&&NHX:S=insect;E=1.1.1.1]):0.1[&&NHX:S=Metazoa;E=1.1.1.1;D=N],(ADH4:0.09[&&NHX:S=yeast;E=1.1.1.1],ADH3:0.13[&&NHX:S=yeast;E=1.1.1.1],ADH2:0.12[&&NHX:S=yeast;E=1.1.1.1],ADH1:0.11[&&NHX:S=yeast;E=1.1.1.1]):0.1[&&NHX:S=Fungi])[&&NHX:E=1.1.1.1;D=N]"
         assert newick_str == expected_str
+
+    @staticmethod
+    def test_tree_to_newick_deep():
+        from bigtree.tree import construct
+
+        depth = 5000
+        nested_dict = {"name": "0"}
+        _dict = nested_dict
+        for idx in range(1, depth):
+            _dict["children"] = [{"name": str(idx)}]
+            _dict = _dict["children"][0]
+        root = construct.nested_dict_to_tree(nested_dict)
+        newick_str = export.tree_to_newick(root)
+        expected_str = (
+            "(" * (depth - 1)
+            + f"{depth - 1}"
+            + "".join(f"){idx}" for idx in range(depth - 2, -1, -1))
+        )
+        assert newick_str == expected_str
+
+
+class TestTreeToNewickFile:
+    @staticmethod
+    def test_tree_to_newick_file(tree_node):
+        fp = io.StringIO()
+        export.tree_to_newick_file(tree_node, fp)
+        assert fp.getvalue() == export.tree_to_newick(tree_node)
+
+    @staticmethod
+    def test_tree_to_newick_file_length_attr_list(tree_node):
+        fp = io.StringIO()
+        export.tree_to_newick_file(
+            tree_node, fp, length_attr="age", attr_list=["age"], attr_sep=";"
+        )
+        expected_str = "((d:40[&&NHX:age=40],(g:10[&&NHX:age=10],h:6[&&NHX:age=6])e:35[&&NHX:age=35])b:65[&&NHX:age=65],(f:38[&&NHX:age=38])c:60[&&NHX:age=60])a[&&NHX:age=90]"
+        assert fp.getvalue() == expected_str
+
+    @staticmethod
+    def test_tree_to_newick_file_path(tree_node):
+        from bigtree.tree import construct
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tree.nwk")
+            export.tree_to_newick_file(tree_node, path, length_attr="age")
+            with open(path, encoding="utf-8") as fp:
+                assert fp.read() == "((d:40,(g:10,h:6)e:35)b:65,(f:38)c:60)a"
+            with open(path, encoding="utf-8") as fp:
+                root = construct.newick_to_tree(fp, length_attr="age")
+        assert export.tree_to_newick(root, length_attr="age") == export.tree_to_newick(
+            tree_node, length_attr="age"
+        )
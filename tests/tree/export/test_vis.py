@@ -1,3 +1,11 @@
+import io
+import json
+import os
+import tempfile
+
+import pytest
+
+from bigtree.node import node
 from bigtree.tree import export
 from tests.test_constants import Constants
 
@@ -87,3 +95,166 @@ class TestTreeToVis:
             net.save_graph(
                 f"{Constants.LOCAL_FILE}/test_tree_to_vis_network_kwargs.html"
             )
+
+    @staticmethod
+    def test_tree_to_vis_node_ids(tree_node):
+        net = export.tree_to_vis(tree_node)
+        assert net.get_nodes() == [
+            "/a",
+            "/a/b",
+            "/a/b/d",
+            "/a/b/e",
+            "/a/b/e/g",
+            "/a/b/e/h",
+            "/a/c",
+            "/a/c/f",
+        ]
+        assert net.get_node("/a/b/e") == {
+            "id": "/a/b/e",
+            "label": "e",
+            "x": 100.0,
+            "y": 200.0,
+            "value": 10,
+            "title": "e",
+            "shape": "dot",
+            "color": "#97c2fc",
+        }
+        assert net.get_edges()[:2] == [
+            {"from": "/a/b", "to": "/a"},
+            {"from": "/a/b/d", "to": "/a/b"},
+        ]
+
+    @staticmethod
+    def test_tree_to_vis_node_name_or_path(tree_node):
+        net = export.tree_to_vis(tree_node, node_name_or_path="e")
+        assert net.get_nodes() == ["/e", "/e/g", "/e/h"]
+        assert [_edge["from"] for _edge in net.get_edges()] == ["/e/g", "/e/h"]
+
+    @staticmethod
+    def test_tree_to_vis_kwargs_coordinates(tree_node):
+        net = export.tree_to_vis(tree_node)
+        expected = {
+            _node["id"]: (_node["x"], _node["y"])
+            for _node in net.nodes
+            if _node["id"].startswith("/a/b")
+        }
+        net = export.tree_to_vis(tree_node, node_name_or_path="b")
+        actual = {f"/a{_node['id']}": (_node["x"], _node["y"]) for _node in net.nodes}
+        assert actual == expected
+
+    @staticmethod
+    def test_tree_to_vis_max_nodes(tree_node):
+        net = export.tree_to_vis(tree_node, max_nodes=4)
+        assert net.get_nodes() == ["/a", "/a/b", "/a/b/", "/a/c", "/a/c/f"]
+        assert net.get_node("/a/b/") == {
+            "id": "/a/b/",
+            "label": "+4",
+            "x": 0.0,
+            "y": 200.0,
+            "value": 10,
+            "title": "4 nodes collapsed",
+            "shape": "box",
+            "color": "#97c2fc",
+        }
+        assert {"from": "/a/b/", "to": "/a/b"} in net.get_edges()
+        if LOCAL:
+            net.save_graph(f"{Constants.LOCAL_FILE}/test_tree_to_vis_max_nodes.html")
+
+    @staticmethod
+    def test_tree_to_vis_max_nodes_root(tree_node):
+        net = export.tree_to_vis(tree_node, max_nodes=1)
+        assert net.get_nodes() == ["/a", "/a/"]
+        assert net.get_node("/a/")["label"] == "+7"
+
+    @staticmethod
+    def test_tree_to_vis_max_nodes_all(tree_node):
+        net = export.tree_to_vis(tree_node, max_nodes=8)
+        assert net.get_nodes() == export.tree_to_vis(tree_node).get_nodes()
+
+    @staticmethod
+    def test_tree_to_vis_max_nodes_error(tree_node):
+        with pytest.raises(ValueError) as exc_info:
+            export.tree_to_vis(tree_node, max_nodes=-1)
+        assert str(exc_info.value) == Constants.ERROR_NODE_EXPORT_VIS_MAX_NODES.format(
+            max_nodes=-1
+        )
+
+
+class TestTreeToVisJson:
+    @staticmethod
+    def test_tree_to_vis_json(tree_node):
+        json_file = io.StringIO()
+        export.tree_to_vis_json(tree_node, json_file)
+        vis_data = json.loads(json_file.getvalue())
+        net = export.tree_to_vis(tree_node)
+        assert vis_data["nodes"] == [
+            {k: v for k, v in _node.items() if k not in ["shape", "color"]}
+            for _node in net.nodes
+        ]
+        assert vis_data["edges"] == net.edges
+
+    @staticmethod
+    def test_tree_to_vis_json_max_nodes(tree_node):
+        json_file = io.StringIO()
+        export.tree_to_vis_json(tree_node, json_file, max_nodes=4)
+        vis_data = json.loads(json_file.getvalue())
+        assert [_node["id"] for _node in vis_data["nodes"]] == [
+            "/a",
+            "/a/b",
+            "/a/b/",
+            "/a/c",
+            "/a/c/f",
+        ]
+        assert vis_data["nodes"][2]["shape"] == "box"
+        assert len(vis_data["edges"]) == 4
+
+    @staticmethod
+    def test_tree_to_vis_json_kwargs(tree_node):
+        tree_node["b"].set_attrs({"node_weight": 10, "alias": "bb"})
+        json_file = io.StringIO()
+        export.tree_to_vis_json(
+            tree_node,
+            json_file,
+            alias="alias",
+            custom_node_kwargs={"title": "age"},
+            node_kwargs={"color": "black"},
+            custom_edge_kwargs={"width": "node_weight"},
+            edge_kwargs={"color": "grey"},
+        )
+        vis_data = json.loads(json_file.getvalue())
+        assert vis_data["nodes"][1] == {
+            "id": "/a/b",
+            "label": "bb",
+            "x": 50.0,
+            "y": 100.0,
+            "value": 10,
+            "color": "black",
+            "title": 65,
+        }
+        assert vis_data["edges"][:2] == [
+            {"from": "/a/b", "to": "/a", "color": "grey", "width": 10},
+            {"from": "/a/b/d", "to": "/a/b", "color": "grey"},
+        ]
+
+    @staticmethod
+    def test_tree_to_vis_json_chunks():
+        root = node.Node("0")
+        nodes = [root]
+        for idx in range(1, 2500):
+            nodes.append(node.Node(str(idx), parent=nodes[(idx - 1) // 50]))
+        json_file = io.StringIO()
+        export.tree_to_vis_json(root, json_file)
+        vis_data = json.loads(json_file.getvalue())
+        assert len(vis_data["nodes"]) == 2500
+        assert len(vis_data["edges"]) == 2499
+        assert vis_data["edges"][-1] == {"from": "/0/50", "to": "/0"}
+        assert {"from": "/0/49/2499", "to": "/0/49"} in vis_data["edges"]
+
+    @staticmethod
+    def test_tree_to_vis_json_path(tree_node):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tree.json")
+            export.tree_to_vis_json(tree_node, path)
+            with open(path) as fp:
+                vis_data = json.load(fp)
+        assert len(vis_data["nodes"]) == 8
@@ -3,7 +3,7 @@ import math
 import pytest
 
 from bigtree.node import basenode, node
-from bigtree.tree import export, helper
+from bigtree.tree import construct, export, helper
 from bigtree.utils import exceptions
 from tests.conftest import assert_print_statement
 from tests.node.test_basenode import (
@@ -66,6 +66,38 @@ class TestGetSubtree:
         assert subtree_node.children[1].path_name == ".b.e"
 
 
+class TestGetSubtreeView:
+    @staticmethod
+    def test_get_subtree_view(tree_node):
+        # Subtree is b/d, b/e/g, b/e/h
+        subtree_view = helper.get_subtree_view(tree_node, "a/b")
+        assert subtree_view.node_name == "b"
+        assert subtree_view.is_root
+        assert len(subtree_view.children) == 2
+        assert not len(subtree_view.children[0].children)
+        assert len(subtree_view.children[1].children) == 2
+        assert subtree_view.viewed_node is tree_node["b"]
+        assert tree_node["b"].parent is tree_node
+
+    @staticmethod
+    def test_get_subtree_view_max_depth(tree_node):
+        subtree_view = helper.get_subtree_view(tree_node, "a/b", max_depth=2)
+        assert [_node.node_name for _node in subtree_view.descendants] == ["d", "e"]
+
+    @staticmethod
+    def test_get_subtree_view_sep(tree_node):
+        tree_node.sep = "."
+        subtree_view = helper.get_subtree_view(tree_node, "a.b")
+        assert subtree_view.children[0].path_name == ".b.d"
+        assert subtree_view.children[1].path_name == ".b.e"
+
+    @staticmethod
+    def test_get_subtree_view_not_found_error(tree_node):
+        with pytest.raises(ValueError) as exc_info:
+            helper.get_subtree_view(tree_node, "a/z")
+        assert str(exc_info.value) == "Node name or path a/z not found"
+
+
 class TestPruneTree:
     @staticmethod
     def test_prune_tree(tree_node):
@@ -861,3 +893,420 @@ class TestTreeDiff:
         )
         actual = export.tree_to_dict(diff_node)
         assert actual == expected, f"Expected\n{expected}\nReceived\n{actual}"
+
+
+class TestGetSubtreeHashes:
+    @staticmethod
+    def test_get_subtree_hashes(tree_node):
+        hashes = helper.get_subtree_hashes(tree_node)
+        assert len(hashes) == 8
+        assert hashes[tree_node["b"]["d"]] != hashes[tree_node["c"]["f"]]
+
+    @staticmethod
+    def test_get_subtree_hashes_same_tree(tree_node):
+        tree_node_copy = tree_node.copy()
+        tree_node_copy["b"].children = list(reversed(tree_node_copy["b"].children))
+        assert (
+            helper.get_subtree_hashes(tree_node)[tree_node]
+            == helper.get_subtree_hashes(tree_node_copy)[tree_node_copy]
+        )
+
+    @staticmethod
+    def test_get_subtree_hashes_attr_list(tree_node):
+        tree_node_copy = tree_node.copy()
+        tree_node_copy["c"]["f"].age += 10
+        hashes = helper.get_subtree_hashes(tree_node, attr_list=["age"])
+        hashes_copy = helper.get_subtree_hashes(tree_node_copy, attr_list=["age"])
+        assert hashes[tree_node] != hashes_copy[tree_node_copy]
+        assert hashes[tree_node["b"]] == hashes_copy[tree_node_copy["b"]]
+
+        # Without attributes
+        assert (
+            helper.get_subtree_hashes(tree_node)[tree_node]
+            == helper.get_subtree_hashes(tree_node_copy)[tree_node_copy]
+        )
+
+
+class TestTreeDiffByHash:
+    @staticmethod
+    def test_tree_diff_by_hash(tree_node, tree_node_diff):
+        diff_node = helper.get_tree_diff_by_hash(tree_node, tree_node_diff)
+        assert_print_statement(
+            export.print_tree, EXPECTED_TREE_NODE_DIFF, tree=diff_node
+        )
+
+    @staticmethod
+    def test_tree_diff_by_hash_all_diff(tree_node, tree_node_diff):
+        diff_node = helper.get_tree_diff_by_hash(
+            tree_node, tree_node_diff, only_diff=False
+        )
+        assert_print_statement(
+            export.print_tree, EXPECTED_TREE_NODE_DIFF_ALL, tree=diff_node
+        )
+
+    @staticmethod
+    def test_tree_diff_by_hash_diff_sep_error(tree_node):
+        other_tree_node = helper.prune_tree(tree_node, "a/c")
+        other_tree_node.sep = "-"
+        with pytest.raises(ValueError) as exc_info:
+            helper.get_tree_diff_by_hash(tree_node, other_tree_node)
+        assert str(exc_info.value) == Constants.ERROR_NODE_TREE_DIFF_DIFF_SEP
+
+    @staticmethod
+    @pytest.mark.parametrize("symbol", [".", "-", "+", "~"])
+    def test_tree_diff_by_hash_sep(tree_node, tree_node_diff, symbol):
+        tree_node.sep = symbol
+        tree_node_diff.sep = symbol
+        diff_node = helper.get_tree_diff_by_hash(tree_node, tree_node_diff)
+        assert_print_statement(
+            export.print_tree, EXPECTED_TREE_NODE_DIFF, tree=diff_node
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ["only_diff", "detail", "aggregate"],
+        [
+            (True, True, False),
+            (True, False, True),
+            (True, True, True),
+            (False, True, False),
+            (False, False, True),
+            (False, True, True),
+        ],
+    )
+    def test_tree_diff_by_hash_same_as_tree_diff(
+        tree_node, tree_node_diff, only_diff, detail, aggregate
+    ):
+        tree_node_diff.append(node.Node("g"))
+        kwargs = dict(only_diff=only_diff, detail=detail, aggregate=aggregate)
+        expected = export.tree_to_dict(
+            helper.get_tree_diff(tree_node, tree_node_diff, **kwargs)
+        )
+        actual = export.tree_to_dict(
+            helper.get_tree_diff_by_hash(tree_node, tree_node_diff, **kwargs)
+        )
+        assert actual == expected, f"Expected\n{expected}\nReceived\n{actual}"
+
+    @staticmethod
+    @pytest.mark.parametrize("only_diff", [True, False])
+    @pytest.mark.parametrize("detail", [True, False])
+    @pytest.mark.parametrize("aggregate", [True, False])
+    def test_tree_diff_by_hash_same_as_tree_diff_nested(only_diff, detail, aggregate):
+        tree = construct.list_to_tree(["r/a/d/b", "r/a/c", "r/a/b", "r/a/a", "r/c/d"])
+        other_tree = construct.list_to_tree(
+            ["r/d/b/d", "r/c/a/b", "r/c/a/a/c", "r/c/d/c/d", "r/a/d"]
+        )
+        kwargs = dict(only_diff=only_diff, detail=detail, aggregate=aggregate)
+        expected = export.tree_to_dict(helper.get_tree_diff(tree, other_tree, **kwargs))
+        actual = export.tree_to_dict(
+            helper.get_tree_diff_by_hash(tree, other_tree, **kwargs)
+        )
+        assert actual == expected, f"Expected\n{expected}\nReceived\n{actual}"
+
+    @staticmethod
+    def test_tree_diff_by_hash_same_tree(tree_node):
+        assert helper.get_tree_diff_by_hash(tree_node, tree_node.copy()) is None
+
+    @staticmethod
+    def test_tree_diff_by_hash_same_tree_all_diff(tree_node):
+        expected = export.tree_to_dict(tree_node)
+        diff_node = helper.get_tree_diff_by_hash(
+            tree_node, tree_node.copy(), only_diff=False
+        )
+        actual = export.tree_to_dict(diff_node)
+        assert actual == expected, f"Expected\n{expected}\nReceived\n{actual}"
+
+    @staticmethod
+    def test_tree_diff_by_hash_attributes(tree_node):
+        tree_node_copy = tree_node.copy()
+        tree_node_copy["c"]["f"].age += 10
+        tree_node_copy["b"].age2 = 2
+        tree_node["b"]["e"]["g"].age2 = 3
+        tree_node_copy["b"]["e"]["g"].age2 = 4
+
+        # Without attributes
+        assert helper.get_tree_diff_by_hash(tree_node, tree_node_copy) is None
+
+        # With attributes
+        expected = {
+            "/a": {"name": "a"},
+            "/a/b (~)": {"name": "b (~)", "age2": (None, 2)},
+            "/a/b (~)/e": {"name": "e"},
+            "/a/b (~)/e/g (~)": {"name": "g (~)", "age2": (3, 4)},
+            "/a/c": {"name": "c"},
+            "/a/c/f (~)": {"name": "f (~)", "age": (38, 48)},
+        }
+        diff_node = helper.get_tree_diff_by_hash(
+            tree_node, tree_node_copy, attr_list=["age", "age2"]
+        )
+        actual = export.tree_to_dict(diff_node, all_attrs=True)
+        assert actual == expected, f"Expected\n{expected}\nReceived\n{actual}"
+
+
+class TestTreePatch:
+    @staticmethod
+    def test_diff_to_patch(tree_node, tree_node_diff):
+        patch = helper.diff_to_patch(tree_node, tree_node_diff)
+        expected = [
+            {"op": "add", "path": "/a/i"},
+            {"op": "add", "path": "/a/i/j"},
+            {"op": "move", "from": "/a/b/e", "path": "/a/c/e"},
+            {"op": "remove", "path": "/a/b"},
+        ]
+        assert patch == expected, f"Expected\n{expected}\nReceived\n{patch}"
+
+    @staticmethod
+    def test_diff_to_patch_same_tree(tree_node):
+        assert helper.diff_to_patch(tree_node, tree_node.copy()) == []
+
+    @staticmethod
+    def test_diff_to_patch_diff_sep_error(tree_node):
+        other_tree_node = tree_node.copy()
+        other_tree_node.sep = "-"
+        with pytest.raises(ValueError) as exc_info:
+            helper.diff_to_patch(tree_node, other_tree_node)
+        assert str(exc_info.value) == Constants.ERROR_NODE_TREE_DIFF_DIFF_SEP
+
+    @staticmethod
+    def test_diff_to_patch_rename_and_attrs(tree_node):
+        other_tree_node = tree_node.copy()
+        other_tree_node.name = "z"
+        other_tree_node["b"].name = "y"
+        other_tree_node["c"]["f"].age = 48
+        other_tree_node["c"]["f"].age2 = 1
+        del other_tree_node["c"].age
+        patch = helper.diff_to_patch(tree_node, other_tree_node)
+        expected = [
+            {"op": "rename", "path": "/a", "name": "z"},
+            {"op": "rename", "path": "/z/b", "name": "y"},
+            {"op": "set_attrs", "path": "/z/c", "unset": ["age"]},
+            {"op": "set_attrs", "path": "/z/c/f", "attrs": {"age": 48, "age2": 1}},
+        ]
+        assert patch == expected, f"Expected\n{expected}\nReceived\n{patch}"
+
+    @staticmethod
+    def test_apply_patch(tree_node, tree_node_diff):
+        import json
+
+        patch = helper.diff_to_patch(tree_node, tree_node_diff)
+        patch_jsonl = "\n".join(json.dumps(op) for op in patch)
+        helper.apply_patch(tree_node, map(json.loads, patch_jsonl.splitlines()))
+        expected = export.tree_to_dict(tree_node_diff, all_attrs=True)
+        actual = export.tree_to_dict(tree_node, all_attrs=True)
+        assert actual == expected, f"Expected\n{expected}\nReceived\n{actual}"
+
+    @staticmethod
+    def test_apply_patch_rename_and_attrs(tree_node):
+        other_tree_node = tree_node.copy()
+        other_tree_node.name = "z"
+        other_tree_node["b"].name = "y"
+        other_tree_node["c"]["f"].age = 48
+        del other_tree_node["c"].age
+        helper.apply_patch(tree_node, helper.diff_to_patch(tree_node, other_tree_node))
+        expected = export.tree_to_dict(other_tree_node, all_attrs=True)
+        actual = export.tree_to_dict(tree_node, all_attrs=True)
+        assert actual == expected, f"Expected\n{expected}\nReceived\n{actual}"
+
+    @staticmethod
+    def test_apply_patch_sep(tree_node):
+        helper.apply_patch(
+            tree_node,
+            [
+                {"op": "move", "from": "a.b.d", "path": "a.c.d"},
+                {"op": "remove", "path": "a.b.e.g"},
+                {"op": "add", "path": "a.c.d.i", "attrs": {"age": 1}},
+            ],
+            sep=".",
+        )
+        expected_str = (
+            "a\n"
+            "├── b\n"
+            "│   └── e\n"
+            "│       └── h\n"
+            "└── c\n"
+            "    ├── f\n"
+            "    └── d\n"
+            "        └── i\n"
+        )
+        assert_print_statement(export.print_tree, expected_str, tree=tree_node)
+
+    @staticmethod
+    def test_apply_patch_tree_sep(tree_node, tree_node_diff):
+        tree_node.sep = "\\"
+        tree_node_diff.sep = "\\"
+        patch = helper.diff_to_patch(tree_node, tree_node_diff)
+        assert all("/" not in op["path"] for op in patch)
+        helper.apply_patch(tree_node, patch)
+        expected = export.tree_to_dict(tree_node_diff, all_attrs=True)
+        actual = export.tree_to_dict(tree_node, all_attrs=True)
+        assert actual == expected, f"Expected\n{expected}\nReceived\n{actual}"
+
+    @staticmethod
+    def test_apply_patch_path_not_found_error(tree_node):
+        with pytest.raises(exceptions.NotFoundError) as exc_info:
+            helper.apply_patch(
+                tree_node, [{"op": "rename", "path": "a/x", "name": "y"}]
+            )
+        assert str(exc_info.value) == Constants.ERROR_NODE_PATCH_NOT_FOUND.format(
+            path="a/x"
+        )
+
+    @staticmethod
+    def test_apply_patch_invalid_op_error(tree_node):
+        with pytest.raises(ValueError) as exc_info:
+            helper.apply_patch(tree_node, [{"op": "copy", "path": "a/b"}])
+        assert str(exc_info.value) == Constants.ERROR_NODE_PATCH_INVALID_OP.format(
+            op="copy"
+        )
+
+
+def get_leaf_distance(leaf, other_leaf, weight_attr=None):
+    ancestors = {leaf: 0}
+    _node, distance = leaf, 0
+    while _node.parent:
+        distance += (_node.get_attr(weight_attr) or 0) if weight_attr else 1
+        _node = _node.parent
+        ancestors[_node] = distance
+    _node, distance = other_leaf, 0
+    while _node not in ancestors:
+        distance += (_node.get_attr(weight_attr) or 0) if weight_attr else 1
+        _node = _node.parent
+    return ancestors[_node] + distance
+
+
+class TestGetLeafDistanceMatrix:
+    @staticmethod
+    def test_get_leaf_distance_matrix(tree_node):
+        matrix, leaves = helper.get_leaf_distance_matrix(tree_node)
+        assert [leaf.node_name for leaf in leaves] == ["d", "g", "h", "f"]
+        assert matrix.tolist() == [
+            [0, 3, 3, 4],
+            [3, 0, 2, 5],
+            [3, 2, 0, 5],
+            [4, 5, 5, 0],
+        ]
+
+    @staticmethod
+    def test_get_leaf_distance_matrix_weight_attr(phylogenetic_tree):
+        matrix, leaves = helper.get_leaf_distance_matrix(
+            phylogenetic_tree, weight_attr="length"
+        )
+        assert len(leaves) == 8
+        assert matrix.shape == (8, 8)
+        for idx, leaf in enumerate(leaves):
+            for idx2, other_leaf in enumerate(leaves):
+                assert matrix[idx, idx2] == pytest.approx(
+                    get_leaf_distance(leaf, other_leaf, "length")
+                )
+
+    @staticmethod
+    def test_get_leaf_distance_matrix_weight_attr_missing(tree_node):
+        tree_node["b"].age = None
+        matrix, _ = helper.get_leaf_distance_matrix(tree_node, weight_attr="age")
+        assert matrix.tolist() == [
+            [0.0, 85.0, 81.0, 138.0],
+            [85.0, 0.0, 16.0, 143.0],
+            [81.0, 16.0, 0.0, 139.0],
+            [138.0, 143.0, 139.0, 0.0],
+        ]
+
+    @staticmethod
+    def test_get_leaf_distance_matrix_root():
+        root = node.Node("a")
+        matrix, leaves = helper.get_leaf_distance_matrix(root)
+        assert leaves == [root]
+        assert matrix.tolist() == [[0]]
+
+    @staticmethod
+    def test_get_leaf_distance_matrix_subtree(tree_node):
+        matrix, leaves = helper.get_leaf_distance_matrix(tree_node["b"])
+        assert [leaf.node_name for leaf in leaves] == ["d", "g", "h"]
+        assert matrix.tolist() == [
+            [0, 3, 3],
+            [3, 0, 2],
+            [3, 2, 0],
+        ]
+
+        matrix, leaves = helper.get_leaf_distance_matrix(
+            tree_node["b"]["e"], weight_attr="age"
+        )
+        assert [leaf.node_name for leaf in leaves] == ["g", "h"]
+        assert matrix.tolist() == [[0.0, 16.0], [16.0, 0.0]]
+
+    @staticmethod
+    def test_get_leaf_distance_matrix_binarytree(binarytree_node):
+        matrix, leaves = helper.get_leaf_distance_matrix(binarytree_node)
+        assert [leaf.node_name for leaf in leaves] == ["8", "5", "6", "7"]
+        assert matrix.tolist() == [
+            [0, 3, 5, 5],
+            [3, 0, 4, 4],
+            [5, 4, 0, 2],
+            [5, 4, 2, 0],
+        ]
+
+    @staticmethod
+    def test_get_leaf_distance_matrix_random():
+        import random
+
+        random.seed(0)
+        root = node.Node("0")
+        nodes = [root]
+        for idx in range(1, 300):
+            nodes.append(
+                node.Node(
+                    str(idx),
+                    length=random.random(),
+                    parent=random.choice(nodes[-20:]),
+                )
+            )
+        for weight_attr in [None, "length"]:
+            matrix, leaves = helper.get_leaf_distance_matrix(
+                root, weight_attr=weight_attr
+            )
+            assert set(leaves) == {_node for _node in nodes if _node.is_leaf}
+            for idx, leaf in enumerate(leaves):
+                for idx2, other_leaf in enumerate(leaves):
+                    assert matrix[idx, idx2] == pytest.approx(
+                        get_leaf_distance(leaf, other_leaf, weight_attr)
+                    )
+
+    @staticmethod
+    def test_get_leaf_distance_matrix_chunk_size(tree_node_big):
+        import numpy as np
+
+        for weight_attr in [None, "age"]:
+            matrix, leaves = helper.get_leaf_distance_matrix(
+                tree_node_big, weight_attr=weight_attr
+            )
+            for chunk_size in [1, 2, 3, len(leaves), len(leaves) + 1]:
+                blocks, leaves_chunk = helper.get_leaf_distance_matrix(
+                    tree_node_big, weight_attr=weight_attr, chunk_size=chunk_size
+                )
+                assert leaves_chunk == leaves
+                blocks = list(blocks)
+                assert all(len(block) <= chunk_size for block in blocks)
+                np.testing.assert_array_equal(np.vstack(blocks), matrix)
+
+    @staticmethod
+    def test_get_leaf_distance_matrix_chunk_size_error(tree_node):
+        for chunk_size in [0, -1, 1.5, True]:
+            with pytest.raises(ValueError) as exc_info:
+                helper.get_leaf_distance_matrix(tree_node, chunk_size=chunk_size)
+            assert str(exc_info.value) == Constants.ERROR_NODE_STREAM_CHUNK_SIZE.format(
+                chunk_size=chunk_size
+            )
+
+    @staticmethod
+    def test_get_leaf_distance_matrix_deep():
+        from bigtree.tree import construct
+
+        nested_dict = {"name": "0"}
+        _dict = nested_dict
+        for idx in range(1, 5000):
+            _dict["children"] = [{"name": str(idx)}, {"name": f"leaf{idx}"}]
+            _dict = _dict["children"][0]
+        root = construct.nested_dict_to_tree(nested_dict)
+        matrix, leaves = helper.get_leaf_distance_matrix(root)
+        assert len(leaves) == 5000
+        assert leaves[0].node_name == "4999"
+        assert matrix[0, -1] == 5000
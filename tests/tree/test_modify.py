@@ -117,6 +117,50 @@ class TestMergeTrees(unittest.TestCase):
         assert_tree_structure_basenode_root_attr(root)
         assert_tree_structure_node_root(root)
 
+    def test_merge_trees_conflict_first(self):
+        self.g.parent.age = 2
+        self.h.parent.age = 1
+        root = modify.merge_trees(
+            [self.a, self.b, self.c, self.d, self.e, self.f, self.g, self.h],
+            conflict="first",
+        )
+
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_basenode_root_attr(root)
+        assert_tree_structure_node_root(root)
+
+    def test_merge_trees_conflict_callable(self):
+        self.g.parent.age = 2
+        self.h.parent.age = 1
+        root = modify.merge_trees(
+            [self.a, self.b, self.c, self.d, self.e, self.f, self.g, self.h],
+            conflict=lambda _, values: min(values),
+        )
+
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_basenode_root_attr(root, e=("e", 1))
+        assert_tree_structure_node_root(root)
+
+    def test_merge_trees_conflict_error(self):
+        conflict = "middle"
+        with pytest.raises(ValueError) as exc_info:
+            modify.merge_trees([self.a, self.b], conflict=conflict)
+        assert str(exc_info.value) == Constants.ERROR_MODIFY_MERGE_CONFLICT.format(
+            conflict=conflict
+        )
+
+    def test_merge_trees_no_copy(self):
+        root = modify.merge_trees(
+            [self.a, self.b, self.c, self.d, self.e, self.f, self.g, self.h],
+            copy=False,
+        )
+
+        assert root is self.a, "Root of first tree is not reused"
+        assert root["b"] is self.b, "Node of later tree is not reused"
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_basenode_root_attr(root)
+        assert_tree_structure_node_root(root)
+
     def test_merge_trees_exact(self):
         root = modify.merge_trees(
             [self.d, self.f, self.g, self.h],
@@ -363,6 +407,17 @@ class TestCopyNodes(unittest.TestCase):
         assert search.find_path(self.root, "a/d"), "Original node not present"
         assert search.find_path(self.root, "a/b/c/d"), "Copied node not present"
 
+    def test_copy_nodes_plan(self):
+        from_paths = ["d", "e"]
+        to_paths = ["a/b/c/d", "a/b/e"]
+        planned = modify.copy_nodes(self.root, from_paths, to_paths, plan=True)
+        assert self.root.max_depth == 2, "Tree is modified when planning"
+        assert [op["action"] for op in planned] == ["copy", "copy"]
+        assert [op["to_path_action"] for op in planned] == ["create", "create"]
+        assert planned[0]["created_paths"] == ["/a/b/c"]
+        assert planned[0]["from_node"] is search.find_path(self.root, "a/d")
+        assert [op["nodes_copied"] for op in planned] == [1, 1]
+
     def test_copy_nodes_invalid_type_error(self):
         with pytest.raises(ValueError) as exc_info:
             modify.copy_nodes(self.root, {}, [])
@@ -1190,6 +1245,55 @@ class TestShiftNodes(unittest.TestCase):
         assert_tree_structure_basenode_root_attr(self.root)
         assert_tree_structure_node_root(self.root)
 
+    def test_shift_nodes_plan(self):
+        from_paths = ["d", "e", "g", "h", "f"]
+        to_paths = ["a/b/d", "a/b/e", "a/b/e/g", "a/b/e/h", "a/c/f"]
+        planned = modify.shift_nodes(self.root, from_paths, to_paths, plan=True)
+        assert len(self.root.children) == 7, "Tree is modified when planning"
+        assert [op["action"] for op in planned] == ["shift"] * 5
+        assert [op["to_path_action"] for op in planned] == ["create"] * 5
+        assert [op["from_node"].node_name for op in planned] == from_paths
+        assert [op["to_node"] for op in planned] == [None] * 5
+        assert [op["created_paths"] for op in planned] == [[]] * 5
+        assert [op["nodes_touched"] for op in planned] == [1] * 5
+
+        modify.shift_nodes(self.root, from_paths, to_paths)
+        assert_tree_structure_basenode_root(self.root)
+        assert_tree_structure_basenode_root_attr(self.root)
+        assert_tree_structure_node_root(self.root)
+
+    def test_shift_nodes_plan_skippable_overriding(self):
+        node.Node("e", parent=search.find_name(self.root, "c"))
+        from_paths = ["i", "d", "/a/e"]
+        to_paths = ["a/i", "a/x/y/d", "a/c/e"]
+        planned = modify.shift_nodes(
+            self.root,
+            from_paths,
+            to_paths,
+            skippable=True,
+            overriding=True,
+            plan=True,
+        )
+        assert [op["action"] for op in planned] == ["skip", "shift", "shift"]
+        assert [op["to_path_action"] for op in planned] == [None, "create", "override"]
+        assert planned[1]["created_paths"] == ["/a/x", "/a/x/y"]
+        assert planned[2]["to_node"] is search.find_full_path(self.root, "a/c/e")
+        assert [op["nodes_touched"] for op in planned] == [0, 1, 2]
+
+    def test_shift_nodes_plan_error(self):
+        from_paths = ["d", "e", "f"]
+        to_paths = ["a/b/d", "a/b/e", "a/d"]
+        with pytest.raises(ValueError):
+            modify.shift_nodes(self.root, from_paths, to_paths, plan=True)
+
+        from_paths = ["d", "e"]
+        to_paths = ["a/c/d", "a/e/x/e"]
+        with pytest.raises(exceptions.LoopError):
+            modify.shift_nodes(
+                self.root, from_paths, to_paths, overriding=True, plan=True
+            )
+        assert len(self.root.children) == 7, "Tree is modified when planning"
+
     def test_shift_nodes_invalid_type_error(self):
         with pytest.raises(ValueError) as exc_info:
             modify.shift_nodes(self.root, {}, [])
@@ -1437,6 +1541,43 @@ class TestShiftNodes(unittest.TestCase):
             path=path
         )
 
+    def test_shift_nodes_overriding_error_before_shifting(self):
+        new_aa = node.Node("aa", parent=self.root)
+        node.Node("e", parent=new_aa)
+        from_paths = ["d", "/a/e", "aa/e"]
+        to_paths = ["a/b/d", "a/b/e", "a/b/e"]
+        with pytest.raises(exceptions.TreeError) as exc_info:
+            modify.shift_nodes(self.root, from_paths, to_paths)
+        assert str(exc_info.value) == Constants.ERROR_MODIFY_OVERRIDING.format(
+            to_path="a/b/e"
+        )
+        assert search.find_full_path(self.root, "a/d"), "Node d is shifted before error"
+
+    def test_shift_nodes_loop_error(self):
+        from_paths = ["d"]
+        to_paths = ["a/d/dd/d"]
+        with pytest.raises(exceptions.LoopError) as exc_info:
+            modify.shift_nodes(self.root, from_paths, to_paths)
+        assert str(exc_info.value).startswith(Constants.ERROR_NODE_LOOP_ANCESTOR)
+        assert not search.find_path(self.root, "dd"), "Intermediate node is created"
+
+    def test_shift_nodes_partial_path_after_shift(self):
+        from_paths = ["d", "b/d"]
+        to_paths = ["a/b/d", "a/c/d"]
+        modify.shift_nodes(self.root, from_paths, to_paths)
+        assert search.find_path(self.root, "a/c/d"), "Node d parent is not Node c"
+
+    def test_shift_nodes_wide_tree(self):
+        root = node.Node("a")
+        for idx in range(1000):
+            node.Node(f"b{idx}", parent=root)
+        from_paths = [f"a/b{idx}" for idx in range(1000)]
+        to_paths = [f"a/c{idx % 10}/b{idx}" for idx in range(1000)]
+        modify.shift_nodes(root, from_paths, to_paths, with_full_path=True)
+        assert len(root.children) == 10
+        assert [len(child.children) for child in root.children] == [100] * 10
+        assert search.find_full_path(root, "a/c9/b999")
+
     def test_shift_nodes_same_node_error(self):
         from_paths = ["d"]
         to_paths = ["a/d"]
@@ -1849,6 +1990,18 @@ class TestShiftAndReplaceNodes(unittest.TestCase):
         assert_tree_structure_basenode_root_attr(self.root)
         assert_tree_structure_node_root(self.root)
 
+    def test_shift_and_replace_nodes_plan(self):
+        from_paths = ["/e", "/c"]
+        to_paths = ["a/b/ee", "a/cc"]
+        planned = modify.shift_and_replace_nodes(
+            self.root, from_paths, to_paths, plan=True
+        )
+        assert search.find_path(self.root, "a/b/ee"), "Tree is modified when planning"
+        assert [op["to_path_action"] for op in planned] == ["replace", "replace"]
+        assert planned[0]["to_node"] is search.find_path(self.root, "a/b/ee")
+        assert [op["nodes_touched"] for op in planned] == [4, 3]
+        assert [op["nodes_copied"] for op in planned] == [0, 0]
+
     def test_shift_and_replace_nodes_invalid_type_error(self):
         with pytest.raises(ValueError) as exc_info:
             modify.shift_and_replace_nodes(self.root, {}, [])
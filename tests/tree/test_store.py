@@ -0,0 +1,336 @@
+import os
+import tempfile
+
+import pytest
+
+from bigtree.node import node
+from bigtree.tree import construct, export, store
+from bigtree.utils import exceptions
+from tests.node.test_basenode import (
+    assert_tree_structure_basenode_root,
+    assert_tree_structure_basenode_root_attr,
+)
+from tests.node.test_node import assert_tree_structure_node_root
+from tests.test_constants import Constants
+
+
+@pytest.fixture
+def tree_store(tree_node):
+    tree_store = store.TreeStore(":memory:")
+    tree_store.add_tree(tree_node)
+    yield tree_store
+    tree_store.close()
+
+
+def get_paths(tree):
+    paths = []
+    stack = [(tree, tree.path_name)]
+    while stack:
+        _node, path_name = stack.pop()
+        paths.append(path_name)
+        stack.extend(
+            (_child, f"{path_name}{tree.sep}{_child.node_name}")
+            for _child in reversed(_node.children)
+        )
+    return paths
+
+
+class TestTreeStore:
+    @staticmethod
+    def test_add_tree(tree_store):
+        assert len(tree_store) == 8
+        assert "a/b/e/g" in tree_store
+        assert "/a/b/e/g" in tree_store
+        assert "a/b/g" not in tree_store
+        root = tree_store.load_subtree("a")
+        assert_tree_structure_basenode_root(root)
+        assert_tree_structure_basenode_root_attr(root)
+        assert_tree_structure_node_root(root)
+
+    @staticmethod
+    def test_add_tree_parent_path(tree_store):
+        new_node = node.Node("x", age=1, children=[node.Node("y"), node.Node("z")])
+        tree_store.add_tree(new_node, "a/b/e")
+        assert tree_store.find_paths("a/b/e") == [
+            "/a/b/e",
+            "/a/b/e/g",
+            "/a/b/e/h",
+            "/a/b/e/x",
+            "/a/b/e/x/y",
+            "/a/b/e/x/z",
+        ]
+        assert [
+            _node.node_name for _node in tree_store.load_subtree("a/b/e").children
+        ] == ["g", "h", "x"]
+        assert tree_store.load_subtree("a/b").max_depth == 4
+
+    @staticmethod
+    def test_add_tree_root_error(tree_store, tree_node):
+        with pytest.raises(exceptions.TreeError) as exc_info:
+            tree_store.add_tree(tree_node)
+        assert str(exc_info.value) == Constants.ERROR_STORE_ROOT_EXISTS
+
+    @staticmethod
+    def test_add_tree_duplicate_error(tree_store):
+        with pytest.raises(exceptions.DuplicatedNodeError) as exc_info:
+            tree_store.add_tree(node.Node("d"), "a/b")
+        assert str(exc_info.value) == Constants.ERROR_STORE_PATH_EXISTS.format(
+            path="/a/b/d"
+        )
+
+    @staticmethod
+    def test_attr_types():
+        root = node.Node(
+            "a",
+            flag=True,
+            count=1,
+            weight=0.5,
+            label="",
+            big=2**70,
+            items=[1, "2"],
+            none=None,
+        )
+        with store.TreeStore(":memory:") as tree_store:
+            tree_store.add_tree(root)
+            new_root = tree_store.load_subtree("a")
+        assert new_root.describe(exclude_prefix="_") == root.describe(
+            exclude_prefix="_"
+        )
+        for (_, value), (_, new_value) in zip(
+            root.describe(exclude_prefix="_"), new_root.describe(exclude_prefix="_")
+        ):
+            assert type(value) is type(new_value)
+
+    @staticmethod
+    def test_persist(tree_node):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tree.db")
+            with store.TreeStore(path) as tree_store:
+                tree_store.add_tree(tree_node)
+                tree_store.set_attrs("a/b", {"age": 1})
+            with store.TreeStore(path) as tree_store:
+                root = tree_store.load_subtree("a")
+        assert root["b"].get_attr("age") == 1
+        assert get_paths(root) == get_paths(tree_node)
+
+    @staticmethod
+    def test_sep(tree_node):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tree.db")
+            with store.TreeStore(path, sep="\\") as tree_store:
+                tree_store.add_tree(tree_node)
+            with store.TreeStore(path) as tree_store:
+                assert tree_store.sep == "\\"
+                assert tree_store.find_paths("a\\b\\e") == [
+                    "\\a\\b\\e",
+                    "\\a\\b\\e\\g",
+                    "\\a\\b\\e\\h",
+                ]
+                root = tree_store.load_subtree("a")
+        assert root.sep == "\\"
+        assert root["b"]["e"].path_name == "\\a\\b\\e"
+
+    @staticmethod
+    def test_load_subtree_depth(tree_store):
+        root = tree_store.load_subtree("a", depth=0)
+        assert root.is_leaf
+        assert root.get_attr("age") == 90
+
+        root = tree_store.load_subtree("a", depth=2)
+        assert get_paths(root) == ["/a", "/a/b", "/a/b/d", "/a/b/e", "/a/c", "/a/c/f"]
+        assert root["b"]["e"].get_attr("age") == 35
+
+        subtree = tree_store.load_subtree("a/b", depth=1)
+        assert subtree.is_root
+        assert get_paths(subtree) == ["/b", "/b/d", "/b/e"]
+
+    @staticmethod
+    def test_load_subtree_node_type(tree_store):
+        class CustomNode(node.Node):
+            pass
+
+        root = tree_store.load_subtree("a", node_type=CustomNode)
+        assert isinstance(root, CustomNode)
+        assert all(isinstance(_node, CustomNode) for _node in root.descendants)
+
+    @staticmethod
+    def test_load_subtree_deep():
+        depth = 500
+        nested_dict = {"name": "0"}
+        _dict = nested_dict
+        for idx in range(1, depth):
+            _dict["children"] = [{"name": str(idx)}]
+            _dict = _dict["children"][0]
+        tree = construct.nested_dict_to_tree(nested_dict)
+        with store.TreeStore(":memory:") as tree_store:
+            tree_store.add_tree(tree)
+            root = tree_store.load_subtree("0")
+        assert get_paths(root) == get_paths(tree)
+
+    @staticmethod
+    def test_set_attrs(tree_store):
+        tree_store.set_attrs("a/b/d", {"age": 41, "items": [1], "flag": False})
+        d = tree_store.load_subtree("a/b/d")
+        assert d.describe(exclude_prefix="_") == [
+            ("age", 41),
+            ("flag", False),
+            ("items", [1]),
+            ("name", "d"),
+        ]
+
+    @staticmethod
+    def test_set_attrs_rename(tree_store):
+        tree_store.set_attrs("a/b", {"name": "x", "age": 1})
+        assert "a/b" not in tree_store
+        assert tree_store.find_paths("a/x") == [
+            "/a/x",
+            "/a/x/d",
+            "/a/x/e",
+            "/a/x/e/g",
+            "/a/x/e/h",
+        ]
+        assert tree_store.find_names("x") == ["/a/x"]
+        root = tree_store.load_subtree("a")
+        assert [_node.node_name for _node in root.children] == ["x", "c"]
+        assert root["x"].get_attr("age") == 1
+
+    @staticmethod
+    def test_set_attrs_rename_error(tree_store):
+        with pytest.raises(exceptions.DuplicatedNodeError) as exc_info:
+            tree_store.set_attrs("a/b", {"name": "c"})
+        assert str(exc_info.value) == Constants.ERROR_STORE_PATH_EXISTS.format(
+            path="/a/c"
+        )
+
+    @staticmethod
+    def test_remove_attrs(tree_store):
+        tree_store.remove_attrs("a/b", ["age"])
+        assert tree_store.load_subtree("a/b", depth=0).describe(exclude_prefix="_") == [
+            ("name", "b")
+        ]
+
+    @staticmethod
+    def test_remove_node(tree_store):
+        tree_store.remove_node("a/b/e")
+        assert len(tree_store) == 5
+        assert tree_store.find_attrs("age", 10) == []
+        assert get_paths(tree_store.load_subtree("a")) == [
+            "/a",
+            "/a/b",
+            "/a/b/d",
+            "/a/c",
+            "/a/c/f",
+        ]
+        tree_store.add_tree(node.Node("e"), "a/b")
+        assert tree_store.find_paths("a/b/e") == ["/a/b/e"]
+
+    @staticmethod
+    def test_shift_node(tree_store):
+        tree_store.shift_node("a/b/e", "a/c")
+        assert tree_store.find_paths("a/c") == [
+            "/a/c",
+            "/a/c/e",
+            "/a/c/e/g",
+            "/a/c/e/h",
+            "/a/c/f",
+        ]
+        root = tree_store.load_subtree("a")
+        assert get_paths(root) == [
+            "/a",
+            "/a/b",
+            "/a/b/d",
+            "/a/c",
+            "/a/c/f",
+            "/a/c/e",
+            "/a/c/e/g",
+            "/a/c/e/h",
+        ]
+        assert root["c"]["e"]["g"].get_attr("age") == 10
+        assert tree_store.load_subtree("a/c", depth=1).max_depth == 2
+
+    @staticmethod
+    def test_shift_node_position(tree_store):
+        tree_store.shift_node("a/c", "a", position=0)
+        root = tree_store.load_subtree("a")
+        assert [_node.node_name for _node in root.children] == ["c", "b"]
+
+        tree_store.shift_node("a/b/e/h", "a/b", position=1)
+        tree_store.shift_node("a/b/d", "a/b")
+        root = tree_store.load_subtree("a")
+        assert [_node.node_name for _node in root["b"].children] == ["h", "e", "d"]
+        assert [_node.node_name for _node in root["b"]["e"].children] == ["g"]
+
+    @staticmethod
+    def test_shift_node_position_after_remove_node():
+        root = node.Node("r")
+        for name in ["a", "b", "c", "d"]:
+            node.Node(name, parent=root)
+        with store.TreeStore(":memory:") as tree_store:
+            tree_store.add_tree(root)
+            tree_store.remove_node("r/b")
+            tree_store.shift_node("r/a", "r", position=2)
+            new_root = tree_store.load_subtree("r")
+        assert [_node.node_name for _node in new_root.children] == ["c", "d", "a"]
+
+    @staticmethod
+    def test_shift_node_error(tree_store):
+        with pytest.raises(exceptions.NotFoundError) as exc_info:
+            tree_store.shift_node("a/b/x", "a")
+        assert str(exc_info.value) == Constants.ERROR_STORE_PATH_NOT_FOUND.format(
+            path="a/b/x"
+        )
+        with pytest.raises(exceptions.TreeError) as exc_info:
+            tree_store.shift_node("a", "a/b")
+        assert str(exc_info.value) == Constants.ERROR_STORE_SHIFT_ROOT.format(path="a")
+        with pytest.raises(exceptions.LoopError) as exc_info:
+            tree_store.shift_node("a/b", "a/b/e")
+        assert str(exc_info.value) == Constants.ERROR_STORE_SHIFT_LOOP.format(
+            path="a/b", new_parent_path="a/b/e"
+        )
+        tree_store.add_tree(node.Node("d"), "a/c")
+        with pytest.raises(exceptions.DuplicatedNodeError) as exc_info:
+            tree_store.shift_node("a/b/d", "a/c")
+        assert str(exc_info.value) == Constants.ERROR_STORE_PATH_EXISTS.format(
+            path="/a/c/d"
+        )
+
+    @staticmethod
+    def test_find_names(tree_store):
+        tree_store.add_tree(node.Node("d"), "a/c")
+        assert tree_store.find_names("d") == ["/a/b/d", "/a/c/d"]
+        assert tree_store.find_names("x") == []
+
+    @staticmethod
+    def test_find_attrs(tree_store):
+        tree_store.set_attrs("a/c", {"flag": True, "age": None})
+        tree_store.set_attrs("a/b/d", {"flag": 1})
+        assert tree_store.find_attrs("age", 35) == ["/a/b/e"]
+        assert tree_store.find_attrs("age", None) == ["/a/c"]
+        assert tree_store.find_attrs("flag", True) == ["/a/c"]
+        assert tree_store.find_attrs("flag", 1) == ["/a/b/d"]
+
+    @staticmethod
+    def test_find_attrs_type_error(tree_store):
+        with pytest.raises(TypeError) as exc_info:
+            tree_store.find_attrs("age", [1])
+        assert str(exc_info.value) == Constants.ERROR_STORE_QUERY_TYPE.format(
+            type="list"
+        )
+
+    @staticmethod
+    def test_find_paths(tree_store):
+        tree_store.add_tree(node.Node("bb"), "a")
+        assert tree_store.find_paths("a/b") == [
+            "/a/b",
+            "/a/b/d",
+            "/a/b/e",
+            "/a/b/e/g",
+            "/a/b/e/h",
+        ]
+        assert tree_store.find_paths("a/x") == []
+
+    @staticmethod
+    def test_export_loaded_subtree(tree_store, tree_node):
+        assert export.tree_to_newick(
+            tree_store.load_subtree("a")
+        ) == export.tree_to_newick(tree_node)
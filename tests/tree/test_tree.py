@@ -440,6 +440,35 @@ class TestTreeExport:
         actual = tree_tree.to_polars()
         assert expected.equals(actual)
 
+    @staticmethod
+    def test_to_csv(tree_tree):
+        import io
+
+        csv_file = io.StringIO()
+        tree_tree.to_csv(csv_file, max_depth=2)
+        assert csv_file.getvalue() == "path,name\n/a,a\n/a/b,b\n/a/c,c\n"
+
+    @staticmethod
+    def test_to_jsonl(tree_tree):
+        import io
+
+        jsonl_file = io.StringIO()
+        tree_tree.to_jsonl(jsonl_file, max_depth=2)
+        assert jsonl_file.getvalue() == (
+            '{"path": "/a", "name": "a"}\n'
+            '{"path": "/a/b", "name": "b"}\n'
+            '{"path": "/a/c", "name": "c"}\n'
+        )
+
+    @staticmethod
+    def test_to_parquet(tree_tree):
+        import io
+
+        parquet_file = io.BytesIO()
+        tree_tree.to_parquet(parquet_file)
+        parquet_file.seek(0)
+        assert pl.read_parquet(parquet_file).equals(tree_tree.to_polars())
+
     @staticmethod
     def test_to_dict(tree_tree):
         expected = {
@@ -530,6 +559,40 @@ class TestTreeExport:
         expected_str = "((d,(g,h)e)b,(f)c)a"
         assert newick_str == expected_str
 
+    @staticmethod
+    def test_to_bytes(tree_tree):
+        tree = Tree.from_bytes(tree_tree.to_bytes())
+        assert_tree_structure_basenode_tree(tree)
+        assert_tree_structure_basenode_root(tree.node)
+        assert_tree_structure_basenode_root_attr(tree.node)
+        assert_tree_structure_node_root(tree.node)
+
+    @staticmethod
+    def test_save(tree_tree):
+        import io
+
+        tree_file = io.BytesIO()
+        tree_tree.save(tree_file)
+        tree_file.seek(0)
+        tree = Tree.load(tree_file)
+        assert_tree_structure_basenode_tree(tree)
+        assert_tree_structure_basenode_root(tree.node)
+        assert_tree_structure_basenode_root_attr(tree.node)
+        assert_tree_structure_node_root(tree.node)
+
+    @staticmethod
+    def test_mmap(tree_tree):
+        import os
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tree.bin")
+            tree_tree.save(path)
+            tree = Tree.mmap(path)
+        assert_tree_structure_basenode_root(tree.node)
+        assert_tree_structure_basenode_root_attr(tree.node)
+        assert_tree_structure_node_root(tree.node)
+
     @staticmethod
     def test_to_dot(tree_tree):
         graph = tree_tree.to_dot()
@@ -641,6 +704,18 @@ class TestTreeHelper:
         assert isinstance(diff_tree, Tree), "Wrong type returned"
         assert_print_statement(diff_tree.show, EXPECTED_TREE_NODE_DIFF)
 
+    @staticmethod
+    def test_diff_by_hash(tree_tree, tree_tree_diff):
+        diff_tree = tree_tree.diff_by_hash(tree_tree_diff)
+        assert isinstance(diff_tree, Tree), "Wrong type returned"
+        assert_print_statement(diff_tree.show, EXPECTED_TREE_NODE_DIFF)
+
+    @staticmethod
+    def test_diff_to_patch_and_apply_patch(tree_tree, tree_tree_diff):
+        patch = tree_tree.diff_to_patch(tree_tree_diff)
+        tree_tree.apply_patch(patch)
+        assert tree_tree.to_dict() == tree_tree_diff.to_dict()
+
     @staticmethod
     def test_get_subtree(tree_tree):
         # Subtree is b/d, b/e/g, b/e/h
@@ -0,0 +1,110 @@
+import io
+
+import pytest
+
+from bigtree.utils import dot
+
+
+class TestQuoteDotId:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "value, result",
+        [
+            ("a0", "a0"),
+            ("_a", "_a"),
+            ("ab_1", "ab_1"),
+            ("12", "12"),
+            ("1.5", "1.5"),
+            (".5", ".5"),
+            ("-1.5", '"-1.5"'),
+            (3, "3"),
+            (True, "true"),
+            ("", ""),
+            ("1a", '"1a"'),
+            ("a b", '"a b"'),
+            ("a-b", '"a-b"'),
+            ("a:b", "a:b"),
+            ("a:b-c", '"a:b-c"'),
+            ("node", '"node"'),
+            ("Graph", '"Graph"'),
+            ('say "hi"', r'"say \"hi\""'),
+            ('"a b"', '"a b"'),
+            ("a\nb", r'"a\nb"'),
+            ("ü", "ü"),
+            ("ü_1", '"ü_1"'),
+            ("<<b>a</b>>", "<<b>a</b>>"),
+        ],
+    )
+    def test_quote_dot_id(value, result):
+        assert dot.quote_dot_id(value) == result
+
+    @staticmethod
+    @pytest.mark.parametrize("value", ["node", "Graph"])
+    def test_quote_dot_id_unquoted_keywords(value):
+        assert dot.quote_dot_id(value, unquoted_keywords=["graph", "node"]) == value
+
+
+class TestQuoteDotAttr:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "value, result",
+        [
+            ("a0", "a0"),
+            ("ab_1", '"ab_1"'),
+            ("12", "12"),
+            ("1.5", "1.5"),
+            ("-1.5", '"-1.5"'),
+            (1.5, "1.5"),
+            (True, "true"),
+            ("", '""'),
+            ("1a", '"1a"'),
+            ("light blue", '"light blue"'),
+            ("node", '"node"'),
+            ('say "hi"', r'"say \"hi\""'),
+            ("ü", "ü"),
+            ("<<b>a</b>>", "<<b>a</b>>"),
+        ],
+    )
+    def test_quote_dot_attr(value, result):
+        assert dot.quote_dot_attr(value) == result
+
+
+class TestDotWriter:
+    @staticmethod
+    def test_dot_writer():
+        dot_file = io.StringIO()
+        writer = dot.DotWriter(
+            dot_file, graph_attr={"rankdir": "LR", "bgcolor": "light blue"}
+        )
+        writer.add_node("a", {"label": "a", "width": None})
+        writer.add_node("b", {})
+        writer.add_edge("a", "b", {"label": 1})
+        writer.close()
+        assert dot_file.getvalue() == (
+            "strict digraph G {\n"
+            "rankdir=LR;\n"
+            'bgcolor="light blue";\n'
+            "a [label=a];\n"
+            "b;\n"
+            "a -> b [label=1];\n"
+            "}\n"
+        )
+
+    @staticmethod
+    def test_dot_writer_undirected():
+        dot_file = io.StringIO()
+        writer = dot.DotWriter(dot_file, directed=False, strict=False)
+        writer.add_edge("a", "b", {})
+        writer.close()
+        assert dot_file.getvalue() == "graph G {\na -- b;\n}\n"
+
+    @staticmethod
+    def test_dot_writer_chunk_size():
+        dot_file = io.StringIO()
+        writer = dot.DotWriter(dot_file, chunk_size=2)
+        writer.add_node("a", {})
+        assert dot_file.getvalue() == "strict digraph G {\na;\n"
+        writer.add_node("b", {})
+        assert dot_file.getvalue() == "strict digraph G {\na;\n"
+        writer.close()
+        assert dot_file.getvalue() == "strict digraph G {\na;\nb;\n}\n"
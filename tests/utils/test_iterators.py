@@ -1,3 +1,4 @@
+from bigtree.node import node
 from bigtree.utils import iterators
 
 
@@ -237,6 +238,36 @@ class TestLevelOrderGroupIter:
         ]
         assert actual == expected, f"Expected\n{expected}\nReceived\n{actual}"
 
+    @staticmethod
+    def test_levelordergroup_iter_max_depth_subtree(tree_node):
+        expected = [["e"], ["g", "h"]]
+        actual = [
+            [_node.node_name for _node in group]
+            for group in iterators.levelordergroup_iter(
+                tree_node["b"]["e"], max_depth=4
+            )
+        ]
+        assert actual == expected, f"Expected\n{expected}\nReceived\n{actual}"
+
+        expected = [[]]
+        actual = [
+            [_node.node_name for _node in group]
+            for group in iterators.levelordergroup_iter(
+                tree_node["b"]["e"], max_depth=2
+            )
+        ]
+        assert actual == expected, f"Expected\n{expected}\nReceived\n{actual}"
+
+    @staticmethod
+    def test_levelordergroup_iter_max_depth_deep_tree():
+        root = node.Node("0")
+        _node = root
+        for idx in range(1, 3000):
+            _node = node.Node(str(idx), parent=_node)
+        actual = list(iterators.levelordergroup_iter(root, max_depth=2999))
+        assert len(actual) == 2999
+        assert actual[-1][0].node_name == "2998"
+
 
 class TestZigZagIter:
     @staticmethod